@@ -30,6 +30,7 @@ from . import _init_helper
 from ._device_selection import select_device_with_aspects
 from ._sycl_context import SyclContext, SyclContextCreationError
 from ._sycl_device import (
+    DeviceCapabilities,
     SyclDevice,
     SyclDeviceCreationError,
     SyclSubDeviceCreationError,
@@ -49,6 +50,7 @@ from ._sycl_device_factory import (
 from ._sycl_event import SyclEvent
 from ._sycl_platform import SyclPlatform, get_platforms, lsplatform
 from ._sycl_queue import (
+    KernelLaunch,
     LocalAccessor,
     SyclKernelInvalidRangeError,
     SyclKernelSubmitError,
@@ -72,6 +74,7 @@ __all__ = [
 ]
 __all__ += [
     "SyclDevice",
+    "DeviceCapabilities",
     "SyclDeviceCreationError",
     "SyclSubDeviceCreationError",
 ]
@@ -106,6 +109,7 @@ __all__ += [
     "SyclQueueCreationError",
     "WorkGroupMemory",
     "LocalAccessor",
+    "KernelLaunch",
 ]
 __all__ += [
     "get_device_cached_queue",
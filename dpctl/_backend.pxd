@@ -358,6 +358,18 @@ cdef extern from "syclinterface/dpctl_sycl_kernel_bundle_interface.h":
         const DPCTLSyclDeviceRef Dev,
         const char *Source,
         const char *CompileOpts)
+    cdef DPCTLSyclKernelBundleRef DPCTLKernelBundle_CreateFromBinary(
+        const DPCTLSyclContextRef Ctx,
+        const DPCTLSyclDeviceRef Dev,
+        const void *Binary,
+        size_t Length,
+        const char *CompileOpts)
+    cdef size_t DPCTLKernelBundle_GetBinarySize(
+        DPCTLSyclKernelBundleRef KBRef)
+    cdef bool DPCTLKernelBundle_GetBinary(
+        DPCTLSyclKernelBundleRef KBRef,
+        void *Binary,
+        size_t Length)
     cdef DPCTLSyclKernelRef DPCTLKernelBundle_GetKernel(
         DPCTLSyclKernelBundleRef KBRef,
         const char *KernelName)
@@ -245,6 +245,95 @@ def _cached_filter_string(d : SyclDevice):
     return ":".join((br_str, dt_str, str(relId)))
 
 
+class DeviceCapabilities(
+    collections.namedtuple(
+        "DeviceCapabilities",
+        [
+            "has_fp16",
+            "has_fp64",
+            "has_atomic64",
+            "max_work_group_size",
+            "sub_group_sizes",
+            "local_mem_size",
+            "default_fp_type",
+            "default_complex_type",
+            "default_int_type",
+            "default_uint_type",
+            "default_index_type",
+        ],
+    )
+):
+    """
+    Immutable snapshot of properties of a :class:`dpctl.SyclDevice` which
+    are consulted when choosing data types and launch parameters, returned
+    by :attr:`dpctl.SyclDevice.capabilities`.
+
+    Attributes:
+        has_fp16 (bool):
+            whether the device supports half precision floating point type.
+        has_fp64 (bool):
+            whether the device supports double precision floating point type.
+        has_atomic64 (bool):
+            whether the device supports 64-bit atomic operations.
+        max_work_group_size (int):
+            maximal number of work-items in a work-group.
+        sub_group_sizes (Tuple[int]):
+            supported sub-group sizes.
+        local_mem_size (int):
+            size of local memory in bytes.
+        default_fp_type (str):
+            default real floating point data type, ``"f8"`` or ``"f4"``.
+        default_complex_type (str):
+            default complex floating point data type, ``"c16"`` or ``"c8"``.
+        default_int_type (str):
+            default signed integral data type, consistent with NumPy.
+        default_uint_type (str):
+            default unsigned integral data type, consistent with NumPy.
+        default_index_type (str):
+            default data type of array indices.
+    """
+    __slots__ = ()
+
+
+def _default_integral_types():
+    """
+    Internal utility returning default signed and unsigned integral
+    data types, consistent with default integral type of NumPy.
+    """
+    import numpy
+
+    if numpy.lib.NumpyVersion(numpy.__version__).major >= 2:
+        return "i8", "u8"
+    # numpy.dtype('long') is the default integral type of NumPy 1.x
+    # across platforms
+    return "l", "L"
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_capabilities(d : SyclDevice):
+    """
+    Internal utility to compute capabilities of input SyclDevice
+    and cached with `functools.cache`.
+    """
+    # default data types are those used by dpctl.tensor
+    has_fp64 = d.has_aspect_fp64
+    int_type, uint_type = _default_integral_types()
+
+    return DeviceCapabilities(
+        has_fp16=d.has_aspect_fp16,
+        has_fp64=has_fp64,
+        has_atomic64=d.has_aspect_atomic64,
+        max_work_group_size=d.max_work_group_size,
+        sub_group_sizes=tuple(d.sub_group_sizes),
+        local_mem_size=d.local_mem_size,
+        default_fp_type="f8" if has_fp64 else "f4",
+        default_complex_type="c16" if has_fp64 else "c8",
+        default_int_type=int_type,
+        default_uint_type=uint_type,
+        default_index_type="i8",
+    )
+
+
 cdef class SyclDevice(_SyclDevice):
     """ SyclDevice(arg=None)
     A Python wrapper for the ``sycl::device`` C++ class.
@@ -1931,6 +2020,26 @@ cdef class SyclDevice(_SyclDevice):
         else:
             return False
 
+    @property
+    def capabilities(self):
+        """ Returns snapshot of device properties consulted when choosing
+        data types, computed once per device.
+
+        Returns:
+            :class:`dpctl.DeviceCapabilities`:
+                Named tuple of device properties.
+
+        :Example:
+
+            .. code-block:: python
+
+                >>> import dpctl
+                >>> dev = dpctl.select_cpu_device()
+                >>> dev.capabilities.has_fp64
+                True
+        """
+        return _cached_capabilities(self)
+
     @property
     def filter_string(self):
         """ For a root device, returns a fully specified filter selector
@@ -80,17 +80,40 @@ from cpython.buffer cimport (
     PyObject_GetBuffer,
 )
 from cpython.ref cimport Py_DECREF, Py_INCREF, PyObject
+from libc.stdint cimport (
+    int8_t,
+    int16_t,
+    int32_t,
+    int64_t,
+    uint8_t,
+    uint16_t,
+    uint32_t,
+    uint64_t,
+)
 from libc.stdlib cimport free, malloc
 
 import collections.abc
 import logging
 
+ctypedef union _kernel_arg_slot:
+    int8_t i8
+    uint8_t u8
+    int16_t i16
+    uint16_t u16
+    int32_t i32
+    uint32_t u32
+    int64_t i64
+    uint64_t u64
+    float f32
+    double f64
+
 
 cdef extern from "_host_task_util.hpp":
     DPCTLSyclEventRef async_dec_ref(DPCTLSyclQueueRef, PyObject **, size_t, DPCTLSyclEventRef *, size_t, int *) nogil
 
 
 __all__ = [
+    "KernelLaunch",
     "SyclQueue",
     "SyclKernelInvalidRangeError",
     "SyclKernelSubmitError",
@@ -507,6 +530,371 @@ cdef DPCTLSyclEventRef _memcpy_impl(
     return ERef
 
 
+cdef int _scalar_arg_type(object arg):
+    "Returns type id of ctypes scalar kernel argument, or -1"
+    if isinstance(arg, ctypes.c_char):
+        return _arg_data_type._INT8_T
+    elif isinstance(arg, ctypes.c_uint8):
+        return _arg_data_type._UINT8_T
+    elif isinstance(arg, ctypes.c_short):
+        return _arg_data_type._INT16_T
+    elif isinstance(arg, ctypes.c_ushort):
+        return _arg_data_type._UINT16_T
+    elif isinstance(arg, ctypes.c_int):
+        return _arg_data_type._INT32_T
+    elif isinstance(arg, ctypes.c_uint):
+        return _arg_data_type._UINT32_T
+    elif isinstance(arg, ctypes.c_longlong):
+        return _arg_data_type._INT64_T
+    elif isinstance(arg, ctypes.c_ulonglong):
+        return _arg_data_type._UINT64_T
+    elif isinstance(arg, ctypes.c_float):
+        return _arg_data_type._FLOAT
+    elif isinstance(arg, ctypes.c_double):
+        return _arg_data_type._DOUBLE
+    return -1
+
+
+cdef bint _scalar_arg_type_valid(int ty):
+    "Whether `ty` is type id of a scalar kernel argument"
+    return not (
+        ty == _arg_data_type._VOID_PTR or
+        ty == _arg_data_type._LOCAL_ACCESSOR or
+        ty == _arg_data_type._WORK_GROUP_MEMORY
+    )
+
+
+cdef int _store_scalar_arg(
+    _kernel_arg_slot *slot, _arg_data_type ty, object value
+) except -1:
+    "Writes value of scalar kernel argument of type `ty` into `slot`"
+    if isinstance(value, ctypes._SimpleCData):
+        value = value.value
+    if isinstance(value, bytes):
+        # value of ctypes.c_char
+        value = ord(value)
+    if ty == _arg_data_type._INT8_T:
+        slot.i8 = <int8_t>value
+    elif ty == _arg_data_type._UINT8_T:
+        slot.u8 = <uint8_t>value
+    elif ty == _arg_data_type._INT16_T:
+        slot.i16 = <int16_t>value
+    elif ty == _arg_data_type._UINT16_T:
+        slot.u16 = <uint16_t>value
+    elif ty == _arg_data_type._INT32_T:
+        slot.i32 = <int32_t>value
+    elif ty == _arg_data_type._UINT32_T:
+        slot.u32 = <uint32_t>value
+    elif ty == _arg_data_type._INT64_T:
+        slot.i64 = <int64_t>value
+    elif ty == _arg_data_type._UINT64_T:
+        slot.u64 = <uint64_t>value
+    elif ty == _arg_data_type._FLOAT:
+        slot.f32 = <float>value
+    elif ty == _arg_data_type._DOUBLE:
+        slot.f64 = <double>value
+    else:
+        raise TypeError("Kernel argument is not a scalar")
+    return 0
+
+
+cdef int _parse_range(size_t Range[3], object S) except -1:
+    "Populates `Range` from sequence `S`, returning its length"
+    cdef size_t nS = len(S)
+    if nS < 1 or nS > 3:
+        raise SyclKernelInvalidRangeError(
+            "Range with ", nS, " not allowed. Range can only have "
+            "between one and three dimensions."
+        )
+    Range[0] = 1
+    Range[1] = 1
+    Range[2] = 1
+    for i in range(nS):
+        Range[i] = <size_t>S[i]
+    return nS
+
+
+cdef DPCTLSyclEventRef *_make_dep_events(object dEvents, size_t *nDE) except? NULL:
+    "Returns array of references of events in `dEvents`, to be freed"
+    cdef DPCTLSyclEventRef *depEvents = NULL
+    nDE[0] = 0
+    if dEvents is None or len(dEvents) == 0:
+        return NULL
+    depEvents = (
+        <DPCTLSyclEventRef*>malloc(len(dEvents) * sizeof(DPCTLSyclEventRef))
+    )
+    if not depEvents:
+        raise MemoryError()
+    for idx, de in enumerate(dEvents):
+        if isinstance(de, SyclEvent):
+            depEvents[idx] = (<SyclEvent>de).get_event_ref()
+        else:
+            free(depEvents)
+            raise TypeError("A sequence of dpctl.SyclEvent is expected")
+    nDE[0] = len(dEvents)
+    return depEvents
+
+
+cdef class KernelLaunch:
+    """
+    KernelLaunch(queue, kernel, args, gS, lS=None)
+
+    Kernel submission with arguments marshalled once, for repeated
+    submission of :class:`dpctl.program.SyclKernel` to a
+    :class:`dpctl.SyclQueue`.
+
+    Values of scalar arguments are copied into storage owned by the
+    launch object, so that they can be changed with :meth:`set_arg`
+    without re-packing other arguments. Arguments are validated when
+    the launch is created, and when they are replaced.
+
+    Args:
+        queue (dpctl.SyclQueue):
+            Queue the kernel is submitted to.
+        kernel (dpctl.program.SyclKernel):
+            SYCL kernel object
+        args (List[object]):
+            List of kernel arguments, of the types supported by
+            :meth:`dpctl.SyclQueue.submit_async`.
+        gS (List[int]):
+            Global iteration range. Must be a list of length 1, 2, or 3.
+        lS (List[int], optional):
+            Local iteration range. Must be ``None`` or have the same
+            length as ``gS``.
+
+    .. note::
+        As with :meth:`dpctl.SyclQueue.submit_async`, one must ensure that
+        USM allocations passed as arguments outlive tasks submitted with
+        the launch. The launch object keeps references to them until they
+        are replaced.
+    """
+    cdef SyclQueue _queue
+    cdef SyclKernel _kernel
+    cdef list _args
+    cdef size_t _nargs
+    cdef void **_kargs
+    cdef _arg_data_type *_kargty
+    cdef _kernel_arg_slot *_scalars
+    cdef size_t _gRange[3]
+    cdef size_t _lRange[3]
+    cdef size_t _nd
+    cdef bint _has_local
+
+    def __cinit__(
+        self,
+        SyclQueue queue,
+        SyclKernel kernel,
+        list args,
+        list gS,
+        list lS=None,
+    ):
+        cdef size_t nargs = len(args)
+        cdef size_t nLS = 0
+        self._queue = queue
+        self._kernel = kernel
+        self._args = list(args)
+        self._nargs = nargs
+        self._nd = _parse_range(self._gRange, gS)
+        self._has_local = (lS is not None)
+        if self._has_local:
+            nLS = _parse_range(self._lRange, lS)
+            if nLS != self._nd:
+                raise ValueError(
+                    "Local and global ranges need to have same "
+                    "number of dimensions."
+                )
+        # allocate at least one element, so that NULL signals failure
+        self._kargs = <void**>malloc(max(nargs, 1) * sizeof(void*))
+        self._kargty = (
+            <_arg_data_type*>malloc(max(nargs, 1) * sizeof(_arg_data_type))
+        )
+        self._scalars = (
+            <_kernel_arg_slot*>malloc(max(nargs, 1) * sizeof(_kernel_arg_slot))
+        )
+        if not (self._kargs and self._kargty and self._scalars):
+            raise MemoryError()
+        for idx in range(nargs):
+            self._pack_arg(idx, args[idx], True)
+
+    def __dealloc__(self):
+        free(self._kargs)
+        free(self._kargty)
+        free(self._scalars)
+
+    cdef int _pack_arg(self, size_t idx, object arg, bint new) except -1:
+        cdef int ty = _scalar_arg_type(arg)
+        cdef int cur_ty = -1
+        cdef void *ptr = NULL
+        cdef bint is_scalar = False
+        if not new:
+            cur_ty = self._kargty[idx]
+            if (
+                ty == -1 and isinstance(arg, numbers.Number) and
+                _scalar_arg_type_valid(cur_ty)
+            ):
+                # plain Python number is converted to argument's type
+                ty = cur_ty
+        if ty != -1:
+            is_scalar = True
+            ptr = <void*>&self._scalars[idx]
+        elif isinstance(arg, _Memory):
+            ptr = <void*>(<size_t>arg._pointer)
+            ty = _arg_data_type._VOID_PTR
+        elif isinstance(arg, WorkGroupMemory):
+            ptr = <void*>(<size_t>arg._ref)
+            ty = _arg_data_type._WORK_GROUP_MEMORY
+        elif isinstance(arg, LocalAccessor):
+            ptr = <void*>((<LocalAccessor>arg).addressof())
+            ty = _arg_data_type._LOCAL_ACCESSOR
+        else:
+            raise TypeError("Unsupported type for a kernel argument")
+        if not new and ty != cur_ty:
+            raise TypeError(f"Kernel argument {idx} has a different type")
+        if is_scalar:
+            _store_scalar_arg(&self._scalars[idx], <_arg_data_type>ty, arg)
+        self._kargs[idx] = ptr
+        self._kargty[idx] = <_arg_data_type>ty
+        self._args[idx] = arg
+        return 0
+
+    def set_arg(self, idx, value):
+        """
+        set_arg(idx, value)
+
+        Replaces kernel argument at position ``idx``. Scalar arguments
+        may be given as ``ctypes`` scalars of the same type as the
+        original argument, or as Python numbers, which are converted to
+        that type. USM allocations may only replace USM allocations.
+        """
+        cdef Py_ssize_t i = idx
+        if i < 0:
+            i += self._nargs
+        if i < 0 or i >= <Py_ssize_t>self._nargs:
+            raise IndexError(f"Kernel argument index {idx} is out of range")
+        self._pack_arg(<size_t>i, value, False)
+
+    def set_range(self, list gS, list lS=None):
+        """
+        set_range(gS, lS=None)
+
+        Replaces global and local iteration ranges of the launch.
+        """
+        cdef size_t gRange[3]
+        cdef size_t lRange[3]
+        cdef size_t nd = _parse_range(gRange, gS)
+        cdef size_t nLS = 0
+        if lS is not None:
+            nLS = _parse_range(lRange, lS)
+            if nLS != nd:
+                raise ValueError(
+                    "Local and global ranges need to have same "
+                    "number of dimensions."
+                )
+        for i in range(3):
+            self._gRange[i] = gRange[i]
+            self._lRange[i] = lRange[i] if lS is not None else 1
+        self._nd = nd
+        self._has_local = (lS is not None)
+
+    cdef DPCTLSyclEventRef _submit(
+        self, DPCTLSyclEventRef *depEvents, size_t nDE
+    ):
+        if self._has_local:
+            return DPCTLQueue_SubmitNDRange(
+                self._kernel.get_kernel_ref(),
+                self._queue.get_queue_ref(),
+                self._kargs,
+                self._kargty,
+                self._nargs,
+                self._gRange,
+                self._lRange,
+                self._nd,
+                depEvents,
+                nDE
+            )
+        else:
+            return DPCTLQueue_SubmitRange(
+                self._kernel.get_kernel_ref(),
+                self._queue.get_queue_ref(),
+                self._kargs,
+                self._kargty,
+                self._nargs,
+                self._gRange,
+                self._nd,
+                depEvents,
+                nDE
+            )
+
+    def submit_async(self, dEvents=None):
+        """
+        submit_async(dEvents=None)
+
+        Asynchronously submits the kernel for execution.
+
+        Args:
+            dEvents (List[dpctl.SyclEvent], optional):
+                List of events indicating ordering of this task relative
+                to tasks associated with specified events.
+
+        Returns:
+            dpctl.SyclEvent:
+                An event associated with submission of the kernel.
+        """
+        cdef size_t nDE = 0
+        cdef DPCTLSyclEventRef *depEvents = _make_dep_events(dEvents, &nDE)
+        cdef DPCTLSyclEventRef Eref = self._submit(depEvents, nDE)
+        free(depEvents)
+        if Eref is NULL:
+            raise SyclKernelSubmitError(
+                "Kernel submission to Sycl queue failed."
+            )
+        return SyclEvent._create(Eref)
+
+    def submit(self, dEvents=None):
+        """
+        submit(dEvents=None)
+
+        Submits the kernel for execution, and waits for its completion.
+        """
+        cdef SyclEvent e = self.submit_async(dEvents)
+        e.wait()
+        return e
+
+    @property
+    def sycl_queue(self):
+        """:class:`dpctl.SyclQueue` the kernel is submitted to."""
+        return self._queue
+
+    @property
+    def kernel(self):
+        """:class:`dpctl.program.SyclKernel` submitted by the launch."""
+        return self._kernel
+
+    @property
+    def args(self):
+        """Tuple of current kernel arguments."""
+        return tuple(self._args)
+
+    @property
+    def global_range(self):
+        """Global iteration range as a tuple."""
+        return tuple(self._gRange[i] for i in range(self._nd))
+
+    @property
+    def local_range(self):
+        """Local iteration range as a tuple, or ``None``."""
+        if not self._has_local:
+            return None
+        return tuple(self._lRange[i] for i in range(self._nd))
+
+    def __repr__(self):
+        return (
+            f"<dpctl.KernelLaunch {self._kernel.get_function_name()}, "
+            f"global_range={self.global_range}, "
+            f"local_range={self.local_range}>"
+        )
+
+
 cdef class _SyclQueue:
     """ Barebone data owner class used by SyclQueue.
     """
@@ -1347,6 +1735,70 @@ cdef class SyclQueue(_SyclQueue):
         e.wait()
         return e
 
+    def submit_batch(self, launches, dEvents=None):
+        """
+        submit_batch(launches, dEvents=None)
+
+        Asynchronously submits a sequence of kernels for execution.
+
+        Each element of ``launches`` is either a :class:`dpctl.KernelLaunch`
+        created for this queue, or a tuple ``(kernel, args, gS)`` or
+        ``(kernel, args, gS, lS)`` with the meaning of the respective
+        arguments of :meth:`dpctl.SyclQueue.submit_async`. Tuples are
+        marshalled into :class:`dpctl.KernelLaunch` objects, which can
+        be reused to avoid marshalling arguments again.
+
+        All kernels depend on events in ``dEvents``, whose references are
+        collected once for the whole batch. Kernels of the batch are not
+        ordered relative to each other, unless the queue is in-order.
+
+        Args:
+            launches (Iterable):
+                Kernel launches to submit.
+            dEvents (List[dpctl.SyclEvent], optional):
+                List of events indicating ordering of the submitted tasks
+                relative to tasks associated with specified events.
+
+        Returns:
+            List[dpctl.SyclEvent]:
+                Events associated with submission of each kernel.
+        """
+        cdef size_t nDE = 0
+        cdef DPCTLSyclEventRef *depEvents = NULL
+        cdef DPCTLSyclEventRef Eref = NULL
+        cdef KernelLaunch launch
+        cdef list prepared = []
+        cdef list events = []
+
+        for item in launches:
+            if isinstance(item, KernelLaunch):
+                launch = <KernelLaunch>item
+                if not self.equals(launch._queue):
+                    raise ValueError(
+                        "KernelLaunch was created for a different queue"
+                    )
+            elif isinstance(item, tuple) and len(item) in (3, 4):
+                launch = KernelLaunch(self, *item)
+            else:
+                raise TypeError(
+                    "Expected KernelLaunch, or tuple (kernel, args, gS) or "
+                    f"(kernel, args, gS, lS), got {type(item)}"
+                )
+            prepared.append(launch)
+
+        depEvents = _make_dep_events(dEvents, &nDE)
+        try:
+            for launch in prepared:
+                Eref = launch._submit(depEvents, nDE)
+                if Eref is NULL:
+                    raise SyclKernelSubmitError(
+                        "Kernel submission to Sycl queue failed."
+                    )
+                events.append(SyclEvent._create(Eref))
+        finally:
+            free(depEvents)
+        return events
+
     cpdef void wait(self):
         with nogil: DPCTLQueue_Wait(self._queue_ref)
 
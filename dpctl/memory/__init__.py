@@ -29,17 +29,25 @@
 
 """
 from ._memory import (
+    MemoryPool,
     MemoryUSMDevice,
     MemoryUSMHost,
     MemoryUSMShared,
     USMAllocationError,
     as_usm_memory,
+    deferred_free_stats,
+    set_deferred_free,
+    wait_deferred_free,
 )
 
 __all__ = [
+    "MemoryPool",
     "MemoryUSMDevice",
     "MemoryUSMHost",
     "MemoryUSMShared",
     "USMAllocationError",
     "as_usm_memory",
+    "deferred_free_stats",
+    "set_deferred_free",
+    "wait_deferred_free",
 ]
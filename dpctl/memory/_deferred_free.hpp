@@ -0,0 +1,203 @@
+//===--- _deferred_free.hpp                                        --------===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===---------------------------------------------------------------------===//
+///
+/// \file
+/// This file implements deferred release of opaque smart pointers to USM
+/// allocations. The last owner of an allocation is handed over to a host
+/// task submitted to the allocation queue, which releases it once tasks
+/// previously submitted to that queue complete, so that the thread dropping
+/// the last Python reference to the allocation does not block.
+///
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#ifndef __cplusplus
+#error "C++ is required to compile this file"
+#endif
+
+#include "syclinterface/dpctl_sycl_type_casters.hpp"
+#include "syclinterface/dpctl_sycl_types.h"
+#include <condition_variable>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <sycl/sycl.hpp>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <exception>
+#include <iostream>
+
+struct DeferredFreeStats
+{
+    std::size_t pending_bytes;
+    std::size_t pending_blocks;
+    std::size_t deferred_blocks;
+    std::size_t released_bytes;
+};
+
+namespace
+{
+
+class DeferredFreeRegistry
+{
+public:
+    static DeferredFreeRegistry &get()
+    {
+        // intentionally leaked, see `shutdown`
+        static DeferredFreeRegistry *instance = new DeferredFreeRegistry();
+        return *instance;
+    }
+
+    void
+    defer(std::shared_ptr<void> *sptr, const sycl::queue &q, std::size_t nbytes)
+    {
+        if (sptr->use_count() > 1) {
+            // other owners keep the allocation alive, dropping this
+            // copy of the smart pointer does not release memory
+            delete sptr;
+            return;
+        }
+        std::uint64_t ticket = 0;
+        bool deferred = false;
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            if (!shutdown_) {
+                // USM address may be handed out again before the host
+                // task runs, identify the release by a ticket instead
+                ticket = next_ticket_++;
+                pending_.emplace(ticket, nbytes);
+                pending_bytes_ += nbytes;
+                ++deferred_blocks_;
+                deferred = true;
+            }
+        }
+        if (!deferred) {
+            // SYCL runtime may be torn down after shutdown, release
+            // synchronously
+            delete sptr;
+            return;
+        }
+        try {
+            sycl::queue exec_q{q};
+            std::vector<sycl::event> depends;
+            if (!exec_q.is_in_order()) {
+                // tasks of out-of-order queue are not ordered by
+                // submission, wait for those already submitted
+                depends.push_back(exec_q.ext_oneapi_submit_barrier());
+            }
+            exec_q.submit([&](sycl::handler &cgh) {
+                cgh.depends_on(depends);
+                cgh.host_task([this, sptr, ticket]() {
+                    // deleter either frees the memory or returns it to
+                    // the pool
+                    delete sptr;
+                    this->on_released(ticket);
+                });
+            });
+        } catch (const std::exception &ex) {
+            std::cout << "Submission of deferred USM release caught an "
+                      << "exception: " << ex.what() << std::endl;
+            delete sptr;
+            on_released(ticket);
+        }
+    }
+
+    /*! @brief Blocks until all pending smart pointers are released */
+    void wait()
+    {
+        std::unique_lock<std::mutex> lock(mu_);
+        drained_cv_.wait(lock, [this] { return pending_.empty(); });
+    }
+
+    /*! @brief Releases pending smart pointers, and releases smart pointers
+     * synchronously from now on. Must be called before SYCL runtime is
+     * torn down. */
+    void shutdown()
+    {
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            shutdown_ = true;
+        }
+        wait();
+    }
+
+    void get_stats(DeferredFreeStats *stats)
+    {
+        std::lock_guard<std::mutex> lock(mu_);
+        stats->pending_bytes = pending_bytes_;
+        stats->pending_blocks = pending_.size();
+        stats->deferred_blocks = deferred_blocks_;
+        stats->released_bytes = released_bytes_;
+    }
+
+private:
+    // pending releases keyed by ticket, mapped to size of allocation
+    std::unordered_map<std::uint64_t, std::size_t> pending_{};
+    std::uint64_t next_ticket_ = 0;
+    std::mutex mu_{};
+    std::condition_variable drained_cv_{};
+    bool shutdown_ = false;
+    std::size_t pending_bytes_ = 0;
+    std::size_t deferred_blocks_ = 0;
+    std::size_t released_bytes_ = 0;
+
+    DeferredFreeRegistry() = default;
+
+    void on_released(std::uint64_t ticket)
+    {
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            auto it = pending_.find(ticket);
+            if (it != pending_.end()) {
+                pending_bytes_ -= it->second;
+                released_bytes_ += it->second;
+                pending_.erase(it);
+            }
+        }
+        drained_cv_.notify_all();
+    }
+};
+
+} // end of anonymous namespace
+
+/*! @brief Schedules release of opaque smart pointer once tasks submitted
+ * to queue `QRef` complete. */
+void OpaqueSmartPtr_DeferredDelete(void *opaque_ptr,
+                                   DPCTLSyclQueueRef QRef,
+                                   std::size_t nbytes)
+{
+    auto sptr = reinterpret_cast<std::shared_ptr<void> *>(opaque_ptr);
+    const sycl::queue *q_ptr = dpctl::syclinterface::unwrap<sycl::queue>(QRef);
+
+    DeferredFreeRegistry::get().defer(sptr, *q_ptr, nbytes);
+}
+
+void DeferredFree_Wait() { DeferredFreeRegistry::get().wait(); }
+
+void DeferredFree_Shutdown() { DeferredFreeRegistry::get().shutdown(); }
+
+void DeferredFree_GetStats(DeferredFreeStats *stats)
+{
+    DeferredFreeRegistry::get().get_stats(stats);
+}
@@ -64,16 +64,22 @@ from .._sycl_device cimport SyclDevice
 from .._sycl_queue cimport SyclQueue
 from .._sycl_queue_manager cimport get_device_cached_queue
 
+import atexit
 import collections
 import numbers
+from contextvars import ContextVar
 
 import numpy as np
 
 __all__ = [
+    "MemoryPool",
     "MemoryUSMShared",
     "MemoryUSMHost",
     "MemoryUSMDevice",
     "USMAllocationError",
+    "deferred_free_stats",
+    "set_deferred_free",
+    "wait_deferred_free",
 ]
 
 include "_sycl_usm_array_interface_utils.pxi"
@@ -84,6 +90,42 @@ cdef extern from "_opaque_smart_ptr.hpp":
     void OpaqueSmartPtr_Delete(void *) nogil
     void * OpaqueSmartPtr_Get(void *) nogil
 
+cdef extern from "_usm_memory_pool.hpp":
+    ctypedef struct USMMemoryPoolStats:
+        size_t cached_bytes
+        size_t cached_blocks
+        size_t in_use_bytes
+        size_t peak_in_use_bytes
+        size_t hits
+        size_t misses
+        size_t bypassed
+    void * USMMemoryPool_Create(DPCTLSyclContextRef, int, size_t, size_t)
+    void USMMemoryPool_Delete(void *) nogil
+    void * USMMemoryPool_Malloc(
+        void *, size_t, DPCTLSyclQueueRef, size_t *
+    ) nogil
+    void * OpaqueSmartPtr_MakePooled(
+        void *, DPCTLSyclQueueRef, void *, size_t
+    ) nogil
+    size_t USMMemoryPool_Trim(void *, size_t) nogil
+    void USMMemoryPool_SetMaxCachedBytes(void *, size_t) nogil
+    size_t USMMemoryPool_GetMaxCachedBytes(void *) nogil
+    size_t USMMemoryPool_GetMaxBlockSize(void *) nogil
+    void USMMemoryPool_GetStats(void *, USMMemoryPoolStats *) nogil
+
+cdef extern from "_deferred_free.hpp":
+    ctypedef struct DeferredFreeStats:
+        size_t pending_bytes
+        size_t pending_blocks
+        size_t deferred_blocks
+        size_t released_bytes
+    void OpaqueSmartPtr_DeferredDelete(
+        void *, DPCTLSyclQueueRef, size_t
+    ) nogil
+    void DeferredFree_Wait() nogil
+    void DeferredFree_Shutdown() nogil
+    void DeferredFree_GetStats(DeferredFreeStats *) nogil
+
 class USMAllocationError(Exception):
     """
     An exception raised when Universal Shared Memory (USM) allocation
@@ -153,6 +195,299 @@ def _to_memory(unsigned char[::1] b, str usm_kind):
     return res
 
 
+cdef bint _deferred_free_enabled = False
+cdef bint _deferred_free_shut_down = False
+
+
+def set_deferred_free(bint enabled):
+    """
+    set_deferred_free(enabled)
+
+    Toggles deferred release of USM allocations.
+
+    When enabled, dropping the last reference to a ``MemoryUSM*`` object
+    does not release the USM allocation in the calling thread. Instead,
+    the allocation is handed over to a host task submitted to the
+    allocation queue, which returns it to the memory pool or to SYCL
+    runtime once tasks previously submitted to the queue complete.
+    Release is not deferred during interpreter shutdown.
+
+    Args:
+        enabled (bool):
+            Whether to defer release of USM allocations.
+
+    Returns:
+        bool:
+            Previous setting.
+    """
+    global _deferred_free_enabled
+    prev = _deferred_free_enabled
+    _deferred_free_enabled = enabled and not _deferred_free_shut_down
+    return prev
+
+
+def wait_deferred_free():
+    """
+    wait_deferred_free()
+
+    Blocks until all USM allocations scheduled for deferred
+    release have been released.
+    """
+    with nogil: DeferredFree_Wait()
+
+
+def deferred_free_stats():
+    """
+    deferred_free_stats()
+
+    Returns:
+        dict:
+            Dictionary with counters of deferred release of USM
+            allocations: ``"pending_bytes"`` and ``"pending_blocks"``
+            for allocations awaiting release, ``"deferred_blocks"`` for
+            the total number of allocations scheduled for release, and
+            ``"released_bytes"`` for the total size of released allocations.
+    """
+    cdef DeferredFreeStats st
+    with nogil: DeferredFree_GetStats(&st)
+    return {
+        "pending_bytes": st.pending_bytes,
+        "pending_blocks": st.pending_blocks,
+        "deferred_blocks": st.deferred_blocks,
+        "released_bytes": st.released_bytes,
+    }
+
+
+def _shutdown_deferred_free():
+    global _deferred_free_enabled, _deferred_free_shut_down
+    _deferred_free_enabled = False
+    _deferred_free_shut_down = True
+    with nogil: DeferredFree_Shutdown()
+
+
+atexit.register(_shutdown_deferred_free)
+
+
+_active_memory_pools = ContextVar("active_memory_pools", default=tuple())
+# tokens to restore active pools on exit from ``with`` blocks, kept per
+# context so that a pool may be entered concurrently by several threads
+_memory_pool_tokens = ContextVar("memory_pool_tokens", default=tuple())
+
+
+cdef class MemoryPool:
+    """
+    MemoryPool(sycl_context, usm_type="device", \
+        max_cached_bytes=1<<30, max_block_size=1<<27)
+
+    Caching pool of USM allocations of a given kind bound to a given
+    SYCL context.
+
+    While the pool is active, allocations made by ``MemoryUSM*``
+    constructors of matching USM type, on a queue bound to the pool's
+    context and without an alignment request, are served from the pool.
+    Requests are rounded up to a size class, and blocks released by
+    Python objects are kept in per-size-class bins to serve subsequent
+    requests without calling into SYCL runtime. The pool is activated
+    for the duration of a ``with`` block, and may be entered repeatedly.
+
+    :Example:
+
+        .. code-block:: python
+
+            import dpctl
+            import dpctl.memory as dpm
+            import dpctl.tensor as dpt
+
+            q = dpctl.SyclQueue()
+            pool = dpm.MemoryPool(q.sycl_context, usm_type="device")
+            with pool:
+                for _ in range(100):
+                    x = dpt.ones(1024, sycl_queue=q)
+            print(pool.stats())
+
+    Args:
+        sycl_context (:class:`dpctl.SyclContext`, :class:`dpctl.SyclQueue`):
+            SYCL context allocations are bound to. If a queue is given,
+            its context is used.
+        usm_type (str, optional):
+            Kind of USM allocations to pool, ``"device"``,
+            ``"shared"``, or ``"host"``. Default: ``"device"``.
+        max_cached_bytes (int, optional):
+            High-water mark for the total size of unused blocks
+            retained by the pool. Blocks released beyond this mark
+            are returned to SYCL runtime. Default: 1 GiB.
+        max_block_size (int, optional):
+            Largest request served from the pool. Larger requests
+            are forwarded to SYCL runtime directly. Default: 128 MiB.
+    """
+    cdef void *_opaque_pool
+    cdef SyclContext _ctx
+    cdef bytes _usm_type
+
+    def __cinit__(self, sycl_context, str usm_type="device", *,
+                  Py_ssize_t max_cached_bytes=1 << 30,
+                  Py_ssize_t max_block_size=1 << 27):
+        cdef int usm_kind = 0
+        self._opaque_pool = NULL
+        if isinstance(sycl_context, SyclQueue):
+            sycl_context = (<SyclQueue>sycl_context).get_sycl_context()
+        if not isinstance(sycl_context, SyclContext):
+            raise TypeError(
+                "Expected dpctl.SyclContext or dpctl.SyclQueue, "
+                f"got {type(sycl_context)}"
+            )
+        if usm_type == "device":
+            usm_kind = <int>_usm_type._USM_DEVICE
+        elif usm_type == "shared":
+            usm_kind = <int>_usm_type._USM_SHARED
+        elif usm_type == "host":
+            usm_kind = <int>_usm_type._USM_HOST
+        else:
+            raise ValueError(
+                "Unrecognized usm_type={}, expected 'device', "
+                "'shared', or 'host'".format(usm_type)
+            )
+        if max_cached_bytes < 0 or max_block_size < 0:
+            raise ValueError(
+                "Arguments max_cached_bytes and max_block_size "
+                "must be non-negative"
+            )
+        self._ctx = <SyclContext>sycl_context
+        self._usm_type = usm_type.encode("UTF-8")
+        self._opaque_pool = USMMemoryPool_Create(
+            self._ctx.get_context_ref(),
+            usm_kind,
+            <size_t>max_cached_bytes,
+            <size_t>max_block_size
+        )
+        if self._opaque_pool is NULL:
+            raise RuntimeError("Could not create memory pool")
+
+    def __dealloc__(self):
+        if not (self._opaque_pool is NULL):
+            # blocks in use keep the pool alive until they are released
+            USMMemoryPool_Delete(self._opaque_pool)
+        self._opaque_pool = NULL
+
+    cdef void *get_opaque_pool(self):
+        return self._opaque_pool
+
+    def __enter__(self):
+        active = _active_memory_pools.get()
+        token = _active_memory_pools.set((self,) + active)
+        _memory_pool_tokens.set(_memory_pool_tokens.get() + ((self, token),))
+        return self
+
+    def __exit__(self, *exc):
+        tokens = _memory_pool_tokens.get()
+        for i in range(len(tokens) - 1, -1, -1):
+            if tokens[i][0] is self:
+                break
+        else:
+            raise RuntimeError("Memory pool has not been entered")
+        _memory_pool_tokens.set(tokens[:i] + tokens[i + 1:])
+        _active_memory_pools.reset(tokens[i][1])
+        return False
+
+    @property
+    def sycl_context(self):
+        """:class:`dpctl.SyclContext` allocations of the pool are bound to."""
+        return self._ctx
+
+    @property
+    def usm_type(self):
+        """USM type of allocations served by the pool."""
+        return self._usm_type.decode("UTF-8")
+
+    @property
+    def max_block_size(self):
+        """Largest request in bytes served from the pool."""
+        return USMMemoryPool_GetMaxBlockSize(self._opaque_pool)
+
+    @property
+    def max_cached_bytes(self):
+        """
+        High-water mark for the total size of unused blocks retained
+        by the pool. Lowering the mark releases excess cached blocks.
+        """
+        return USMMemoryPool_GetMaxCachedBytes(self._opaque_pool)
+
+    @max_cached_bytes.setter
+    def max_cached_bytes(self, Py_ssize_t value):
+        if value < 0:
+            raise ValueError("max_cached_bytes must be non-negative")
+        with nogil: USMMemoryPool_SetMaxCachedBytes(
+            self._opaque_pool, <size_t>value
+        )
+
+    def trim(self, Py_ssize_t target_bytes=0):
+        """
+        trim(target_bytes=0)
+
+        Returns unused cached blocks to SYCL runtime until no more than
+        ``target_bytes`` bytes remain cached.
+
+        Returns:
+            int:
+                Number of bytes released.
+        """
+        cdef size_t released = 0
+        if target_bytes < 0:
+            raise ValueError("target_bytes must be non-negative")
+        with nogil: released = USMMemoryPool_Trim(
+            self._opaque_pool, <size_t>target_bytes
+        )
+        return released
+
+    def stats(self):
+        """
+        stats()
+
+        Returns:
+            dict:
+                Dictionary with pool counters: ``"cached_bytes"`` and
+                ``"cached_blocks"`` for unused blocks retained by the pool,
+                ``"in_use_bytes"`` and ``"peak_in_use_bytes"`` for pooled
+                blocks owned by Python objects, ``"hits"`` and ``"misses"``
+                for requests served from the cache and from SYCL runtime,
+                and ``"bypassed"`` for requests exceeding
+                ``max_block_size``.
+        """
+        cdef USMMemoryPoolStats st
+        USMMemoryPool_GetStats(self._opaque_pool, &st)
+        return {
+            "cached_bytes": st.cached_bytes,
+            "cached_blocks": st.cached_blocks,
+            "in_use_bytes": st.in_use_bytes,
+            "peak_in_use_bytes": st.peak_in_use_bytes,
+            "hits": st.hits,
+            "misses": st.misses,
+            "bypassed": st.bypassed,
+        }
+
+    def __repr__(self):
+        return "<dpctl.memory.MemoryPool usm_type={} at {}>".format(
+            self.usm_type, hex(id(self))
+        )
+
+
+cdef MemoryPool _find_active_pool(bytes ptr_type, SyclQueue queue):
+    """
+    Returns the innermost active pool serving allocations of
+    type `ptr_type` made with `queue`, or `None`.
+    """
+    cdef MemoryPool pool
+    active = _active_memory_pools.get()
+    if not active:
+        return None
+    for pool in active:
+        if pool._usm_type == ptr_type and pool._ctx.equals(
+            queue.get_sycl_context()
+        ):
+            return pool
+    return None
+
+
 cdef class _Memory:
     """ Internal class implementing methods common to
         MemoryUSMShared, MemoryUSMDevice, MemoryUSMHost
@@ -168,6 +503,9 @@ cdef class _Memory:
                       bytes ptr_type, SyclQueue queue):
         cdef DPCTLSyclUSMRef p = NULL
         cdef DPCTLSyclQueueRef QRef = NULL
+        cdef MemoryPool pool = None
+        cdef void *opaque_pool = NULL
+        cdef size_t block_size = 0
 
         self._cinit_empty()
 
@@ -176,6 +514,25 @@ cdef class _Memory:
                 queue = get_device_cached_queue(dpctl.SyclDevice())
 
             QRef = queue.get_queue_ref()
+            if alignment <= 0:
+                pool = _find_active_pool(ptr_type, queue)
+            if pool is not None:
+                opaque_pool = pool.get_opaque_pool()
+                with nogil: p = <DPCTLSyclUSMRef>USMMemoryPool_Malloc(
+                    opaque_pool, <size_t>nbytes, QRef, &block_size
+                )
+                if (p):
+                    self._memory_ptr = p
+                    self._opaque_ptr = OpaqueSmartPtr_MakePooled(
+                        p, QRef, opaque_pool, block_size
+                    )
+                    self.nbytes = nbytes
+                    self.queue = queue
+                    return
+                else:
+                    raise USMAllocationError(
+                        "USM allocation failed"
+                    )
             if (ptr_type == b"shared"):
                 if alignment > 0:
                     with nogil: p = DPCTLaligned_alloc_shared(
@@ -254,7 +611,14 @@ cdef class _Memory:
 
     def __dealloc__(self):
         if not (self._opaque_ptr is NULL):
-            OpaqueSmartPtr_Delete(self._opaque_ptr)
+            if _deferred_free_enabled and self.queue is not None:
+                OpaqueSmartPtr_DeferredDelete(
+                    self._opaque_ptr,
+                    (<SyclQueue>self.queue).get_queue_ref(),
+                    <size_t>self.nbytes
+                )
+            else:
+                OpaqueSmartPtr_Delete(self._opaque_ptr)
         self._cinit_empty()
 
     cdef DPCTLSyclUSMRef get_data_ptr(self):
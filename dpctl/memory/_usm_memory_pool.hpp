@@ -0,0 +1,396 @@
+//===--- _usm_memory_pool.hpp                                      --------===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===---------------------------------------------------------------------===//
+///
+/// \file
+/// This file implements a caching pool of USM allocations bound to a
+/// single SYCL context and USM allocation kind. Freed blocks are retained
+/// in size-class bins and are handed out again for subsequent requests of
+/// the same size class, avoiding round-trips to the SYCL runtime.
+///
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#ifndef __cplusplus
+#error "C++ is required to compile this file"
+#endif
+
+#include "syclinterface/dpctl_sycl_type_casters.hpp"
+#include "syclinterface/dpctl_sycl_types.h"
+#include <cstddef>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <sycl/sycl.hpp>
+#include <utility>
+#include <vector>
+
+#include <exception>
+#include <iostream>
+
+struct USMMemoryPoolStats
+{
+    std::size_t cached_bytes;
+    std::size_t cached_blocks;
+    std::size_t in_use_bytes;
+    std::size_t peak_in_use_bytes;
+    std::size_t hits;
+    std::size_t misses;
+    std::size_t bypassed;
+};
+
+namespace
+{
+
+class USMMemoryPool
+{
+public:
+    USMMemoryPool(const sycl::context &ctx,
+                  sycl::usm::alloc kind,
+                  std::size_t max_cached_bytes,
+                  std::size_t max_block_size)
+        : ctx_(ctx), kind_(kind), max_cached_bytes_(max_cached_bytes),
+          max_block_size_(max_block_size), bins_(), mu_(), cached_bytes_(0),
+          cached_blocks_(0), in_use_bytes_(0), peak_in_use_bytes_(0), hits_(0),
+          misses_(0), bypassed_(0)
+    {
+    }
+
+    USMMemoryPool(const USMMemoryPool &) = delete;
+    USMMemoryPool &operator=(const USMMemoryPool &) = delete;
+
+    ~USMMemoryPool() { trim(0); }
+
+    /*! @brief Size class the request of `nbytes` bytes is served from.
+     *
+     * Requests are rounded up to one of four evenly spaced sizes
+     * between consecutive powers of two, which bounds internal
+     * fragmentation to 25%.
+     */
+    static std::size_t size_class(std::size_t nbytes)
+    {
+        static constexpr std::size_t min_block_size = 256;
+        if (nbytes <= min_block_size) {
+            return min_block_size;
+        }
+        std::size_t pow2 = min_block_size;
+        while (pow2 < nbytes) {
+            pow2 <<= 1;
+        }
+        const std::size_t step = (pow2 >> 3);
+        return ((nbytes + step - 1) / step) * step;
+    }
+
+    void *
+    allocate(std::size_t nbytes, const sycl::queue &q, std::size_t &block_size)
+    {
+        const sycl::device &dev = q.get_device();
+        if (nbytes > max_block_size_) {
+            void *ptr = runtime_malloc(nbytes, dev);
+            block_size = 0;
+            if (ptr) {
+                std::lock_guard<std::mutex> lock(mu_);
+                ++bypassed_;
+            }
+            return ptr;
+        }
+        block_size = size_class(nbytes);
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            auto &bin = bins_[bin_key_t{device_key(dev), block_size}];
+            if (!bin.empty()) {
+                void *ptr = bin.back();
+                bin.pop_back();
+                cached_bytes_ -= block_size;
+                --cached_blocks_;
+                ++hits_;
+                note_in_use(block_size);
+                return ptr;
+            }
+        }
+        void *ptr = runtime_malloc(block_size, dev);
+        if (ptr == nullptr) {
+            // the runtime may be out of memory because of blocks
+            // retained by the pool, release them and try again
+            trim(0);
+            ptr = runtime_malloc(block_size, dev);
+        }
+        if (ptr) {
+            std::lock_guard<std::mutex> lock(mu_);
+            ++misses_;
+            note_in_use(block_size);
+        }
+        return ptr;
+    }
+
+    void release(void *ptr, std::size_t block_size, const sycl::device &dev)
+    {
+        if (block_size == 0) {
+            runtime_free(ptr);
+            return;
+        }
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            in_use_bytes_ -= block_size;
+            if (cached_bytes_ + block_size <= max_cached_bytes_) {
+                bins_[bin_key_t{device_key(dev), block_size}].push_back(ptr);
+                cached_bytes_ += block_size;
+                ++cached_blocks_;
+                return;
+            }
+        }
+        runtime_free(ptr);
+    }
+
+    /*! @brief Returns cached blocks to the runtime until no more than
+     * `target_bytes` bytes remain cached. Largest blocks go first.
+     * Returns the number of bytes released. */
+    std::size_t trim(std::size_t target_bytes)
+    {
+        std::vector<void *> to_free;
+        std::size_t released = 0;
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            for (auto it = bins_.rbegin();
+                 it != bins_.rend() && cached_bytes_ > target_bytes; ++it)
+            {
+                const std::size_t block_size = it->first.second;
+                auto &bin = it->second;
+                while (!bin.empty() && cached_bytes_ > target_bytes) {
+                    to_free.push_back(bin.back());
+                    bin.pop_back();
+                    cached_bytes_ -= block_size;
+                    --cached_blocks_;
+                    released += block_size;
+                }
+            }
+        }
+        for (void *ptr : to_free) {
+            runtime_free(ptr);
+        }
+        return released;
+    }
+
+    void set_max_cached_bytes(std::size_t max_cached_bytes)
+    {
+        {
+            std::lock_guard<std::mutex> lock(mu_);
+            max_cached_bytes_ = max_cached_bytes;
+        }
+        trim(max_cached_bytes);
+    }
+
+    std::size_t get_max_cached_bytes()
+    {
+        std::lock_guard<std::mutex> lock(mu_);
+        return max_cached_bytes_;
+    }
+
+    std::size_t get_max_block_size() const { return max_block_size_; }
+
+    void get_stats(USMMemoryPoolStats *stats)
+    {
+        std::lock_guard<std::mutex> lock(mu_);
+        stats->cached_bytes = cached_bytes_;
+        stats->cached_blocks = cached_blocks_;
+        stats->in_use_bytes = in_use_bytes_;
+        stats->peak_in_use_bytes = peak_in_use_bytes_;
+        stats->hits = hits_;
+        stats->misses = misses_;
+        stats->bypassed = bypassed_;
+    }
+
+private:
+    // USM-host allocations are not bound to a device,
+    // hence are cached under the same key
+    using device_key_t = std::size_t;
+    using bin_key_t = std::pair<device_key_t, std::size_t>;
+
+    sycl::context ctx_;
+    sycl::usm::alloc kind_;
+    std::size_t max_cached_bytes_;
+    std::size_t max_block_size_;
+    std::map<bin_key_t, std::vector<void *>> bins_;
+    std::mutex mu_;
+    std::size_t cached_bytes_;
+    std::size_t cached_blocks_;
+    std::size_t in_use_bytes_;
+    std::size_t peak_in_use_bytes_;
+    std::size_t hits_;
+    std::size_t misses_;
+    std::size_t bypassed_;
+
+    device_key_t device_key(const sycl::device &dev) const
+    {
+        return (kind_ == sycl::usm::alloc::host)
+                   ? 0
+                   : std::hash<sycl::device>{}(dev);
+    }
+
+    void note_in_use(std::size_t block_size)
+    {
+        in_use_bytes_ += block_size;
+        if (in_use_bytes_ > peak_in_use_bytes_) {
+            peak_in_use_bytes_ = in_use_bytes_;
+        }
+    }
+
+    void *runtime_malloc(std::size_t nbytes, const sycl::device &dev)
+    {
+        try {
+            return sycl::malloc(nbytes, dev, ctx_, kind_);
+        } catch (const std::exception &e) {
+            return nullptr;
+        }
+    }
+
+    void runtime_free(void *ptr)
+    {
+        try {
+            sycl::free(ptr, ctx_);
+        } catch (const std::exception &e) {
+            std::cout << "Call to sycl::free caught an exception: " << e.what()
+                      << std::endl;
+        }
+    }
+};
+
+class USMPoolDeleter
+{
+public:
+    USMPoolDeleter() = delete;
+    USMPoolDeleter(const USMPoolDeleter &) = default;
+    USMPoolDeleter(USMPoolDeleter &&) = default;
+    USMPoolDeleter(std::shared_ptr<USMMemoryPool> pool,
+                   const sycl::device &dev,
+                   std::size_t block_size)
+        : _pool(std::move(pool)), _device(dev), _block_size(block_size)
+    {
+    }
+    template <typename T> void operator()(T *ptr) const
+    {
+        _pool->release(ptr, _block_size, _device);
+    }
+
+private:
+    std::shared_ptr<USMMemoryPool> _pool;
+    ::sycl::device _device;
+    std::size_t _block_size;
+};
+
+} // end of anonymous namespace
+
+void *USMMemoryPool_Create(DPCTLSyclContextRef CRef,
+                           int usm_kind,
+                           std::size_t max_cached_bytes,
+                           std::size_t max_block_size)
+{
+    sycl::context *ctx_ptr = dpctl::syclinterface::unwrap<sycl::context>(CRef);
+    sycl::usm::alloc kind;
+    switch (usm_kind) {
+    case 1:
+        kind = sycl::usm::alloc::device;
+        break;
+    case 2:
+        kind = sycl::usm::alloc::shared;
+        break;
+    case 3:
+        kind = sycl::usm::alloc::host;
+        break;
+    default:
+        return nullptr;
+    }
+    auto pool =
+        new std::shared_ptr<USMMemoryPool>(std::make_shared<USMMemoryPool>(
+            *ctx_ptr, kind, max_cached_bytes, max_block_size));
+
+    return reinterpret_cast<void *>(pool);
+}
+
+void USMMemoryPool_Delete(void *opaque_pool)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+
+    delete pool;
+}
+
+void *USMMemoryPool_Malloc(void *opaque_pool,
+                           std::size_t nbytes,
+                           DPCTLSyclQueueRef QRef,
+                           std::size_t *block_size)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+    sycl::queue *q_ptr = dpctl::syclinterface::unwrap<sycl::queue>(QRef);
+
+    return (*pool)->allocate(nbytes, *q_ptr, *block_size);
+}
+
+/*! @brief Creates opaque smart pointer to memory allocated with
+ * `USMMemoryPool_Malloc` that returns the memory to the pool
+ * once the last reference to it is dropped. */
+void *OpaqueSmartPtr_MakePooled(void *usm_ptr,
+                                DPCTLSyclQueueRef QRef,
+                                void *opaque_pool,
+                                std::size_t block_size)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+    sycl::queue *q_ptr = dpctl::syclinterface::unwrap<sycl::queue>(QRef);
+
+    USMPoolDeleter _deleter(*pool, q_ptr->get_device(), block_size);
+    auto sptr = new std::shared_ptr<void>(usm_ptr, std::move(_deleter));
+
+    return reinterpret_cast<void *>(sptr);
+}
+
+std::size_t USMMemoryPool_Trim(void *opaque_pool, std::size_t target_bytes)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+
+    return (*pool)->trim(target_bytes);
+}
+
+void USMMemoryPool_SetMaxCachedBytes(void *opaque_pool,
+                                     std::size_t max_cached_bytes)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+
+    (*pool)->set_max_cached_bytes(max_cached_bytes);
+}
+
+std::size_t USMMemoryPool_GetMaxCachedBytes(void *opaque_pool)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+
+    return (*pool)->get_max_cached_bytes();
+}
+
+std::size_t USMMemoryPool_GetMaxBlockSize(void *opaque_pool)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+
+    return (*pool)->get_max_block_size();
+}
+
+void USMMemoryPool_GetStats(void *opaque_pool, USMMemoryPoolStats *stats)
+{
+    auto pool = reinterpret_cast<std::shared_ptr<USMMemoryPool> *>(opaque_pool);
+
+    (*pool)->get_stats(stats);
+}
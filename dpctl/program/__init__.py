@@ -24,13 +24,19 @@ from ._program import (
     SyclKernel,
     SyclProgram,
     SyclProgramCompilationError,
+    clear_program_cache,
     create_program_from_source,
     create_program_from_spirv,
+    get_program_cache_dir,
+    set_program_cache_dir,
 )
 
 __all__ = [
+    "clear_program_cache",
     "create_program_from_source",
     "create_program_from_spirv",
+    "get_program_cache_dir",
+    "set_program_cache_dir",
     "SyclKernel",
     "SyclProgram",
     "SyclProgramCompilationError",
@@ -56,6 +56,7 @@ cdef api class SyclProgram [object PySyclProgramObject, type PySyclProgramType]:
     cpdef SyclKernel get_sycl_kernel(self, str kernel_name)
 
 
-cpdef create_program_from_source (SyclQueue q, unicode source, unicode copts=*)
+cpdef create_program_from_source (SyclQueue q, unicode source, unicode copts=*,
+                                  bint cache=*)
 cpdef create_program_from_spirv (SyclQueue q, const unsigned char[:] IL,
-                                 unicode copts=*)
+                                 unicode copts=*, bint cache=*)
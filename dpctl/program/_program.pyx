@@ -25,6 +25,12 @@ a OpenCL source string or a SPIR-V binary file.
 
 """
 
+import hashlib
+import os
+import re
+import tempfile
+import threading
+
 from libc.stdint cimport uint32_t
 
 from dpctl._backend cimport (  # noqa: E211, E402;
@@ -40,9 +46,12 @@ from dpctl._backend cimport (  # noqa: E211, E402;
     DPCTLKernel_GetPrivateMemSize,
     DPCTLKernel_GetWorkGroupSize,
     DPCTLKernelBundle_Copy,
+    DPCTLKernelBundle_CreateFromBinary,
     DPCTLKernelBundle_CreateFromOCLSource,
     DPCTLKernelBundle_CreateFromSpirv,
     DPCTLKernelBundle_Delete,
+    DPCTLKernelBundle_GetBinary,
+    DPCTLKernelBundle_GetBinarySize,
     DPCTLKernelBundle_GetKernel,
     DPCTLKernelBundle_HasKernel,
     DPCTLSyclContextRef,
@@ -52,8 +61,11 @@ from dpctl._backend cimport (  # noqa: E211, E402;
 )
 
 __all__ = [
+    "clear_program_cache",
     "create_program_from_source",
     "create_program_from_spirv",
+    "get_program_cache_dir",
+    "set_program_cache_dir",
     "SyclKernel",
     "SyclProgram",
     "SyclProgramCompilationError",
@@ -230,7 +242,176 @@ cdef class SyclProgram:
         return int(<size_t>self._program_ref)
 
 
-cpdef create_program_from_source(SyclQueue q, str src, str copts=""):
+# Programs built in this process, keyed by the digest of their input,
+# the context and the device they were built for
+_program_memo = dict()
+_program_memo_lock = threading.Lock()
+
+# Directory of on-disk cache of program binaries, or None if disabled
+_program_cache_dir = os.environ.get("DPCTL_PROGRAM_CACHE_DIR", None) or None
+
+# Names of files of the on-disk cache: binaries named by the digest of
+# the program, and temporary files left by interrupted writes. Other
+# files in the directory are not touched.
+_program_cache_file_re = re.compile(r"([0-9a-f]{64}\.bin|program-.*\.tmp)")
+
+
+def get_program_cache_dir():
+    """
+    get_program_cache_dir()
+
+    Returns the directory where binaries of programs built by
+    :func:`create_program_from_source` and :func:`create_program_from_spirv`
+    are stored, or ``None`` if the on-disk cache is disabled.
+
+    The directory is initialized from ``DPCTL_PROGRAM_CACHE_DIR``
+    environment variable. The on-disk cache is disabled if the variable
+    is not set.
+    """
+    return _program_cache_dir
+
+
+def set_program_cache_dir(path):
+    """
+    set_program_cache_dir(path)
+
+    Sets the directory where binaries of built programs are stored, and
+    looked up before building a program. The directory is created if it
+    does not exist. ``None`` disables the on-disk cache.
+
+    Binaries are stored in files named by a hash of the program source or
+    SPIR-V, compilation options, device, and driver version, so that
+    a change to any of them results in the program being rebuilt.
+    """
+    global _program_cache_dir
+    if path is None:
+        _program_cache_dir = None
+        return
+    path = os.fspath(path)
+    os.makedirs(path, exist_ok=True)
+    _program_cache_dir = path
+
+
+def clear_program_cache(on_disk=False):
+    """
+    clear_program_cache(on_disk=False)
+
+    Removes programs built in this process from the in-process cache,
+    so that subsequent calls to :func:`create_program_from_source` and
+    :func:`create_program_from_spirv` create new
+    :class:`.SyclProgram` objects. If ``on_disk`` is ``True``, binaries
+    stored in the on-disk cache directory are removed as well. Files in
+    the directory not created by the cache are kept.
+    """
+    with _program_memo_lock:
+        _program_memo.clear()
+    cache_dir = _program_cache_dir
+    if on_disk and cache_dir is not None and os.path.isdir(cache_dir):
+        for fn in os.listdir(cache_dir):
+            if _program_cache_file_re.fullmatch(fn):
+                try:
+                    os.remove(os.path.join(cache_dir, fn))
+                except OSError:
+                    pass
+
+
+def _program_digest(str kind, bytes payload, str copts, SyclDevice dev):
+    "Content hash identifying a program built for a device"
+    h = hashlib.sha256()
+    for part in (
+        kind,
+        copts,
+        str(dev.backend),
+        dev.name,
+        dev.vendor,
+        dev.driver_version,
+    ):
+        h.update(part.encode("utf8"))
+        h.update(b"\0")
+    h.update(payload)
+    return h.hexdigest()
+
+
+cdef bytes _get_program_binary(DPCTLSyclKernelBundleRef KBRef):
+    "Returns device-specific binary of the program, or None"
+    cdef size_t n = DPCTLKernelBundle_GetBinarySize(KBRef)
+    cdef bytearray buf
+    cdef char *buf_ptr
+    if n == 0:
+        return None
+    buf = bytearray(n)
+    buf_ptr = buf
+    if not DPCTLKernelBundle_GetBinary(KBRef, <void*>buf_ptr, n):
+        return None
+    return bytes(buf)
+
+
+cdef SyclProgram _load_cached_program(
+    SyclQueue q, str digest, const char *COpts
+):
+    "Creates program from binary stored in the on-disk cache, if any"
+    cdef bytes binary
+    cdef const char *bin_ptr
+    cdef DPCTLSyclKernelBundleRef KBref
+    cdef DPCTLSyclContextRef CRef
+    cdef DPCTLSyclDeviceRef DRef
+    cache_dir = _program_cache_dir
+    if cache_dir is None:
+        return None
+    fn = os.path.join(cache_dir, digest + ".bin")
+    try:
+        with open(fn, "rb") as f:
+            binary = f.read()
+    except OSError:
+        return None
+    if len(binary) == 0:
+        return None
+    bin_ptr = binary
+    CRef = q.get_sycl_context().get_context_ref()
+    DRef = q.get_sycl_device().get_device_ref()
+    KBref = DPCTLKernelBundle_CreateFromBinary(
+        CRef, DRef, <const void*>bin_ptr, len(binary), COpts
+    )
+    if KBref is NULL:
+        # stale or corrupted entry, rebuild the program
+        try:
+            os.remove(fn)
+        except OSError:
+            pass
+        return None
+    return SyclProgram._create(KBref)
+
+
+cdef _store_cached_program(SyclProgram prog, str digest):
+    "Stores binary of the program in the on-disk cache, if enabled"
+    cache_dir = _program_cache_dir
+    if cache_dir is None:
+        return
+    binary = _get_program_binary(prog.get_program_ref())
+    if binary is None:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_fn = tempfile.mkstemp(
+            dir=cache_dir, prefix="program-", suffix=".tmp"
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(binary)
+        # concurrent writers of the same entry write identical content
+        os.replace(tmp_fn, os.path.join(cache_dir, digest + ".bin"))
+    except OSError:
+        try:
+            os.unlink(tmp_fn)
+        except OSError:
+            pass
+
+
+cpdef create_program_from_source(
+    SyclQueue q, str src, str copts="", bint cache=True
+):
     """
         Creates a Sycl interoperability program from an OpenCL source string.
 
@@ -239,6 +420,13 @@ cpdef create_program_from_source(SyclQueue q, str src, str copts=""):
         from an OpenCL source program that can contain multiple kernels.
         Note: This function is currently only supported for the OpenCL backend.
 
+        Built programs are cached. Repeated calls with the same source,
+        compilation options, context and device return the same
+        :class:`.SyclProgram`. If the on-disk cache is enabled, see
+        :func:`set_program_cache_dir`, the device binary of the program is
+        stored on disk, and reused instead of compiling the source by
+        other processes.
+
         Parameters:
             q (:class:`dpctl.SyclQueue`)
                 The :class:`dpctl.SyclQueue` for which the
@@ -248,6 +436,9 @@ cpdef create_program_from_source(SyclQueue q, str src, str copts=""):
             copts (str, optional)
                 Optional compilation flags that will be used
                 when compiling the program. Default: ``""``.
+            cache (bool, optional)
+                Whether to look up the program in, and to store it into,
+                the program caches. Default: ``True``.
 
         Returns:
             program (:class:`.SyclProgram`)
@@ -261,12 +452,33 @@ cpdef create_program_from_source(SyclQueue q, str src, str copts=""):
     """
 
     cdef DPCTLSyclKernelBundleRef KBref
+    cdef SyclProgram prog
     cdef bytes bSrc = src.encode('utf8')
     cdef bytes bCOpts = copts.encode('utf8')
     cdef const char *Src = <const char*>bSrc
     cdef const char *COpts = <const char*>bCOpts
     cdef DPCTLSyclContextRef CRef = q.get_sycl_context().get_context_ref()
     cdef DPCTLSyclDeviceRef DRef = q.get_sycl_device().get_device_ref()
+
+    if cache:
+        digest = _program_digest("source", bSrc, copts, q.get_sycl_device())
+        memo_key = (digest, q.get_sycl_context(), q.get_sycl_device())
+        with _program_memo_lock:
+            prog = _program_memo.get(memo_key, None)
+        if prog is not None:
+            return prog
+        prog = _load_cached_program(q, digest, COpts)
+        if prog is None:
+            KBref = DPCTLKernelBundle_CreateFromOCLSource(
+                CRef, DRef, Src, COpts
+            )
+            if KBref is NULL:
+                raise SyclProgramCompilationError()
+            prog = SyclProgram._create(KBref)
+            _store_cached_program(prog, digest)
+        with _program_memo_lock:
+            return _program_memo.setdefault(memo_key, prog)
+
     KBref = DPCTLKernelBundle_CreateFromOCLSource(CRef, DRef, Src, COpts)
 
     if KBref is NULL:
@@ -276,7 +488,7 @@ cpdef create_program_from_source(SyclQueue q, str src, str copts=""):
 
 
 cpdef create_program_from_spirv(SyclQueue q, const unsigned char[:] IL,
-                                str copts=""):
+                                str copts="", bint cache=True):
     """
         Creates a Sycl interoperability program from an SPIR-V binary.
 
@@ -284,6 +496,9 @@ cpdef create_program_from_spirv(SyclQueue q, const unsigned char[:] IL,
         create a ``sycl::kernel_bundle<sycl::bundle_state::executable>`` object
         from an compiled SPIR-V binary file.
 
+        Built programs are cached the same way as by
+        :func:`create_program_from_source`, keyed by the SPIR-V binary.
+
         Parameters:
             q (:class:`dpctl.SyclQueue`)
                 The :class:`dpctl.SyclQueue` for which the
@@ -293,6 +508,9 @@ cpdef create_program_from_spirv(SyclQueue q, const unsigned char[:] IL,
             copts (str, optional)
                 Optional compilation flags that will be used
                 when compiling the program. Default: ``""``.
+            cache (bool, optional)
+                Whether to look up the program in, and to store it into,
+                the program caches. Default: ``True``.
 
         Returns:
             program (:class:`.SyclProgram`)
@@ -306,12 +524,35 @@ cpdef create_program_from_spirv(SyclQueue q, const unsigned char[:] IL,
     """
 
     cdef DPCTLSyclKernelBundleRef KBref
+    cdef SyclProgram prog
     cdef const unsigned char *dIL = &IL[0]
     cdef DPCTLSyclContextRef CRef = q.get_sycl_context().get_context_ref()
     cdef DPCTLSyclDeviceRef DRef = q.get_sycl_device().get_device_ref()
     cdef size_t length = IL.shape[0]
     cdef bytes bCOpts = copts.encode('utf8')
     cdef const char *COpts = <const char*>bCOpts
+
+    if cache:
+        digest = _program_digest(
+            "spirv", (<const char*>dIL)[:length], copts, q.get_sycl_device()
+        )
+        memo_key = (digest, q.get_sycl_context(), q.get_sycl_device())
+        with _program_memo_lock:
+            prog = _program_memo.get(memo_key, None)
+        if prog is not None:
+            return prog
+        prog = _load_cached_program(q, digest, COpts)
+        if prog is None:
+            KBref = DPCTLKernelBundle_CreateFromSpirv(
+                CRef, DRef, <const void*>dIL, length, COpts
+            )
+            if KBref is NULL:
+                raise SyclProgramCompilationError()
+            prog = SyclProgram._create(KBref)
+            _store_cached_program(prog, digest)
+        with _program_memo_lock:
+            return _program_memo.setdefault(memo_key, prog)
+
     KBref = DPCTLKernelBundle_CreateFromSpirv(
         CRef, DRef, <const void*>dIL, length, COpts
     )
@@ -23,7 +23,17 @@
     [ArrayAPI] https://data-apis.org/array-api
 """
 
-from dpctl.tensor._copy_utils import asnumpy, astype, copy, from_numpy, to_numpy
+import types as _types
+
+from dpctl.tensor._copy_utils import (
+    asnumpy,
+    astype,
+    async_upload,
+    copy,
+    from_numpy,
+    set_async_upload,
+    to_numpy,
+)
 from dpctl.tensor._ctors import (
     arange,
     asarray,
@@ -64,6 +74,7 @@ from dpctl.tensor._dldevice_conversions import (
     sycl_device_to_dldevice,
 )
 from dpctl.tensor._dlpack import from_dlpack
+from dpctl.tensor._histogram import bincount, histogram
 from dpctl.tensor._indexing_functions import (
     extract,
     nonzero,
@@ -74,6 +85,7 @@ from dpctl.tensor._indexing_functions import (
     take_along_axis,
 )
 from dpctl.tensor._linear_algebra_functions import (
+    fused_matmul,
     matmul,
     matrix_transpose,
     tensordot,
@@ -104,7 +116,13 @@ from dpctl.tensor._print import (
 )
 from dpctl.tensor._reshape import reshape
 from dpctl.tensor._search_functions import where
-from dpctl.tensor._statistical_functions import mean, std, var
+from dpctl.tensor._statistical_functions import (
+    describe,
+    mean,
+    reduce_many,
+    std,
+    var,
+)
 from dpctl.tensor._usmarray import DLDeviceType, usm_ndarray
 from dpctl.tensor._utility_functions import all, any, diff
 
@@ -112,6 +130,8 @@ from ._accumulation import cumulative_logsumexp, cumulative_prod, cumulative_sum
 from ._array_api import __array_api_version__, __array_namespace_info__
 from ._clip import clip
 from ._constants import e, inf, nan, newaxis, pi
+from ._dispatch_cache import clear_dispatch_caches, set_dispatch_cache_size
+from ._einsum import einsum, einsum_path
 from ._elementwise_funcs import (
     abs,
     acos,
@@ -185,6 +205,13 @@ from ._elementwise_funcs import (
     tanh,
     trunc,
 )
+from ._gemm_tuning import (
+    clear_gemm_tuning,
+    get_gemm_tuning_file,
+    set_gemm_autotuning,
+    set_gemm_tuning_file,
+)
+from ._lazy import DeferredSizeArray, LazyArray, _eager_call, lazy
 from ._reduction import (
     argmax,
     argmin,
@@ -203,7 +230,23 @@ from ._set_functions import (
     unique_inverse,
     unique_values,
 )
-from ._sorting import argsort, sort, top_k
+from ._sharding import ShardedArray, shard
+from ._sorting import (
+    TopKAccumulator,
+    argsort,
+    lexsort,
+    segmented_argsort,
+    segmented_sort,
+    sort,
+    sort_by_key,
+    top_k,
+)
+from ._streaming import (
+    StagingRing,
+    TransferStream,
+    stream_to_device,
+    stream_to_host,
+)
 from ._testing import allclose
 from ._type_utils import can_cast, finfo, iinfo, isdtype, result_type
 
@@ -242,6 +285,8 @@ __all__ = [
     "from_numpy",
     "to_numpy",
     "asnumpy",
+    "set_async_upload",
+    "async_upload",
     "from_dlpack",
     "tril",
     "triu",
@@ -368,19 +413,34 @@ __all__ = [
     "mean",
     "std",
     "var",
+    "reduce_many",
+    "describe",
+    "bincount",
+    "histogram",
     "__array_api_version__",
     "__array_namespace_info__",
     "reciprocal",
     "angle",
     "sort",
     "argsort",
+    "segmented_sort",
+    "segmented_argsort",
+    "sort_by_key",
+    "lexsort",
     "unique_all",
     "unique_counts",
     "unique_inverse",
     "unique_values",
     "matmul",
+    "fused_matmul",
     "tensordot",
     "vecdot",
+    "einsum",
+    "einsum_path",
+    "set_gemm_autotuning",
+    "get_gemm_tuning_file",
+    "set_gemm_tuning_file",
+    "clear_gemm_tuning",
     "searchsorted",
     "cumulative_logsumexp",
     "cumulative_prod",
@@ -392,6 +452,35 @@ __all__ = [
     "take_along_axis",
     "put_along_axis",
     "top_k",
+    "TopKAccumulator",
     "dldevice_to_sycl_device",
     "sycl_device_to_dldevice",
+    "lazy",
+    "LazyArray",
+    "DeferredSizeArray",
+    "clear_dispatch_caches",
+    "set_dispatch_cache_size",
+    "shard",
+    "ShardedArray",
+    "StagingRing",
+    "TransferStream",
+    "stream_to_device",
+    "stream_to_host",
 ]
+
+
+def _evaluate_eagerly(namespace, names, lazy_aware):
+    """Wraps functions of `namespace` named in `names` so that element-wise
+    functions called by their implementations are evaluated immediately
+    within :func:`dpctl.tensor.lazy` context. Element-wise functions,
+    and functions in `lazy_aware` returning deferred results themselves,
+    are left intact."""
+    for name in names:
+        fn = namespace[name]
+        if isinstance(fn, _types.FunctionType) and name not in lazy_aware:
+            namespace[name] = _eager_call(fn)
+
+
+_evaluate_eagerly(
+    globals(), __all__, ("lazy", "extract", "nonzero", "unique_values")
+)
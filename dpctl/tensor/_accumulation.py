@@ -25,8 +25,11 @@ from dpctl.tensor._type_utils import (
 )
 from dpctl.utils import ExecutionPlacementError, SequentialOrderManager
 
+from ._dispatch_cache import DispatchCache
 from ._numpy_helper import normalize_axis_index
 
+_accumulation_dtype_cache = DispatchCache()
+
 
 def _accumulate_common(
     x,
@@ -70,14 +73,23 @@ def _accumulate_common(
     q = x.sycl_queue
     inp_dt = x.dtype
     res_usm_type = x.usm_type
-    if dtype is None:
-        res_dt = _default_accumulation_type_fn(inp_dt, q)
-    else:
-        res_dt = dpt.dtype(dtype)
-        res_dt = _to_device_supported_dtype(res_dt, q.sycl_device)
+    if dtype is not None:
+        # normalized data type is hashable, and spellings of the same
+        # type share an entry of the cache
+        dtype = dpt.dtype(dtype)
+    key = (_accumulate_fn, inp_dt, dtype, q)
+    resolved = _accumulation_dtype_cache.get(key)
+    if resolved is None:
+        if dtype is None:
+            res_dt = _default_accumulation_type_fn(inp_dt, q)
+        else:
+            res_dt = _to_device_supported_dtype(dtype, q.sycl_device)
 
-    # checking now avoids unnecessary allocations
-    implemented_types = _dtype_supported(inp_dt, res_dt)
+        # checking now avoids unnecessary allocations
+        implemented_types = _dtype_supported(inp_dt, res_dt)
+        _accumulation_dtype_cache.put(key, (res_dt, implemented_types))
+    else:
+        res_dt, implemented_types = resolved
     if dtype is None and not implemented_types:
         raise RuntimeError(
             "Automatically determined accumulation data type does not "
@@ -126,7 +138,7 @@ def _accumulate_common(
             out = dpt.permute_dims(out, perm)
 
     _manager = SequentialOrderManager[q]
-    depends = _manager.submitted_events
+    depends = _manager.dependency_events
     if implemented_types:
         if not include_initial:
             ht_e, acc_ev = _accumulate_fn(
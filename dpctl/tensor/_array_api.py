@@ -208,7 +208,7 @@ class Info:
                 ``kind``
         """
         device = _get_device_impl(device)
-        _fp64 = device.has_aspect_fp64
+        _fp64 = device.capabilities.has_fp64
         if kind is None:
             return {
                 key: val
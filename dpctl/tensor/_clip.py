@@ -45,8 +45,9 @@ def _check_clip_dtypes(res_dtype, arg1_dtype, arg2_dtype, sycl_dev):
     if arg1_dtype == res_dtype and arg2_dtype == res_dtype:
         return None, None, res_dtype
 
-    _fp16 = sycl_dev.has_aspect_fp16
-    _fp64 = sycl_dev.has_aspect_fp64
+    caps = sycl_dev.capabilities
+    _fp16 = caps.has_fp16
+    _fp64 = caps.has_fp64
     if _can_cast(arg1_dtype, res_dtype, _fp16, _fp64) and _can_cast(
         arg2_dtype, res_dtype, _fp16, _fp64
     ):
@@ -107,8 +108,9 @@ def _clip_none(x, val, out, order, _binary_fn):
     val_dtype = _resolve_one_strong_one_weak_types(x_dtype, val_dtype, sycl_dev)
 
     res_dt = x.dtype
-    _fp16 = sycl_dev.has_aspect_fp16
-    _fp64 = sycl_dev.has_aspect_fp64
+    caps = sycl_dev.capabilities
+    _fp16 = caps.has_fp16
+    _fp64 = caps.has_fp64
     if not _can_cast(val_dtype, res_dt, _fp16, _fp64):
         raise ValueError(
             f"function 'clip' does not support input types "
@@ -191,7 +193,7 @@ def _clip_none(x, val, out, order, _binary_fn):
         if val_ary.shape != res_shape:
             val_ary = dpt.broadcast_to(val_ary, res_shape)
         _manager = SequentialOrderManager[exec_q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_binary_ev, binary_ev = _binary_fn(
             src1=x, src2=val_ary, dst=out, sycl_queue=exec_q, depends=dep_evs
         )
@@ -213,7 +215,7 @@ def _clip_none(x, val, out, order, _binary_fn):
         else:
             buf = dpt.empty_like(val_ary, dtype=res_dt, order=order)
         _manager = SequentialOrderManager[exec_q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=val_ary, dst=buf, sycl_queue=exec_q, depends=dep_evs
         )
@@ -345,7 +347,7 @@ def clip(x, /, min=None, max=None, out=None, order="K"):
                 out = dpt.empty_like(x, order=order)
 
         _manager = SequentialOrderManager[exec_q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x, dst=out, sycl_queue=exec_q, depends=dep_evs
         )
@@ -568,7 +570,7 @@ def clip(x, /, min=None, max=None, out=None, order="K"):
             if a_max.shape != res_shape:
                 a_max = dpt.broadcast_to(a_max, res_shape)
             _manager = SequentialOrderManager[exec_q]
-            dep_ev = _manager.submitted_events
+            dep_ev = _manager.dependency_events
             ht_binary_ev, binary_ev = ti._clip(
                 src=x,
                 min=a_min,
@@ -596,7 +598,7 @@ def clip(x, /, min=None, max=None, out=None, order="K"):
             else:
                 buf2 = dpt.empty_like(a_max, dtype=buf2_dt, order=order)
             _manager = SequentialOrderManager[exec_q]
-            dep_ev = _manager.submitted_events
+            dep_ev = _manager.dependency_events
             ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
                 src=a_max, dst=buf2, sycl_queue=exec_q, depends=dep_ev
             )
@@ -652,7 +654,7 @@ def clip(x, /, min=None, max=None, out=None, order="K"):
             else:
                 buf1 = dpt.empty_like(a_min, dtype=buf1_dt, order=order)
             _manager = SequentialOrderManager[exec_q]
-            dep_ev = _manager.submitted_events
+            dep_ev = _manager.dependency_events
             ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
                 src=a_min, dst=buf1, sycl_queue=exec_q, depends=dep_ev
             )
@@ -721,7 +723,7 @@ def clip(x, /, min=None, max=None, out=None, order="K"):
             buf1 = dpt.empty_like(a_min, dtype=buf1_dt, order=order)
 
         _manager = SequentialOrderManager[exec_q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_copy1_ev, copy1_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=a_min, dst=buf1, sycl_queue=exec_q, depends=dep_evs
         )
@@ -14,7 +14,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import builtins
+import contextlib
 import operator
+from contextvars import ContextVar
 from numbers import Integral
 
 import numpy as np
@@ -28,6 +30,8 @@ from dpctl.tensor._data_types import _get_dtype
 from dpctl.tensor._device import normalize_queue_device
 from dpctl.tensor._type_utils import _dtype_supported_by_device_impl
 
+from ._dispatch_cache import _queue_capabilities
+from ._lazy import DeferredSizeArray, _DeviceSize
 from ._numpy_helper import normalize_axis_index
 
 __doc__ = (
@@ -37,36 +41,88 @@ __doc__ = (
 
 int32_t_max = 1 + np.iinfo(np.int32).max
 
+_async_upload = ContextVar("async_upload", default=False)
+
 
 def _copy_to_numpy(ary):
     if not isinstance(ary, dpt.usm_ndarray):
         raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(ary)}")
-    nb = ary.usm_data.nbytes
+    if ary.size == 0:
+        # no data to transfer
+        return np.ndarray(ary.shape, dtype=ary.dtype)
     q = ary.sycl_queue
-    hh = dpm.MemoryUSMHost(nb, queue=q)
-    h = np.ndarray(nb, dtype="u1", buffer=hh).view(ary.dtype)
+    _manager = dpctl.utils.SequentialOrderManager[q]
+    dep_evs = _manager.dependency_events
     itsz = ary.itemsize
+    beg_p, end_p = ary._byte_bounds
+    span_nbytes = end_p - beg_p
+    if span_nbytes > ary.size * itsz:
+        # the view is sparse in its allocation, pack it into
+        # a dense temporary on the device to only move the
+        # elements of the view over to the host
+        packed = _empty_like_orderK(ary, ary.dtype, usm_type="device")
+        hev, pack_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+            src=ary, dst=packed, sycl_queue=q, depends=dep_evs
+        )
+        _manager.add_event_pair(hev, pack_ev)
+        ary = packed
+        dep_evs = [pack_ev]
+        beg_p, end_p = ary._byte_bounds
+        span_nbytes = end_p - beg_p
+    # view the byte span covered by the array as 1D array of bytes
+    src_bytes = dpt.usm_ndarray(
+        (span_nbytes,),
+        dtype="u1",
+        buffer=ary.usm_data,
+        offset=beg_p - ary.usm_data._pointer,
+    )
+    hh = dpm.MemoryUSMHost(span_nbytes, queue=q)
+    dst_bytes = dpt.usm_ndarray((span_nbytes,), dtype="u1", buffer=hh)
+    hev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+        src=src_bytes, dst=dst_bytes, sycl_queue=q, depends=dep_evs
+    )
+    _manager.add_event_pair(hev, cpy_ev)
+    # only wait for the transfer itself, not for the entire queue
+    cpy_ev.wait()
     strides_bytes = tuple(si * itsz for si in ary.strides)
-    offset = ary._element_offset * itsz
-    # ensure that content of ary.usm_data is final
-    q.wait()
-    hh.copy_from_device(ary.usm_data)
     return np.ndarray(
         ary.shape,
         dtype=ary.dtype,
-        buffer=h,
+        buffer=np.ndarray(span_nbytes, dtype="u1", buffer=hh),
         strides=strides_bytes,
-        offset=offset,
+        offset=ary._pointer - beg_p,
     )
 
 
+def _map_to_device_dtype(dt, q):
+    dtc = dt.char
+    if dtc == "?" or np.issubdtype(dt, np.integer):
+        return dt
+    caps = _queue_capabilities(q)
+    if np.issubdtype(dt, np.floating):
+        if dtc == "f":
+            return dt
+        if dtc == "d" and caps.has_fp64:
+            return dt
+        if dtc == "e" and caps.has_fp16:
+            return dt
+        return dpt.dtype("f4")
+    if np.issubdtype(dt, np.complexfloating):
+        if dtc == "F":
+            return dt
+        if dtc == "D" and caps.has_fp64:
+            return dt
+        return dpt.dtype("c8")
+    raise RuntimeError(f"Unrecognized data type '{dt}' encountered.")
+
+
 def _copy_from_numpy(np_ary, usm_type="device", sycl_queue=None):
     "Copies numpy array `np_ary` into a new usm_ndarray"
     # This may perform a copy to meet stated requirements
     Xnp = np.require(np_ary, requirements=["A", "E"])
     alloc_q = normalize_queue_device(sycl_queue=sycl_queue, device=None)
     dt = Xnp.dtype
-    if dt.char in "dD" and alloc_q.sycl_device.has_aspect_fp64 is False:
+    if dt.char in "dD" and not _queue_capabilities(alloc_q).has_fp64:
         Xusm_dtype = (
             dpt.dtype("float32") if dt.char == "d" else dpt.dtype("complex64")
         )
@@ -79,12 +135,117 @@ def _copy_from_numpy(np_ary, usm_type="device", sycl_queue=None):
     return Xusm
 
 
+def set_async_upload(enabled, /):
+    """
+    set_async_upload(enabled)
+
+    Toggles asynchronous copying of data from host memory into
+    :class:`dpctl.tensor.usm_ndarray`, performed by
+    :func:`dpctl.tensor.asarray` and :func:`dpctl.tensor.from_numpy`
+    given NumPy arrays, and by assignment of NumPy arrays to elements of
+    :class:`dpctl.tensor.usm_ndarray`.
+
+    By default, these functions block until the data have been copied.
+    When asynchronous copying is enabled, the upload is staged: the data
+    are first copied on the host into a temporary USM-host allocation,
+    and the copy from it into the array is submitted without waiting for
+    its completion, so that the transfer to the device may overlap with
+    other computations. Functions of :mod:`dpctl.tensor` offloading to
+    the same queue are ordered after the copy. The temporary allocation
+    is obtained from the active :class:`dpctl.memory.MemoryPool`, if any.
+
+    Staging costs a host-side copy of the data, performed before the
+    function returns. In exchange, the host array may be modified or
+    released as soon as the function returns, without waiting for the
+    transfer to complete.
+
+    The setting applies to the current context, e.g. the current thread.
+
+    Args:
+        enabled (bool):
+            Whether to copy host data asynchronously.
+
+    Returns:
+        bool:
+            Previous setting.
+    """
+    prev = _async_upload.get()
+    _async_upload.set(bool(enabled))
+    return prev
+
+
+@contextlib.contextmanager
+def async_upload(enabled=True, /):
+    """
+    async_upload(enabled=True)
+
+    Context manager toggling asynchronous copying of data from host
+    memory into :class:`dpctl.tensor.usm_ndarray`, as set by
+    :func:`dpctl.tensor.set_async_upload`, for the scope of a ``with``
+    block. The previous setting is restored on exit from the block.
+
+    :Example:
+
+        .. code-block:: python
+
+            import numpy as np
+            import dpctl.tensor as dpt
+
+            with dpt.async_upload():
+                x = dpt.asarray(np.arange(10**6))
+    """
+    token = _async_upload.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _async_upload.reset(token)
+
+
+def _staged_copy_from_numpy_into(dst, np_ary):
+    """Copies `np_ary` into USM-host allocation on the host, and submits
+    copy from it into `dst` without waiting for its completion"""
+    copy_q = dst.sycl_queue
+    stage = dpt.empty(
+        np_ary.shape, dtype=np_ary.dtype, usm_type="host", sycl_queue=copy_q
+    )
+    if np_ary.size > 0:
+        stage_np = np.ndarray(
+            np_ary.shape, dtype=np_ary.dtype, buffer=stage.usm_data
+        )
+        np.copyto(stage_np, np_ary, casting="no")
+    src = stage
+    if stage.shape != dst.shape:
+        src = dpt.broadcast_to(stage, dst.shape)
+    _manager = dpctl.utils.SequentialOrderManager[copy_q]
+    dep_ev = _manager.dependency_events
+    # the host task keeps the staging allocation alive until
+    # the copy completes
+    ht_ev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+        src=src, dst=dst, sycl_queue=copy_q, depends=dep_ev
+    )
+    _manager.add_event_pair(ht_ev, cpy_ev)
+
+
 def _copy_from_numpy_into(dst, np_ary):
     "Copies `np_ary` into `dst` of type :class:`dpctl.tensor.usm_ndarray"
     if not isinstance(np_ary, np.ndarray):
         raise TypeError(f"Expected numpy.ndarray, got {type(np_ary)}")
     if not isinstance(dst, dpt.usm_ndarray):
         raise TypeError(f"Expected usm_ndarray, got {type(dst)}")
+    copy_q = dst.sycl_queue
+    if (
+        _async_upload.get()
+        and np_ary.dtype.char in "?bBhHiIlLqQefdFD"
+        and np_ary.dtype.isnative
+    ):
+        # stage data in a type the device supports
+        Xnp = np_ary.astype(
+            _map_to_device_dtype(np_ary.dtype, copy_q), copy=False
+        )
+        # raises if shapes are not compatible
+        np.broadcast_to(Xnp, dst.shape)
+        _staged_copy_from_numpy_into(dst, Xnp)
+        return
     if np_ary.flags["OWNDATA"]:
         Xnp = np_ary
     else:
@@ -101,15 +262,14 @@ def _copy_from_numpy_into(dst, np_ary):
         else:
             Xnp = np_ary
     src_ary = np.broadcast_to(Xnp, dst.shape)
-    copy_q = dst.sycl_queue
-    if copy_q.sycl_device.has_aspect_fp64 is False:
+    if not _queue_capabilities(copy_q).has_fp64:
         src_ary_dt_c = src_ary.dtype.char
         if src_ary_dt_c == "d":
             src_ary = src_ary.astype(np.float32)
         elif src_ary_dt_c == "D":
             src_ary = src_ary.astype(np.complex64)
     _manager = dpctl.utils.SequentialOrderManager[copy_q]
-    dep_ev = _manager.submitted_events
+    dep_ev = _manager.dependency_events
     # synchronizing call
     ti._copy_numpy_ndarray_into_usm_ndarray(
         src=src_ary, dst=dst, sycl_queue=copy_q, depends=dep_ev
@@ -212,7 +372,7 @@ def _copy_overlapping(dst, src):
         buffer_ctor_kwargs={"queue": q},
     )
     _manager = dpctl.utils.SequentialOrderManager[q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     hcp1, cp1 = ti._copy_usm_ndarray_into_usm_ndarray(
         src=src, dst=tmp, sycl_queue=q, depends=dep_evs
     )
@@ -237,7 +397,7 @@ def _copy_same_shape(dst, src):
 
     copy_q = dst.sycl_queue
     _manager = dpctl.utils.SequentialOrderManager[copy_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     hev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
         src=src, dst=dst, sycl_queue=copy_q, depends=dep_evs
     )
@@ -651,10 +811,10 @@ def astype(
                 device = device.sycl_queue
             else:
                 device = dpt.Device.create_device(device).sycl_queue
-        d = device.sycl_device
+        caps = _queue_capabilities(device)
         target_dtype = _get_dtype(newdtype, device)
         if not _dtype_supported_by_device_impl(
-            target_dtype, d.has_aspect_fp16, d.has_aspect_fp64
+            target_dtype, caps.has_fp16, caps.has_fp64
         ):
             raise ValueError(
                 f"Requested dtype '{target_dtype}' is not supported by the "
@@ -712,9 +872,12 @@ def astype(
     return R
 
 
-def _extract_impl(ary, ary_mask, axis=0):
+def _extract_impl(ary, ary_mask, axis=0, deferred=False):
     """Extract elements of ary by applying mask starting from slot
-    dimension axis"""
+    dimension axis.
+
+    If deferred is true, returns DeferredSizeArray without waiting for
+    the number of set elements of the mask to be computed."""
     if not isinstance(ary, dpt.usm_ndarray):
         raise TypeError(
             f"Expecting type dpctl.tensor.usm_ndarray, got {type(ary)}"
@@ -746,7 +909,30 @@ def _extract_impl(ary, ary_mask, axis=0):
     cumsum = dpt.empty(mask_nelems, dtype=cumsum_dt, device=ary_mask.device)
     exec_q = cumsum.sycl_queue
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
+    if deferred and mask_nelems > 0:
+        # allocate for all elements to be selected, the number of
+        # selected elements remains on device
+        hev, mp_ev = ti._mask_positions_async(
+            ary_mask, cumsum, sycl_queue=exec_q, depends=dep_evs
+        )
+        _manager.add_event_pair(hev, mp_ev)
+        dst_shape = ary.shape[:pp] + (mask_nelems,) + ary.shape[pp + mask_nd :]
+        dst = dpt.empty(
+            dst_shape, dtype=ary.dtype, usm_type=dst_usm_type, device=ary.device
+        )
+        if dst.size > 0:
+            hev, ev = ti._extract(
+                src=ary,
+                cumsum=cumsum,
+                axis_start=pp,
+                axis_end=pp + mask_nd,
+                dst=dst,
+                sycl_queue=exec_q,
+                depends=[mp_ev],
+            )
+            _manager.add_event_pair(hev, ev)
+        return DeferredSizeArray(dst, _DeviceSize(cumsum), pp)
     mask_count = ti.mask_positions(
         ary_mask, cumsum, sycl_queue=exec_q, depends=dep_evs
     )
@@ -769,7 +955,11 @@ def _extract_impl(ary, ary_mask, axis=0):
     return dst
 
 
-def _nonzero_impl(ary):
+def _nonzero_impl(ary, deferred=False):
+    """Indices of non-zero elements of ary.
+
+    If deferred is true, returns DeferredSizeArray objects without
+    waiting for the number of non-zero elements to be computed."""
     if not isinstance(ary, dpt.usm_ndarray):
         raise TypeError(
             f"Expecting type dpctl.tensor.usm_ndarray, got {type(ary)}"
@@ -782,10 +972,21 @@ def _nonzero_impl(ary):
         mask_nelems, dtype=cumsum_dt, sycl_queue=exec_q, order="C"
     )
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
-    mask_count = ti.mask_positions(
-        ary, cumsum, sycl_queue=exec_q, depends=dep_evs
-    )
+    dep_evs = _manager.dependency_events
+    deferred = deferred and mask_nelems > 0
+    if deferred:
+        hev, mp_ev = ti._mask_positions_async(
+            ary, cumsum, sycl_queue=exec_q, depends=dep_evs
+        )
+        _manager.add_event_pair(hev, mp_ev)
+        # rows of index matrix are long enough for all elements
+        mask_count = mask_nelems
+        nz_deps = [mp_ev]
+    else:
+        mask_count = ti.mask_positions(
+            ary, cumsum, sycl_queue=exec_q, depends=dep_evs
+        )
+        nz_deps = []
     indexes_dt = ti.default_device_index_type(exec_q.sycl_device)
     indexes = dpt.empty(
         (ary.ndim, mask_count),
@@ -794,10 +995,14 @@ def _nonzero_impl(ary):
         sycl_queue=exec_q,
         order="C",
     )
-    hev, nz_ev = ti._nonzero(cumsum, indexes, ary.shape, exec_q)
-    res = tuple(indexes[i, :] for i in range(ary.ndim))
+    hev, nz_ev = ti._nonzero(cumsum, indexes, ary.shape, exec_q, nz_deps)
     _manager.add_event_pair(hev, nz_ev)
-    return res
+    if deferred:
+        count = _DeviceSize(cumsum)
+        return tuple(
+            DeferredSizeArray(indexes[i, :], count, 0) for i in range(ary.ndim)
+        )
+    return tuple(indexes[i, :] for i in range(ary.ndim))
 
 
 def _validate_indices(inds, queue_list, usm_type_list):
@@ -918,7 +1123,7 @@ def _take_multi_index(ary, inds, p, mode=0):
         res_shape, dtype=ary.dtype, usm_type=res_usm_type, sycl_queue=exec_q
     )
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    dep_ev = _manager.submitted_events
+    dep_ev = _manager.dependency_events
     hev, take_ev = ti._take(
         src=ary,
         ind=inds,
@@ -971,10 +1176,21 @@ def _place_impl(ary, ary_mask, vals, axis=0):
     cumsum = dpt.empty(mask_nelems, dtype=cumsum_dt, device=ary_mask.device)
     exec_q = cumsum.sycl_queue
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    dep_ev = _manager.submitted_events
-    mask_count = ti.mask_positions(
-        ary_mask, cumsum, sycl_queue=exec_q, depends=dep_ev
-    )
+    dep_ev = _manager.dependency_events
+    # position of the masked axis in vals, aligned to trailing dimensions
+    vals_p = vals.ndim - (ary_nd - mask_nd + 1) + pp
+    if vals_p < 0 or vals.shape[vals_p] == 1:
+        # vals are broadcast along the masked axis, the number of set
+        # elements of the mask is not needed on host
+        hev, mp_ev = ti._mask_positions_async(
+            ary_mask, cumsum, sycl_queue=exec_q, depends=dep_ev
+        )
+        _manager.add_event_pair(hev, mp_ev)
+        mask_count = mask_nelems
+    else:
+        mask_count = ti.mask_positions(
+            ary_mask, cumsum, sycl_queue=exec_q, depends=dep_ev
+        )
     expected_vals_shape = (
         ary.shape[:pp] + (mask_count,) + ary.shape[pp + mask_nd :]
     )
@@ -985,7 +1201,7 @@ def _place_impl(ary, ary_mask, vals, axis=0):
     rhs = dpt.broadcast_to(rhs, expected_vals_shape)
     if mask_nelems == 0:
         return
-    dep_ev = _manager.submitted_events
+    dep_ev = _manager.dependency_events
     hev, pl_ev = ti._place(
         dst=ary,
         cumsum=cumsum,
@@ -1060,7 +1276,7 @@ def _put_multi_index(ary, inds, p, vals, mode=0):
         rhs = dpt.astype(vals, ary.dtype)
     rhs = dpt.broadcast_to(rhs, expected_vals_shape)
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    dep_ev = _manager.submitted_events
+    dep_ev = _manager.dependency_events
     hev, put_ev = ti._put(
         dst=ary,
         ind=inds,
@@ -24,7 +24,7 @@ import dpctl.memory as dpm
 import dpctl.tensor as dpt
 import dpctl.tensor._tensor_impl as ti
 import dpctl.utils
-from dpctl.tensor._copy_utils import _empty_like_orderK
+from dpctl.tensor._copy_utils import _empty_like_orderK, _map_to_device_dtype
 from dpctl.tensor._data_types import _get_dtype
 from dpctl.tensor._device import normalize_queue_device
 from dpctl.tensor._usmarray import _is_object_with_buffer_protocol
@@ -165,7 +165,7 @@ def _asarray_from_usm_ndarray(
     eq = dpctl.utils.get_execution_queue([usm_ndary.sycl_queue, copy_q])
     if eq is not None:
         _manager = dpctl.utils.SequentialOrderManager[eq]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         hev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=usm_ndary, dst=res, sycl_queue=eq, depends=dep_evs
         )
@@ -176,28 +176,6 @@ def _asarray_from_usm_ndarray(
     return res
 
 
-def _map_to_device_dtype(dt, q):
-    dtc = dt.char
-    if dtc == "?" or np.issubdtype(dt, np.integer):
-        return dt
-    d = q.sycl_device
-    if np.issubdtype(dt, np.floating):
-        if dtc == "f":
-            return dt
-        if dtc == "d" and d.has_aspect_fp64:
-            return dt
-        if dtc == "e" and d.has_aspect_fp16:
-            return dt
-        return dpt.dtype("f4")
-    if np.issubdtype(dt, np.complexfloating):
-        if dtc == "F":
-            return dt
-        if dtc == "D" and d.has_aspect_fp64:
-            return dt
-        return dpt.dtype("c8")
-    raise RuntimeError(f"Unrecognized data type '{dt}' encountered.")
-
-
 def _usm_ndarray_from_suai(obj):
     sua_iface = getattr(obj, "__sycl_usm_array_interface__")
     membuf = dpm.as_usm_memory(obj)
@@ -288,7 +266,8 @@ def _ensure_native_dtype_device_support(dtype, dev) -> None:
         ValueError:
             if device does not natively support this `dtype`.
     """
-    if dtype in [dpt.float64, dpt.complex128] and not dev.has_aspect_fp64:
+    caps = dev.capabilities
+    if dtype in [dpt.float64, dpt.complex128] and not caps.has_fp64:
         raise ValueError(
             f"Device {dev.name} does not provide native support "
             "for double-precision floating point type."
@@ -298,7 +277,7 @@ def _ensure_native_dtype_device_support(dtype, dev) -> None:
         in [
             dpt.float16,
         ]
-        and not dev.has_aspect_fp16
+        and not caps.has_fp16
     ):
         raise ValueError(
             f"Device {dev.name} does not provide native support "
@@ -333,7 +312,7 @@ def _usm_types_walker(o, usm_types_list):
 def _device_copy_walker(seq_o, res, _manager):
     if isinstance(seq_o, dpt.usm_ndarray):
         exec_q = res.sycl_queue
-        deps = _manager.submitted_events
+        deps = _manager.dependency_events
         ht_ev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=seq_o, dst=res, sycl_queue=exec_q, depends=deps
         )
@@ -347,7 +326,7 @@ def _device_copy_walker(seq_o, res, _manager):
     if hasattr(seq_o, "__sycl_usm_array_interface__"):
         usm_ar = _usm_ndarray_from_suai(seq_o)
         exec_q = res.sycl_queue
-        deps = _manager.submitted_events
+        deps = _manager.dependency_events
         ht_ev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=usm_ar, dst=res, sycl_queue=exec_q, depends=deps
         )
@@ -1520,7 +1499,7 @@ def full_like(
             res = _empty_like_orderK(x, dtype, usm_type, sycl_queue)
             _manager = dpctl.utils.SequentialOrderManager[sycl_queue]
             # order copy after tasks populating X
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             hev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
                 src=X, dst=res, sycl_queue=sycl_queue, depends=dep_evs
             )
@@ -1790,7 +1769,7 @@ def tril(x, /, *, k=0):
             sycl_queue=q,
         )
         _manager = dpctl.utils.SequentialOrderManager[q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         hev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x, dst=res, sycl_queue=q, depends=dep_evs
         )
@@ -1812,7 +1791,7 @@ def tril(x, /, *, k=0):
             sycl_queue=q,
         )
         _manager = dpctl.utils.SequentialOrderManager[q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         hev, tril_ev = ti._tril(
             src=x, dst=res, k=k, sycl_queue=q, depends=dep_evs
         )
@@ -1876,7 +1855,7 @@ def triu(x, /, *, k=0):
             sycl_queue=q,
         )
         _manager = dpctl.utils.SequentialOrderManager[q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         hev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x, dst=res, sycl_queue=q, depends=dep_evs
         )
@@ -1890,7 +1869,7 @@ def triu(x, /, *, k=0):
             sycl_queue=q,
         )
         _manager = dpctl.utils.SequentialOrderManager[q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         hev, triu_ev = ti._triu(
             src=x, dst=res, k=k, sycl_queue=q, depends=dep_evs
         )
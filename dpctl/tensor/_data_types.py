@@ -21,18 +21,7 @@ from numpy import floating as np_floating
 from numpy import integer as np_integer
 from numpy import issubdtype as np_issubdtype
 
-from dpctl.tensor._tensor_impl import (
-    default_device_bool_type as ti_default_device_bool_type,
-)
-from dpctl.tensor._tensor_impl import (
-    default_device_complex_type as ti_default_device_complex_type,
-)
-from dpctl.tensor._tensor_impl import (
-    default_device_fp_type as ti_default_device_fp_type,
-)
-from dpctl.tensor._tensor_impl import (
-    default_device_int_type as ti_default_device_int_type,
-)
+from dpctl.tensor._dispatch_cache import _queue_capabilities
 
 bool = dtype("bool")
 int8 = dtype("int8")
@@ -57,21 +46,19 @@ def _get_dtype(inp_dt, sycl_obj, ref_type=None):
 
     _get_dtype is used by dpctl.tensor.asarray
     to infer data type of the output array from the
-    input sequence.
+    input sequence. Default data types are those of
+    the device of queue `sycl_obj`.
     """
     if inp_dt is None:
+        caps = _queue_capabilities(sycl_obj)
         if ref_type in [None, float] or np_issubdtype(ref_type, np_floating):
-            fp_dt = ti_default_device_fp_type(sycl_obj)
-            return dtype(fp_dt)
+            return dtype(caps.default_fp_type)
         if ref_type in [bool, np_bool_]:
-            bool_dt = ti_default_device_bool_type(sycl_obj)
-            return dtype(bool_dt)
+            return bool
         if ref_type is int or np_issubdtype(ref_type, np_integer):
-            int_dt = ti_default_device_int_type(sycl_obj)
-            return dtype(int_dt)
+            return dtype(caps.default_int_type)
         if ref_type is complex or np_issubdtype(ref_type, np_complexfloating):
-            cfp_dt = ti_default_device_complex_type(sycl_obj)
-            return dtype(cfp_dt)
+            return dtype(caps.default_complex_type)
         raise TypeError(f"Reference type {ref_type} not recognized.")
     return dtype(inp_dt)
 
@@ -17,6 +17,8 @@ import dpctl
 from dpctl._sycl_device_factory import _cached_default_device
 from dpctl._sycl_queue_manager import get_device_cached_queue
 
+from ._dispatch_cache import _queue_capabilities
+
 __doc__ = "Implementation of array API mandated Device class"
 
 
@@ -101,6 +103,14 @@ class Device:
         """
         return self.sycl_queue_.sycl_device
 
+    @property
+    def capabilities(self):
+        """
+        :class:`dpctl.DeviceCapabilities` of the device targeted by this
+        :class:`.Device`.
+        """
+        return _queue_capabilities(self.sycl_queue_)
+
     def __repr__(self):
         try:
             sd = self.sycl_device
@@ -0,0 +1,155 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import operator
+import weakref
+from collections import OrderedDict
+
+__doc__ = (
+    "Implementation module for bounded caches memoizing resolution of "
+    "data types and shapes performed by :mod:`dpctl.tensor` functions."
+)
+
+_default_maxsize = 256
+_all_caches = weakref.WeakSet()
+
+
+class DispatchCache:
+    """
+    Bounded mapping with least-recently-used eviction policy.
+
+    Values are looked up with :meth:`get`, and stored with :meth:`put`.
+    All instances are registered with the module, so that they can be
+    emptied at once by :func:`clear_dispatch_caches`.
+    """
+
+    def __init__(self, maxsize=None):
+        if maxsize is None:
+            maxsize = _default_maxsize
+        self._data = OrderedDict()
+        self._maxsize = operator.index(maxsize)
+        self.hits = 0
+        self.misses = 0
+        _all_caches.add(self)
+
+    def get(self, key, default=None):
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        while len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        """Largest number of entries retained by the cache. Zero
+        value disables caching."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        value = operator.index(value)
+        if value < 0:
+            raise ValueError("Cache size must be non-negative")
+        self._maxsize = value
+        data = self._data
+        while len(data) > value:
+            data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return (
+            f"<DispatchCache size={len(self._data)}, "
+            f"maxsize={self._maxsize}, hits={self.hits}, "
+            f"misses={self.misses}>"
+        )
+
+
+def clear_dispatch_caches():
+    """
+    clear_dispatch_caches()
+
+    Empties caches of resolved data types and shapes of
+    :mod:`dpctl.tensor` functions. Caches are to be cleared when
+    behavior of type resolution changes, e.g. after replacing
+    type promotion acceptance function of an element-wise function.
+    """
+    for c in list(_all_caches):
+        c.clear()
+
+
+def set_dispatch_cache_size(maxsize):
+    """
+    set_dispatch_cache_size(maxsize)
+
+    Sets the largest number of entries retained by each cache of
+    resolved data types and shapes of :mod:`dpctl.tensor` functions,
+    both existing and created afterwards. Zero value disables caching.
+    """
+    global _default_maxsize
+    maxsize = operator.index(maxsize)
+    if maxsize < 0:
+        raise ValueError("Cache size must be non-negative")
+    _default_maxsize = maxsize
+    for c in list(_all_caches):
+        c.maxsize = maxsize
+
+
+# Capabilities of devices of queues, which spares constructing
+# a `dpctl.SyclDevice` to look them up
+_queue_capabilities_cache = DispatchCache()
+
+
+def _queue_capabilities(q):
+    "Returns :class:`dpctl.DeviceCapabilities` of the device of queue `q`"
+    caps = _queue_capabilities_cache.get(q)
+    if caps is None:
+        caps = q.sycl_device.capabilities
+        _queue_capabilities_cache.put(q, caps)
+    return caps
+
+
+# Types of data element-wise functions can operate on only depend on
+# availability of half and double precision floating point types, and
+# Python integer scalars are resolved to the default integer type
+_device_capabilities_cache = DispatchCache()
+
+
+def _device_capabilities(q):
+    "Returns tuple of device capabilities relevant to type resolution"
+    caps = _device_capabilities_cache.get(q)
+    if caps is None:
+        d_caps = _queue_capabilities(q)
+        caps = (d_caps.has_fp16, d_caps.has_fp64, d_caps.default_int_type)
+        _device_capabilities_cache.put(q, caps)
+    return caps
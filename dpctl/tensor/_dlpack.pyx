@@ -916,7 +916,7 @@ cdef usm_ndarray _to_usm_ary_from_host_blob(object host_blob, dev : Device):
     q = dev.sycl_queue
     np_ary = np.asarray(host_blob)
     dt = np_ary.dtype
-    if dt.char in "dD" and q.sycl_device.has_aspect_fp64 is False:
+    if dt.char in "dD" and not q.sycl_device.capabilities.has_fp64:
         Xusm_dtype = (
             "float32" if dt.char == "d" else "complex64"
         )
@@ -0,0 +1,564 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import itertools
+import operator
+
+import dpctl
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_linalg_impl as tli
+from dpctl.utils import ExecutionPlacementError, SequentialOrderManager
+
+from ._dispatch_cache import DispatchCache
+from ._gemm_tuning import _dot as _gemm_dot
+from ._type_utils import _acceptance_fn_default_binary, _find_buf_dtype2
+
+__doc__ = (
+    "Implementation module for :func:`dpctl.tensor.einsum`, evaluating "
+    "Einstein summation as a sequence of pairwise contractions computed "
+    "by matrix multiplication kernels."
+)
+
+# compiled contraction plans keyed by subscripts, shapes of operands and
+# the path optimization strategy
+_einsum_plan_cache = DispatchCache()
+
+
+def _parse_term(term, ndim, pos):
+    "Returns labels of dimensions of the operand, and size of its ellipsis"
+    n_dots = term.count(".")
+    if n_dots:
+        if n_dots != 3 or "..." not in term:
+            raise ValueError(
+                f"Invalid ellipsis in subscripts of operand {pos}: '{term}'"
+            )
+        left, right = term.split("...")
+        n_ell = ndim - len(left) - len(right)
+        if n_ell < 0:
+            raise ValueError(
+                f"Operand {pos} has {ndim} dimensions, fewer than "
+                f"subscripts '{term}'"
+            )
+        # dimensions spanned by ellipsis are labeled by negative integers,
+        # so that they are aligned on the right across operands
+        labels = list(left) + list(range(-n_ell, 0)) + list(right)
+    else:
+        if len(term) != ndim:
+            raise ValueError(
+                f"Operand {pos} has {ndim} dimensions, but subscripts "
+                f"'{term}' label {len(term)}"
+            )
+        n_ell = 0
+        labels = list(term)
+    for lbl in labels:
+        if isinstance(lbl, str) and not lbl.isalpha():
+            raise ValueError(f"Invalid subscript '{lbl}' in '{term}'")
+    return labels, n_ell
+
+
+def _parse_subscripts(subscripts, shapes):
+    """Returns labels of operands, labels of the output and sizes of
+    labels"""
+    if not isinstance(subscripts, str):
+        raise TypeError(
+            f"Expected `subscripts` to be a string, got {type(subscripts)}"
+        )
+    s = subscripts.replace(" ", "")
+    if s.count("->") > 1:
+        raise ValueError("Subscripts may only contain one '->'")
+    explicit = "->" in s
+    if explicit:
+        in_s, out_s = s.split("->")
+    else:
+        in_s, out_s = s, None
+    in_terms = in_s.split(",")
+    if len(in_terms) != len(shapes):
+        raise ValueError(
+            f"Subscripts describe {len(in_terms)} operands, but "
+            f"{len(shapes)} operands were given"
+        )
+    in_labels = []
+    max_ell = 0
+    sizes = dict()
+    for pos, (term, shape) in enumerate(zip(in_terms, shapes)):
+        labels, n_ell = _parse_term(term, len(shape), pos)
+        max_ell = max(max_ell, n_ell)
+        own = dict()
+        for lbl, sz in zip(labels, shape):
+            if lbl in own and own[lbl] != sz:
+                raise ValueError(
+                    f"Dimensions of operand {pos} labeled '{lbl}' have "
+                    f"different sizes {own[lbl]} and {sz}"
+                )
+            own[lbl] = sz
+            prev = sizes.get(lbl, 1)
+            if sz != 1 and prev != 1 and sz != prev:
+                raise ValueError(
+                    f"Size {sz} of dimension labeled '{lbl}' of operand "
+                    f"{pos} is not compatible with size {prev} of the "
+                    "same label in preceding operands"
+                )
+            sizes[lbl] = max(sz, prev)
+        in_labels.append(tuple(labels))
+    ell_labels = list(range(-max_ell, 0))
+    if explicit:
+        if "..." in out_s:
+            left, right = out_s.split("...", 1)
+            if "." in left or "." in right:
+                raise ValueError(f"Invalid ellipsis in output '{out_s}'")
+            out_labels = list(left) + ell_labels + list(right)
+        else:
+            if "." in out_s:
+                raise ValueError(f"Invalid ellipsis in output '{out_s}'")
+            out_labels = list(out_s)
+        seen = set()
+        for lbl in out_labels:
+            if isinstance(lbl, str) and not lbl.isalpha():
+                raise ValueError(f"Invalid subscript '{lbl}' in output")
+            if lbl in seen:
+                raise ValueError(f"Output subscript '{lbl}' is repeated")
+            if lbl not in sizes:
+                raise ValueError(
+                    f"Output subscript '{lbl}' does not appear in the "
+                    "subscripts of operands"
+                )
+            seen.add(lbl)
+    else:
+        counts = dict()
+        for labels in in_labels:
+            for lbl in labels:
+                if isinstance(lbl, str):
+                    counts[lbl] = counts.get(lbl, 0) + 1
+        out_labels = ell_labels + sorted(
+            lbl for lbl, cnt in counts.items() if cnt == 1
+        )
+    return in_labels, tuple(out_labels), sizes
+
+
+def _unique(labels):
+    "Labels in the order of first occurrence, without repetitions"
+    return tuple(dict.fromkeys(labels))
+
+
+def _set_size(labels, sizes):
+    res = 1
+    for lbl in labels:
+        res *= sizes[lbl]
+    return res
+
+
+def _contraction(sets, i, j, output, sizes):
+    """Returns labels of the result of contraction of operands `i` and `j`,
+    and the number of multiply-add operations it performs"""
+    others = set(output)
+    for k, s in enumerate(sets):
+        if k != i and k != j:
+            others |= s
+    union = sets[i] | sets[j]
+    return union & others, _set_size(union, sizes)
+
+
+def _greedy_path(sets, output, sizes):
+    """At each step contracts the pair reducing the total size of
+    operands the most, preferring pairs with common labels over outer
+    products, and the fewest operations among equals"""
+    sets = list(sets)
+    path = []
+    while len(sets) > 1:
+        best, best_key = None, None
+        for i, j in itertools.combinations(range(len(sets)), 2):
+            new, flops = _contraction(sets, i, j, output, sizes)
+            removed = (
+                _set_size(new, sizes)
+                - _set_size(sets[i], sizes)
+                - _set_size(sets[j], sizes)
+            )
+            key = (sets[i].isdisjoint(sets[j]), removed, flops)
+            if best_key is None or key < best_key:
+                best, best_key = (i, j, new), key
+        i, j, new = best
+        path.append((i, j))
+        sets = [s for k, s in enumerate(sets) if k != i and k != j] + [new]
+    return path
+
+
+def _path_cost(sets, path, output, sizes):
+    sets = list(sets)
+    cost = 0
+    for i, j in path:
+        new, flops = _contraction(sets, i, j, output, sizes)
+        cost += flops
+        sets = [s for k, s in enumerate(sets) if k != i and k != j] + [new]
+    return cost
+
+
+def _optimal_path(sets, output, sizes):
+    """Searches all orders of pairwise contractions for the one performing
+    the fewest operations, pruning orders costlier than the best found"""
+    greedy = _greedy_path(sets, output, sizes)
+    best = [_path_cost(sets, greedy, output, sizes), greedy]
+
+    def _search(sets, cost, path):
+        if len(sets) == 1:
+            best[0], best[1] = cost, path
+            return
+        for i, j in itertools.combinations(range(len(sets)), 2):
+            new, flops = _contraction(sets, i, j, output, sizes)
+            if cost + flops >= best[0]:
+                continue
+            rest = [s for k, s in enumerate(sets) if k != i and k != j]
+            _search(rest + [new], cost + flops, path + [(i, j)])
+
+    _search(list(sets), 0, [])
+    return best[1]
+
+
+def _validate_path(path, n_ops):
+    steps = list(path)
+    if steps and steps[0] == "einsum_path":
+        steps = steps[1:]
+    res = []
+    n = n_ops
+    for step in steps:
+        try:
+            i, j = map(operator.index, step)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "Expected contraction path to be a sequence of pairs of "
+                f"operand positions, got {step}"
+            )
+        if i < 0 or j < 0 or i >= n or j >= n or i == j:
+            raise ValueError(f"Invalid contraction {step} of {n} operands")
+        res.append((min(i, j), max(i, j)))
+        n -= 1
+    if n != 1:
+        raise ValueError(
+            f"Contraction path has {len(res)} steps, while {n_ops - 1} "
+            "are needed"
+        )
+    return res
+
+
+def _optimize_key(optimize):
+    if optimize is True:
+        return "greedy"
+    if optimize is False or optimize is None:
+        return "none"
+    if isinstance(optimize, str):
+        if optimize not in ("greedy", "optimal", "none"):
+            raise ValueError(
+                "Expected `optimize` to be one of 'greedy', 'optimal', "
+                f"'none', a bool, or a contraction path, got '{optimize}'"
+            )
+        return optimize
+    try:
+        return tuple(
+            step if isinstance(step, str) else tuple(step) for step in optimize
+        )
+    except TypeError:
+        raise TypeError(
+            "Expected `optimize` to be a string, a bool, or a contraction "
+            f"path, got {type(optimize)}"
+        )
+
+
+def _make_plan(subscripts, shapes, optimize):
+    """Returns labels of operands and of the output, sizes of labels, and
+    the contraction path"""
+    in_labels, out_labels, sizes = _parse_subscripts(subscripts, shapes)
+    n_ops = len(in_labels)
+    # labels found in a single operand and not in the output are summed
+    # over before contractions
+    sets = []
+    for pos, labels in enumerate(in_labels):
+        others = set(out_labels)
+        for k, other in enumerate(in_labels):
+            if k != pos:
+                others.update(other)
+        sets.append(frozenset(lbl for lbl in labels if lbl in others))
+    if optimize == "none" or n_ops < 3:
+        path = [(0, 1)] * (n_ops - 1)
+    elif optimize == "greedy":
+        path = _greedy_path(sets, frozenset(out_labels), sizes)
+    elif optimize == "optimal":
+        path = _optimal_path(sets, frozenset(out_labels), sizes)
+    else:
+        path = _validate_path(optimize, n_ops)
+    return tuple(in_labels), out_labels, sizes, tuple(path)
+
+
+def _get_plan(subscripts, operands, optimize):
+    opt_key = _optimize_key(optimize)
+    shapes = tuple(op.shape for op in operands)
+    key = (subscripts, shapes, opt_key)
+    plan = _einsum_plan_cache.get(key)
+    if plan is None:
+        plan = _make_plan(subscripts, shapes, opt_key)
+        _einsum_plan_cache.put(key, plan)
+    return plan
+
+
+def _diagonal(x, labels):
+    "Returns view of diagonal of dimensions of `x` with repeated labels"
+    unique = _unique(labels)
+    if len(unique) == len(labels):
+        return x, labels
+    shape, strides = [], []
+    for lbl in unique:
+        axes = [i for i, other in enumerate(labels) if other == lbl]
+        shape.append(x.shape[axes[0]])
+        strides.append(sum(x.strides[i] for i in axes))
+    x_diag = dpt.usm_ndarray(
+        shape=tuple(shape),
+        dtype=x.dtype,
+        buffer=x,
+        strides=tuple(strides),
+        offset=x._element_offset,
+    )
+    return x_diag, unique
+
+
+def _sum_labels(x, labels, to_sum):
+    "Sums `x` over dimensions with labels in `to_sum`"
+    if not to_sum:
+        return x, labels
+    axes = tuple(i for i, lbl in enumerate(labels) if lbl in to_sum)
+    if x.dtype == dpt.bool:
+        res = dpt.any(x, axis=axes)
+    else:
+        res = dpt.sum(x, axis=axes, dtype=x.dtype)
+    return res, tuple(lbl for lbl in labels if lbl not in to_sum)
+
+
+def _broadcast_dims(x, labels, target_sizes):
+    "Broadcasts dimensions of `x` of size 1 to sizes of their labels"
+    shape = tuple(target_sizes.get(lbl, sz) for lbl, sz in zip(labels, x.shape))
+    if shape != x.shape:
+        x = dpt.broadcast_to(x, shape)
+    return x
+
+
+def _cast(x, dt):
+    if dt is None:
+        return x
+    return dpt.astype(x, dt)
+
+
+def _contract_pair(x1, l1, x2, l2, keep, exec_q, res_usm_type):
+    """Contracts operands `x1` and `x2` by a single call of matrix
+    multiplication kernel, keeping dimensions with labels in `keep`"""
+    x1, l1 = _sum_labels(
+        x1, l1, {lbl for lbl in l1 if lbl not in l2 and lbl not in keep}
+    )
+    x2, l2 = _sum_labels(
+        x2, l2, {lbl for lbl in l2 if lbl not in l1 and lbl not in keep}
+    )
+    batch = [lbl for lbl in l1 if lbl in l2 and lbl in keep]
+    inner = [lbl for lbl in l1 if lbl in l2 and lbl not in keep]
+    outer1 = [lbl for lbl in l1 if lbl not in l2]
+    outer2 = [lbl for lbl in l2 if lbl not in l1]
+
+    # permutations are views, strided operands are handled by the kernel
+    x1 = dpt.permute_dims(x1, [l1.index(lbl) for lbl in batch + outer1 + inner])
+    x2 = dpt.permute_dims(x2, [l2.index(lbl) for lbl in batch + inner + outer2])
+    sz1 = {lbl: x1.shape[k] for k, lbl in enumerate(batch + outer1 + inner)}
+    sz2 = {lbl: x2.shape[k] for k, lbl in enumerate(batch + inner + outer2)}
+    common = {lbl: max(sz1[lbl], sz2[lbl]) for lbl in batch + inner}
+    x1 = _broadcast_dims(x1, batch + outer1 + inner, common)
+    x2 = _broadcast_dims(x2, batch + inner + outer2, common)
+    n_inner = len(inner)
+    if n_inner == 0:
+        # outer product is computed as contraction over dimension of size 1
+        x1 = x1[..., dpt.newaxis]
+        x2 = dpt.expand_dims(x2, axis=len(batch))
+        n_inner = 1
+
+    buf1_dt, buf2_dt, res_dt = _find_buf_dtype2(
+        x1.dtype,
+        x2.dtype,
+        tli._dot_result_type,
+        exec_q.sycl_device,
+        acceptance_fn=_acceptance_fn_default_binary,
+    )
+    if res_dt is None:
+        raise TypeError(
+            "function 'einsum' does not support input types "
+            f"({x1.dtype}, {x2.dtype}), "
+            "and the inputs could not be safely coerced to any "
+            "supported types according to the casting rule ''safe''."
+        )
+    x1 = _cast(x1, buf1_dt)
+    x2 = _cast(x2, buf2_dt)
+
+    res_labels = tuple(batch + outer1 + outer2)
+    res_shape = (
+        tuple(common[lbl] for lbl in batch)
+        + tuple(sz1[lbl] for lbl in outer1)
+        + tuple(sz2[lbl] for lbl in outer2)
+    )
+    out = dpt.empty(
+        res_shape,
+        dtype=res_dt,
+        usm_type=res_usm_type,
+        sycl_queue=exec_q,
+        order="C",
+    )
+    _manager = SequentialOrderManager[exec_q]
+    ht_dot_ev, dot_ev = _gemm_dot(
+        x1=x1,
+        x2=x2,
+        batch_dims=len(batch),
+        x1_outer_dims=len(outer1),
+        x2_outer_dims=len(outer2),
+        inner_dims=n_inner,
+        dst=out,
+        sycl_queue=exec_q,
+        depends=_manager.dependency_events,
+    )
+    _manager.add_event_pair(ht_dot_ev, dot_ev)
+    return out, res_labels
+
+
+def einsum_path(subscripts, /, *operands, optimize="greedy"):
+    """einsum_path(subscripts, *operands, optimize="greedy")
+
+    Returns the order of pairwise contractions :func:`dpctl.tensor.einsum`
+    performs to evaluate the Einstein summation.
+
+    Args:
+        subscripts (str):
+            subscripts of the summation, see :func:`dpctl.tensor.einsum`.
+        operands (usm_ndarray):
+            input arrays.
+        optimize (Union[str, bool, Sequence[Tuple[int, int]]]):
+            path optimization strategy, see :func:`dpctl.tensor.einsum`.
+            Default: ``"greedy"``.
+
+    Returns:
+        List[Tuple[int, int]]:
+            contraction path. Each step contracts operands at the given
+            positions in the list of remaining operands, removes them from
+            the list and appends the result to its end.
+    """
+    for op in operands:
+        if not isinstance(op, dpt.usm_ndarray):
+            raise TypeError(
+                f"Expected dpctl.tensor.usm_ndarray, got {type(op)}"
+            )
+    _, _, _, path = _get_plan(subscripts, operands, optimize)
+    return list(path)
+
+
+def einsum(subscripts, /, *operands, optimize="greedy"):
+    """einsum(subscripts, *operands, optimize="greedy")
+
+    Evaluates the Einstein summation convention on the operands.
+
+    Subscripts are letters labeling dimensions of each operand, separated
+    by commas, optionally followed by ``->`` and labels of dimensions of
+    the output. Dimensions with repeated labels within an operand are
+    taken along their diagonal, and labels absent from the output are
+    summed over. Without ``->``, the output is labeled by letters appearing
+    exactly once, in alphabetical order. An ellipsis ``...`` stands for
+    dimensions broadcast across operands, and precedes other dimensions of
+    the output if it is not given explicitly.
+
+    Operands are contracted pairwise, each contraction performed by a
+    single call of the batched matrix multiplication kernel used by
+    :func:`dpctl.tensor.matmul`, with dimensions of operands permuted
+    without copying data. The order of contractions is chosen according to
+    `optimize`, and memoized for given subscripts and shapes of operands.
+
+    Args:
+        subscripts (str):
+            subscripts of the summation, e.g. ``"ij,jk->ik"``.
+        operands (usm_ndarray):
+            input arrays.
+        optimize (Union[str, bool, Sequence[Tuple[int, int]]]):
+            path optimization strategy. ``"greedy"`` (or ``True``) contracts
+            at each step the pair of operands reducing the total size of
+            operands the most. ``"optimal"`` searches all orders of
+            contractions for the one performing the fewest operations,
+            which takes time growing factorially with the number of
+            operands. ``"none"`` (or ``False``) contracts operands from left
+            to right. A sequence of pairs of positions, e.g. returned by
+            :func:`dpctl.tensor.einsum_path`, gives the path explicitly.
+            Default: ``"greedy"``.
+
+    Returns:
+        usm_ndarray:
+            result of the summation, whose data type is determined by the
+            Type Promotion Rules. The returned array does not share memory
+            with operands.
+    """
+    if len(operands) == 0:
+        raise ValueError("At least one operand is required")
+    for op in operands:
+        if not isinstance(op, dpt.usm_ndarray):
+            raise TypeError(
+                f"Expected dpctl.tensor.usm_ndarray, got {type(op)}"
+            )
+    exec_q = dpctl.utils.get_execution_queue([op.sycl_queue for op in operands])
+    if exec_q is None:
+        raise ExecutionPlacementError(
+            "Execution placement can not be unambiguously inferred "
+            "from input arguments."
+        )
+    res_usm_type = dpctl.utils.get_coerced_usm_type(
+        [op.usm_type for op in operands]
+    )
+    dpctl.utils.validate_usm_type(res_usm_type, allow_none=False)
+
+    in_labels, out_labels, sizes, path = _get_plan(
+        subscripts, operands, optimize
+    )
+    out_set = set(out_labels)
+
+    # operands paired with their labels, and whether the array was
+    # computed, rather than being a view of the input
+    ops = []
+    for pos, (op, labels) in enumerate(zip(operands, in_labels)):
+        x, labels = _diagonal(op, labels)
+        others = set(out_set)
+        for k, other in enumerate(in_labels):
+            if k != pos:
+                others.update(other)
+        to_sum = {lbl for lbl in labels if lbl not in others}
+        x, labels = _sum_labels(x, labels, to_sum)
+        ops.append((x, labels, bool(to_sum)))
+
+    for i, j in path:
+        x1, l1, _ = ops[i]
+        x2, l2, _ = ops[j]
+        ops = [op for k, op in enumerate(ops) if k != i and k != j]
+        keep = set(out_set)
+        for _, labels, _ in ops:
+            keep.update(labels)
+        res, labels = _contract_pair(x1, l1, x2, l2, keep, exec_q, res_usm_type)
+        ops.append((res, labels, True))
+
+    ((res, labels, computed),) = ops
+    to_sum = {lbl for lbl in labels if lbl not in out_set}
+    res, labels = _sum_labels(res, labels, to_sum)
+    computed = computed or bool(to_sum)
+    res = dpt.permute_dims(res, [labels.index(lbl) for lbl in out_labels])
+    res_shape = tuple(sizes[lbl] for lbl in out_labels)
+    if res.shape != res_shape:
+        res = dpt.broadcast_to(res, res_shape)
+        computed = False
+    if not computed:
+        res = dpt.copy(res, order="K")
+    return res
@@ -27,6 +27,13 @@ from dpctl.tensor._usmarray import _is_object_with_buffer_protocol as _is_buffer
 from dpctl.utils import ExecutionPlacementError, SequentialOrderManager
 
 from ._copy_utils import _empty_like_orderK, _empty_like_pair_orderK
+from ._dispatch_cache import DispatchCache, _device_capabilities
+from ._lazy import (
+    DeferredSizeArray,
+    LazyArray,
+    _deferred_operands,
+    _is_lazy_mode,
+)
 from ._type_utils import (
     WeakBooleanType,
     WeakComplexType,
@@ -38,6 +45,7 @@ from ._type_utils import (
     _find_buf_dtype,
     _find_buf_dtype2,
     _find_buf_dtype_in_place_op,
+    _is_weak_dtype,
     _resolve_weak_types,
     _to_device_supported_dtype,
 )
@@ -102,6 +110,7 @@ class UnaryElementwiseFunc:
             self.acceptance_fn_ = acceptance_fn
         else:
             self.acceptance_fn_ = _acceptance_fn_default_unary
+        self._dispatch_cache = DispatchCache()
 
     def __str__(self):
         return f"<{self.__name__} '{self.name_}'>"
@@ -176,12 +185,11 @@ class UnaryElementwiseFunc:
             self.types_ = types
         return types
 
-    def __call__(self, x, /, *, out=None, order="K"):
-        if not isinstance(x, dpt.usm_ndarray):
-            raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
-
-        if order not in ["C", "F", "K", "A"]:
-            order = "K"
+    def _resolve_dtypes(self, x):
+        key = (x.dtype, _device_capabilities(x.sycl_queue))
+        resolved = self._dispatch_cache.get(key)
+        if resolved is not None:
+            return resolved
         buf_dt, res_dt = _find_buf_dtype(
             x.dtype,
             self.result_type_resolver_fn_,
@@ -195,6 +203,34 @@ class UnaryElementwiseFunc:
                 "and the input could not be safely coerced to any "
                 "supported types according to the casting rule ''safe''."
             )
+        resolved = (buf_dt, res_dt)
+        self._dispatch_cache.put(key, resolved)
+        return resolved
+
+    def __call__(self, x, /, *, out=None, order="K"):
+        if isinstance(x, LazyArray):
+            if out is None:
+                if order not in ["C", "F", "K", "A"]:
+                    order = "K"
+                _, res_dt = self._resolve_dtypes(x)
+                deferred, (x,) = _deferred_operands((x,), (None,))
+                res = LazyArray(
+                    self, (x,), order, x.shape, res_dt, x.sycl_queue, x.usm_type
+                )
+                if deferred is not None:
+                    return deferred._with_buffer(res)
+                return res
+            x = x.materialize()
+        if not isinstance(x, dpt.usm_ndarray):
+            raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
+
+        if order not in ["C", "F", "K", "A"]:
+            order = "K"
+        buf_dt, res_dt = self._resolve_dtypes(x)
+        if out is None and _is_lazy_mode():
+            return LazyArray(
+                self, (x,), order, x.shape, res_dt, x.sycl_queue, x.usm_type
+            )
 
         orig_out = out
         if out is not None:
@@ -247,7 +283,7 @@ class UnaryElementwiseFunc:
                         order = "F" if x.flags.f_contiguous else "C"
                     out = dpt.empty_like(x, dtype=res_dt, order=order)
 
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             ht_unary_ev, unary_ev = self.unary_fn_(
                 x, out, sycl_queue=exec_q, depends=dep_evs
             )
@@ -270,7 +306,7 @@ class UnaryElementwiseFunc:
                 order = "F" if x.flags.f_contiguous else "C"
             buf = dpt.empty_like(x, dtype=buf_dt, order=order)
 
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x, dst=buf, sycl_queue=exec_q, depends=dep_evs
         )
@@ -291,7 +327,7 @@ class UnaryElementwiseFunc:
 
 def _get_queue_usm_type(o):
     """Return SYCL device where object `o` allocated memory, or None."""
-    if isinstance(o, dpt.usm_ndarray):
+    if isinstance(o, (dpt.usm_ndarray, LazyArray)):
         return o.sycl_queue, o.usm_type
     elif hasattr(o, "__sycl_usm_array_interface__"):
         try:
@@ -303,7 +339,7 @@ def _get_queue_usm_type(o):
 
 
 def _get_dtype(o, dev):
-    if isinstance(o, dpt.usm_ndarray):
+    if isinstance(o, (dpt.usm_ndarray, LazyArray)):
         return o.dtype
     if hasattr(o, "__sycl_usm_array_interface__"):
         return dpt.asarray(o).dtype
@@ -352,7 +388,7 @@ def _validate_dtype(dt) -> bool:
 
 
 def _get_shape(o):
-    if isinstance(o, dpt.usm_ndarray):
+    if isinstance(o, (dpt.usm_ndarray, LazyArray)):
         return o.shape
     if _is_buffer(o):
         return memoryview(o).shape
@@ -361,6 +397,40 @@ def _get_shape(o):
     return getattr(o, "shape", tuple())
 
 
+_array_types = (dpt.usm_ndarray, LazyArray)
+_placement_cache = DispatchCache()
+_broadcast_shape_cache = DispatchCache()
+
+
+def _dtype_kind_key(dt):
+    "Key representing data type `dt` in caches of resolved data types"
+    if isinstance(dt, dpt.dtype):
+        return dt
+    # weak types are resolved according to their kind
+    return type(dt)
+
+
+def _broadcast_shape_pair(o1_shape, o2_shape):
+    key = (tuple(o1_shape), tuple(o2_shape))
+    res_shape = _broadcast_shape_cache.get(key)
+    if res_shape is not None:
+        return res_shape
+    try:
+        res_shape = _broadcast_shape_impl(
+            [
+                o1_shape,
+                o2_shape,
+            ]
+        )
+    except ValueError:
+        raise ValueError(
+            "operands could not be broadcast together with shapes "
+            f"{o1_shape} and {o2_shape}"
+        )
+    _broadcast_shape_cache.put(key, res_shape)
+    return res_shape
+
+
 class BinaryElementwiseFunc:
     """
     Class that implements binary element-wise functions.
@@ -441,6 +511,7 @@ class BinaryElementwiseFunc:
             self.weak_type_resolver_ = weak_type_resolver
         else:
             self.weak_type_resolver_ = _resolve_weak_types
+        self._dispatch_cache = DispatchCache()
 
     def __str__(self):
         return f"<{self.__name__} '{self.name_}'>"
@@ -548,11 +619,14 @@ class BinaryElementwiseFunc:
             self.types_ = types
         return types
 
-    def __call__(self, o1, o2, /, *, out=None, order="K"):
-        if order not in ["K", "C", "F", "A"]:
-            order = "K"
+    def _resolve_placement(self, o1, o2):
+        """Infers execution queue and USM type of the result"""
         q1, o1_usm_type = _get_queue_usm_type(o1)
         q2, o2_usm_type = _get_queue_usm_type(o2)
+        key = ("placement", q1, o1_usm_type, q2, o2_usm_type)
+        resolved = _placement_cache.get(key)
+        if resolved is not None:
+            return resolved
         if q1 is None and q2 is None:
             raise ExecutionPlacementError(
                 "Execution placement can not be unambiguously inferred "
@@ -580,35 +654,44 @@ class BinaryElementwiseFunc:
                 )
             )
         dpctl.utils.validate_usm_type(res_usm_type, allow_none=False)
-        o1_shape = _get_shape(o1)
-        o2_shape = _get_shape(o2)
-        if not all(
-            isinstance(s, (tuple, list))
-            for s in (
-                o1_shape,
-                o2_shape,
-            )
-        ):
-            raise TypeError(
-                "Shape of arguments can not be inferred. "
-                "Arguments are expected to be "
-                "lists, tuples, or both"
-            )
-        try:
-            res_shape = _broadcast_shape_impl(
-                [
-                    o1_shape,
-                    o2_shape,
-                ]
-            )
-        except ValueError:
-            raise ValueError(
-                "operands could not be broadcast together with shapes "
-                f"{o1_shape} and {o2_shape}"
+        resolved = (exec_q, res_usm_type)
+        _placement_cache.put(key, resolved)
+        return resolved
+
+    def _resolve_dtypes(self, o1, o2, exec_q):
+        """Infers data types of arguments, of buffers the arguments
+        need to be cast to, and of the result"""
+        sycl_dev = None
+        if isinstance(o1, _array_types):
+            o1_dtype = o1.dtype
+        else:
+            sycl_dev = exec_q.sycl_device
+            o1_dtype = _get_dtype(o1, sycl_dev)
+        if isinstance(o2, _array_types):
+            o2_dtype = o2.dtype
+        else:
+            if sycl_dev is None:
+                sycl_dev = exec_q.sycl_device
+            o2_dtype = _get_dtype(o2, sycl_dev)
+        if (
+            _is_weak_dtype(o1_dtype) or _is_weak_dtype(o2_dtype)
+        ) and self.weak_type_resolver_ is not _resolve_weak_types:
+            # resolution may depend on values of Python scalars
+            if not all(_validate_dtype(o) for o in (o1_dtype, o2_dtype)):
+                raise ValueError("Operands have unsupported data types")
+            o1_dtype, o2_dtype = self.weak_type_resolver_(
+                o1_dtype, o2_dtype, sycl_dev
             )
-        sycl_dev = exec_q.sycl_device
-        o1_dtype = _get_dtype(o1, sycl_dev)
-        o2_dtype = _get_dtype(o2, sycl_dev)
+        key = (
+            _dtype_kind_key(o1_dtype),
+            _dtype_kind_key(o2_dtype),
+            _device_capabilities(exec_q),
+        )
+        resolved = self._dispatch_cache.get(key)
+        if resolved is not None:
+            return resolved
+        if sycl_dev is None:
+            sycl_dev = exec_q.sycl_device
         if not all(_validate_dtype(o) for o in (o1_dtype, o2_dtype)):
             raise ValueError("Operands have unsupported data types")
 
@@ -631,6 +714,89 @@ class BinaryElementwiseFunc:
                 "and the inputs could not be safely coerced to any "
                 "supported types according to the casting rule ''safe''."
             )
+        resolved = (o1_dtype, o2_dtype, buf1_dt, buf2_dt, res_dt)
+        self._dispatch_cache.put(key, resolved)
+        return resolved
+
+    def _resolve_call(self, o1, o2):
+        """Infers execution placement, shape and data types of the result
+        of this function applied to `o1` and `o2`"""
+        exec_q, res_usm_type = self._resolve_placement(o1, o2)
+        o1_shape = _get_shape(o1)
+        o2_shape = _get_shape(o2)
+        if not all(
+            isinstance(s, (tuple, list))
+            for s in (
+                o1_shape,
+                o2_shape,
+            )
+        ):
+            raise TypeError(
+                "Shape of arguments can not be inferred. "
+                "Arguments are expected to be "
+                "lists, tuples, or both"
+            )
+        res_shape = _broadcast_shape_pair(o1_shape, o2_shape)
+        (
+            o1_dtype,
+            o2_dtype,
+            buf1_dt,
+            buf2_dt,
+            res_dt,
+        ) = self._resolve_dtypes(o1, o2, exec_q)
+        return (
+            exec_q,
+            res_usm_type,
+            res_shape,
+            o1_dtype,
+            o2_dtype,
+            buf1_dt,
+            buf2_dt,
+            res_dt,
+        )
+
+    def __call__(self, o1, o2, /, *, out=None, order="K"):
+        if order not in ["K", "C", "F", "A"]:
+            order = "K"
+        lazy_args = isinstance(o1, LazyArray) or isinstance(o2, LazyArray)
+        deferred = None
+        if lazy_args:
+            if out is not None:
+                if isinstance(o1, LazyArray):
+                    o1 = o1.materialize()
+                if isinstance(o2, LazyArray):
+                    o2 = o2.materialize()
+            elif isinstance(o1, DeferredSizeArray) or isinstance(
+                o2, DeferredSizeArray
+            ):
+                # compute over allocations of deferred-size arrays
+                deferred, (o1, o2) = _deferred_operands(
+                    (o1, o2), (_get_shape(o1), _get_shape(o2))
+                )
+        (
+            exec_q,
+            res_usm_type,
+            res_shape,
+            o1_dtype,
+            o2_dtype,
+            buf1_dt,
+            buf2_dt,
+            res_dt,
+        ) = self._resolve_call(o1, o2)
+
+        if out is None and (lazy_args or _is_lazy_mode()):
+            res = LazyArray(
+                self,
+                (o1, o2),
+                order,
+                res_shape,
+                res_dt,
+                exec_q,
+                res_usm_type,
+            )
+            if deferred is not None:
+                return deferred._with_buffer(res)
+            return res
 
         orig_out = out
         _manager = SequentialOrderManager[exec_q]
@@ -685,7 +851,7 @@ class BinaryElementwiseFunc:
                         if buf2_dt is None:
                             if src2.shape != res_shape:
                                 src2 = dpt.broadcast_to(src2, res_shape)
-                            dep_evs = _manager.submitted_events
+                            dep_evs = _manager.dependency_events
                             ht_, comp_ev = self.binary_inplace_fn_(
                                 lhs=o1,
                                 rhs=src2,
@@ -695,7 +861,7 @@ class BinaryElementwiseFunc:
                             _manager.add_event_pair(ht_, comp_ev)
                         else:
                             buf2 = dpt.empty_like(src2, dtype=buf2_dt)
-                            dep_evs = _manager.submitted_events
+                            dep_evs = _manager.dependency_events
                             (
                                 ht_copy_ev,
                                 copy_ev,
@@ -768,7 +934,7 @@ class BinaryElementwiseFunc:
                 src1 = dpt.broadcast_to(src1, res_shape)
             if src2.shape != res_shape:
                 src2 = dpt.broadcast_to(src2, res_shape)
-            deps_ev = _manager.submitted_events
+            deps_ev = _manager.dependency_events
             ht_binary_ev, binary_ev = self.binary_fn_(
                 src1=src1,
                 src2=src2,
@@ -793,7 +959,7 @@ class BinaryElementwiseFunc:
                 buf2 = _empty_like_orderK(src2, buf2_dt)
             else:
                 buf2 = dpt.empty_like(src2, dtype=buf2_dt, order=order)
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
                 src=src2, dst=buf2, sycl_queue=exec_q, depends=dep_evs
             )
@@ -839,7 +1005,7 @@ class BinaryElementwiseFunc:
                 buf1 = _empty_like_orderK(src1, buf1_dt)
             else:
                 buf1 = dpt.empty_like(src1, dtype=buf1_dt, order=order)
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
                 src=src1, dst=buf1, sycl_queue=exec_q, depends=dep_evs
             )
@@ -890,7 +1056,7 @@ class BinaryElementwiseFunc:
             buf1 = _empty_like_orderK(src1, buf1_dt)
         else:
             buf1 = dpt.empty_like(src1, dtype=buf1_dt, order=order)
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_copy1_ev, copy1_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=src1, dst=buf1, sycl_queue=exec_q, depends=dep_evs
         )
@@ -1033,7 +1199,7 @@ class BinaryElementwiseFunc:
         if buf_dt is None:
             if src2.shape != res_shape:
                 src2 = dpt.broadcast_to(src2, res_shape)
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             ht_, comp_ev = self.binary_inplace_fn_(
                 lhs=o1,
                 rhs=src2,
@@ -1043,7 +1209,7 @@ class BinaryElementwiseFunc:
             _manager.add_event_pair(ht_, comp_ev)
         else:
             buf = dpt.empty_like(src2, dtype=buf_dt)
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             (
                 ht_copy_ev,
                 copy_ev,
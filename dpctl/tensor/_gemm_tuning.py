@@ -0,0 +1,315 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+import dpctl
+import dpctl.tensor._tensor_linalg_impl as tli
+
+from ._dispatch_cache import _queue_capabilities
+
+__doc__ = (
+    "Implementation module for autotuning of work-group tiling of "
+    "matrix multiplication kernels used by :func:`dpctl.tensor.matmul`, "
+    ":func:`dpctl.tensor.tensordot` and :func:`dpctl.tensor.vecdot`."
+)
+
+_default_tuning = (0, 0, 0)
+
+# candidate (nm_wg_delta_m, nm_wi_delta_k, k_n_wi) triples, zero keeps
+# the default chosen by the kernel
+_nm_candidates = tuple(
+    (wg_delta_m, wi_delta_k, 0)
+    for wg_delta_m in (2, 4, 8, 16, 32)
+    for wi_delta_k in (0, 32, 16)
+)
+_k_candidates = tuple((0, 0, n_wi) for n_wi in (16, 32, 128))
+# rows of the left-hand side matrix processed by a work-group of kernels
+# tiling N and M, which have `_nm_wg_delta_n * nm_wg_delta_m` work-items
+_nm_wg_delta_n = 16
+
+_benchmark_repeats = 3
+_file_format_version = 1
+
+_lock = threading.Lock()
+_tuning_db = dict()
+_device_keys = dict()
+_autotuning = os.environ.get("DPCTL_GEMM_AUTOTUNE", "0") not in ("", "0")
+_tuning_file = os.environ.get("DPCTL_GEMM_TUNING_FILE", None) or None
+
+
+def _read_tuning_file(path):
+    try:
+        with open(path, "r") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return dict()
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _file_format_version
+    ):
+        return dict()
+    entries = data.get("entries", dict())
+    res = dict()
+    if isinstance(entries, dict):
+        for k, v in entries.items():
+            if (
+                isinstance(v, list)
+                and len(v) == 3
+                and all(isinstance(el, int) and el >= 0 for el in v)
+            ):
+                res[k] = tuple(v)
+    return res
+
+
+def _write_tuning_file(path, entries):
+    dir_name = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dir_name, exist_ok=True)
+    merged = _read_tuning_file(path)
+    merged.update(entries)
+    data = {
+        "version": _file_format_version,
+        "entries": {k: list(v) for k, v in sorted(merged.items())},
+    }
+    fd, tmp_name = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            json.dump(data, fh, indent=1)
+        os.replace(tmp_name, path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+if _tuning_file is not None:
+    _tuning_db.update(_read_tuning_file(_tuning_file))
+
+
+def set_gemm_autotuning(enabled):
+    """
+    set_gemm_autotuning(enabled)
+
+    Enables or disables autotuning of matrix multiplication kernels.
+
+    When enabled, the first call of :func:`dpctl.tensor.matmul`,
+    :func:`dpctl.tensor.tensordot` or :func:`dpctl.tensor.vecdot`
+    for a combination of device, data type of the result and sizes of the
+    problem, rounded to powers of two, benchmarks several work-group tilings
+    of the kernel, blocking until they complete, and records the fastest.
+    Later calls for the same combination use the recorded tiling without
+    benchmarking. Recorded tilings are also stored in the tuning file, if
+    one is set, see :func:`set_gemm_tuning_file`.
+
+    Autotuning is disabled by default, unless ``DPCTL_GEMM_AUTOTUNE``
+    environment variable is set to a non-zero value. Tilings already
+    recorded are used regardless of this setting.
+
+    Args:
+        enabled (bool):
+            Whether to benchmark tilings of not yet tuned problems.
+
+    Returns:
+        bool:
+            Previous setting.
+    """
+    global _autotuning
+    prev = _autotuning
+    _autotuning = bool(enabled)
+    return prev
+
+
+def get_gemm_tuning_file():
+    """
+    get_gemm_tuning_file()
+
+    Returns the path of the file storing tilings of matrix multiplication
+    kernels found by autotuning, or ``None`` if tilings are only kept in
+    memory of the process.
+
+    The file is initially given by ``DPCTL_GEMM_TUNING_FILE`` environment
+    variable.
+
+    Returns:
+        Optional[str]:
+            Path of the tuning file.
+    """
+    return _tuning_file
+
+
+def set_gemm_tuning_file(path):
+    """
+    set_gemm_tuning_file(path)
+
+    Sets the file storing tilings of matrix multiplication kernels found by
+    autotuning. Tilings recorded in the file, if it exists, are loaded and
+    used by subsequent calls. Newly found tilings are merged into the file.
+
+    Args:
+        path (Optional[str, os.PathLike]):
+            Path of the tuning file. ``None`` stops persisting tilings.
+    """
+    global _tuning_file
+    if path is None:
+        _tuning_file = None
+        return
+    path = os.fspath(path)
+    entries = _read_tuning_file(path)
+    with _lock:
+        _tuning_file = path
+        _tuning_db.update(entries)
+
+
+def clear_gemm_tuning(on_disk=False):
+    """
+    clear_gemm_tuning(on_disk=False)
+
+    Forgets tilings of matrix multiplication kernels recorded in the
+    process, so that they are tuned again if autotuning is enabled.
+
+    Args:
+        on_disk (bool):
+            If ``True``, the tuning file, if set, is also removed.
+            Default: ``False``.
+    """
+    with _lock:
+        _tuning_db.clear()
+        _device_keys.clear()
+    path = _tuning_file
+    if on_disk and path is not None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _device_key(q):
+    key = _device_keys.get(q, None)
+    if key is None:
+        d = q.sycl_device
+        key = "|".join(
+            (d.backend.name, d.name, d.driver_version, d.device_type.name)
+        )
+        _device_keys[q] = key
+    return key
+
+
+def _prod(seq):
+    res = 1
+    for el in seq:
+        res *= el
+    return res
+
+
+def _problem_sizes(x1, x2, batch_dims, x1_outer_dims, x2_outer_dims):
+    sh1 = x1.shape
+    sh2 = x2.shape
+    n = _prod(sh1[batch_dims : batch_dims + x1_outer_dims])
+    k = _prod(sh1[batch_dims + x1_outer_dims :])
+    m = _prod(sh2[len(sh2) - x2_outer_dims :])
+    return n, k, m
+
+
+def _candidates(q, n, m):
+    # mirrors selection of kernel in gemm.hpp: the tiling along K is used
+    # when right-hand side has few columns, unless the problem is large
+    min_nm, max_nm = min(n, m), max(n, m)
+    if m < 4 and max_nm < (64 * 1024) // min_nm:
+        return (_default_tuning,) + _k_candidates
+    max_wg = _queue_capabilities(q).max_work_group_size
+    return (_default_tuning,) + tuple(
+        c for c in _nm_candidates if _nm_wg_delta_n * c[0] <= max_wg
+    )
+
+
+def _benchmark(dot_kw, candidates):
+    best, best_t = _default_tuning, None
+    for tuning in candidates:
+        t = None
+        try:
+            for _ in range(_benchmark_repeats):
+                t0 = time.perf_counter()
+                ht_ev, ev = tli._dot(**dot_kw, depends=[], tuning=tuning)
+                ev.wait()
+                t1 = time.perf_counter()
+                ht_ev.wait()
+                t = (t1 - t0) if t is None else min(t, t1 - t0)
+        except (RuntimeError, ValueError):
+            # tiling can not be launched on the device, skip it
+            continue
+        if best_t is None or t < best_t:
+            best, best_t = tuning, t
+    return best
+
+
+def _dot(
+    *,
+    x1,
+    x2,
+    batch_dims,
+    x1_outer_dims,
+    x2_outer_dims,
+    inner_dims,
+    dst,
+    sycl_queue,
+    depends,
+):
+    """Submits ``tli._dot`` with tiling of GEMM kernel found by autotuning,
+    returns pair of host task event and event of the computation."""
+    dot_kw = dict(
+        x1=x1,
+        x2=x2,
+        batch_dims=batch_dims,
+        x1_outer_dims=x1_outer_dims,
+        x2_outer_dims=x2_outer_dims,
+        inner_dims=inner_dims,
+        dst=dst,
+        sycl_queue=sycl_queue,
+    )
+    if not (_tuning_db or _autotuning):
+        return tli._dot(**dot_kw, depends=depends)
+    n, k, m = _problem_sizes(x1, x2, batch_dims, x1_outer_dims, x2_outer_dims)
+    if (n == 1 and m == 1) or n * k * m == 0 or dst.size == 0:
+        # reduction kernel is used, which has no tunable tiling
+        return tli._dot(**dot_kw, depends=depends)
+    key = "{}|{}|{},{},{}".format(
+        _device_key(sycl_queue),
+        dst.dtype.name,
+        n.bit_length(),
+        k.bit_length(),
+        m.bit_length(),
+    )
+    tuning = _tuning_db.get(key, None)
+    if tuning is None:
+        if not _autotuning:
+            return tli._dot(**dot_kw, depends=depends)
+        # dependencies are not passed for in-order queues, wait for all
+        # submitted tasks so that they are not timed with the candidates
+        dpctl.SyclEvent.wait_for(depends)
+        sycl_queue.wait()
+        tuning = _benchmark(dot_kw, _candidates(sycl_queue, n, m))
+        with _lock:
+            _tuning_db[key] = tuning
+            path = _tuning_file
+        if path is not None:
+            _write_tuning_file(path, {key: tuning})
+        depends = []
+    return tli._dot(**dot_kw, depends=depends, tuning=tuning)
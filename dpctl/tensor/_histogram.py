@@ -0,0 +1,347 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import math
+import operator
+from typing import NamedTuple
+
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_impl as ti
+import dpctl.tensor._tensor_reductions_impl as tri
+import dpctl.utils as du
+from dpctl.utils import ExecutionPlacementError
+
+__doc__ = (
+    "Implementation module for functions counting elements of an array per "
+    "bin: :func:`dpctl.tensor.bincount` and :func:`dpctl.tensor.histogram`."
+)
+
+
+class HistogramResult(NamedTuple):
+    hist: dpt.usm_ndarray
+    bin_edges: dpt.usm_ndarray
+
+
+def _execution_placement(arrays):
+    exec_q = du.get_execution_queue(tuple(a.sycl_queue for a in arrays))
+    if exec_q is None:
+        raise ExecutionPlacementError(
+            "Execution placement can not be unambiguously inferred "
+            "from input arguments."
+        )
+    res_usm_type = du.get_coerced_usm_type(tuple(a.usm_type for a in arrays))
+    du.validate_usm_type(res_usm_type, allow_none=False)
+    return exec_q, res_usm_type
+
+
+def _weights_result_dtype(w_dt, q):
+    """Data type of sums of weights of type `w_dt` on queue `q`"""
+    if w_dt.kind == "c" or (w_dt.kind == "f" and w_dt.itemsize >= 4):
+        return w_dt
+    return dpt.dtype(ti.default_device_fp_type(q))
+
+
+def _validate_weights(weights, x):
+    if not isinstance(weights, dpt.usm_ndarray):
+        raise TypeError(
+            f"Expected dpctl.tensor.usm_ndarray, got {type(weights)}"
+        )
+    if weights.shape != x.shape:
+        raise ValueError(
+            "`weights` must have the same shape as the input array, "
+            f"got {weights.shape} and {x.shape}"
+        )
+
+
+def _histogram_with_atomics(fn, supported_fn, res_dt, nbins, usm_type, q, kw):
+    """Accumulates histogram by the kernel `fn`, returns `None` if atomic
+    operations on the result are not supported by the device"""
+    if kw["x"].size == 0:
+        return dpt.zeros(nbins, dtype=res_dt, usm_type=usm_type, sycl_queue=q)
+    if supported_fn(usm_type):
+        tmp_usm_type = usm_type
+    elif usm_type != "device" and supported_fn("device"):
+        # atomics are only supported on device allocations
+        tmp_usm_type = "device"
+    else:
+        return None
+    res = dpt.empty(nbins, dtype=res_dt, usm_type=tmp_usm_type, sycl_queue=q)
+    _manager = du.SequentialOrderManager[q]
+    dep_evs = _manager.dependency_events
+    ht_e, hist_e = fn(**kw, dst=res, sycl_queue=q, depends=dep_evs)
+    _manager.add_event_pair(ht_e, hist_e)
+    if tmp_usm_type != usm_type:
+        res = dpt.asarray(res, usm_type=usm_type, sycl_queue=q)
+    return res
+
+
+def _histogram_by_sorting(bin_ids, weights, res_dt, nbins):
+    """Counts elements per bin, or sums their weights, by sorting indices of
+    bins `bin_ids`, where indices outside of `[0, nbins)` are not counted"""
+    q = bin_ids.sycl_queue
+    usm_type = bin_ids.usm_type
+    bin_starts = dpt.arange(
+        nbins + 1, dtype=bin_ids.dtype, usm_type=usm_type, sycl_queue=q
+    )
+    if weights is None:
+        sorted_ids = dpt.sort(bin_ids)
+        pos = dpt.searchsorted(sorted_ids, bin_starts, side="left")
+        return dpt.astype(pos[1:] - pos[:-1], res_dt)
+    order = dpt.argsort(bin_ids)
+    sorted_ids = dpt.take(bin_ids, order)
+    pos = dpt.searchsorted(sorted_ids, bin_starts, side="left")
+    cum_w = dpt.cumulative_sum(
+        dpt.take(dpt.astype(weights, res_dt, copy=False), order),
+        include_initial=True,
+    )
+    return dpt.take(cum_w, pos[1:]) - dpt.take(cum_w, pos[:-1])
+
+
+def bincount(x, /, weights=None, *, minlength=0):
+    """bincount(x, weights=None, minlength=0)
+
+    Counts occurrences of each value in the array of non-negative integers
+    `x`.
+
+    Args:
+        x (usm_ndarray):
+            one-dimensional input array of non-negative integers. Must have
+            a boolean or integral data type.
+        weights (Optional[usm_ndarray]):
+            array of the same shape as `x`. If given, the result for value
+            `n` is the sum of weights of elements of `x` equal to `n`,
+            rather than their number. Default: `None`.
+        minlength (int):
+            minimal number of bins of the result. Default: `0`.
+
+    Returns:
+        usm_ndarray:
+            one-dimensional array of ``max(max(x) + 1, minlength)`` elements.
+            Without `weights`, the returned array has the default array index
+            data type. With real-valued `weights`, it has the data type of
+            `weights` if it is a single or double precision floating point
+            type, and the default real-valued floating point data type for
+            the device otherwise. Complex-valued `weights` are summed in
+            their data type.
+
+    Elements are counted in a single pass over `x` by work-groups
+    accumulating private counts in local memory, which are merged with atomic
+    operations.
+    """
+    if not isinstance(x, dpt.usm_ndarray):
+        raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
+    if x.ndim != 1:
+        raise ValueError(f"`x` must be one-dimensional, got {x.ndim} dims")
+    if x.dtype.kind not in "biu":
+        raise TypeError(
+            f"`x` must have a boolean or integral data type, got {x.dtype}"
+        )
+    minlength = operator.index(minlength)
+    if minlength < 0:
+        raise ValueError("`minlength` must be non-negative")
+    arrays = [x]
+    if weights is not None:
+        _validate_weights(weights, x)
+        arrays.append(weights)
+    q, res_usm_type = _execution_placement(arrays)
+
+    nbins = minlength
+    if x.size > 0:
+        x_min, x_max = dpt.reduce_many(x, ("min", "max"))
+        if int(x_min) < 0:
+            raise ValueError("`x` must not have negative elements")
+        nbins = max(int(x_max) + 1, minlength)
+
+    if weights is None:
+        res_dt = dpt.dtype(ti.default_device_index_type(q.sycl_device))
+    else:
+        res_dt = _weights_result_dtype(weights.dtype, q)
+        weights = dpt.astype(weights, res_dt, copy=False)
+
+    res = _histogram_with_atomics(
+        tri._bincount,
+        lambda usm_type: tri._bincount_dtype_supported(
+            x.dtype, res_dt, usm_type, q
+        ),
+        res_dt,
+        nbins,
+        res_usm_type,
+        q,
+        dict(x=x, weights=weights),
+    )
+    if res is None:
+        bin_ids = dpt.astype(x, dpt.int64)
+        res = _histogram_by_sorting(bin_ids, weights, res_dt, nbins)
+        res = dpt.asarray(res, usm_type=res_usm_type, sycl_queue=q)
+    return res
+
+
+def histogram(x, /, bins=10, *, range=None, weights=None, density=False):
+    """histogram(x, bins=10, range=None, weights=None, density=False)
+
+    Computes the histogram of elements of the array `x`.
+
+    Args:
+        x (usm_ndarray):
+            input array. The histogram is computed over the flattened array.
+            Must have a boolean, integral or real-valued floating point data
+            type.
+        bins (Union[int, usm_ndarray]):
+            if an integer, the number of bins of equal width over `range`.
+            If an array, the one-dimensional array of monotonically
+            increasing edges of bins, including the rightmost edge.
+            Default: `10`.
+        range (Optional[Tuple[float, float]]):
+            lower and upper edge of bins of equal width. If `None`, the
+            minimum and maximum of `x` are used. Ignored when `bins` is an
+            array. Default: `None`.
+        weights (Optional[usm_ndarray]):
+            array of the same shape as `x`. If given, each element of `x`
+            contributes its weight, rather than one, to its bin.
+            Default: `None`.
+        density (bool):
+            if `True`, the result is normalized, so that its integral over
+            the range of bins is one. Default: `False`.
+
+    Returns:
+        HistogramResult:
+            a namedtuple `(hist, bin_edges)`, where `hist` is the array of
+            counts, or sums of weights, per bin and `bin_edges` is the array
+            of edges of bins, which has one more element than `hist`. All
+            bins but the last are half-open, the last bin includes its
+            right edge. Elements outside of the edges, and NaNs, are not
+            counted.
+
+            Counts have the default array index data type. Data types of
+            sums of weights are determined as by
+            :func:`dpctl.tensor.bincount`. Edges, as well as normalized
+            results, have the default real-valued floating point data type
+            for the device.
+
+    Bins of elements are computed from their values for bins of equal width,
+    and found by binary search for explicit edges. Elements are counted in
+    a single pass over `x` by work-groups accumulating private counts in
+    local memory, which are merged with atomic operations.
+    """
+    if not isinstance(x, dpt.usm_ndarray):
+        raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
+    if x.dtype.kind not in "biuf":
+        raise TypeError(
+            "`x` must have a boolean, integral or real-valued floating point "
+            f"data type, got {x.dtype}"
+        )
+    arrays = [x]
+    if weights is not None:
+        _validate_weights(weights, x)
+        arrays.append(weights)
+    explicit_edges = isinstance(bins, dpt.usm_ndarray)
+    if explicit_edges:
+        arrays.append(bins)
+    q, res_usm_type = _execution_placement(arrays)
+    edges_dt = dpt.dtype(ti.default_device_fp_type(q))
+
+    x = dpt.reshape(x, -1)
+    if weights is not None:
+        weights = dpt.reshape(weights, -1)
+
+    if explicit_edges:
+        if bins.ndim != 1 or bins.size < 2:
+            raise ValueError(
+                "`bins` must be a one-dimensional array of at least two edges"
+            )
+        if bins.dtype.kind not in "biuf":
+            raise TypeError(
+                f"`bins` must have a real-valued data type, got {bins.dtype}"
+            )
+        if not dpt.all(bins[1:] >= bins[:-1]):
+            raise ValueError("`bins` must increase monotonically")
+        bin_edges = dpt.astype(bins, edges_dt, order="C", copy=False)
+        if bin_edges.usm_type != res_usm_type:
+            bin_edges = dpt.asarray(bin_edges, usm_type=res_usm_type)
+        nbins = bins.size - 1
+        uniform_range = None
+    else:
+        nbins = operator.index(bins)
+        if nbins < 1:
+            raise ValueError("`bins` must be a positive integer")
+        if range is None:
+            if x.size > 0:
+                x_min, x_max = dpt.reduce_many(x, ("min", "max"))
+                first_edge, last_edge = float(x_min), float(x_max)
+            else:
+                first_edge, last_edge = 0.0, 1.0
+        else:
+            first_edge, last_edge = (float(v) for v in range)
+            if first_edge > last_edge:
+                raise ValueError("max must be larger than min in `range`")
+        if not (math.isfinite(first_edge) and math.isfinite(last_edge)):
+            raise ValueError(
+                f"range of [{first_edge}, {last_edge}] is not finite"
+            )
+        if first_edge == last_edge:
+            first_edge -= 0.5
+            last_edge += 0.5
+        bin_edges = dpt.linspace(
+            first_edge,
+            last_edge,
+            nbins + 1,
+            dtype=edges_dt,
+            usm_type=res_usm_type,
+            sycl_queue=q,
+        )
+        uniform_range = (first_edge, last_edge)
+
+    if weights is None:
+        res_dt = dpt.dtype(ti.default_device_index_type(q.sycl_device))
+    else:
+        res_dt = _weights_result_dtype(weights.dtype, q)
+        weights = dpt.astype(weights, res_dt, copy=False)
+
+    res = _histogram_with_atomics(
+        tri._histogram,
+        lambda usm_type: tri._histogram_dtype_supported(
+            x.dtype, edges_dt, res_dt, usm_type, q
+        ),
+        res_dt,
+        nbins,
+        res_usm_type,
+        q,
+        dict(
+            x=x,
+            weights=weights,
+            bin_edges=bin_edges,
+            uniform_range=uniform_range,
+        ),
+    )
+    if res is None:
+        x_e = dpt.astype(x, edges_dt, copy=False)
+        bin_ids = dpt.searchsorted(bin_edges, x_e, side="right") - 1
+        # the last bin includes its right edge, and elements outside of the
+        # edges, including NaNs, are not counted
+        bin_ids = dpt.where(x_e == bin_edges[-1], nbins - 1, bin_ids)
+        bin_ids = dpt.where(
+            (bin_ids < 0) | (x_e > bin_edges[-1]) | dpt.isnan(x_e),
+            nbins,
+            bin_ids,
+        )
+        res = _histogram_by_sorting(bin_ids, weights, res_dt, nbins)
+        res = dpt.asarray(res, usm_type=res_usm_type, sycl_queue=q)
+
+    if density:
+        widths = bin_edges[1:] - bin_edges[:-1]
+        hist = dpt.astype(res, edges_dt)
+        res = hist / (dpt.sum(hist) * widths)
+    return HistogramResult(res, bin_edges)
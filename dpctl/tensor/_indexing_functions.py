@@ -27,6 +27,7 @@ from ._copy_utils import (
     _put_multi_index,
     _take_multi_index,
 )
+from ._lazy import LazyArray, _is_lazy_mode
 from ._numpy_helper import normalize_axis_index
 
 
@@ -156,7 +157,7 @@ def take(x, indices, /, *, axis=None, out=None, mode="wrap"):
         )
 
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    deps_ev = _manager.submitted_events
+    deps_ev = _manager.dependency_events
     hev, take_ev = ti._take(
         x, (indices,), out, axis, mode, sycl_queue=exec_q, depends=deps_ev
     )
@@ -315,7 +316,7 @@ def put(x, indices, vals, /, *, axis=None, mode="wrap"):
     rhs = dpt.broadcast_to(rhs, val_shape)
 
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    deps_ev = _manager.submitted_events
+    deps_ev = _manager.dependency_events
     hev, put_ev = ti._put(
         x, (indices,), rhs, axis, mode, sycl_queue=exec_q, depends=deps_ev
     )
@@ -344,7 +345,8 @@ def extract(condition, arr):
     Returns:
         usm_ndarray:
             Rank 1 array of values from ``arr`` where ``condition`` is
-            ``True``.
+            ``True``. Within :func:`dpctl.tensor.lazy` context,
+            :class:`dpctl.tensor.DeferredSizeArray` is returned.
     """
     if not isinstance(condition, dpt.usm_ndarray):
         raise TypeError(
@@ -364,7 +366,7 @@ def extract(condition, arr):
         raise dpctl.utils.ExecutionPlacementError
     if condition.shape != arr.shape:
         raise ValueError("Arrays are not of the same size")
-    return _extract_impl(arr, condition)
+    return _extract_impl(arr, condition, deferred=_is_lazy_mode())
 
 
 def place(arr, mask, vals):
@@ -410,16 +412,24 @@ def place(arr, mask, vals):
         raise dpctl.utils.ExecutionPlacementError
     if arr.shape != mask.shape or vals.ndim != 1:
         raise ValueError("Array sizes are not as required")
+    if mask.size == 0:
+        return
     cumsum = dpt.empty(mask.size, dtype="i8", sycl_queue=exec_q)
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    deps_ev = _manager.submitted_events
-    nz_count = ti.mask_positions(
-        mask, cumsum, sycl_queue=exec_q, depends=deps_ev
-    )
-    if nz_count == 0:
-        return
+    deps_ev = _manager.dependency_events
     if vals.size == 0:
+        nz_count = ti.mask_positions(
+            mask, cumsum, sycl_queue=exec_q, depends=deps_ev
+        )
+        if nz_count == 0:
+            return
         raise ValueError("Cannot insert from an empty array!")
+    # values are repeated as needed, so the number of set elements
+    # of the mask is not needed on host
+    hev, mp_ev = ti._mask_positions_async(
+        mask, cumsum, sycl_queue=exec_q, depends=deps_ev
+    )
+    _manager.add_event_pair(hev, mp_ev)
     if vals.dtype == arr.dtype:
         rhs = vals
     else:
@@ -431,6 +441,7 @@ def place(arr, mask, vals):
         axis_end=mask.ndim,
         rhs=rhs,
         sycl_queue=exec_q,
+        depends=_manager.dependency_events,
     )
     _manager.add_event_pair(hev, pl_ev)
 
@@ -451,15 +462,19 @@ def nonzero(arr):
 
     Returns:
         Tuple[usm_ndarray, ...]:
-            Indices of non-zero array elements.
+            Indices of non-zero array elements. Within
+            :func:`dpctl.tensor.lazy` context, a tuple of
+            :class:`dpctl.tensor.DeferredSizeArray` is returned.
     """
+    if isinstance(arr, LazyArray):
+        arr = arr.materialize()
     if not isinstance(arr, dpt.usm_ndarray):
         raise TypeError(
             "Expecting dpctl.tensor.usm_ndarray type, " f"got {type(arr)}"
         )
     if arr.ndim == 0:
         raise ValueError("Array of positive rank is expected")
-    return _nonzero_impl(arr)
+    return _nonzero_impl(arr, deferred=_is_lazy_mode())
 
 
 def _range(sh_i, i, nd, q, usm_t, dt):
@@ -0,0 +1,872 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import contextlib
+import functools
+import numbers
+import operator
+from contextvars import ContextVar
+
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_elementwise_impl as ti
+import dpctl.utils as du
+
+__doc__ = (
+    "Implementation module for deferred evaluation of chains of "
+    "element-wise functions on :class:`dpctl.tensor.usm_ndarray`."
+)
+
+_lazy_mode = ContextVar("lazy_mode", default=False)
+# set while implementations of functions of dpctl.tensor are executed
+_eager_mode = ContextVar("eager_mode", default=False)
+
+
+def _is_lazy_mode():
+    """Whether element-wise functions should return deferred results.
+    Within :func:`lazy` context, functions called by user code are
+    deferred, while functions called by implementations of
+    :mod:`dpctl.tensor`, which are wrapped with :func:`_eager_call`,
+    are evaluated immediately, so that those implementations receive
+    :class:`dpctl.tensor.usm_ndarray`."""
+    return _lazy_mode.get() and not _eager_mode.get()
+
+
+def _eager_call(fn):
+    "Decorator evaluating element-wise functions called by `fn` immediately"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _lazy_mode.get() or _eager_mode.get():
+            return fn(*args, **kwargs)
+        token = _eager_mode.set(True)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _eager_mode.reset(token)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def lazy():
+    """
+    lazy()
+
+    Context manager within which element-wise functions of
+    :mod:`dpctl.tensor`, as well as arithmetic operators of
+    :class:`dpctl.tensor.usm_ndarray`, do not compute their results
+    but record them in an expression graph, returning
+    :class:`dpctl.tensor.LazyArray` objects.
+
+    The graph is evaluated when :meth:`LazyArray.materialize` is
+    called. Evaluation merges common sub-expressions, and evaluates
+    chains of arithmetic and elementary functions of C-contiguous
+    ``float32`` or ``float64`` arrays of the same shape, and of real
+    scalars, by a single kernel which keeps intermediate results in
+    registers. Other operations are evaluated by their own kernels,
+    writing results of intermediate operations into temporaries
+    released by operations evaluated before them. Passing ``out``
+    keyword to an element-wise function evaluates it immediately.
+
+    Only functions called by user code are deferred. Other functions of
+    :mod:`dpctl.tensor`, such as reductions, expect
+    :class:`dpctl.tensor.usm_ndarray` arguments, and element-wise
+    functions called by their implementations are evaluated
+    immediately.
+
+    :func:`dpctl.tensor.extract`, :func:`dpctl.tensor.nonzero` and
+    :func:`dpctl.tensor.unique_values` return
+    :class:`dpctl.tensor.DeferredSizeArray` objects within this
+    context, and do not wait for the number of selected elements to be
+    computed until the result is materialized.
+
+    :Example:
+
+        .. code-block:: python
+
+            import dpctl.tensor as dpt
+
+            x = dpt.linspace(0, 1, num=10**6)
+            with dpt.lazy():
+                y = dpt.exp(-0.5 * dpt.square(x)) * dpt.sin(2.3 * x + 0.11)
+            res = y.materialize()
+    """
+    token = _lazy_mode.set(True)
+    eager_token = _eager_mode.set(False)
+    try:
+        yield
+    finally:
+        _eager_mode.reset(eager_token)
+        _lazy_mode.reset(token)
+
+
+class LazyArray:
+    """
+    Deferred result of an element-wise function.
+
+    Instances are created by element-wise functions of
+    :mod:`dpctl.tensor` invoked within :func:`dpctl.tensor.lazy`
+    context, or with another :class:`LazyArray` argument. Element-wise
+    functions and arithmetic operators applied to instances of this class
+    are recorded as well.
+    """
+
+    def __init__(self, fn, args, order, shape, dtype, sycl_queue, usm_type):
+        self._fn = fn
+        self._args = args
+        self._order = order
+        self._shape = shape
+        self._dtype = dtype
+        self._sycl_queue = sycl_queue
+        self._usm_type = usm_type
+        self._value = None
+
+    @property
+    def shape(self):
+        """Shape of the result."""
+        return self._shape
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the result."""
+        return len(self._shape)
+
+    @property
+    def size(self):
+        """Number of elements in the result."""
+        res = 1
+        for d in self._shape:
+            res *= d
+        return res
+
+    @property
+    def dtype(self):
+        """Data type of the result."""
+        return self._dtype
+
+    @property
+    def sycl_queue(self):
+        """:class:`dpctl.SyclQueue` the result is computed on."""
+        return self._sycl_queue
+
+    @property
+    def sycl_device(self):
+        """:class:`dpctl.SyclDevice` the result is computed on."""
+        return self._sycl_queue.sycl_device
+
+    @property
+    def device(self):
+        """:class:`dpctl.tensor.Device` the result is allocated on."""
+        return dpt.Device.create_device(self._sycl_queue)
+
+    @property
+    def usm_type(self):
+        """USM type of allocation of the result."""
+        return self._usm_type
+
+    @property
+    def is_materialized(self):
+        """``True`` if the result has been computed."""
+        return self._value is not None
+
+    @_eager_call
+    def materialize(self):
+        """
+        materialize()
+
+        Evaluates the expression graph this array is the result of.
+
+        Returns:
+            usm_ndarray:
+                Result of the expression. Repeated calls return
+                the same array.
+        """
+        if self._value is None:
+            _materialize((self,))
+        return self._value
+
+    @property
+    def __sycl_usm_array_interface__(self):
+        return self.materialize().__sycl_usm_array_interface__
+
+    def __repr__(self):
+        state = "materialized" if self._value is not None else "deferred"
+        return (
+            f"<LazyArray '{self._fn.name_}', shape={self._shape}, "
+            f"dtype={self._dtype}, {state}>"
+        )
+
+    def __abs__(self):
+        return dpt.abs(self)
+
+    def __add__(self, other):
+        return dpt.add(self, other)
+
+    def __radd__(self, other):
+        return dpt.add(other, self)
+
+    def __sub__(self, other):
+        return dpt.subtract(self, other)
+
+    def __rsub__(self, other):
+        return dpt.subtract(other, self)
+
+    def __mul__(self, other):
+        return dpt.multiply(self, other)
+
+    def __rmul__(self, other):
+        return dpt.multiply(other, self)
+
+    def __truediv__(self, other):
+        return dpt.divide(self, other)
+
+    def __rtruediv__(self, other):
+        return dpt.divide(other, self)
+
+    def __floordiv__(self, other):
+        return dpt.floor_divide(self, other)
+
+    def __rfloordiv__(self, other):
+        return dpt.floor_divide(other, self)
+
+    def __mod__(self, other):
+        return dpt.remainder(self, other)
+
+    def __rmod__(self, other):
+        return dpt.remainder(other, self)
+
+    def __pow__(self, other):
+        return dpt.pow(self, other)
+
+    def __rpow__(self, other):
+        return dpt.pow(other, self)
+
+    def __neg__(self):
+        return dpt.negative(self)
+
+    def __pos__(self):
+        return dpt.positive(self)
+
+    def __invert__(self):
+        return dpt.bitwise_invert(self)
+
+    def __lt__(self, other):
+        return dpt.less(self, other)
+
+    def __le__(self, other):
+        return dpt.less_equal(self, other)
+
+    def __gt__(self, other):
+        return dpt.greater(self, other)
+
+    def __ge__(self, other):
+        return dpt.greater_equal(self, other)
+
+
+def _is_pending(o):
+    "Whether `o` is a node of expression graph yet to be evaluated"
+    return isinstance(o, LazyArray) and o._value is None and o._fn is not None
+
+
+def _arg_key(o, canonical):
+    "Key identifying argument `o` of a node for common sub-expression search"
+    if isinstance(o, LazyArray):
+        if _is_pending(o):
+            return ("n", id(canonical[id(o)]))
+        if o._value is None:
+            # deferred-size result, materialized on evaluation
+            return ("o", id(o))
+        return ("a", id(o._value))
+    if isinstance(o, dpt.usm_ndarray):
+        return ("a", id(o))
+    try:
+        hash(o)
+    except TypeError:
+        return ("o", id(o))
+    if isinstance(o, numbers.Number):
+        # distinguishes 0.0 from -0.0, and NaN payloads
+        return ("s", type(o), repr(o))
+    return ("s", type(o), o)
+
+
+def _topological_order(roots):
+    "Pending nodes reachable from `roots`, each after its arguments"
+    order = []
+    visited = set()
+    stack = [(r, False) for r in roots if _is_pending(r)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        stack.append((node, True))
+        for a in node._args:
+            if _is_pending(a) and id(a) not in visited:
+                stack.append((a, False))
+    return order
+
+
+def _can_reuse(tmp, node):
+    "Whether temporary array `tmp` can hold the result of `node`"
+    if not (
+        tmp.shape == node._shape
+        and tmp.dtype == node._dtype
+        and tmp.usm_type == node._usm_type
+        and tmp.sycl_queue == node._sycl_queue
+    ):
+        return False
+    if node._order == "C":
+        return tmp.flags.c_contiguous
+    if node._order == "F":
+        return tmp.flags.f_contiguous
+    return True
+
+
+# functions evaluated by the fused kernel, opcodes of unary functions
+# start at 1, and opcodes of binary functions start at 32
+_fused_unary_names = (
+    "abs",
+    "negative",
+    "positive",
+    "square",
+    "sqrt",
+    "exp",
+    "expm1",
+    "log",
+    "log1p",
+    "sin",
+    "cos",
+    "tan",
+    "tanh",
+    "sinh",
+    "cosh",
+    "rsqrt",
+    "reciprocal",
+    "floor",
+    "ceil",
+    "trunc",
+)
+_fused_binary_names = (
+    "add",
+    "subtract",
+    "multiply",
+    "divide",
+    "pow",
+    "maximum",
+    "minimum",
+)
+_fused_opcodes = dict()
+
+# limits of the fused kernel
+_fused_max_registers = 16
+_fused_max_inputs = 8
+_fused_max_constants = 16
+_fused_max_instructions = 64
+# operands numbered from `_fused_input_base` refer to inputs, and those
+# numbered from `_fused_constant_base` refer to constants
+_fused_input_base = _fused_max_registers
+_fused_constant_base = _fused_input_base + _fused_max_inputs
+
+
+def _fused_opcode(fn):
+    "Opcode of element-wise function `fn` in the fused kernel, or ``None``"
+    if not _fused_opcodes:
+        for i, name in enumerate(_fused_unary_names):
+            _fused_opcodes[id(getattr(dpt, name))] = 1 + i
+        for i, name in enumerate(_fused_binary_names):
+            _fused_opcodes[id(getattr(dpt, name))] = 32 + i
+    return _fused_opcodes.get(id(fn))
+
+
+def _is_fusable_scalar(o):
+    "Whether scalar `o` can be a constant of the fused kernel"
+    if not isinstance(o, numbers.Real):
+        return False
+    try:
+        float(o)
+    except OverflowError:
+        return False
+    return True
+
+
+def _is_fusable(node, args):
+    """Whether `node` with arguments `args` can be evaluated by the fused
+    kernel: it is a supported function of real floating-point arrays of
+    the shape and data type of the result, or of scalars"""
+    if _fused_opcode(node._fn) is None:
+        return False
+    if node._dtype not in (dpt.float32, dpt.float64):
+        return False
+    if node._order == "F" and len(node._shape) > 1:
+        return False
+    for a in args:
+        if isinstance(a, LazyArray) and not _is_pending(a):
+            a = a._value
+            if a is None:
+                return False
+        if isinstance(a, (LazyArray, dpt.usm_ndarray)):
+            if (
+                a.shape != node._shape
+                or a.dtype != node._dtype
+                or a.sycl_queue != node._sycl_queue
+            ):
+                return False
+        elif not _is_fusable_scalar(a):
+            return False
+    return True
+
+
+def _fused_members(root, node_args, inlined):
+    "Nodes evaluated by the fused kernel computing `root`, in order"
+    members = []
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            members.append(node)
+            continue
+        stack.append((node, True))
+        # arguments are evaluated from first to last
+        for a in reversed(node_args[id(node)]):
+            if _is_pending(a) and id(a) in inlined:
+                stack.append((a, False))
+    return members
+
+
+def _fused_inlining(unique_nodes, node_args, fusable, candidates):
+    """Ids of nodes evaluated by the fused kernel computing their
+    consumer. Nodes in `candidates` are inlined into their consumers in
+    `fusable`, unless the kernel would exceed its limits, in which case
+    the largest arguments are evaluated by kernels of their own."""
+    inlined = set()
+    # number of instructions, keys of inputs, number of constants and
+    # of registers of the kernel computing a node
+    stats = dict()
+    for n in unique_nodes:
+        if id(n) not in fusable:
+            continue
+        args = node_args[id(n)]
+        inl = [a for a in args if _is_pending(a) and id(a) in candidates]
+        while True:
+            n_instr, inputs, n_consts, n_regs, live = 1, set(), 0, 1, 0
+            for a in args:
+                if any(a is b for b in inl):
+                    a_instr, a_inputs, a_consts, a_regs = stats[id(a)]
+                    n_instr += a_instr
+                    inputs |= a_inputs
+                    n_consts += a_consts
+                    n_regs = max(n_regs, live + a_regs)
+                    live += 1
+                elif _is_pending(a):
+                    inputs.add(id(a))
+                elif isinstance(a, LazyArray):
+                    inputs.add(id(a._value))
+                elif isinstance(a, dpt.usm_ndarray):
+                    inputs.add(id(a))
+                else:
+                    n_consts += 1
+            if (
+                n_instr <= _fused_max_instructions
+                and len(inputs) <= _fused_max_inputs
+                and n_consts <= _fused_max_constants
+                and n_regs <= _fused_max_registers
+            ):
+                break
+            inl.remove(max(inl, key=lambda a: stats[id(a)][0]))
+        inlined.update(id(a) for a in inl)
+        stats[id(n)] = (n_instr, inputs, n_consts, n_regs)
+    return inlined
+
+
+def _fused_program(members, node_args, values, inlined):
+    """Inputs, instructions and constants of the fused kernel evaluating
+    `members`, or ``None`` if the kernel can not evaluate them"""
+    if len(members) > _fused_max_instructions:
+        return None
+    inputs = []
+    input_pos = dict()
+    constants = []
+    program = []
+    free_regs = list(range(_fused_max_registers))
+    regs = dict()
+    for n in members:
+        operands = []
+        for a in node_args[id(n)]:
+            if _is_pending(a) and id(a) in inlined:
+                # inlined nodes have a single use
+                r = regs.pop(id(a))
+                free_regs.append(r)
+                operands.append(r)
+            elif isinstance(a, (LazyArray, dpt.usm_ndarray)):
+                if isinstance(a, LazyArray):
+                    a = values[id(a)] if _is_pending(a) else a._value
+                if not a.flags.c_contiguous:
+                    return None
+                pos = input_pos.get(id(a))
+                if pos is None:
+                    if len(inputs) == _fused_max_inputs:
+                        return None
+                    pos = len(inputs)
+                    input_pos[id(a)] = pos
+                    inputs.append(a)
+                operands.append(_fused_input_base + pos)
+            else:
+                if len(constants) == _fused_max_constants:
+                    return None
+                operands.append(_fused_constant_base + len(constants))
+                constants.append(float(a))
+        if not free_regs:
+            return None
+        r = min(free_regs)
+        free_regs.remove(r)
+        regs[id(n)] = r
+        operands += [0] * (2 - len(operands))
+        program += [_fused_opcode(n._fn), r] + operands
+    return inputs, program, constants
+
+
+def _materialize(roots):
+    topo = _topological_order(roots)
+    # merge common sub-expressions
+    canonical = dict()
+    seen = dict()
+    unique_nodes = []
+    for node in topo:
+        key = (
+            id(node._fn),
+            node._order,
+            tuple(_arg_key(a, canonical) for a in node._args),
+        )
+        rep = seen.setdefault(key, node)
+        canonical[id(node)] = rep
+        if rep is node:
+            unique_nodes.append(node)
+
+    def _resolve(a):
+        return canonical[id(a)] if _is_pending(a) else a
+
+    node_args = {
+        id(n): tuple(_resolve(a) for a in n._args) for n in unique_nodes
+    }
+    remaining_uses = dict()
+    consumers = dict()
+    for n in unique_nodes:
+        for a in node_args[id(n)]:
+            if _is_pending(a):
+                remaining_uses[id(a)] = remaining_uses.get(id(a), 0) + 1
+                consumers[id(a)] = n
+    root_ids = set(id(canonical[id(r)]) for r in roots if _is_pending(r))
+
+    # a node is evaluated by the fused kernel computing its consumer,
+    # if both can be evaluated by that kernel, and its result is used
+    # only once
+    fusable = set(
+        id(n) for n in unique_nodes if _is_fusable(n, node_args[id(n)])
+    )
+    candidates = set(
+        id(n)
+        for n in unique_nodes
+        if id(n) in fusable
+        and id(n) not in root_ids
+        and remaining_uses[id(n)] == 1
+        and id(consumers[id(n)]) in fusable
+    )
+    inlined = _fused_inlining(unique_nodes, node_args, fusable, candidates)
+
+    values = dict()
+    free_temps = []
+
+    def _concrete(a):
+        if isinstance(a, LazyArray):
+            return values[id(a)] if _is_pending(a) else a.materialize()
+        return a
+
+    def _select_out(n, args, concrete_args, c_contig):
+        # write the result in place of an argument which is not used
+        # by any other node, otherwise reuse a released temporary
+        for a, ca in zip(args, concrete_args):
+            if (
+                _is_pending(a)
+                and id(a) not in root_ids
+                and remaining_uses[id(a)] == sum(1 for b in args if b is a)
+                and _can_reuse(ca, n)
+                and (ca.flags.c_contiguous or not c_contig)
+            ):
+                return ca
+        for i, tmp in enumerate(free_temps):
+            if _can_reuse(tmp, n) and (tmp.flags.c_contiguous or not c_contig):
+                return free_temps.pop(i)
+        return None
+
+    def _release_args(args, res):
+        for a in set(id(a) for a in args if _is_pending(a)):
+            remaining_uses[a] -= sum(1 for b in args if id(b) == a)
+            if remaining_uses[a] == 0 and a not in root_ids:
+                tmp = values.pop(a)
+                if tmp is not res:
+                    free_temps.append(tmp)
+
+    def _evaluate(n):
+        args = node_args[id(n)]
+        concrete_args = tuple(_concrete(a) for a in args)
+        out = _select_out(n, args, concrete_args, False)
+        res = n._fn(*concrete_args, out=out, order=n._order)
+        values[id(n)] = res
+        _release_args(args, res)
+
+    def _evaluate_fused(n, members):
+        fused = _fused_program(members, node_args, values, inlined)
+        if fused is None:
+            return False
+        inputs, program, constants = fused
+        # arguments of the fused kernel, which are not inlined nodes
+        args = tuple(
+            a
+            for m in members
+            for a in node_args[id(m)]
+            if not (_is_pending(a) and id(a) in inlined)
+        )
+        concrete_args = tuple(_concrete(a) for a in args)
+        out = _select_out(n, args, concrete_args, True)
+        if out is None:
+            out = dpt.empty(
+                n._shape,
+                dtype=n._dtype,
+                usm_type=n._usm_type,
+                sycl_queue=n._sycl_queue,
+            )
+        q = n._sycl_queue
+        _manager = du.SequentialOrderManager[q]
+        ht_ev, fused_ev = ti._fused_elementwise(
+            inputs,
+            out,
+            program,
+            constants,
+            sycl_queue=q,
+            depends=_manager.dependency_events,
+        )
+        _manager.add_event_pair(ht_ev, fused_ev)
+        values[id(n)] = out
+        _release_args(args, out)
+        return True
+
+    for n in unique_nodes:
+        if id(n) in inlined:
+            continue
+        members = _fused_members(n, node_args, inlined)
+        if len(members) == 1 or not _evaluate_fused(n, members):
+            for m in members:
+                _evaluate(m)
+    for r in roots:
+        if _is_pending(r):
+            r._value = values[id(canonical[id(r)])]
+            # release references to inputs
+            r._args = tuple()
+
+
+class _DeviceSize:
+    "Number of selected elements, computed on device"
+
+    def __init__(self, cumsum):
+        # total is the last element of inclusive cumulative sum
+        self._ary = cumsum[-1]
+        self._value = None
+        self.extent = _DeferredExtent(self, cumsum.size)
+
+    def value(self):
+        if self._value is None:
+            self._value = int(self._ary)
+        return self._value
+
+
+class _DeferredExtent:
+    """Length of the deferred axis of :class:`DeferredSizeArray`.
+    Converting it to integer, or comparing it with lengths of other
+    axes, synchronizes with the device."""
+
+    __hash__ = None
+
+    def __init__(self, size, capacity):
+        self._size = size
+        self._capacity = capacity
+
+    def __index__(self):
+        return self._size.value()
+
+    def __int__(self):
+        return self._size.value()
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        try:
+            return self._size.value() == operator.index(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        if self._size._value is not None:
+            return repr(self._size._value)
+        return f"<deferred, at most {self._capacity}>"
+
+
+class DeferredSizeArray(LazyArray):
+    """
+    Result of :func:`dpctl.tensor.extract`, :func:`dpctl.tensor.nonzero`,
+    or :func:`dpctl.tensor.unique_values` computed within
+    :func:`dpctl.tensor.lazy` context.
+
+    The number of elements selected along :attr:`axis` is computed on
+    the device, and the result is written into an array large enough to
+    hold all of the input elements. Data type, number of dimensions and
+    placement of the result are known without waiting for the device.
+
+    Element-wise functions applied to instances of this class are
+    evaluated over the whole allocation, and return another
+    :class:`DeferredSizeArray` of the same length, without waiting for
+    the device. Materializing the array synchronizes with the device and
+    trims the result to its length.
+    """
+
+    def __init__(self, buffer, count, axis):
+        super().__init__(
+            None,
+            tuple(),
+            "K",
+            None,
+            buffer.dtype,
+            buffer.sycl_queue,
+            buffer.usm_type,
+        )
+        # buffer is usm_ndarray, or LazyArray computing it
+        self._buffer = buffer
+        self._count = count
+        self._axis = axis
+
+    @property
+    def shape(self):
+        """Shape of the result. Length along :attr:`axis` is a
+        placeholder, which synchronizes with the device when converted
+        to integer or compared."""
+        if self._value is not None:
+            return self._value.shape
+        sh = self._buffer.shape
+        return sh[: self._axis] + (self._count.extent,) + sh[self._axis + 1 :]
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the result."""
+        return self._buffer.ndim
+
+    @property
+    def size(self):
+        """Number of elements in the result. Synchronizes with the
+        device."""
+        return self.materialize().size
+
+    @property
+    def axis(self):
+        """Axis along which the length of the result is computed on
+        device."""
+        return self._axis
+
+    @property
+    def capacity(self):
+        """Largest possible length of the result along :attr:`axis`."""
+        return self._buffer.shape[self._axis]
+
+    @property
+    def count(self):
+        """Zero-dimensional :class:`dpctl.tensor.usm_ndarray` holding
+        the length of the result along :attr:`axis`, which can be used
+        in computations without synchronizing with the device."""
+        return self._count._ary
+
+    @_eager_call
+    def materialize(self):
+        """
+        materialize()
+
+        Evaluates the expression graph computing the result, waits for
+        the length of the result to be computed, and trims the result
+        to it.
+
+        Returns:
+            usm_ndarray:
+                Result of the operation. Repeated calls return
+                the same array.
+        """
+        if self._value is None:
+            if isinstance(self._buffer, LazyArray):
+                self._buffer = self._buffer.materialize()
+            n = self._count.value()
+            sl = (slice(None),) * self._axis + (slice(0, n),)
+            self._value = self._buffer[sl]
+        return self._value
+
+    def _with_buffer(self, buffer):
+        "Deferred-size array of the same length holding `buffer`"
+        return DeferredSizeArray(buffer, self._count, self._axis)
+
+    def __repr__(self):
+        if self._value is not None:
+            return (
+                f"<DeferredSizeArray shape={self._value.shape}, "
+                f"dtype={self._dtype}, materialized>"
+            )
+        return (
+            f"<DeferredSizeArray capacity={self.capacity}, axis={self._axis}, "
+            f"dtype={self._dtype}, deferred>"
+        )
+
+
+def _deferred_operands(args, arg_shapes):
+    """Returns a deferred-size array among `args` and `args` with
+    deferred-size arrays replaced with their allocations, if the
+    result of an element-wise function of `args` can be computed over
+    these allocations. Otherwise returns ``None`` and `args` with
+    deferred-size arrays materialized."""
+    ref = None
+    for a in args:
+        if isinstance(a, DeferredSizeArray) and a._value is None:
+            ref = a
+            break
+    if ref is None:
+        return None, tuple(
+            a.materialize() if isinstance(a, DeferredSizeArray) else a
+            for a in args
+        )
+    # position of the deferred axis counting from the last axis
+    rev_axis = ref.ndim - ref._axis
+    bufs = []
+    for a, sh in zip(args, arg_shapes):
+        if isinstance(a, DeferredSizeArray) and a._value is None:
+            if a._count is not ref._count or a.ndim - a._axis != rev_axis:
+                break
+            bufs.append(a._buffer)
+        elif len(sh) < rev_axis or sh[len(sh) - rev_axis] == 1:
+            # broadcasts along the deferred axis
+            bufs.append(a._value if isinstance(a, DeferredSizeArray) else a)
+        else:
+            break
+    else:
+        return ref, tuple(bufs)
+    return None, tuple(
+        a.materialize() if isinstance(a, DeferredSizeArray) else a for a in args
+    )
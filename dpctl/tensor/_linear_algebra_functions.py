@@ -30,6 +30,7 @@ from dpctl.tensor._type_utils import (
 )
 from dpctl.utils import ExecutionPlacementError, SequentialOrderManager
 
+from ._gemm_tuning import _dot as _gemm_dot
 from ._numpy_helper import normalize_axis_index, normalize_axis_tuple
 
 
@@ -198,8 +199,8 @@ def tensordot(x1, x2, axes=2):
             sycl_queue=exec_q,
             order="C",
         )
-        dep_evs = _manager.submitted_events
-        ht_dot_ev, dot_ev = tli._dot(
+        dep_evs = _manager.dependency_events
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=arr1,
             x2=arr2,
             batch_dims=0,
@@ -217,7 +218,7 @@ def tensordot(x1, x2, axes=2):
     elif buf1_dt is None:
         buf2 = _empty_like_orderK(arr2, buf2_dt)
 
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=arr2, dst=buf2, sycl_queue=exec_q, depends=dep_evs
         )
@@ -229,7 +230,7 @@ def tensordot(x1, x2, axes=2):
             sycl_queue=exec_q,
             order="C",
         )
-        ht_dot_ev, dot_ev = tli._dot(
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=arr1,
             x2=buf2,
             batch_dims=0,
@@ -246,7 +247,7 @@ def tensordot(x1, x2, axes=2):
 
     elif buf2_dt is None:
         buf1 = _empty_like_orderK(arr1, buf1_dt)
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=arr1, dst=buf1, sycl_queue=exec_q, depends=dep_evs
         )
@@ -258,7 +259,7 @@ def tensordot(x1, x2, axes=2):
             sycl_queue=exec_q,
             order="C",
         )
-        ht_dot_ev, dot_ev = tli._dot(
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=buf1,
             x2=arr2,
             batch_dims=0,
@@ -274,7 +275,7 @@ def tensordot(x1, x2, axes=2):
         return out
 
     buf1 = _empty_like_orderK(arr1, buf1_dt)
-    deps_ev = _manager.submitted_events
+    deps_ev = _manager.dependency_events
     ht_copy1_ev, copy1_ev = ti._copy_usm_ndarray_into_usm_ndarray(
         src=arr1, dst=buf1, sycl_queue=exec_q, depends=deps_ev
     )
@@ -291,7 +292,7 @@ def tensordot(x1, x2, axes=2):
         sycl_queue=exec_q,
         order="C",
     )
-    ht_, dot_ev = tli._dot(
+    ht_, dot_ev = _gemm_dot(
         x1=buf1,
         x2=buf2,
         batch_dims=0,
@@ -412,7 +413,7 @@ def vecdot(x1, x2, axis=-1):
     if buf1_dt is None and buf2_dt is None:
         if x1.dtype.kind == "c":
             x1_tmp = _empty_like_orderK(x1, x1.dtype)
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             ht_conj_ev, conj_ev = tei._conj(
                 src=x1, dst=x1_tmp, sycl_queue=exec_q, depends=dep_evs
             )
@@ -431,8 +432,8 @@ def vecdot(x1, x2, axis=-1):
             sycl_queue=exec_q,
             order="C",
         )
-        dep_evs = _manager.submitted_events
-        ht_dot_ev, dot_ev = tli._dot(
+        dep_evs = _manager.dependency_events
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=x1,
             x2=x2,
             batch_dims=len(res_sh),
@@ -449,14 +450,14 @@ def vecdot(x1, x2, axis=-1):
     elif buf1_dt is None:
         if x1.dtype.kind == "c":
             x1_tmp = _empty_like_orderK(x1, x1.dtype)
-            deps_ev = _manager.submitted_events
+            deps_ev = _manager.dependency_events
             ht_conj_ev, conj_e = tei._conj(
                 src=x1, dst=x1_tmp, sycl_queue=exec_q, depends=deps_ev
             )
             _manager.add_event_pair(ht_conj_ev, conj_e)
             x1 = x1_tmp
         buf2 = _empty_like_orderK(x2, buf2_dt)
-        deps_ev = _manager.submitted_events
+        deps_ev = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x2, dst=buf2, sycl_queue=exec_q, depends=deps_ev
         )
@@ -474,7 +475,7 @@ def vecdot(x1, x2, axis=-1):
             sycl_queue=exec_q,
             order="C",
         )
-        ht_dot_ev, dot_ev = tli._dot(
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=x1,
             x2=buf2,
             batch_dims=len(res_sh),
@@ -490,7 +491,7 @@ def vecdot(x1, x2, axis=-1):
 
     elif buf2_dt is None:
         buf1 = _empty_like_orderK(x1, buf1_dt)
-        deps_ev = _manager.submitted_events
+        deps_ev = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x1, dst=buf1, sycl_queue=exec_q, depends=deps_ev
         )
@@ -513,8 +514,8 @@ def vecdot(x1, x2, axis=-1):
             sycl_queue=exec_q,
             order="C",
         )
-        deps_ev = _manager.submitted_events
-        ht_dot_ev, dot_ev = tli._dot(
+        deps_ev = _manager.dependency_events
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=buf1,
             x2=x2,
             batch_dims=len(res_sh),
@@ -529,7 +530,7 @@ def vecdot(x1, x2, axis=-1):
         return dpt.reshape(out, res_sh)
 
     buf1 = _empty_like_orderK(x1, buf1_dt)
-    deps_ev = _manager.submitted_events
+    deps_ev = _manager.dependency_events
     ht_copy1_ev, copy1_ev = ti._copy_usm_ndarray_into_usm_ndarray(
         src=x1, dst=buf1, sycl_queue=exec_q, depends=deps_ev
     )
@@ -557,8 +558,8 @@ def vecdot(x1, x2, axis=-1):
         sycl_queue=exec_q,
         order="C",
     )
-    deps_ev = _manager.submitted_events
-    ht_dot_ev, dot_ev = tli._dot(
+    deps_ev = _manager.dependency_events
+    ht_dot_ev, dot_ev = _gemm_dot(
         x1=buf1,
         x2=buf2,
         batch_dims=len(res_sh),
@@ -573,6 +574,51 @@ def vecdot(x1, x2, axis=-1):
     return out
 
 
+def _matmul_dtypes(x1_dtype, x2_dtype, dtype, sycl_dev):
+    """Returns data types `x1` and `x2` are cast to, or `None` if no cast
+    is needed, and data type of the result of `matmul`"""
+    if dtype is None:
+        buf1_dt, buf2_dt, res_dt = _find_buf_dtype2(
+            x1_dtype,
+            x2_dtype,
+            tli._dot_result_type,
+            sycl_dev,
+            acceptance_fn=_acceptance_fn_default_binary,
+        )
+        if res_dt is None:
+            raise ValueError(
+                "function 'matmul' does not support input types "
+                f"({x1_dtype}, {x2_dtype}), "
+                "and the inputs could not be safely coerced to any "
+                "supported types according to the casting rule ''safe''."
+            )
+    else:
+        res_dt = dpt.dtype(dtype)
+        res_dt = _to_device_supported_dtype(res_dt, sycl_dev)
+        buf1_dt, buf2_dt = None, None
+        if x1_dtype != res_dt:
+            if dpt.can_cast(x1_dtype, res_dt, casting="same_kind"):
+                buf1_dt = res_dt
+            else:
+                raise ValueError(
+                    r"`matmul` input `x1` cannot be cast from "
+                    f"{x1_dtype} to "
+                    f"requested type {res_dt} according to the casting rule "
+                    "''same_kind''."
+                )
+        if x2_dtype != res_dt:
+            if dpt.can_cast(x2_dtype, res_dt, casting="same_kind"):
+                buf2_dt = res_dt
+            else:
+                raise ValueError(
+                    r"`matmul` input `x2` cannot be cast from "
+                    f"{x2_dtype} to "
+                    f"requested type {res_dt} according to the casting rule "
+                    "''same_kind''."
+                )
+    return buf1_dt, buf2_dt, res_dt
+
+
 def matmul(x1, x2, out=None, dtype=None, order="K"):
     r"""matmul(x1, x2, out=None, order="K")
 
@@ -697,45 +743,9 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
     sycl_dev = exec_q.sycl_device
     x1_dtype = x1.dtype
     x2_dtype = x2.dtype
-    if dtype is None:
-        buf1_dt, buf2_dt, res_dt = _find_buf_dtype2(
-            x1_dtype,
-            x2_dtype,
-            tli._dot_result_type,
-            sycl_dev,
-            acceptance_fn=_acceptance_fn_default_binary,
-        )
-        if res_dt is None:
-            raise ValueError(
-                "function 'matmul' does not support input types "
-                f"({x1_dtype}, {x2_dtype}), "
-                "and the inputs could not be safely coerced to any "
-                "supported types according to the casting rule ''safe''."
-            )
-    else:
-        res_dt = dpt.dtype(dtype)
-        res_dt = _to_device_supported_dtype(res_dt, sycl_dev)
-        buf1_dt, buf2_dt = None, None
-        if x1_dtype != res_dt:
-            if dpt.can_cast(x1_dtype, res_dt, casting="same_kind"):
-                buf1_dt = res_dt
-            else:
-                raise ValueError(
-                    r"`matmul` input `x1` cannot be cast from "
-                    f"{x1_dtype} to "
-                    f"requested type {res_dt} according to the casting rule "
-                    "''same_kind''."
-                )
-        if x2_dtype != res_dt:
-            if dpt.can_cast(x2_dtype, res_dt, casting="same_kind"):
-                buf2_dt = res_dt
-            else:
-                raise ValueError(
-                    r"`matmul` input `x2` cannot be cast from "
-                    f"{x2_dtype} to "
-                    f"requested type {res_dt} according to the casting rule "
-                    "''same_kind''."
-                )
+    buf1_dt, buf2_dt, res_dt = _matmul_dtypes(
+        x1_dtype, x2_dtype, dtype, sycl_dev
+    )
 
     orig_out = out
     if out is not None:
@@ -812,8 +822,8 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
             x1 = dpt.broadcast_to(x1, x1_broadcast_shape)
         if x2.shape != x2_broadcast_shape:
             x2 = dpt.broadcast_to(x2, x2_broadcast_shape)
-        deps_evs = _manager.submitted_events
-        ht_dot_ev, dot_ev = tli._dot(
+        deps_evs = _manager.dependency_events
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=x1,
             x2=x2,
             batch_dims=len(res_shape[:-2]),
@@ -843,7 +853,7 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
             buf2 = _empty_like_orderK(x2, buf2_dt)
         else:
             buf2 = dpt.empty_like(x2, dtype=buf2_dt, order=order)
-        deps_evs = _manager.submitted_events
+        deps_evs = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x2, dst=buf2, sycl_queue=exec_q, depends=deps_evs
         )
@@ -866,7 +876,7 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
             x1 = dpt.broadcast_to(x1, x1_broadcast_shape)
         if buf2.shape != x2_broadcast_shape:
             buf2 = dpt.broadcast_to(buf2, x2_broadcast_shape)
-        ht_dot_ev, dot_ev = tli._dot(
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=x1,
             x2=buf2,
             batch_dims=len(res_shape[:-2]),
@@ -897,7 +907,7 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
             buf1 = _empty_like_orderK(x1, buf1_dt)
         else:
             buf1 = dpt.empty_like(x1, dtype=buf1_dt, order=order)
-        deps_ev = _manager.submitted_events
+        deps_ev = _manager.dependency_events
         ht_copy_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x1, dst=buf1, sycl_queue=exec_q, depends=deps_ev
         )
@@ -920,7 +930,7 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
             buf1 = dpt.broadcast_to(buf1, x1_broadcast_shape)
         if x2.shape != x2_broadcast_shape:
             x2 = dpt.broadcast_to(x2, x2_broadcast_shape)
-        ht_dot_ev, dot_ev = tli._dot(
+        ht_dot_ev, dot_ev = _gemm_dot(
             x1=buf1,
             x2=x2,
             batch_dims=len(res_shape[:-2]),
@@ -955,7 +965,7 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
         buf1 = _empty_like_orderK(x1, buf1_dt)
     else:
         buf1 = dpt.empty_like(x1, dtype=buf1_dt, order=order)
-    deps_ev = _manager.submitted_events
+    deps_ev = _manager.dependency_events
     ht_copy1_ev, copy1_ev = ti._copy_usm_ndarray_into_usm_ndarray(
         src=x1, dst=buf1, sycl_queue=exec_q, depends=deps_ev
     )
@@ -986,7 +996,7 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
         buf1 = dpt.broadcast_to(buf1, x1_broadcast_shape)
     if buf2.shape != x2_broadcast_shape:
         buf2 = dpt.broadcast_to(buf2, x2_broadcast_shape)
-    ht_, dot_ev = tli._dot(
+    ht_, dot_ev = _gemm_dot(
         x1=buf1,
         x2=buf2,
         batch_dims=len(res_shape[:-2]),
@@ -1001,3 +1011,188 @@ def matmul(x1, x2, out=None, dtype=None, order="K"):
     if appended_axes:
         out = dpt.squeeze(out, tuple(appended_axes))
     return out
+
+
+_gemm_activations = {None: 0, "relu": 1, "gelu": 2, "tanh": 3}
+
+
+def _validate_epilogue_scalar(name, v, res_dt):
+    if not isinstance(v, (int, float, complex)) and not hasattr(
+        v, "__complex__"
+    ):
+        raise TypeError(
+            f"Expected `{name}` to be a Python scalar, got {type(v)}"
+        )
+    v = complex(v)
+    if res_dt.kind != "c" and v.imag != 0:
+        raise TypeError(
+            f"Complex `{name}` is not supported for result of data type "
+            f"{res_dt}"
+        )
+    if res_dt.kind in "iu" and not float(v.real).is_integer():
+        raise TypeError(
+            f"Non-integral `{name}` is not supported for result of data type "
+            f"{res_dt}"
+        )
+    return v
+
+
+def fused_matmul(
+    x1,
+    x2,
+    /,
+    bias=None,
+    *,
+    activation=None,
+    alpha=1,
+    beta=0,
+    out=None,
+    dtype=None,
+    order="K",
+):
+    r"""fused_matmul(x1, x2, bias=None, *, activation=None, alpha=1, beta=0, \
+    out=None, dtype=None, order="K")
+
+    Computes ``act(alpha * matmul(x1, x2) + beta * out + bias)``, where
+    ``bias`` is broadcast along all but the last dimension of the result.
+
+    Scaling, accumulation, bias and activation are applied by a single
+    kernel, in place, after the matrix product is computed, so that no
+    temporary arrays of the size of the result are allocated unless ``beta``
+    is non-zero.
+
+    Args:
+        x1 (usm_ndarray):
+            first input array, see :func:`dpctl.tensor.matmul`.
+        x2 (usm_ndarray):
+            second input array, see :func:`dpctl.tensor.matmul`.
+        bias (Optional[usm_ndarray]):
+            zero- or one-dimensional array broadcast to the last dimension
+            of the matrix product, added to the scaled product. It is cast
+            to the data type of the result if needed. Default: `None`.
+        activation (Optional[str]):
+            activation applied to each element: ``"relu"``, ``"gelu"``
+            (exact, using the error function) or ``"tanh"``. The latter two
+            are only supported for real floating point results, ``"relu"``
+            for real results. If `None`, no activation is applied.
+            Default: `None`.
+        alpha (scalar):
+            factor of the matrix product. Default: `1`.
+        beta (scalar):
+            factor of the initial content of `out`. If non-zero, `out` must
+            be provided. If zero, `out` is not read, like in BLAS.
+            Default: `0`.
+        out (Optional[usm_ndarray]):
+            the array into which the result is written, see
+            :func:`dpctl.tensor.matmul`. Default: `None`.
+        dtype (Optional[dtype]):
+            data type of the matrix product, see :func:`dpctl.tensor.matmul`.
+            Default: `None`.
+        order (["K", "C", "F", "A"]):
+            memory layout of the output array, if `out` is `None`.
+            Default: `K`.
+
+    Returns:
+        usm_ndarray:
+            array of the shape of ``matmul(x1, x2)``.
+    """
+    try:
+        act_id = _gemm_activations[activation]
+    except (KeyError, TypeError):
+        raise ValueError(
+            "Expected `activation` to be one of 'relu', 'gelu', 'tanh', "
+            f"or None, got {activation}"
+        )
+    if not isinstance(x1, dpt.usm_ndarray):
+        raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x1)}")
+    if not isinstance(x2, dpt.usm_ndarray):
+        raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x2)}")
+    if out is not None and not isinstance(out, dpt.usm_ndarray):
+        raise TypeError(
+            f"output array must be of usm_ndarray type, got {type(out)}"
+        )
+    if bias is not None and not isinstance(bias, dpt.usm_ndarray):
+        raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(bias)}")
+    # validate all arguments before `out` is written to
+    queues = [x1.sycl_queue, x2.sycl_queue]
+    if bias is not None:
+        queues.append(bias.sycl_queue)
+    exec_q = dpctl.utils.get_execution_queue(queues)
+    if exec_q is None:
+        raise ExecutionPlacementError(
+            "Execution placement can not be unambiguously inferred "
+            "from input arguments."
+        )
+    accumulate = beta != 0
+    if accumulate:
+        if out is None:
+            raise ValueError("Non-zero `beta` requires `out` to be provided")
+        if dtype is None:
+            dtype = out.dtype
+    _, _, res_dt = _matmul_dtypes(x1.dtype, x2.dtype, dtype, exec_q.sycl_device)
+    if out is not None and out.dtype != res_dt:
+        raise ValueError(
+            f"Output array of type {res_dt} is needed, got {out.dtype}"
+        )
+    alpha = _validate_epilogue_scalar("alpha", alpha, res_dt)
+    beta = _validate_epilogue_scalar("beta", beta, res_dt)
+    if (act_id == 1 and res_dt.kind == "c") or (
+        act_id > 1 and res_dt.kind != "f"
+    ):
+        raise ValueError(
+            f"Activation '{activation}' is not supported for result of "
+            f"data type {res_dt}"
+        )
+    if bias is not None:
+        if bias.ndim > 1:
+            raise ValueError(
+                "Expected `bias` to have at most one dimension, got "
+                f"{bias.ndim}"
+            )
+        # length of the last dimension of the result
+        if x2.ndim > 1:
+            n = x2.shape[-1]
+        elif x1.ndim > 1:
+            n = x1.shape[-2]
+        else:
+            n = 1
+        if bias.ndim == 1 and bias.shape[0] not in (1, n):
+            raise ValueError(
+                f"`bias` of shape {bias.shape} can not be broadcast to the "
+                f"last dimension of the result of length {n}"
+            )
+        if out is not None and ti._array_overlap(bias, out):
+            # `out` is written before `bias` is read, read a copy instead
+            bias = dpt.astype(bias, res_dt)
+
+    if accumulate:
+        # product is computed into a temporary, validated like `out`
+        res = matmul(x1, x2, out=dpt.empty_like(out), dtype=dtype)
+        dst = out
+    else:
+        res = matmul(x1, x2, out=out, dtype=dtype, order=order)
+        dst = res
+    if bias is None and act_id == 0 and alpha == 1 and not accumulate:
+        return dst
+
+    if bias is not None:
+        if bias.dtype != res.dtype:
+            bias = dpt.astype(bias, res.dtype)
+        bias = dpt.broadcast_to(bias, res.shape[-1:] if res.ndim else (1,))
+    res_v, dst_v = res, dst
+    if res.ndim == 0:
+        res_v, dst_v = dpt.reshape(res, (1,)), dpt.reshape(dst, (1,))
+
+    _manager = SequentialOrderManager[exec_q]
+    ht_ev, ep_ev = tli._gemm_epilogue(
+        res=res_v,
+        dst=dst_v,
+        bias=bias,
+        alpha=alpha,
+        beta=beta,
+        activation=act_id,
+        sycl_queue=exec_q,
+        depends=_manager.dependency_events,
+    )
+    _manager.add_event_pair(ht_ev, ep_ev)
+    return dst
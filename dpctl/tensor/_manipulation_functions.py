@@ -354,7 +354,7 @@ def roll(x, /, shift, *, axis=None):
         )
         sz = operator.index(x.size)
         shift = (shift % sz) if sz > 0 else 0
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         hev, roll_ev = ti._copy_usm_ndarray_for_roll_1d(
             src=x,
             dst=res,
@@ -379,7 +379,7 @@ def roll(x, /, shift, *, axis=None):
     res = dpt.empty(
         x.shape, dtype=x.dtype, usm_type=x.usm_type, sycl_queue=exec_q
     )
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     ht_e, roll_ev = ti._copy_usm_ndarray_for_roll_nd(
         src=x, dst=res, shifts=shifts, sycl_queue=exec_q, depends=dep_evs
     )
@@ -454,7 +454,7 @@ def _concat_axis_None(arrays):
 
     fill_start = 0
     _manager = dputils.SequentialOrderManager[exec_q]
-    deps = _manager.submitted_events
+    deps = _manager.dependency_events
     for array in arrays:
         fill_end = fill_start + array.size
         if array.flags.c_contiguous:
@@ -545,7 +545,7 @@ def concat(arrays, /, *, axis=0):
     )
 
     _manager = dputils.SequentialOrderManager[exec_q]
-    deps = _manager.submitted_events
+    deps = _manager.dependency_events
     fill_start = 0
     for i in range(n):
         fill_end = fill_start + arrays[i].shape[axis]
@@ -612,7 +612,7 @@ def stack(arrays, /, *, axis=0):
     )
 
     _manager = dputils.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     for i in range(n):
         c_shapes_copy = tuple(
             i if j == axis else np.s_[:] for j in range(res_ndim)
@@ -869,7 +869,7 @@ def repeat(x, repeats, /, *, axis=None):
         )
 
     _manager = dputils.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if scalar:
         res_axis_size = repeats * axis_size
         if axis is not None:
@@ -1057,7 +1057,7 @@ def tile(x, repetitions, /):
         )
         # copy broadcast input into flat array
         _manager = dputils.SequentialOrderManager[exec_q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         hev, cp_ev = ti._copy_usm_ndarray_for_reshape(
             src=x, dst=res, sycl_queue=exec_q, depends=dep_evs
         )
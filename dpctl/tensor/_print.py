@@ -266,7 +266,7 @@ def _nd_corners(arr_in, edge_items):
             blocks.append((np.s_[:],))
 
     _manager = dpctl.utils.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     hev_list = []
     for slc in itertools.product(*blocks):
         hev, _ = ti._copy_usm_ndarray_into_usm_ndarray(
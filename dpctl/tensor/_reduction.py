@@ -20,6 +20,7 @@ import dpctl.tensor._tensor_impl as ti
 import dpctl.tensor._tensor_reductions_impl as tri
 from dpctl.utils import ExecutionPlacementError, SequentialOrderManager
 
+from ._dispatch_cache import DispatchCache
 from ._numpy_helper import normalize_axis_tuple
 from ._type_utils import (
     _default_accumulation_dtype,
@@ -27,6 +28,8 @@ from ._type_utils import (
     _to_device_supported_dtype,
 )
 
+_reduction_dtype_cache = DispatchCache()
+
 
 def _reduction_over_axis(
     x,
@@ -55,15 +58,25 @@ def _reduction_over_axis(
     res_shape = arr.shape[: nd - red_nd]
     q = x.sycl_queue
     inp_dt = x.dtype
-    if dtype is None:
-        res_dt = _default_reduction_type_fn(inp_dt, q)
-    else:
-        res_dt = dpt.dtype(dtype)
-        res_dt = _to_device_supported_dtype(res_dt, q.sycl_device)
-
     res_usm_type = x.usm_type
+    if dtype is not None:
+        # normalized data type is hashable, and spellings of the same
+        # type share an entry of the cache
+        dtype = dpt.dtype(dtype)
+    # support of atomic operations depends on the device and USM type,
+    # hence the queue is a part of the key
+    key = (_reduction_fn, inp_dt, dtype, res_usm_type, q)
+    resolved = _reduction_dtype_cache.get(key)
+    if resolved is None:
+        if dtype is None:
+            res_dt = _default_reduction_type_fn(inp_dt, q)
+        else:
+            res_dt = _to_device_supported_dtype(dtype, q.sycl_device)
 
-    implemented_types = _dtype_supported(inp_dt, res_dt, res_usm_type, q)
+        implemented_types = _dtype_supported(inp_dt, res_dt, res_usm_type, q)
+        _reduction_dtype_cache.put(key, (res_dt, implemented_types))
+    else:
+        res_dt, implemented_types = resolved
     if dtype is None and not implemented_types:
         raise RuntimeError(
             "Automatically determined reduction data type does not "
@@ -108,7 +121,7 @@ def _reduction_over_axis(
         )
 
     _manager = SequentialOrderManager[q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if red_nd == 0:
         ht_e_cpy, cpy_e = ti._copy_usm_ndarray_into_usm_ndarray(
             src=arr, dst=out, sycl_queue=q, depends=dep_evs
@@ -500,7 +513,7 @@ def _comparison_over_axis(x, axis, keepdims, out, _reduction_fn):
         )
 
     _manager = SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if red_nd == 0:
         ht_e_cpy, cpy_e = ti._copy_usm_ndarray_into_usm_ndarray(
             src=x_tmp, dst=out, sycl_queue=exec_q, depends=dep_evs
@@ -671,7 +684,7 @@ def _search_over_axis(x, axis, keepdims, out, _reduction_fn):
         )
 
     _manager = SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if red_nd == 0:
         ht_e_fill, fill_ev = ti._full_usm_ndarray(
             fill_value=0, dst=out, sycl_queue=exec_q, depends=dep_evs
@@ -166,7 +166,7 @@ def reshape(X, /, shape, *, order="C", copy=None):
             buffer_ctor_kwargs={"queue": copy_q},
         )
         _manager = dpctl.utils.SequentialOrderManager[copy_q]
-        dep_evs = _manager.submitted_events
+        dep_evs = _manager.dependency_events
         if order == "C":
             hev, r_e = _copy_usm_ndarray_for_reshape(
                 src=X, dst=flat_res, sycl_queue=copy_q, depends=dep_evs
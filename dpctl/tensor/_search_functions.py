@@ -45,11 +45,11 @@ def _default_dtype_from_weak_type(dt, dev):
     if isinstance(dt, WeakBooleanType):
         return dpt.bool
     if isinstance(dt, WeakIntegralType):
-        return dpt.dtype(ti.default_device_int_type(dev))
+        return dpt.dtype(dev.capabilities.default_int_type)
     if isinstance(dt, WeakFloatingType):
-        return dpt.dtype(ti.default_device_fp_type(dev))
+        return dpt.dtype(dev.capabilities.default_fp_type)
     if isinstance(dt, WeakComplexType):
-        return dpt.dtype(ti.default_device_complex_type(dev))
+        return dpt.dtype(dev.capabilities.default_complex_type)
 
 
 def _resolve_two_weak_types(o1_dtype, o2_dtype, dev):
@@ -63,7 +63,7 @@ def _resolve_two_weak_types(o1_dtype, o2_dtype, dev):
         o2_kind_num = _strong_dtype_num_kind(o2_dtype)
         if o1_kind_num > o2_kind_num:
             if isinstance(o1_dtype, WeakIntegralType):
-                return dpt.dtype(ti.default_device_int_type(dev)), o2_dtype
+                return dpt.dtype(dev.capabilities.default_int_type), o2_dtype
             if isinstance(o1_dtype, WeakComplexType):
                 if o2_dtype is dpt.float16 or o2_dtype is dpt.float32:
                     return dpt.complex64, o2_dtype
@@ -79,7 +79,7 @@ def _resolve_two_weak_types(o1_dtype, o2_dtype, dev):
         o2_kind_num = _weak_type_num_kind(o2_dtype)
         if o2_kind_num > o1_kind_num:
             if isinstance(o2_dtype, WeakIntegralType):
-                return o1_dtype, dpt.dtype(ti.default_device_int_type(dev))
+                return o1_dtype, dpt.dtype(dev.capabilities.default_int_type)
             if isinstance(o2_dtype, WeakComplexType):
                 if o1_dtype is dpt.float16 or o1_dtype is dpt.float32:
                     return o1_dtype, dpt.complex64
@@ -96,8 +96,9 @@ def _resolve_two_weak_types(o1_dtype, o2_dtype, dev):
 
 def _where_result_type(dt1, dt2, dev):
     res_dtype = dpt.result_type(dt1, dt2)
-    fp16 = dev.has_aspect_fp16
-    fp64 = dev.has_aspect_fp64
+    caps = dev.capabilities
+    fp16 = caps.has_fp16
+    fp64 = caps.has_fp64
 
     all_dts = _all_data_types(fp16, fp64)
     if res_dtype in all_dts:
@@ -335,7 +336,7 @@ def where(condition, x1, x2, /, *, order="K", out=None):
                 )
 
     _manager = SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if x1_dtype != out_dtype:
         if order == "K":
             _x1 = _empty_like_orderK(x1, out_dtype)
@@ -379,7 +380,7 @@ def where(condition, x1, x2, /, *, order="K", out=None):
     if x2_shape != res_shape:
         x2 = dpt.broadcast_to(x2, res_shape)
 
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     hev, where_ev = ti._where(
         condition=condition,
         x1=x1,
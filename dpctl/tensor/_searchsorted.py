@@ -88,7 +88,7 @@ def searchsorted(
     x2_dt = x2.dtype
 
     _manager = du.SequentialOrderManager[q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     ev = dpctl.SyclEvent()
     if sorter is not None:
         if not isdtype(sorter.dtype, "integral"):
@@ -120,7 +120,7 @@ def searchsorted(
         dt = result_type(x1, x2)
         if x1_dt != dt:
             x1_buf = _empty_like_orderK(x1, dt)
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             ht_ev, ev = ti_copy(
                 src=x1, dst=x1_buf, sycl_queue=q, depends=dep_evs
             )
@@ -128,7 +128,7 @@ def searchsorted(
             x1 = x1_buf
         if x2_dt != dt:
             x2_buf = _empty_like_orderK(x2, dt)
-            dep_evs = _manager.submitted_events
+            dep_evs = _manager.dependency_events
             ht_ev, ev = ti_copy(
                 src=x2, dst=x2_buf, sycl_queue=q, depends=dep_evs
             )
@@ -140,7 +140,7 @@ def searchsorted(
 
     dst = _empty_like_orderK(x2, index_dt, usm_type=dst_usm_type)
 
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if side == "left":
         ht_ev, s_ev = _searchsorted_left(
             hay=x1,
@@ -16,21 +16,28 @@
 
 from typing import NamedTuple
 
+import numpy as np
+
 import dpctl.tensor as dpt
 import dpctl.utils as du
 
+from ._copy_utils import _extract_impl
+from ._dispatch_cache import _queue_capabilities
+from ._lazy import DeferredSizeArray, LazyArray, _DeviceSize, _is_lazy_mode
 from ._tensor_elementwise_impl import _not_equal, _subtract
 from ._tensor_impl import (
     _copy_usm_ndarray_into_usm_ndarray,
     _extract,
     _full_usm_ndarray,
     _linspace_step,
+    _mask_positions_async,
     _take,
     default_device_index_type,
     mask_positions,
 )
 from ._tensor_sorting_impl import (
     _argsort_ascending,
+    _hash_unique_insert,
     _searchsorted_left,
     _sort_ascending,
 )
@@ -63,19 +70,154 @@ class UniqueInverseResult(NamedTuple):
     inverse_indices: dpt.usm_ndarray
 
 
-def unique_values(x: dpt.usm_ndarray) -> dpt.usm_ndarray:
-    """unique_values(x)
+# inputs smaller than this are always processed by sorting
+_hash_min_size = 2**16
+# number of elements sampled to estimate number of distinct values
+_hash_sample_size = 4096
+# hash table is used if the sample has at most this fraction of
+# distinct elements
+_hash_max_sample_ratio = 1 / 16
+
+
+def _validate_unique_method(method):
+    if method not in ("auto", "sort", "hash"):
+        raise ValueError(
+            f"`method` must be 'auto', 'sort' or 'hash', got {method!r}"
+        )
+
+
+def _hash_table_capacity(n_distinct):
+    "Power of two number of slots keeping load factor below one half"
+    cap = 1024
+    while cap < 2 * n_distinct:
+        cap *= 2
+    return cap
+
+
+def _select_hash_capacity(fx, method):
+    """Returns number of slots of hash table to find unique elements of
+    `fx` with, or None if unique elements are to be found by sorting"""
+    if method == "sort":
+        return None
+    supported = (
+        fx.dtype.kind in "biu"
+        and _queue_capabilities(fx.sycl_queue).has_atomic64
+    )
+    if method == "hash":
+        if not supported:
+            raise ValueError(
+                "method='hash' requires input of boolean or integral data "
+                "type, and device supporting 64-bit atomic operations"
+            )
+    elif not supported or fx.size < _hash_min_size:
+        return None
+    step = max(1, fx.size // _hash_sample_size)
+    sample = fx[::step]
+    n_sampled = unique_values(sample, method="sort").shape[0]
+    if method == "auto" and n_sampled > _hash_max_sample_ratio * sample.size:
+        return None
+    # headroom for distinct values absent from the sample
+    return _hash_table_capacity(4 * n_sampled)
+
+
+def _unique_hash(fx, capacity, strict):
+    """Finds unique elements of vector `fx`, their counts and indices of
+    their first occurrences with a device-side hash table.
+
+    Returns None if the table overflows, unless `strict` is true,
+    in which case the table is rebuilt with room for all elements."""
+    exec_q = fx.sycl_queue
+    usm_type = fx.usm_type
+    n = fx.size
+    if not fx.flags.c_contiguous:
+        fx = dpt.copy(fx, order="C")
+    _manager = du.SequentialOrderManager[exec_q]
+    while True:
+        keys = dpt.full(
+            capacity + 1,
+            np.iinfo(np.uint64).max,
+            dtype="u8",
+            usm_type=usm_type,
+            sycl_queue=exec_q,
+        )
+        counts = dpt.zeros(
+            capacity + 1, dtype="i8", usm_type=usm_type, sycl_queue=exec_q
+        )
+        first = dpt.full(
+            capacity + 1, n, dtype="i8", usm_type=usm_type, sycl_queue=exec_q
+        )
+        overflow = dpt.zeros(1, dtype="i8", sycl_queue=exec_q)
+        ht_ev, ins_ev = _hash_unique_insert(
+            src=fx,
+            keys=keys,
+            counts=counts,
+            first_indices=first,
+            overflow=overflow,
+            sycl_queue=exec_q,
+            depends=_manager.dependency_events,
+        )
+        _manager.add_event_pair(ht_ev, ins_ev)
+        # synchronizing call
+        if int(overflow[0]) == 0:
+            break
+        if not strict:
+            return None
+        capacity = _hash_table_capacity(n)
+    # slots with non-zero counts are occupied, use counts as the mask
+    vals = dpt.astype(_extract_impl(keys, counts, deferred=False), fx.dtype)
+    first = _extract_impl(first, counts, deferred=False)
+    counts = _extract_impl(counts, counts, deferred=False)
+    # order of slots is arbitrary, sort the (few) unique values
+    perm = dpt.argsort(vals)
+    return (
+        dpt.take(vals, perm),
+        dpt.take(counts, perm),
+        dpt.take(first, perm),
+    )
+
+
+def _inverse_indices(unique_vals, x, ind_dt):
+    "Positions of elements of `x` among sorted unique values"
+    exec_q = unique_vals.sycl_queue
+    _manager = du.SequentialOrderManager[exec_q]
+    inv = dpt.empty_like(x, dtype=ind_dt, order="C")
+    ht_ev, ssl_ev = _searchsorted_left(
+        hay=unique_vals,
+        needles=x,
+        positions=inv,
+        sycl_queue=exec_q,
+        depends=_manager.dependency_events,
+    )
+    _manager.add_event_pair(ht_ev, ssl_ev)
+    return inv
+
+
+def unique_values(x: dpt.usm_ndarray, /, *, method="auto") -> dpt.usm_ndarray:
+    """unique_values(x, /, *, method="auto")
 
     Returns the unique elements of an input array `x`.
 
     Args:
         x (usm_ndarray):
             input array. Inputs with more than one dimension are flattened.
+        method (str, optional):
+            algorithm used to find unique elements. ``"sort"`` sorts
+            the input, ``"hash"`` counts distinct elements with a hash
+            table built on the device, which is faster for large inputs
+            with few distinct elements, and is only supported for
+            boolean and integral data types. ``"auto"`` chooses between
+            them by the number of distinct elements in a sample of the
+            input. Default: ``"auto"``.
     Returns:
         usm_ndarray
             an array containing the set of unique elements in `x`. The
-            returned array has the same data type as `x`.
+            returned array has the same data type as `x`. Within
+            :func:`dpctl.tensor.lazy` context,
+            :class:`dpctl.tensor.DeferredSizeArray` is returned.
     """
+    deferred = _is_lazy_mode()
+    if isinstance(x, LazyArray):
+        x = x.materialize()
     if not isinstance(x, dpt.usm_ndarray):
         raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
     array_api_dev = x.device
@@ -86,9 +228,15 @@ def unique_values(x: dpt.usm_ndarray) -> dpt.usm_ndarray:
         fx = dpt.reshape(x, (x.size,), order="C")
     if fx.size == 0:
         return fx
+    _validate_unique_method(method)
+    capacity = _select_hash_capacity(fx, method)
+    if capacity is not None:
+        res = _unique_hash(fx, capacity, method == "hash")
+        if res is not None:
+            return res[0]
     s = dpt.empty_like(fx, order="C")
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if fx.flags.c_contiguous:
         ht_ev, sort_ev = _sort_ascending(
             src=fx,
@@ -127,6 +275,27 @@ def unique_values(x: dpt.usm_ndarray) -> dpt.usm_ndarray:
     )
     _manager.add_event_pair(ht_ev, one_ev)
     cumsum = dpt.empty(s.shape, dtype=dpt.int64, sycl_queue=exec_q)
+    if deferred:
+        ht_ev, mp_ev = _mask_positions_async(
+            unique_mask, cumsum, sycl_queue=exec_q, depends=[one_ev, uneq_ev]
+        )
+        _manager.add_event_pair(ht_ev, mp_ev)
+        # allocate for all elements being unique, the number of unique
+        # elements remains on device
+        unique_vals = dpt.empty(
+            fx.size, dtype=x.dtype, usm_type=x.usm_type, sycl_queue=exec_q
+        )
+        ht_ev, ex_e = _extract(
+            src=s,
+            cumsum=cumsum,
+            axis_start=0,
+            axis_end=1,
+            dst=unique_vals,
+            sycl_queue=exec_q,
+            depends=[mp_ev],
+        )
+        _manager.add_event_pair(ht_ev, ex_e)
+        return DeferredSizeArray(unique_vals, _DeviceSize(cumsum), 0)
     # synchronizing call
     n_uniques = mask_positions(
         unique_mask, cumsum, sycl_queue=exec_q, depends=[one_ev, uneq_ev]
@@ -148,8 +317,10 @@ def unique_values(x: dpt.usm_ndarray) -> dpt.usm_ndarray:
     return unique_vals
 
 
-def unique_counts(x: dpt.usm_ndarray) -> UniqueCountsResult:
-    """unique_counts(x)
+def unique_counts(
+    x: dpt.usm_ndarray, /, *, method="auto"
+) -> UniqueCountsResult:
+    """unique_counts(x, /, *, method="auto")
 
     Returns the unique elements of an input array `x` and the corresponding
     counts for each unique element in `x`.
@@ -157,6 +328,14 @@ def unique_counts(x: dpt.usm_ndarray) -> UniqueCountsResult:
     Args:
         x (usm_ndarray):
             input array. Inputs with more than one dimension are flattened.
+        method (str, optional):
+            algorithm used to find unique elements. ``"sort"`` sorts
+            the input, ``"hash"`` counts distinct elements with a hash
+            table built on the device, which is faster for large inputs
+            with few distinct elements, and is only supported for
+            boolean and integral data types. ``"auto"`` chooses between
+            them by the number of distinct elements in a sample of the
+            input. Default: ``"auto"``.
     Returns:
         tuple[usm_ndarray, usm_ndarray]
             a namedtuple `(values, counts)` whose
@@ -181,10 +360,17 @@ def unique_counts(x: dpt.usm_ndarray) -> UniqueCountsResult:
     ind_dt = default_device_index_type(exec_q)
     if fx.size == 0:
         return UniqueCountsResult(fx, dpt.empty_like(fx, dtype=ind_dt))
+    _validate_unique_method(method)
+    capacity = _select_hash_capacity(fx, method)
+    if capacity is not None:
+        res = _unique_hash(fx, capacity, method == "hash")
+        if res is not None:
+            vals, counts, _ = res
+            return UniqueCountsResult(vals, dpt.astype(counts, ind_dt))
     s = dpt.empty_like(fx, order="C")
 
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if fx.flags.c_contiguous:
         ht_ev, sort_ev = _sort_ascending(
             src=fx,
@@ -281,8 +467,8 @@ def unique_counts(x: dpt.usm_ndarray) -> UniqueCountsResult:
     return UniqueCountsResult(unique_vals, _counts)
 
 
-def unique_inverse(x):
-    """unique_inverse
+def unique_inverse(x, /, *, method="auto"):
+    """unique_inverse(x, /, *, method="auto")
 
     Returns the unique elements of an input array x and the indices from the
     set of unique elements that reconstruct `x`.
@@ -290,6 +476,14 @@ def unique_inverse(x):
     Args:
         x (usm_ndarray):
             input array. Inputs with more than one dimension are flattened.
+        method (str, optional):
+            algorithm used to find unique elements. ``"sort"`` sorts
+            the input, ``"hash"`` counts distinct elements with a hash
+            table built on the device, which is faster for large inputs
+            with few distinct elements, and is only supported for
+            boolean and integral data types. ``"auto"`` chooses between
+            them by the number of distinct elements in a sample of the
+            input. Default: ``"auto"``.
     Returns:
         tuple[usm_ndarray, usm_ndarray]
             a namedtuple `(values, inverse_indices)` whose
@@ -316,9 +510,16 @@ def unique_inverse(x):
     unsorting_ids = dpt.empty_like(sorting_ids, dtype=ind_dt, order="C")
     if fx.size == 0:
         return UniqueInverseResult(fx, dpt.reshape(unsorting_ids, x.shape))
+    _validate_unique_method(method)
+    capacity = _select_hash_capacity(fx, method)
+    if capacity is not None:
+        res = _unique_hash(fx, capacity, method == "hash")
+        if res is not None:
+            vals = res[0]
+            return UniqueInverseResult(vals, _inverse_indices(vals, x, ind_dt))
 
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if fx.flags.c_contiguous:
         ht_ev, sort_ev = _argsort_ascending(
             src=fx,
@@ -440,8 +641,8 @@ def unique_inverse(x):
     return UniqueInverseResult(unique_vals, inv)
 
 
-def unique_all(x: dpt.usm_ndarray) -> UniqueAllResult:
-    """unique_all(x)
+def unique_all(x: dpt.usm_ndarray, /, *, method="auto") -> UniqueAllResult:
+    """unique_all(x, /, *, method="auto")
 
     Returns the unique elements of an input array `x`, the first occurring
     indices for each unique element in `x`, the indices from the set of unique
@@ -451,6 +652,14 @@ def unique_all(x: dpt.usm_ndarray) -> UniqueAllResult:
     Args:
         x (usm_ndarray):
             input array. Inputs with more than one dimension are flattened.
+        method (str, optional):
+            algorithm used to find unique elements. ``"sort"`` sorts
+            the input, ``"hash"`` counts distinct elements with a hash
+            table built on the device, which is faster for large inputs
+            with few distinct elements, and is only supported for
+            boolean and integral data types. ``"auto"`` chooses between
+            them by the number of distinct elements in a sample of the
+            input. Default: ``"auto"``.
     Returns:
         tuple[usm_ndarray, usm_ndarray, usm_ndarray, usm_ndarray]
             a namedtuple `(values, indices, inverse_indices, counts)` whose
@@ -492,8 +701,20 @@ def unique_all(x: dpt.usm_ndarray) -> UniqueAllResult:
             dpt.reshape(unsorting_ids, x.shape),
             dpt.empty_like(fx, dtype=ind_dt),
         )
+    _validate_unique_method(method)
+    capacity = _select_hash_capacity(fx, method)
+    if capacity is not None:
+        res = _unique_hash(fx, capacity, method == "hash")
+        if res is not None:
+            vals, counts, first = res
+            return UniqueAllResult(
+                vals,
+                dpt.astype(first, ind_dt),
+                _inverse_indices(vals, x, ind_dt),
+                dpt.astype(counts, ind_dt),
+            )
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if fx.flags.c_contiguous:
         ht_ev, sort_ev = _argsort_ascending(
             src=fx,
@@ -0,0 +1,560 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import operator
+
+import numpy as np
+
+import dpctl
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_impl as ti
+import dpctl.utils as du
+
+from ._copy_utils import _broadcast_shapes
+from ._lazy import _eager_call
+from ._numpy_helper import normalize_axis_index, normalize_axis_tuple
+
+__doc__ = (
+    "Implementation module for arrays partitioned along an axis across "
+    "several SYCL queues."
+)
+
+
+def _to_queue(x, q):
+    "Returns array with data of `x` allocated on queue `q`"
+    if x.sycl_queue == q:
+        return x
+    if x.sycl_context == q.sycl_context:
+        # copy on the target queue, waiting for tasks on both queues
+        src = x.to_device(q)
+        res = dpt.empty_like(x, sycl_queue=q)
+        src_manager = du.SequentialOrderManager[x.sycl_queue]
+        dst_manager = du.SequentialOrderManager[q]
+        dep_evs = src_manager.submitted_events + dst_manager.submitted_events
+        ht_ev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+            src=src, dst=res, sycl_queue=q, depends=dep_evs
+        )
+        # later writes into `x` on its queue wait for the copy
+        src_manager.add_event_pair(ht_ev, cpy_ev)
+        dst_manager.add_event_pair(ht_ev, cpy_ev)
+        return res
+    # different contexts, copy via host
+    return dpt.asarray(x, sycl_queue=q)
+
+
+def _split_sizes(n, k):
+    base, rem = divmod(n, k)
+    return [base + (1 if i < rem else 0) for i in range(k)]
+
+
+def shard(x, queues, /, *, axis=0):
+    """shard(x, queues, /, *, axis=0)
+
+    Partitions array `x` along axis `axis` into contiguous blocks of
+    nearly equal extent, and copies each block to a queue from `queues`.
+
+    Element-wise operations and reductions over the resulting
+    :class:`dpctl.tensor.ShardedArray` are submitted to each of the
+    queues, so that work on different shards can execute concurrently.
+    Queues may, for example, target sub-devices created with
+    :meth:`dpctl.SyclDevice.create_sub_devices`.
+
+    Args:
+        x (usm_ndarray | numpy.ndarray):
+            array to partition.
+        queues (Sequence[dpctl.SyclQueue]):
+            queues to distribute blocks of `x` to. If `x` has fewer
+            than ``len(queues)`` elements along `axis`, only as many
+            queues as there are elements are used.
+        axis (int):
+            axis to partition `x` along. Default: `0`.
+
+    Returns:
+        ShardedArray:
+            array partitioned across `queues`.
+    """
+    queues = tuple(queues)
+    if not queues:
+        raise ValueError("Expected a non-empty sequence of queues")
+    for q in queues:
+        if not isinstance(q, dpctl.SyclQueue):
+            raise TypeError(f"Expected dpctl.SyclQueue, got {type(q)}")
+    if not isinstance(x, (dpt.usm_ndarray, np.ndarray)):
+        raise TypeError(
+            "Expected dpctl.tensor.usm_ndarray or numpy.ndarray, "
+            f"got {type(x)}"
+        )
+    if x.ndim == 0:
+        raise ValueError("Zero-dimensional arrays can not be partitioned")
+    axis = normalize_axis_index(operator.index(axis), x.ndim)
+    n = x.shape[axis]
+    k = max(1, min(len(queues), n))
+    shards = []
+    start = 0
+    for q, size in zip(queues[:k], _split_sizes(n, k)):
+        sl = (slice(None),) * axis + (slice(start, start + size),)
+        block = x[sl]
+        if isinstance(block, dpt.usm_ndarray):
+            if block.sycl_queue == q:
+                shards.append(dpt.copy(block))
+            else:
+                shards.append(_to_queue(block, q))
+        else:
+            shards.append(dpt.asarray(block, sycl_queue=q))
+        start += size
+    return ShardedArray(shards, axis)
+
+
+class ShardedArray:
+    """ShardedArray(shards, axis)
+
+    Array partitioned along an axis into blocks, each allocated on its
+    own :class:`dpctl.SyclQueue`.
+
+    Arrays are usually created with :func:`dpctl.tensor.shard`.
+    Element-wise operations are applied to each shard on its queue,
+    producing another :class:`ShardedArray`. Reductions over axes other
+    than the partitioned one produce a :class:`ShardedArray`, while
+    reductions over the partitioned axis combine partial results of
+    each shard on the queue of the first shard, producing a
+    :class:`dpctl.tensor.usm_ndarray`.
+
+    Args:
+        shards (Sequence[usm_ndarray]):
+            blocks of the array. Blocks must have the same data type
+            and the same shape except along axis `axis`.
+        axis (int):
+            axis the array is partitioned along.
+    """
+
+    def __init__(self, shards, axis):
+        shards = tuple(shards)
+        if not shards:
+            raise ValueError("Expected a non-empty sequence of shards")
+        for s in shards:
+            if not isinstance(s, dpt.usm_ndarray):
+                raise TypeError(
+                    f"Expected dpctl.tensor.usm_ndarray, got {type(s)}"
+                )
+        s0 = shards[0]
+        axis = normalize_axis_index(operator.index(axis), s0.ndim)
+        for s in shards[1:]:
+            if s.dtype != s0.dtype:
+                raise ValueError("Shards must have the same data type")
+            if (
+                s.ndim != s0.ndim
+                or s.shape[:axis] != s0.shape[:axis]
+                or s.shape[axis + 1 :] != s0.shape[axis + 1 :]
+            ):
+                raise ValueError(
+                    "Shapes of shards must only differ along axis "
+                    f"{axis}, got {s0.shape} and {s.shape}"
+                )
+        self._shards = shards
+        self._axis = axis
+        offsets = [0]
+        for s in shards:
+            offsets.append(offsets[-1] + s.shape[axis])
+        self._offsets = tuple(offsets)
+
+    @property
+    def shards(self):
+        """Tuple of blocks the array is partitioned into."""
+        return self._shards
+
+    @property
+    def axis(self):
+        """Axis the array is partitioned along."""
+        return self._axis
+
+    @property
+    def queues(self):
+        """Tuple of queues shards are allocated on."""
+        return tuple(s.sycl_queue for s in self._shards)
+
+    @property
+    def shape(self):
+        """Shape of the array."""
+        sh = list(self._shards[0].shape)
+        sh[self._axis] = self._offsets[-1]
+        return tuple(sh)
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the array."""
+        return self._shards[0].ndim
+
+    @property
+    def size(self):
+        """Number of elements in the array."""
+        res = 1
+        for d in self.shape:
+            res *= d
+        return res
+
+    @property
+    def dtype(self):
+        """Data type of the array."""
+        return self._shards[0].dtype
+
+    def __repr__(self):
+        return (
+            f"<ShardedArray shape={self.shape}, dtype={self.dtype}, "
+            f"axis={self._axis}, shards={len(self._shards)}>"
+        )
+
+    def __len__(self):
+        return self.shape[0]
+
+    def gather(self, sycl_queue=None):
+        """gather(sycl_queue=None)
+
+        Assembles shards into a single array.
+
+        Args:
+            sycl_queue (dpctl.SyclQueue, optional):
+                queue to allocate the result on. If ``None``, the queue
+                of the first shard is used.
+
+        Returns:
+            usm_ndarray:
+                array with the content of all shards.
+        """
+        if sycl_queue is None:
+            sycl_queue = self._shards[0].sycl_queue
+        parts = [_to_queue(s, sycl_queue) for s in self._shards]
+        return dpt.concat(parts, axis=self._axis)
+
+    def _partition_like(self, other):
+        "Blocks of `other` matching shards of this array"
+        if isinstance(other, ShardedArray):
+            if other._axis != self._axis or other._offsets != self._offsets:
+                raise ValueError(
+                    "Sharded arrays must be partitioned identically"
+                )
+            return [
+                _to_queue(o, s.sycl_queue)
+                for o, s in zip(other._shards, self._shards)
+            ]
+        if isinstance(other, (dpt.usm_ndarray, np.ndarray)):
+            nd = self.ndim
+            if other.ndim > nd:
+                raise ValueError(
+                    f"Array of shape {other.shape} can not be broadcast to "
+                    f"shape {self.shape} of the sharded array"
+                )
+            if other.ndim < nd:
+                other = other.reshape((1,) * (nd - other.ndim) + other.shape)
+            if _broadcast_shapes(other.shape, self.shape) != self.shape:
+                raise ValueError(
+                    f"Array of shape {other.shape} can not be broadcast to "
+                    f"shape {self.shape} of the sharded array"
+                )
+            res = []
+            for i, s in enumerate(self._shards):
+                if other.shape[self._axis] == 1:
+                    block = other
+                else:
+                    start, stop = self._offsets[i], self._offsets[i + 1]
+                    sl = (slice(None),) * self._axis + (slice(start, stop),)
+                    block = other[sl]
+                if isinstance(block, dpt.usm_ndarray):
+                    res.append(_to_queue(block, s.sycl_queue))
+                else:
+                    res.append(dpt.asarray(block, sycl_queue=s.sycl_queue))
+            return res
+        # Python scalars are passed through
+        return [other] * len(self._shards)
+
+    @_eager_call
+    def map(self, fn, *args, **kwargs):
+        """map(fn, *args, **kwargs)
+
+        Applies element-wise function `fn` to each shard.
+
+        Args:
+            fn (Callable):
+                element-wise function, e.g. :func:`dpctl.tensor.sin`.
+                It is called as ``fn(shard, *shard_args, **kwargs)`` for
+                each shard, where ``shard_args`` are blocks of `args`
+                matching the shard.
+            args:
+                additional arguments of `fn`: instances of
+                :class:`ShardedArray` partitioned identically with this
+                array, arrays broadcastable to its shape, or scalars.
+
+        Returns:
+            ShardedArray:
+                result of the element-wise function.
+        """
+        blocks = [self._partition_like(a) for a in args]
+        res = []
+        for i, s in enumerate(self._shards):
+            res.append(fn(s, *(b[i] for b in blocks), **kwargs))
+        return ShardedArray(res, self._axis)
+
+    @_eager_call
+    def _rmap(self, fn, other):
+        blocks = self._partition_like(other)
+        res = [fn(b, s) for b, s in zip(blocks, self._shards)]
+        return ShardedArray(res, self._axis)
+
+    @_eager_call
+    def reduce(self, fn, /, *, axis=None, keepdims=False, **kwargs):
+        """reduce(fn, /, *, axis=None, keepdims=False, **kwargs)
+
+        Computes reduction `fn` over axes `axis`.
+
+        Args:
+            fn (Callable):
+                one of :func:`dpctl.tensor.sum`, :func:`dpctl.tensor.prod`,
+                :func:`dpctl.tensor.max`, :func:`dpctl.tensor.min`,
+                :func:`dpctl.tensor.argmax`, :func:`dpctl.tensor.argmin`,
+                :func:`dpctl.tensor.logsumexp`,
+                :func:`dpctl.tensor.reduce_hypot`, :func:`dpctl.tensor.all`,
+                :func:`dpctl.tensor.any`, or :func:`dpctl.tensor.mean`.
+            axis (Optional[int, Tuple[int, ...]]):
+                axes to reduce over. If ``None``, the array is reduced
+                over all axes. Default: ``None``.
+            keepdims (bool):
+                if ``True``, reduced axes are retained as singleton
+                dimensions. Default: ``False``.
+            kwargs:
+                additional keyword arguments of `fn`, e.g. ``dtype``.
+
+        Returns:
+            Union[ShardedArray, usm_ndarray]:
+                result of reduction. If the partitioned axis is reduced
+                over, the result is allocated on the queue of the first
+                shard, otherwise it is partitioned as this array.
+        """
+        nd = self.ndim
+        if fn in (dpt.argmax, dpt.argmin):
+            return self._search(fn, axis, keepdims)
+        if fn is dpt.mean:
+            return self._mean(axis, keepdims)
+        if fn not in (
+            dpt.sum,
+            dpt.prod,
+            dpt.max,
+            dpt.min,
+            dpt.logsumexp,
+            dpt.reduce_hypot,
+            dpt.all,
+            dpt.any,
+        ):
+            raise ValueError(f"Unsupported reduction {fn}")
+        if axis is None:
+            axis = tuple(range(nd))
+        if not isinstance(axis, (tuple, list)):
+            axis = (axis,)
+        axis = normalize_axis_tuple(axis, nd, "axis")
+        if self._axis not in axis:
+            res = [
+                fn(s, axis=axis, keepdims=keepdims, **kwargs)
+                for s in self._shards
+            ]
+            return ShardedArray(res, self._reduced_axis(axis, keepdims))
+        # reduce each shard, then combine per-shard partial results
+        partials = [
+            fn(s, axis=axis, keepdims=True, **kwargs) for s in self._shards
+        ]
+        combine_kwargs = {}
+        if "dtype" in kwargs:
+            combine_kwargs["dtype"] = kwargs["dtype"]
+        res = fn(
+            self._gather_partials(partials),
+            axis=self._axis,
+            keepdims=True,
+            **combine_kwargs,
+        )
+        if not keepdims:
+            res = dpt.squeeze(res, axis=axis)
+        return res
+
+    def _reduced_axis(self, axis, keepdims):
+        if keepdims:
+            return self._axis
+        return self._axis - sum(1 for a in axis if a < self._axis)
+
+    def _gather_partials(self, partials):
+        q = self._shards[0].sycl_queue
+        return dpt.concat([_to_queue(p, q) for p in partials], axis=self._axis)
+
+    def _mean(self, axis, keepdims):
+        nd = self.ndim
+        if axis is None:
+            axis = tuple(range(nd))
+        if not isinstance(axis, (tuple, list)):
+            axis = (axis,)
+        axis = normalize_axis_tuple(axis, nd, "axis")
+        if self._axis not in axis:
+            res = [
+                dpt.mean(s, axis=axis, keepdims=keepdims) for s in self._shards
+            ]
+            return ShardedArray(res, self._reduced_axis(axis, keepdims))
+        nelems = 1
+        for i in axis:
+            nelems *= self.shape[i]
+        res_dt = self.dtype
+        if res_dt.kind not in "fc":
+            q = self._shards[0].sycl_queue
+            res_dt = dpt.dtype(ti.default_device_fp_type(q))
+        res = self.reduce(dpt.sum, axis=axis, keepdims=keepdims, dtype=res_dt)
+        res /= nelems
+        return res
+
+    def _search(self, fn, axis, keepdims):
+        nd = self.ndim
+        if axis is None and nd == 1:
+            axis = 0
+        if axis is None:
+            if self._axis != 0:
+                return fn(self.gather(), axis=None, keepdims=keepdims)
+            flat = True
+        else:
+            axis = normalize_axis_index(operator.index(axis), nd)
+            if axis != self._axis:
+                res = [
+                    fn(s, axis=axis, keepdims=keepdims) for s in self._shards
+                ]
+                return ShardedArray(res, self._reduced_axis((axis,), keepdims))
+            flat = False
+        if self.shape[self._axis] == 0:
+            # raises, like searching an empty array
+            return fn(self.gather(), axis=axis, keepdims=keepdims)
+        # offsets of shards in C-contiguous flattened array
+        inner = self.size // self.shape[0] if flat else 1
+        val_fn = dpt.max if fn is dpt.argmax else dpt.min
+        vals, idxs = [], []
+        for s, off in zip(self._shards, self._offsets):
+            if s.shape[self._axis] == 0:
+                continue
+            if flat:
+                v = dpt.reshape(val_fn(s), (1,))
+                i = dpt.reshape(fn(s), (1,))
+            else:
+                v = val_fn(s, axis=axis, keepdims=True)
+                i = fn(s, axis=axis, keepdims=True)
+            vals.append(v)
+            idxs.append(i + off * inner)
+        q = self._shards[0].sycl_queue
+        red_axis = 0 if flat else self._axis
+        vals = dpt.concat([_to_queue(v, q) for v in vals], axis=red_axis)
+        idxs = dpt.concat([_to_queue(i, q) for i in idxs], axis=red_axis)
+        # the first shard holding the extremal value holds the first
+        # occurrence of it
+        winner = fn(vals, axis=red_axis, keepdims=True)
+        res = dpt.take_along_axis(idxs, winner, axis=red_axis)
+        if flat:
+            return dpt.reshape(res, (1,) * nd if keepdims else ())
+        if not keepdims:
+            res = dpt.squeeze(res, axis=red_axis)
+        return res
+
+    def sum(self, axis=None, dtype=None, keepdims=False):
+        """Sum of elements, see :func:`dpctl.tensor.sum`"""
+        return self.reduce(dpt.sum, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    def prod(self, axis=None, dtype=None, keepdims=False):
+        """Product of elements, see :func:`dpctl.tensor.prod`"""
+        return self.reduce(dpt.prod, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    def max(self, axis=None, keepdims=False):
+        """Maximal elements, see :func:`dpctl.tensor.max`"""
+        return self.reduce(dpt.max, axis=axis, keepdims=keepdims)
+
+    def min(self, axis=None, keepdims=False):
+        """Minimal elements, see :func:`dpctl.tensor.min`"""
+        return self.reduce(dpt.min, axis=axis, keepdims=keepdims)
+
+    def argmax(self, axis=None, keepdims=False):
+        """Indices of maximal elements, see :func:`dpctl.tensor.argmax`"""
+        return self.reduce(dpt.argmax, axis=axis, keepdims=keepdims)
+
+    def argmin(self, axis=None, keepdims=False):
+        """Indices of minimal elements, see :func:`dpctl.tensor.argmin`"""
+        return self.reduce(dpt.argmin, axis=axis, keepdims=keepdims)
+
+    def mean(self, axis=None, keepdims=False):
+        """Arithmetic mean of elements, see :func:`dpctl.tensor.mean`"""
+        return self.reduce(dpt.mean, axis=axis, keepdims=keepdims)
+
+    def __abs__(self):
+        return self.map(dpt.abs)
+
+    def __neg__(self):
+        return self.map(dpt.negative)
+
+    def __pos__(self):
+        return self.map(dpt.positive)
+
+    def __invert__(self):
+        return self.map(dpt.bitwise_invert)
+
+    def __add__(self, other):
+        return self.map(dpt.add, other)
+
+    def __radd__(self, other):
+        return self._rmap(dpt.add, other)
+
+    def __sub__(self, other):
+        return self.map(dpt.subtract, other)
+
+    def __rsub__(self, other):
+        return self._rmap(dpt.subtract, other)
+
+    def __mul__(self, other):
+        return self.map(dpt.multiply, other)
+
+    def __rmul__(self, other):
+        return self._rmap(dpt.multiply, other)
+
+    def __truediv__(self, other):
+        return self.map(dpt.divide, other)
+
+    def __rtruediv__(self, other):
+        return self._rmap(dpt.divide, other)
+
+    def __floordiv__(self, other):
+        return self.map(dpt.floor_divide, other)
+
+    def __rfloordiv__(self, other):
+        return self._rmap(dpt.floor_divide, other)
+
+    def __mod__(self, other):
+        return self.map(dpt.remainder, other)
+
+    def __rmod__(self, other):
+        return self._rmap(dpt.remainder, other)
+
+    def __pow__(self, other):
+        return self.map(dpt.pow, other)
+
+    def __rpow__(self, other):
+        return self._rmap(dpt.pow, other)
+
+    def __lt__(self, other):
+        return self.map(dpt.less, other)
+
+    def __le__(self, other):
+        return self.map(dpt.less_equal, other)
+
+    def __gt__(self, other):
+        return self.map(dpt.greater, other)
+
+    def __ge__(self, other):
+        return self.map(dpt.greater_equal, other)
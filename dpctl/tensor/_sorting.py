@@ -17,10 +17,12 @@
 import operator
 from typing import NamedTuple
 
+import dpctl
 import dpctl.tensor as dpt
 import dpctl.tensor._tensor_impl as ti
 import dpctl.utils as du
 
+from ._lazy import _eager_call
 from ._numpy_helper import normalize_axis_index
 from ._tensor_sorting_impl import (
     _argsort_ascending,
@@ -30,12 +32,30 @@ from ._tensor_sorting_impl import (
     _radix_sort_ascending,
     _radix_sort_descending,
     _radix_sort_dtype_supported,
+    _segmented_sort_ascending,
+    _segmented_sort_descending,
+    _segmented_sort_max_segment_size,
     _sort_ascending,
+    _sort_by_key_ascending,
+    _sort_by_key_descending,
     _sort_descending,
     _topk,
 )
 
-__all__ = ["sort", "argsort"]
+__all__ = [
+    "sort",
+    "argsort",
+    "segmented_sort",
+    "segmented_argsort",
+    "sort_by_key",
+    "lexsort",
+    "top_k",
+    "TopKAccumulator",
+]
+
+# rows not longer than this are sorted by a sorting network, several rows
+# per work-group, which outperforms radix sort for such rows
+_small_segments_max_size = _segmented_sort_max_segment_size()
 
 
 def _get_mergesort_impl_fn(descending):
@@ -69,7 +89,9 @@ def sort(x, /, *, axis=-1, descending=False, stable=True, kind=None):
         kind (Optional[Literal["stable", "mergesort", "radixsort"]]):
             Sorting algorithm. The default is `"stable"`, which uses parallel
             merge-sort or parallel radix-sort algorithms depending on the
-            array data type.
+            array data type. Short rows, of at most 256 elements, are
+            sorted with a bitonic sorting network, several rows per
+            work-group, unless `"radixsort"` is requested.
     Returns:
         usm_ndarray:
             a sorted array. The returned array has the same data type and
@@ -114,13 +136,20 @@ def sort(x, /, *, axis=-1, descending=False, stable=True, kind=None):
             raise ValueError(f"Radix sort is not supported for {x.dtype}")
     else:
         dt = x.dtype
-        if dt in [dpt.bool, dpt.uint8, dpt.int8, dpt.int16, dpt.uint16]:
+        short_rows = arr.shape[-1] <= _small_segments_max_size
+        if not short_rows and dt in [
+            dpt.bool,
+            dpt.uint8,
+            dpt.int8,
+            dpt.int16,
+            dpt.uint16,
+        ]:
             impl_fn = _get_radixsort_impl_fn(descending)
         else:
             impl_fn = _get_mergesort_impl_fn(descending)
     exec_q = x.sycl_queue
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if arr.flags.c_contiguous:
         res = dpt.empty_like(arr, order="C")
         ht_ev, impl_ev = impl_fn(
@@ -183,7 +212,9 @@ def argsort(x, axis=-1, descending=False, stable=True, kind=None):
         kind (Optional[Literal["stable", "mergesort", "radixsort"]]):
             Sorting algorithm. The default is `"stable"`, which uses parallel
             merge-sort or parallel radix-sort algorithms depending on the
-            array data type.
+            array data type. Short rows, of at most 256 elements, are
+            sorted with a bitonic sorting network, several rows per
+            work-group, unless `"radixsort"` is requested.
 
     Returns:
         usm_ndarray:
@@ -232,13 +263,20 @@ def argsort(x, axis=-1, descending=False, stable=True, kind=None):
             raise ValueError(f"Radix sort is not supported for {x.dtype}")
     else:
         dt = x.dtype
-        if dt in [dpt.bool, dpt.uint8, dpt.int8, dpt.int16, dpt.uint16]:
+        short_rows = arr.shape[-1] <= _small_segments_max_size
+        if not short_rows and dt in [
+            dpt.bool,
+            dpt.uint8,
+            dpt.int8,
+            dpt.int16,
+            dpt.uint16,
+        ]:
             impl_fn = _get_radixargsort_impl_fn(descending)
         else:
             impl_fn = _get_mergeargsort_impl_fn(descending)
     exec_q = x.sycl_queue
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     index_dt = ti.default_device_index_type(exec_q)
     if arr.flags.c_contiguous:
         res = dpt.empty_like(arr, dtype=index_dt, order="C")
@@ -271,6 +309,325 @@ def argsort(x, axis=-1, descending=False, stable=True, kind=None):
     return res
 
 
+def _segment_bounds(x, offsets):
+    "Validates segments and returns the maximal size of a segment"
+    if not isinstance(x, dpt.usm_ndarray):
+        raise TypeError(
+            f"Expected type dpctl.tensor.usm_ndarray, got {type(x)}"
+        )
+    if not isinstance(offsets, dpt.usm_ndarray):
+        raise TypeError(
+            f"Expected type dpctl.tensor.usm_ndarray, got {type(offsets)}"
+        )
+    if x.ndim != 1:
+        raise ValueError(
+            f"Expected one-dimensional input array, got {x.ndim} dimensions"
+        )
+    if offsets.ndim != 1 or offsets.size < 1:
+        raise ValueError("Expected non-empty one-dimensional offsets array")
+    if offsets.dtype.kind not in "iu":
+        raise TypeError(
+            f"Offsets array must have integral data type, got {offsets.dtype}"
+        )
+    exec_q = du.get_execution_queue((x.sycl_queue, offsets.sycl_queue))
+    if exec_q is None:
+        raise du.ExecutionPlacementError(
+            "Execution placement can not be unambiguously inferred "
+            "from input arguments."
+        )
+    offsets = dpt.astype(offsets, dpt.int64, order="C", copy=False)
+    n_segs = offsets.size - 1
+    if n_segs > 0:
+        sizes = offsets[1:] - offsets[:-1]
+        bounds = dpt.concat(
+            (
+                offsets[:1],
+                offsets[-1:],
+                dpt.min(sizes, keepdims=True),
+                dpt.max(sizes, keepdims=True),
+            )
+        )
+        first, last, min_size, max_size = (int(v) for v in dpt.asnumpy(bounds))
+    else:
+        sizes = None
+        first = last = int(offsets[0])
+        min_size = max_size = 0
+    if first != 0 or last != x.size or min_size < 0:
+        raise ValueError(
+            "Offsets must be non-decreasing, starting at zero, and ending "
+            "at the size of the input array"
+        )
+    return offsets, sizes, max_size
+
+
+def _segmented_sort_impl(x, offsets, descending, sort_indices):
+    offsets, sizes, max_size = _segment_bounds(x, offsets)
+    exec_q = x.sycl_queue
+    index_dt = dpt.int64
+    if max_size > _small_segments_max_size:
+        # stable sort of the whole array, followed by stable sort by
+        # segment, keeps elements of each segment sorted
+        seg_ids = dpt.repeat(
+            dpt.arange(sizes.size, dtype=index_dt, sycl_queue=exec_q), sizes
+        )
+        perm = argsort(x, descending=descending)
+        perm = dpt.take(perm, argsort(dpt.take(seg_ids, perm)))
+        return perm if sort_indices else dpt.take(x, perm)
+    if not x.flags.c_contiguous:
+        x = dpt.copy(x, order="C")
+    if sort_indices:
+        res = dpt.empty_like(x, dtype=index_dt, order="C")
+    else:
+        res = dpt.empty_like(x, order="C")
+    if x.size == 0:
+        return res
+    impl_fn = (
+        _segmented_sort_descending if descending else _segmented_sort_ascending
+    )
+    _manager = du.SequentialOrderManager[exec_q]
+    ht_ev, impl_ev = impl_fn(
+        src=x,
+        offsets=offsets,
+        max_segment_size=max_size,
+        dst=res,
+        sort_indices=sort_indices,
+        sycl_queue=exec_q,
+        depends=_manager.dependency_events,
+    )
+    _manager.add_event_pair(ht_ev, impl_ev)
+    return res
+
+
+def segmented_sort(x, offsets, /, *, descending=False):
+    """segmented_sort(x, offsets, /, *, descending=False)
+
+    Returns a copy of one-dimensional array `x` with each segment
+    `x[offsets[i]:offsets[i+1]]` sorted independently, for example rows
+    of a ragged array stored one after another.
+
+    Segments of at most 256 elements are sorted with a bitonic sorting
+    network, several segments per work-group. Otherwise, the whole array
+    is sorted, and then stably reordered by segment. The sort is stable.
+
+    Args:
+        x (usm_ndarray):
+            one-dimensional input array.
+        offsets (usm_ndarray):
+            one-dimensional array of integral data type with boundaries of
+            segments. Offsets must be non-decreasing, the first offset must
+            be zero, and the last offset must be equal to the size of `x`.
+        descending (Optional[bool]):
+            sort order. If `True`, segments are sorted in descending order
+            (by value). If `False`, segments are sorted in ascending order
+            (by value). Default: `False`.
+
+    Returns:
+        usm_ndarray:
+            an array with segments sorted, with the same data type and
+            the same shape as the input array `x`.
+    """
+    return _segmented_sort_impl(x, offsets, descending, False)
+
+
+def segmented_argsort(x, offsets, /, *, descending=False):
+    """segmented_argsort(x, offsets, /, *, descending=False)
+
+    Returns the indices that sort each segment `x[offsets[i]:offsets[i+1]]`
+    of one-dimensional array `x` independently, such that
+    ``dpt.take(x, segmented_argsort(x, offsets))`` is equal to
+    ``segmented_sort(x, offsets)``.
+
+    Args:
+        x (usm_ndarray):
+            one-dimensional input array.
+        offsets (usm_ndarray):
+            one-dimensional array of integral data type with boundaries of
+            segments. Offsets must be non-decreasing, the first offset must
+            be zero, and the last offset must be equal to the size of `x`.
+        descending (Optional[bool]):
+            sort order. If `True`, segments are sorted in descending order
+            (by value). If `False`, segments are sorted in ascending order
+            (by value). Default: `False`.
+
+    Returns:
+        usm_ndarray:
+            an array of indices into `x`, relative to the beginning of the
+            array. The returned array has the same shape as `x`, and has
+            data type `int64`.
+    """
+    return _segmented_sort_impl(x, offsets, descending, True)
+
+
+class SortByKeyResult(NamedTuple):
+    keys: dpt.usm_ndarray
+    values: dpt.usm_ndarray
+
+
+def sort_by_key(keys, values, /, *, axis=-1, descending=False):
+    """sort_by_key(keys, values, /, *, axis=-1, descending=False)
+
+    Stably sorts array `keys` along the given axis, and reorders array
+    `values` of the same shape alongside.
+
+    The result is the same as that of ``dpt.take_along_axis`` applied to
+    `keys` and to `values` with indices computed by :func:`argsort`, but
+    values are moved together with keys while sorting, without computing
+    the indices and gathering by them.
+
+    Args:
+        keys (usm_ndarray):
+            array of keys to sort.
+        values (usm_ndarray):
+            array of values with the same shape as `keys`. Values may
+            have any data type.
+        axis (Optional[int]):
+            axis along which to sort. Default: `-1`.
+        descending (Optional[bool]):
+            sort order. If `True`, keys are sorted in descending order.
+            Default: `False`.
+
+    Returns:
+        tuple[usm_ndarray, usm_ndarray]:
+            a namedtuple `(keys, values)` of sorted keys, and values
+            reordered alongside them. The arrays have the same shapes
+            and data types as the input arrays.
+    """
+    if not isinstance(keys, dpt.usm_ndarray):
+        raise TypeError(
+            f"Expected type dpctl.tensor.usm_ndarray, got {type(keys)}"
+        )
+    if not isinstance(values, dpt.usm_ndarray):
+        raise TypeError(
+            f"Expected type dpctl.tensor.usm_ndarray, got {type(values)}"
+        )
+    if keys.shape != values.shape:
+        raise ValueError(
+            "Keys and values must have the same shape, got "
+            f"{keys.shape} and {values.shape}"
+        )
+    exec_q = du.get_execution_queue((keys.sycl_queue, values.sycl_queue))
+    if exec_q is None:
+        raise du.ExecutionPlacementError(
+            "Execution placement can not be unambiguously inferred "
+            "from input arguments."
+        )
+    nd = keys.ndim
+    if nd == 0:
+        axis = normalize_axis_index(axis, ndim=1, msg_prefix="axis")
+        return SortByKeyResult(
+            dpt.copy(keys, order="C"), dpt.copy(values, order="C")
+        )
+    axis = normalize_axis_index(axis, ndim=nd, msg_prefix="axis")
+    a1 = axis + 1
+    if a1 == nd:
+        perm = list(range(nd))
+        k_arr, v_arr = keys, values
+    else:
+        perm = [i for i in range(nd) if i != axis] + [
+            axis,
+        ]
+        k_arr = dpt.permute_dims(keys, perm)
+        v_arr = dpt.permute_dims(values, perm)
+    impl_fn = _sort_by_key_descending if descending else _sort_by_key_ascending
+    _manager = du.SequentialOrderManager[exec_q]
+    dep_evs = _manager.dependency_events
+    if not (k_arr.flags.c_contiguous and v_arr.flags.c_contiguous):
+        if not k_arr.flags.c_contiguous:
+            tmp = dpt.empty_like(k_arr, order="C")
+            ht_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+                src=k_arr, dst=tmp, sycl_queue=exec_q, depends=dep_evs
+            )
+            _manager.add_event_pair(ht_ev, copy_ev)
+            k_arr = tmp
+        if not v_arr.flags.c_contiguous:
+            tmp = dpt.empty_like(v_arr, order="C")
+            ht_ev, copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+                src=v_arr, dst=tmp, sycl_queue=exec_q, depends=dep_evs
+            )
+            _manager.add_event_pair(ht_ev, copy_ev)
+            v_arr = tmp
+        # copies are included in submitted events
+        dep_evs = _manager.dependency_events
+    k_res = dpt.empty_like(k_arr, order="C")
+    v_res = dpt.empty_like(v_arr, order="C")
+    ht_ev, impl_ev = impl_fn(
+        keys=k_arr,
+        values=v_arr,
+        trailing_dims_to_sort=1,
+        keys_dst=k_res,
+        values_dst=v_res,
+        sycl_queue=exec_q,
+        depends=dep_evs,
+    )
+    _manager.add_event_pair(ht_ev, impl_ev)
+    if a1 != nd:
+        inv_perm = sorted(range(nd), key=lambda d: perm[d])
+        k_res = dpt.permute_dims(k_res, inv_perm)
+        v_res = dpt.permute_dims(v_res, inv_perm)
+    return SortByKeyResult(k_res, v_res)
+
+
+def lexsort(keys, /, *, axis=-1):
+    """lexsort(keys, /, *, axis=-1)
+
+    Returns the indices that sort arrays of a sequence of keys
+    lexicographically along the given axis. The last key is the primary
+    sort key, the second to last key is the secondary sort key, and so on,
+    consistently with :func:`numpy.lexsort`.
+
+    Keys are processed from the first to the last one. Indices sorting
+    the preceding keys are reordered by the next key with
+    :func:`sort_by_key`, which preserves the order of equal keys.
+
+    Args:
+        keys (Sequence[usm_ndarray] | usm_ndarray):
+            sequence of arrays of the same shape. An array with at least
+            one dimension is interpreted as a sequence of its sub-arrays
+            along the first axis.
+        axis (Optional[int]):
+            axis along which to sort. Default: `-1`.
+
+    Returns:
+        usm_ndarray:
+            an array of indices with the shape of the keys, and default
+            array index data type.
+    """
+    if isinstance(keys, dpt.usm_ndarray):
+        if keys.ndim == 0:
+            raise ValueError("Expected array of keys with at least one axis")
+        keys = [keys[i] for i in range(keys.shape[0])]
+    else:
+        keys = list(keys)
+    if len(keys) == 0:
+        raise ValueError("Expected at least one key")
+    for k in keys:
+        if not isinstance(k, dpt.usm_ndarray):
+            raise TypeError(
+                f"Expected type dpctl.tensor.usm_ndarray, got {type(k)}"
+            )
+    sh = keys[0].shape
+    if any(k.shape != sh for k in keys[1:]):
+        raise ValueError("All keys must have the same shape")
+    exec_q = du.get_execution_queue(tuple(k.sycl_queue for k in keys))
+    if exec_q is None:
+        raise du.ExecutionPlacementError(
+            "Execution placement can not be unambiguously inferred "
+            "from input arguments."
+        )
+    nd = len(sh)
+    if nd == 0:
+        axis = normalize_axis_index(axis, ndim=1, msg_prefix="axis")
+        return dpt.zeros_like(
+            keys[0], dtype=ti.default_device_index_type(exec_q), order="C"
+        )
+    axis = normalize_axis_index(axis, ndim=nd, msg_prefix="axis")
+    inds = argsort(keys[0], axis=axis)
+    for k in keys[1:]:
+        k_perm = dpt.take_along_axis(k, inds, axis=axis)
+        _, inds = sort_by_key(k_perm, inds, axis=axis)
+    return inds
+
+
 def _get_top_k_largest(mode):
     modes = {"largest": True, "smallest": False}
     try:
@@ -366,7 +723,7 @@ def top_k(x, k, /, *, axis=None, mode="largest"):
 
     exec_q = x.sycl_queue
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
 
     res_usm_type = arr.usm_type
     if arr.flags.c_contiguous:
@@ -432,3 +789,165 @@ def top_k(x, k, /, *, axis=None, mode="largest"):
         inds = dpt.permute_dims(inds, inv_perm)
 
     return TopKResult(vals, inds)
+
+
+class TopKAccumulator:
+    """
+    TopKAccumulator(k, /, *, mode="largest", sycl_queue=None)
+
+    Incrementally computes the `k` largest or smallest values, and their
+    indices, of a sequence of chunks of data which need not reside on
+    the device at the same time.
+
+    Each chunk passed to :meth:`update` is reduced to its own `k`
+    candidates, which are merged with the running result. The running
+    result, of at most `k` elements, stays on the device, and no
+    synchronization with the host is performed until :meth:`result` is
+    called.
+
+    Chunks are flattened, and positions of their elements are offset by
+    the position of the chunk in the sequence, which by default is the
+    number of elements in the preceding chunks.
+
+    Args:
+        k (int):
+            number of elements to find. Must be a positive integer value.
+        mode (Literal["largest", "smallest"]):
+            search mode, as in :func:`dpctl.tensor.top_k`.
+            Default: `"largest"`.
+        sycl_queue (:class:`dpctl.SyclQueue`, optional):
+            queue the running result is allocated on. By default, the
+            queue of the first chunk, or the default queue if the first
+            chunk is not a `usm_ndarray`.
+    """
+
+    def __init__(self, k, /, *, mode="largest", sycl_queue=None):
+        k = operator.index(k)
+        if k < 1:
+            raise ValueError("`k` must be a positive integer value")
+        _get_top_k_largest(mode)
+        if sycl_queue is not None and not isinstance(
+            sycl_queue, dpctl.SyclQueue
+        ):
+            raise TypeError(f"Expected dpctl.SyclQueue, got {type(sycl_queue)}")
+        self._k = k
+        self._mode = mode
+        self._queue = sycl_queue
+        self.reset()
+
+    @property
+    def k(self):
+        """Number of elements to find."""
+        return self._k
+
+    @property
+    def mode(self):
+        """Search mode, `"largest"` or `"smallest"`."""
+        return self._mode
+
+    @property
+    def count(self):
+        """Number of elements fed into the accumulator so far."""
+        return self._count
+
+    @property
+    def sycl_queue(self):
+        """:class:`dpctl.SyclQueue` the running result is allocated on,
+        or `None` if it is not determined yet."""
+        return self._queue
+
+    def reset(self):
+        """Discards the running result."""
+        self._vals = None
+        self._inds = None
+        self._count = 0
+
+    @_eager_call
+    def update(self, chunk, /, *, offset=None):
+        """update(chunk, /, *, offset=None)
+
+        Merges `k` largest or smallest elements of `chunk` into the
+        running result.
+
+        Args:
+            chunk (usm_ndarray | numpy.ndarray):
+                array of values. Arrays which are not `usm_ndarray` are
+                copied to the queue of the accumulator.
+            offset (Optional[int]):
+                index of the first element of `chunk` in the sequence of
+                all elements. Default: number of elements fed so far.
+        """
+        if isinstance(chunk, dpt.usm_ndarray):
+            if self._queue is None:
+                self._queue = chunk.sycl_queue
+            elif chunk.sycl_queue != self._queue:
+                raise du.ExecutionPlacementError(
+                    "Chunk is allocated on a queue different from the "
+                    "queue of the accumulator"
+                )
+        else:
+            chunk = dpt.asarray(chunk, sycl_queue=self._queue)
+            if self._queue is None:
+                self._queue = chunk.sycl_queue
+        if self._vals is not None and chunk.dtype != self._vals.dtype:
+            raise TypeError(
+                f"Expected chunk of data type {self._vals.dtype}, "
+                f"got {chunk.dtype}"
+            )
+        offset = self._count if offset is None else operator.index(offset)
+        if offset < 0:
+            raise ValueError("`offset` must be non-negative")
+        n = chunk.size
+        self._count += n
+        if n == 0:
+            return
+        chunk = dpt.reshape(chunk, (n,))
+        if n > self._k:
+            local = top_k(chunk, self._k, mode=self._mode)
+            vals, inds = local.values, local.indices
+        else:
+            # running result must not alias the chunk, which the caller
+            # may reuse for the next one
+            vals = chunk if self._vals is not None else dpt.copy(chunk)
+            inds = dpt.arange(
+                n,
+                dtype=ti.default_device_index_type(self._queue),
+                usm_type=chunk.usm_type,
+                sycl_queue=self._queue,
+            )
+        if offset:
+            inds = inds + offset
+        if self._vals is not None:
+            vals = dpt.concat((self._vals, vals))
+            inds = dpt.concat((self._inds, inds))
+        if vals.size > self._k:
+            merged = top_k(vals, self._k, mode=self._mode)
+            vals = merged.values
+            inds = dpt.take(inds, merged.indices)
+        self._vals, self._inds = vals, inds
+
+    def result(self):
+        """result()
+
+        Returns the running result.
+
+        Returns:
+            tuple[usm_ndarray, usm_ndarray]:
+                a namedtuple `(values, indices)` of one-dimensional arrays
+                with `k` elements, as returned by
+                :func:`dpctl.tensor.top_k` for the concatenation of all
+                chunks with `axis=None`.
+
+        Raises:
+            ValueError:
+                if fewer than `k` elements were fed into the accumulator.
+        """
+        if self._count < self._k:
+            raise ValueError(f"`k`={self._k} is out of bounds {self._count}")
+        return TopKResult(self._vals, self._inds)
+
+    def __repr__(self):
+        return (
+            f"<TopKAccumulator k={self._k}, mode={self._mode!r}, "
+            f"count={self._count}>"
+        )
@@ -14,6 +14,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from collections import namedtuple
+from functools import lru_cache
+from typing import NamedTuple
+
 import dpctl.tensor as dpt
 import dpctl.tensor._tensor_elementwise_impl as tei
 import dpctl.tensor._tensor_impl as ti
@@ -21,9 +25,12 @@ import dpctl.tensor._tensor_reductions_impl as tri
 import dpctl.utils as du
 
 from ._numpy_helper import normalize_axis_tuple
+from ._type_utils import _default_accumulation_dtype
 
 
-def _var_impl(x, axis, correction, keepdims):
+def _mean_var_impl(x, axis, correction, keepdims):
+    """Computes mean and variance of real-valued `x` over `axis`
+    in a single pass over the data"""
     nd = x.ndim
     if axis is None:
         axis = tuple(range(nd))
@@ -31,12 +38,9 @@ def _var_impl(x, axis, correction, keepdims):
         axis = (axis,)
     axis = normalize_axis_tuple(axis, nd, "axis")
     perm = []
-    nelems = 1
     for i in range(nd):
         if i not in axis:
             perm.append(i)
-        else:
-            nelems *= x.shape[i]
     red_nd = len(axis)
     perm = perm + list(axis)
     q = x.sycl_queue
@@ -48,107 +52,39 @@ def _var_impl(x, axis, correction, keepdims):
     )
     res_usm_type = x.usm_type
 
-    _manager = du.SequentialOrderManager[q]
-    dep_evs = _manager.submitted_events
-    if inp_dt != res_dt:
-        buf = dpt.empty_like(x, dtype=res_dt)
-        ht_e_buf, c_e1 = ti._copy_usm_ndarray_into_usm_ndarray(
-            src=x, dst=buf, sycl_queue=q, depends=dep_evs
-        )
-        _manager.add_event_pair(ht_e_buf, c_e1)
-    else:
-        buf = x
-    # calculate mean
-    buf2 = dpt.permute_dims(buf, perm)
-    res_shape = buf2.shape[: nd - red_nd]
-    # use keepdims=True path for later broadcasting
+    arr2 = dpt.permute_dims(x, perm)
+    res_shape = arr2.shape[: nd - red_nd]
     if red_nd == 0:
-        mean_ary = dpt.empty_like(buf)
-        dep_evs = _manager.submitted_events
-        ht_e1, c_e2 = ti._copy_usm_ndarray_into_usm_ndarray(
-            src=buf, dst=mean_ary, sycl_queue=q, depends=dep_evs
-        )
-        _manager.add_event_pair(ht_e1, c_e2)
-    else:
-        mean_ary = dpt.empty(
-            res_shape,
-            dtype=res_dt,
-            usm_type=res_usm_type,
-            sycl_queue=q,
-        )
-        dep_evs = _manager.submitted_events
-        ht_e1, r_e1 = tri._sum_over_axis(
-            src=buf2,
-            trailing_dims_to_reduce=red_nd,
-            dst=mean_ary,
-            sycl_queue=q,
-            depends=dep_evs,
-        )
-        _manager.add_event_pair(ht_e1, r_e1)
-
-        mean_ary_shape = res_shape + (1,) * red_nd
-        inv_perm = sorted(range(nd), key=lambda d: perm[d])
-        mean_ary = dpt.permute_dims(
-            dpt.reshape(mean_ary, mean_ary_shape), inv_perm
-        )
-    # divide in-place to get mean
-    mean_ary_shape = mean_ary.shape
-
-    dep_evs = _manager.submitted_events
-    ht_e2, d_e1 = tei._divide_by_scalar(
-        src=mean_ary, scalar=nelems, dst=mean_ary, sycl_queue=q, depends=dep_evs
-    )
-    _manager.add_event_pair(ht_e2, d_e1)
-
-    # subtract mean from original array to get deviations
-    dev_ary = dpt.empty_like(buf)
-    if mean_ary_shape != buf.shape:
-        mean_ary = dpt.broadcast_to(mean_ary, buf.shape)
-    ht_e4, su_e = tei._subtract(
-        src1=buf, src2=mean_ary, dst=dev_ary, sycl_queue=q, depends=[d_e1]
+        # reduce over a unit trailing dimension, so that nan-s propagate
+        # and the divisor is `1 - correction`
+        arr2 = dpt.expand_dims(arr2, axis=-1)
+        red_nd = 1
+    mean_ary = dpt.empty(
+        res_shape, dtype=res_dt, usm_type=res_usm_type, sycl_queue=q
     )
-    _manager.add_event_pair(ht_e4, su_e)
-    # square deviations
-    ht_e5, sq_e = tei._square(
-        src=dev_ary, dst=dev_ary, sycl_queue=q, depends=[su_e]
+    var_ary = dpt.empty(
+        res_shape, dtype=res_dt, usm_type=res_usm_type, sycl_queue=q
     )
-    _manager.add_event_pair(ht_e5, sq_e)
 
-    # take sum of squared deviations
-    dev_ary2 = dpt.permute_dims(dev_ary, perm)
-    if red_nd == 0:
-        res = dev_ary
-    else:
-        res = dpt.empty(
-            res_shape,
-            dtype=res_dt,
-            usm_type=res_usm_type,
-            sycl_queue=q,
-        )
-        ht_e6, r_e2 = tri._sum_over_axis(
-            src=dev_ary2,
-            trailing_dims_to_reduce=red_nd,
-            dst=res,
-            sycl_queue=q,
-            depends=[sq_e],
-        )
-        _manager.add_event_pair(ht_e6, r_e2)
-
-        if keepdims:
-            res_shape = res_shape + (1,) * red_nd
-            inv_perm = sorted(range(nd), key=lambda d: perm[d])
-            res = dpt.permute_dims(dpt.reshape(res, res_shape), inv_perm)
-    res_shape = res.shape
-    # when nelems - correction <= 0, yield nans
-    div = max(nelems - correction, 0)
-    if not div:
-        div = dpt.nan
-    dep_evs = _manager.submitted_events
-    ht_e7, d_e2 = tei._divide_by_scalar(
-        src=res, scalar=div, dst=res, sycl_queue=q, depends=dep_evs
+    _manager = du.SequentialOrderManager[q]
+    dep_evs = _manager.dependency_events
+    ht_e, mv_e = tri._mean_var_over_axis(
+        src=arr2,
+        trailing_dims_to_reduce=red_nd,
+        mean_dst=mean_ary,
+        var_dst=var_ary,
+        correction=float(correction),
+        sycl_queue=q,
+        depends=dep_evs,
     )
-    _manager.add_event_pair(ht_e7, d_e2)
-    return res, [d_e2]
+    _manager.add_event_pair(ht_e, mv_e)
+
+    if keepdims and len(axis) > 0:
+        res_shape = res_shape + (1,) * len(axis)
+        inv_perm = sorted(range(nd), key=lambda d: perm[d])
+        mean_ary = dpt.permute_dims(dpt.reshape(mean_ary, res_shape), inv_perm)
+        var_ary = dpt.permute_dims(dpt.reshape(var_ary, res_shape), inv_perm)
+    return mean_ary, var_ary, [mv_e]
 
 
 def mean(x, axis=None, keepdims=False):
@@ -183,6 +119,9 @@ def mean(x, axis=None, keepdims=False):
     """
     if not isinstance(x, dpt.usm_ndarray):
         raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
+    if x.dtype.kind != "c":
+        res, _, _ = _mean_var_impl(x, axis, 0, keepdims)
+        return res
     nd = x.ndim
     if axis is None:
         axis = tuple(range(nd))
@@ -212,7 +151,7 @@ def mean(x, axis=None, keepdims=False):
         return dpt.astype(x, res_dt, copy=True)
 
     _manager = du.SequentialOrderManager[q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     if tri._sum_over_axis_dtype_supported(inp_dt, res_dt, res_usm_type, q):
         res = dpt.empty(
             res_shape, dtype=res_dt, usm_type=res_usm_type, sycl_queue=q
@@ -250,7 +189,7 @@ def mean(x, axis=None, keepdims=False):
         inv_perm = sorted(range(nd), key=lambda d: perm[d])
         res = dpt.permute_dims(dpt.reshape(res, res_shape), inv_perm)
 
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     ht_e2, div_e = tei._divide_by_scalar(
         src=res, scalar=nelems, dst=res, sycl_queue=q, depends=dep_evs
     )
@@ -258,8 +197,8 @@ def mean(x, axis=None, keepdims=False):
     return res
 
 
-def var(x, axis=None, correction=0.0, keepdims=False):
-    """var(x, axis=None, correction=0.0, keepdims=False)
+def var(x, axis=None, correction=0.0, keepdims=False, *, return_mean=False):
+    """var(x, axis=None, correction=0.0, keepdims=False, *, return_mean=False)
 
     Calculates the variance of elements in the input array `x`.
 
@@ -282,8 +221,11 @@ def var(x, axis=None, correction=0.0, keepdims=False):
             compatible with the input array according to Array Broadcasting
             rules. Otherwise, if `False`, the reduced axes are not included in
             the returned array. Default: `False`.
+        return_mean (Optional[bool]):
+            if `True`, the arithmetic means, computed in the same pass over
+            `x` as the variances, are returned as well. Default: `False`.
     Returns:
-        usm_ndarray:
+        Union[usm_ndarray, Tuple[usm_ndarray, usm_ndarray]]:
             an array containing the variances. If the variance was computed
             over the entire array, a zero-dimensional array is returned.
 
@@ -292,6 +234,9 @@ def var(x, axis=None, correction=0.0, keepdims=False):
             If `x` has a boolean or integral data type, the returned array
             will have the default floating point data type for the device
             where input array `x` is allocated.
+
+            If `return_mean` is `True`, a tuple of the array of means and
+            the array of variances is returned.
     """
     if not isinstance(x, dpt.usm_ndarray):
         raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
@@ -305,12 +250,14 @@ def var(x, axis=None, correction=0.0, keepdims=False):
     if x.dtype.kind == "c":
         raise ValueError("`var` does not support complex types")
 
-    res, _ = _var_impl(x, axis, correction, keepdims)
+    mean_ary, res, _ = _mean_var_impl(x, axis, correction, keepdims)
+    if return_mean:
+        return mean_ary, res
     return res
 
 
-def std(x, axis=None, correction=0.0, keepdims=False):
-    """std(x, axis=None, correction=0.0, keepdims=False)
+def std(x, axis=None, correction=0.0, keepdims=False, *, return_mean=False):
+    """std(x, axis=None, correction=0.0, keepdims=False, *, return_mean=False)
 
     Calculates the standard deviation of elements in the input array `x`.
 
@@ -333,8 +280,12 @@ def std(x, axis=None, correction=0.0, keepdims=False):
             compatible with the input array according to Array Broadcasting
             rules. Otherwise, if `False`, the reduced axes are not included in
             the returned array. Default: `False`.
+        return_mean (Optional[bool]):
+            if `True`, the arithmetic means, computed in the same pass over
+            `x` as the standard deviations, are returned as well.
+            Default: `False`.
     Returns:
-        usm_ndarray:
+        Union[usm_ndarray, Tuple[usm_ndarray, usm_ndarray]]:
             an array containing the standard deviations. If the standard
             deviation was computed over the entire array, a zero-dimensional
             array is returned.
@@ -344,6 +295,9 @@ def std(x, axis=None, correction=0.0, keepdims=False):
             If `x` has a boolean or integral data type, the returned array
             will have the default floating point data type for the device
             where input array `x` is allocated.
+
+            If `return_mean` is `True`, a tuple of the array of means and
+            the array of standard deviations is returned.
     """
     if not isinstance(x, dpt.usm_ndarray):
         raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
@@ -359,9 +313,212 @@ def std(x, axis=None, correction=0.0, keepdims=False):
 
     exec_q = x.sycl_queue
     _manager = du.SequentialOrderManager[exec_q]
-    res, deps = _var_impl(x, axis, correction, keepdims)
+    mean_ary, res, deps = _mean_var_impl(x, axis, correction, keepdims)
     ht_ev, sqrt_ev = tei._sqrt(
         src=res, dst=res, sycl_queue=exec_q, depends=deps
     )
     _manager.add_event_pair(ht_ev, sqrt_ev)
+    if return_mean:
+        return mean_ary, res
     return res
+
+
+_reduce_many_ops = ("min", "max", "sum", "argmin", "argmax", "count_nonzero")
+
+
+class DescribeResult(NamedTuple):
+    min: dpt.usm_ndarray
+    max: dpt.usm_ndarray
+    sum: dpt.usm_ndarray
+    argmin: dpt.usm_ndarray
+    argmax: dpt.usm_ndarray
+    count_nonzero: dpt.usm_ndarray
+
+
+@lru_cache(maxsize=128)
+def _reduce_many_result_type(ops):
+    if ops == _reduce_many_ops:
+        return DescribeResult
+    return namedtuple("ReduceManyResult", ops)
+
+
+def _reduce_many_separately(arr2, res_shape, red_nd, ops):
+    """Computes reductions one at a time, for data types not supported by
+    the fused kernel"""
+    if red_nd != 1:
+        red_size = 1
+        for s in arr2.shape[len(res_shape) :]:
+            red_size *= s
+        arr2 = dpt.reshape(arr2, res_shape + (red_size,))
+    fns = {
+        "min": dpt.min,
+        "max": dpt.max,
+        "sum": dpt.sum,
+        "argmin": dpt.argmin,
+        "argmax": dpt.argmax,
+        "count_nonzero": dpt.count_nonzero,
+    }
+    return {op: fns[op](arr2, axis=-1) for op in ops}
+
+
+def _reduce_many_impl(x, ops, axis, keepdims):
+    """Computes reductions `ops` of `x` over `axis` in a single pass over
+    the data, returns dictionary of results keyed by name of reduction"""
+    nd = x.ndim
+    if axis is None:
+        axis = tuple(range(nd))
+    if not isinstance(axis, (tuple, list)):
+        axis = (axis,)
+    # positions of extrema refer to reduced axes flattened in C order
+    axis = tuple(sorted(normalize_axis_tuple(axis, nd, "axis")))
+    perm = [i for i in range(nd) if i not in axis] + list(axis)
+    red_nd = len(axis)
+    arr2 = dpt.permute_dims(x, perm)
+    res_shape = arr2.shape[: nd - red_nd]
+    if any(arr2.shape[i] == 0 for i in range(nd - red_nd, nd)) and any(
+        op in ("min", "max", "argmin", "argmax") for op in ops
+    ):
+        raise ValueError("reduction cannot be performed over zero-size axes")
+    if red_nd == 0:
+        # reduce over a unit trailing dimension
+        arr2 = dpt.expand_dims(arr2, axis=-1)
+        red_nd = 1
+
+    q = x.sycl_queue
+    inp_dt = x.dtype
+    sum_dt = _default_accumulation_dtype(inp_dt, q)
+    if not tri._reduce_many_over_axis_dtype_supported(inp_dt, sum_dt):
+        res = _reduce_many_separately(arr2, res_shape, red_nd, ops)
+    else:
+        res_usm_type = x.usm_type
+        idx_dt = dpt.dtype(ti.default_device_index_type(q.sycl_device))
+        res_dts = {
+            "min": inp_dt,
+            "max": inp_dt,
+            "sum": sum_dt,
+            "argmin": idx_dt,
+            "argmax": idx_dt,
+            "count_nonzero": idx_dt,
+        }
+        # kernel skips statistics without destination
+        res = {
+            op: dpt.empty(
+                res_shape,
+                dtype=res_dts[op],
+                usm_type=res_usm_type,
+                sycl_queue=q,
+            )
+            for op in ops
+        }
+
+        _manager = du.SequentialOrderManager[q]
+        dep_evs = _manager.dependency_events
+        ht_e, red_e = tri._reduce_many_over_axis(
+            src=arr2,
+            trailing_dims_to_reduce=red_nd,
+            min_dst=res.get("min"),
+            max_dst=res.get("max"),
+            sum_dst=res.get("sum"),
+            argmin_dst=res.get("argmin"),
+            argmax_dst=res.get("argmax"),
+            count_nonzero_dst=res.get("count_nonzero"),
+            sycl_queue=q,
+            depends=dep_evs,
+        )
+        _manager.add_event_pair(ht_e, red_e)
+
+    if keepdims and len(axis) > 0:
+        res_shape = res_shape + (1,) * len(axis)
+        inv_perm = sorted(range(nd), key=lambda d: perm[d])
+        res = {
+            op: dpt.permute_dims(dpt.reshape(r, res_shape), inv_perm)
+            for op, r in res.items()
+        }
+    return res
+
+
+def reduce_many(x, /, ops, *, axis=None, keepdims=False):
+    """reduce_many(x, ops, axis=None, keepdims=False)
+
+    Computes several reductions of elements of the input array `x` over the
+    same axes, reading `x` once.
+
+    Args:
+        x (usm_ndarray):
+            input array.
+        ops (Union[str, Sequence[str]]):
+            names of reductions to compute, any of ``"min"``, ``"max"``,
+            ``"sum"``, ``"argmin"``, ``"argmax"`` and ``"count_nonzero"``.
+        axis (Optional[int, Tuple[int, ...]]):
+            axis or axes along which the reductions are computed. If a tuple
+            of unique integers, the reductions are computed over multiple
+            axes. If `None`, the reductions are computed over the entire
+            array. Default: `None`.
+        keepdims (Optional[bool]):
+            if `True`, the reduced axes (dimensions) are included in the
+            results as singleton dimensions, so that the returned arrays
+            remain compatible with the input array according to Array
+            Broadcasting rules. Otherwise, if `False`, the reduced axes are
+            not included in the returned arrays. Default: `False`.
+
+    Returns:
+        namedtuple:
+            a namedtuple with a field per requested reduction, in the order
+            given by `ops`. Each result has the data type of the result of
+            the corresponding function, e.g. :func:`dpctl.tensor.sum` for
+            ``"sum"``. Indices returned by ``"argmin"`` and ``"argmax"`` are
+            those of the first occurrence of the extremum among elements
+            of the reduced axes, flattened in row-major order.
+
+    Boolean, integral and real floating point inputs are reduced in a single
+    pass over the data, and reductions which are not requested are not
+    computed. Complex inputs are reduced by calling the corresponding
+    functions one at a time.
+    """
+    if not isinstance(x, dpt.usm_ndarray):
+        raise TypeError(f"Expected dpctl.tensor.usm_ndarray, got {type(x)}")
+    if isinstance(ops, str):
+        ops = (ops,)
+    ops = tuple(ops)
+    if not ops:
+        raise ValueError("At least one reduction must be requested")
+    for op in ops:
+        if op not in _reduce_many_ops:
+            raise ValueError(
+                f"Unsupported reduction {op!r}, expected one of "
+                f"{_reduce_many_ops}"
+            )
+    if len(set(ops)) != len(ops):
+        raise ValueError("Reductions must not be repeated")
+    res = _reduce_many_impl(x, ops, axis, keepdims)
+    return _reduce_many_result_type(ops)(*(res[op] for op in ops))
+
+
+def describe(x, /, *, axis=None, keepdims=False):
+    """describe(x, axis=None, keepdims=False)
+
+    Computes minimum, maximum, sum, indices of the first minimum and
+    maximum, and the number of non-zero elements of the input array `x`
+    in a single pass over the data.
+
+    Equivalent to
+    ``reduce_many(x, ("min", "max", "sum", "argmin", "argmax",
+    "count_nonzero"), axis=axis, keepdims=keepdims)``,
+    see :func:`dpctl.tensor.reduce_many`.
+
+    Args:
+        x (usm_ndarray):
+            input array.
+        axis (Optional[int, Tuple[int, ...]]):
+            axis or axes along which the statistics are computed. If `None`,
+            the statistics are computed over the entire array.
+            Default: `None`.
+        keepdims (Optional[bool]):
+            if `True`, the reduced axes (dimensions) are included in the
+            results as singleton dimensions. Default: `False`.
+
+    Returns:
+        DescribeResult:
+            a namedtuple `(min, max, sum, argmin, argmax, count_nonzero)`.
+    """
+    return reduce_many(x, _reduce_many_ops, axis=axis, keepdims=keepdims)
@@ -0,0 +1,405 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import operator
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+import dpctl
+import dpctl.memory as dpm
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_impl as ti
+import dpctl.utils as du
+
+from ._copy_utils import _map_to_device_dtype
+from ._device import normalize_queue_device
+
+__doc__ = (
+    "Implementation module for streaming transfers between host and "
+    "device memory through a ring of reusable USM-host staging buffers."
+)
+
+
+class StagingRing:
+    """
+    StagingRing(sycl_queue, /, *, depth=3)
+
+    Ring of ``depth`` reusable USM-host staging buffers associated with
+    a queue, used by :func:`dpctl.tensor.stream_to_device` and
+    :func:`dpctl.tensor.stream_to_host`.
+
+    A buffer is handed out for a new transfer only after the transfer
+    which used it previously has completed, so that up to ``depth``
+    transfers are in flight at a time. Buffers grow to accommodate the
+    largest transfer, and are kept for the lifetime of the ring.
+
+    A ring must not be used by several streams at the same time.
+
+    Args:
+        sycl_queue (:class:`dpctl.SyclQueue`):
+            Queue the staging buffers are allocated for.
+        depth (int, optional):
+            Number of staging buffers, at least ``2``. Default: ``3``.
+    """
+
+    def __init__(self, sycl_queue, /, *, depth=3):
+        if not isinstance(sycl_queue, dpctl.SyclQueue):
+            raise TypeError(f"Expected dpctl.SyclQueue, got {type(sycl_queue)}")
+        depth = operator.index(depth)
+        if depth < 2:
+            raise ValueError("Depth of staging ring must be at least 2")
+        self._queue = sycl_queue
+        self._buffers = [None] * depth
+        self._events = [None] * depth
+        self._next = 0
+        self._in_use = False
+
+    @property
+    def sycl_queue(self):
+        """:class:`dpctl.SyclQueue` the staging buffers are allocated for."""
+        return self._queue
+
+    @property
+    def depth(self):
+        """Number of staging buffers in the ring."""
+        return len(self._buffers)
+
+    @property
+    def nbytes(self):
+        """Total size of staging buffers allocated so far, in bytes."""
+        return sum(b.nbytes for b in self._buffers if b is not None)
+
+    def _acquire(self, nbytes):
+        "Returns index and memory of the next buffer, once it is free"
+        i = self._next
+        self._next = (i + 1) % len(self._buffers)
+        ev = self._events[i]
+        if ev is not None:
+            ev.wait()
+            self._events[i] = None
+        buf = self._buffers[i]
+        if buf is None or buf.nbytes < nbytes:
+            buf = dpm.MemoryUSMHost(max(nbytes, 1), queue=self._queue)
+            self._buffers[i] = buf
+        return i, buf
+
+    def _release(self, i, ev):
+        "Records event of the transfer using buffer `i`"
+        self._events[i] = ev
+
+    def wait(self):
+        """Waits for completion of transfers using the staging buffers."""
+        for i, ev in enumerate(self._events):
+            if ev is not None:
+                ev.wait()
+                self._events[i] = None
+
+
+_local_rings = threading.local()
+
+
+def _default_ring(q):
+    "Returns ring of staging buffers of the current thread for queue `q`"
+    rings = getattr(_local_rings, "rings", None)
+    if rings is None:
+        rings = dict()
+        _local_rings.rings = rings
+    ring = rings.get(q)
+    if ring is None:
+        ring = StagingRing(q)
+        rings[q] = ring
+    return ring
+
+
+class TransferStream:
+    """
+    Iterator over results of streaming transfers, returned by
+    :func:`dpctl.tensor.stream_to_device` and
+    :func:`dpctl.tensor.stream_to_host`.
+
+    Properties :attr:`nbytes`, :attr:`elapsed` and :attr:`bandwidth`
+    report the amount of data transferred, and the achieved bandwidth.
+    """
+
+    def __init__(self, gen_fn, ring):
+        self.nbytes = 0
+        self.elapsed = 0.0
+        self._t0 = None
+        # the ring is taken by the stream until it is exhausted or closed
+        self._ring = ring
+        self._holds_ring = True
+        self._it = gen_fn(self)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._it)
+
+    def close(self):
+        """Stops the stream, waiting for transfers in flight, and
+        releases its staging ring for use by other streams."""
+        try:
+            self._it.close()
+        finally:
+            self._release_ring()
+
+    def __del__(self):
+        if getattr(self, "_holds_ring", False):
+            self._release_ring()
+
+    def _release_ring(self):
+        if self._holds_ring:
+            self._holds_ring = False
+            try:
+                self._ring.wait()
+            finally:
+                self._ring._in_use = False
+
+    @property
+    def sycl_queue(self):
+        """:class:`dpctl.SyclQueue` transfers are submitted to."""
+        return self._ring.sycl_queue
+
+    @property
+    def bandwidth(self):
+        """Achieved bandwidth in bytes per second, measured from
+        submission of the first transfer until completion of the last
+        one, which is known once the stream is exhausted."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.nbytes / self.elapsed
+
+    def _start(self):
+        if self._t0 is None:
+            self._t0 = time.perf_counter()
+
+    def _stop(self):
+        if self._t0 is not None:
+            self.elapsed = time.perf_counter() - self._t0
+
+    def __repr__(self):
+        return (
+            f"<TransferStream nbytes={self.nbytes}, "
+            f"bandwidth={self.bandwidth / 1e9:.3f} GB/s>"
+        )
+
+
+def _take_ring(ring, q):
+    "Returns staging ring for a new stream, marked as used by it"
+    if ring is None:
+        ring = _default_ring(q)
+        if ring._in_use:
+            # default ring is used by another active stream
+            ring = StagingRing(q)
+    else:
+        if not isinstance(ring, StagingRing):
+            raise TypeError(f"Expected StagingRing, got {type(ring)}")
+        if ring._in_use:
+            raise ValueError("Staging ring is used by another active stream")
+        if ring.sycl_queue != q:
+            raise du.ExecutionPlacementError(
+                "Staging ring is associated with a different queue"
+            )
+    ring._in_use = True
+    return ring
+
+
+def stream_to_device(
+    chunks,
+    /,
+    *,
+    dtype=None,
+    device=None,
+    usm_type="device",
+    sycl_queue=None,
+    ring=None,
+):
+    """
+    stream_to_device(chunks, /, *, dtype=None, device=None, \
+        usm_type="device", sycl_queue=None, ring=None)
+
+    Copies NumPy arrays produced by an iterable into new
+    :class:`dpctl.tensor.usm_ndarray` instances, yielded as soon as
+    copying into them is submitted.
+
+    Each chunk is copied into the next buffer of a ring of USM-host
+    staging buffers, from which it is copied to the device
+    asynchronously. Copying the next chunk into the staging ring, and
+    producing it, overlaps with the transfer of the preceding chunks
+    and with computations submitted by the consumer, which are ordered
+    after the transfer by :data:`dpctl.utils.SequentialOrderManager`.
+
+    Args:
+        chunks (Iterable[numpy.ndarray]):
+            Iterable of arrays, or objects convertible to NumPy arrays.
+        dtype (optional):
+            Data type of output arrays. By default, the data type of each
+            chunk, or the default floating point type of the device if
+            the device does not support the data type.
+        device (optional):
+            Array API specification of device where output arrays are
+            allocated. Default: ``None``.
+        usm_type (str, optional):
+            USM allocation type of output arrays. Default: ``"device"``.
+        sycl_queue (:class:`dpctl.SyclQueue`, optional):
+            Queue transfers are submitted to. Default: ``None``.
+        ring (:class:`dpctl.tensor.StagingRing`, optional):
+            Ring of staging buffers to use. By default a ring owned by the
+            current thread for the queue is reused across calls.
+
+    Returns:
+        TransferStream:
+            Iterator over :class:`dpctl.tensor.usm_ndarray` instances.
+    """
+    q = normalize_queue_device(sycl_queue=sycl_queue, device=device)
+    dpctl.utils.validate_usm_type(usm_type, allow_none=False)
+    if dtype is not None:
+        dtype = dpt.dtype(dtype)
+    ring = _take_ring(ring, q)
+
+    def _gen(stream):
+        _manager = du.SequentialOrderManager[q]
+        try:
+            for chunk in chunks:
+                chunk = np.asarray(chunk)
+                if chunk.dtype.char not in "?bBhHiIlLqQefdFD":
+                    raise TypeError(
+                        f"Numpy array of data type {chunk.dtype} is not "
+                        "supported"
+                    )
+                stage_dt = _map_to_device_dtype(chunk.dtype, q)
+                nbytes = chunk.size * stage_dt.itemsize
+                i, buf = ring._acquire(nbytes)
+                stream._start()
+                stage_np = np.ndarray(chunk.shape, dtype=stage_dt, buffer=buf)
+                np.copyto(stage_np, chunk, casting="unsafe")
+                stage = dpt.usm_ndarray(chunk.shape, dtype=stage_dt, buffer=buf)
+                res = dpt.empty(
+                    chunk.shape,
+                    dtype=stage_dt if dtype is None else dtype,
+                    usm_type=usm_type,
+                    sycl_queue=q,
+                )
+                ht_ev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+                    src=stage,
+                    dst=res,
+                    sycl_queue=q,
+                    depends=_manager.dependency_events,
+                )
+                _manager.add_event_pair(ht_ev, cpy_ev)
+                ring._release(i, cpy_ev)
+                stream.nbytes += nbytes
+                yield res
+            ring.wait()
+            stream._stop()
+        finally:
+            stream._release_ring()
+
+    return TransferStream(_gen, ring)
+
+
+def stream_to_host(arrays, /, *, ring=None):
+    """
+    stream_to_host(arrays, /, *, ring=None)
+
+    Copies :class:`dpctl.tensor.usm_ndarray` instances produced by an
+    iterable into new NumPy arrays.
+
+    Transfers into a ring of USM-host staging buffers are submitted
+    ahead of time, so that up to as many transfers as there are buffers
+    in the ring are in flight, and overlap with consumption of the
+    yielded arrays, and with production of the input arrays.
+
+    Args:
+        arrays (Iterable[usm_ndarray]):
+            Iterable of arrays, all allocated on the same queue.
+        ring (:class:`dpctl.tensor.StagingRing`, optional):
+            Ring of staging buffers to use. By default a ring owned by the
+            current thread for the queue of the first array is reused
+            across calls.
+
+    Returns:
+        TransferStream:
+            Iterator over :class:`numpy.ndarray` instances.
+    """
+    it = iter(arrays)
+    try:
+        first = next(it)
+    except StopIteration:
+        first = None
+    if isinstance(first, dpt.usm_ndarray):
+        q = first.sycl_queue
+    elif ring is not None and first is None:
+        q = ring.sycl_queue
+    else:
+        q = normalize_queue_device()
+    ring = _take_ring(ring, q)
+
+    def _arrays():
+        if first is not None:
+            yield first
+        yield from it
+
+    def _copy_out(pending):
+        stage, ev = pending
+        ev.wait()
+        return _host_view(stage).copy()
+
+    def _gen(stream):
+        _manager = du.SequentialOrderManager[q]
+        in_flight = deque()
+        try:
+            for x in _arrays():
+                if not isinstance(x, dpt.usm_ndarray):
+                    raise TypeError(f"Expected usm_ndarray, got {type(x)}")
+                if x.sycl_queue != q:
+                    raise du.ExecutionPlacementError(
+                        "Arrays must be allocated on the same queue"
+                    )
+                if len(in_flight) == ring.depth:
+                    yield _copy_out(in_flight.popleft())
+                nbytes = x.size * x.itemsize
+                i, buf = ring._acquire(nbytes)
+                stream._start()
+                stage = dpt.usm_ndarray(x.shape, dtype=x.dtype, buffer=buf)
+                ht_ev, cpy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+                    src=x,
+                    dst=stage,
+                    sycl_queue=q,
+                    depends=_manager.dependency_events,
+                )
+                _manager.add_event_pair(ht_ev, cpy_ev)
+                ring._release(i, cpy_ev)
+                in_flight.append((stage, cpy_ev))
+                stream.nbytes += nbytes
+            while in_flight:
+                res = _copy_out(in_flight.popleft())
+                if not in_flight:
+                    stream._stop()
+                yield res
+        finally:
+            stream._release_ring()
+
+    return TransferStream(_gen, ring)
+
+
+def _host_view(stage):
+    "NumPy view into USM-host memory of C-contiguous array `stage`"
+    return np.ndarray(stage.shape, dtype=stage.dtype, buffer=stage.usm_data)
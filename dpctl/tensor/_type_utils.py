@@ -18,7 +18,8 @@ from __future__ import annotations
 import numpy as np
 
 import dpctl.tensor as dpt
-import dpctl.tensor._tensor_impl as ti
+
+from ._dispatch_cache import _queue_capabilities
 
 
 def _all_data_types(_fp16, _fp64):
@@ -129,8 +130,9 @@ def _to_device_supported_dtype_impl(dt, has_fp16, has_fp64):
 
 
 def _to_device_supported_dtype(dt, dev):
-    has_fp16 = dev.has_aspect_fp16
-    has_fp64 = dev.has_aspect_fp64
+    caps = dev.capabilities
+    has_fp16 = caps.has_fp16
+    has_fp64 = caps.has_fp64
 
     return _to_device_supported_dtype_impl(dt, has_fp16, has_fp64)
 
@@ -184,8 +186,9 @@ def _find_buf_dtype(arg_dtype, query_fn, sycl_dev, acceptance_fn):
     if res_dt:
         return None, res_dt
 
-    _fp16 = sycl_dev.has_aspect_fp16
-    _fp64 = sycl_dev.has_aspect_fp64
+    caps = sycl_dev.capabilities
+    _fp16 = caps.has_fp16
+    _fp64 = caps.has_fp64
     all_dts = _all_data_types(_fp16, _fp64)
     for buf_dt in all_dts:
         if _can_cast(arg_dtype, buf_dt, _fp16, _fp64):
@@ -201,16 +204,17 @@ def _find_buf_dtype(arg_dtype, query_fn, sycl_dev, acceptance_fn):
 
 
 def _get_device_default_dtype(dt_kind, sycl_dev):
+    caps = sycl_dev.capabilities
     if dt_kind == "b":
-        return dpt.dtype(ti.default_device_bool_type(sycl_dev))
+        return dpt.bool
     elif dt_kind == "i":
-        return dpt.dtype(ti.default_device_int_type(sycl_dev))
+        return dpt.dtype(caps.default_int_type)
     elif dt_kind == "u":
-        return dpt.dtype(ti.default_device_uint_type(sycl_dev))
+        return dpt.dtype(caps.default_uint_type)
     elif dt_kind == "f":
-        return dpt.dtype(ti.default_device_fp_type(sycl_dev))
+        return dpt.dtype(caps.default_fp_type)
     elif dt_kind == "c":
-        return dpt.dtype(ti.default_device_complex_type(sycl_dev))
+        return dpt.dtype(caps.default_complex_type)
     raise RuntimeError
 
 
@@ -246,8 +250,9 @@ def _find_buf_dtype2(arg1_dtype, arg2_dtype, query_fn, sycl_dev, acceptance_fn):
     if res_dt:
         return None, None, res_dt
 
-    _fp16 = sycl_dev.has_aspect_fp16
-    _fp64 = sycl_dev.has_aspect_fp64
+    caps = sycl_dev.capabilities
+    _fp16 = caps.has_fp16
+    _fp64 = caps.has_fp64
     all_dts = _all_data_types(_fp16, _fp64)
     for buf1_dt in all_dts:
         for buf2_dt in all_dts:
@@ -282,8 +287,9 @@ def _find_buf_dtype_in_place_op(arg1_dtype, arg2_dtype, query_fn, sycl_dev):
     if res_dt:
         return None, res_dt
 
-    _fp16 = sycl_dev.has_aspect_fp16
-    _fp64 = sycl_dev.has_aspect_fp64
+    caps = sycl_dev.capabilities
+    _fp16 = caps.has_fp16
+    _fp64 = caps.has_fp64
     if _can_cast(arg2_dtype, arg1_dtype, _fp16, _fp64, casting="same_kind"):
         res_dt = query_fn(arg1_dtype, arg1_dtype)
         if res_dt:
@@ -375,7 +381,7 @@ def _resolve_weak_types(o1_dtype, o2_dtype, dev):
         o2_kind_num = _strong_dtype_num_kind(o2_dtype)
         if o1_kind_num > o2_kind_num:
             if isinstance(o1_dtype, WeakIntegralType):
-                return dpt.dtype(ti.default_device_int_type(dev)), o2_dtype
+                return dpt.dtype(dev.capabilities.default_int_type), o2_dtype
             if isinstance(o1_dtype, WeakComplexType):
                 if o2_dtype is dpt.float16 or o2_dtype is dpt.float32:
                     return dpt.complex64, o2_dtype
@@ -391,7 +397,7 @@ def _resolve_weak_types(o1_dtype, o2_dtype, dev):
         o2_kind_num = _weak_type_num_kind(o2_dtype)
         if o2_kind_num > o1_kind_num:
             if isinstance(o2_dtype, WeakIntegralType):
-                return o1_dtype, dpt.dtype(ti.default_device_int_type(dev))
+                return o1_dtype, dpt.dtype(dev.capabilities.default_int_type)
             if isinstance(o2_dtype, WeakComplexType):
                 if o1_dtype is dpt.float16 or o1_dtype is dpt.float32:
                     return o1_dtype, dpt.complex64
@@ -418,7 +424,7 @@ def _resolve_weak_types_all_py_ints(o1_dtype, o2_dtype, dev):
         o2_kind_num = _strong_dtype_num_kind(o2_dtype)
         if o1_kind_num > o2_kind_num:
             if isinstance(o1_dtype, WeakIntegralType):
-                return dpt.dtype(ti.default_device_int_type(dev)), o2_dtype
+                return dpt.dtype(dev.capabilities.default_int_type), o2_dtype
             if isinstance(o1_dtype, WeakComplexType):
                 if o2_dtype is dpt.float16 or o2_dtype is dpt.float32:
                     return dpt.complex64, o2_dtype
@@ -441,7 +447,7 @@ def _resolve_weak_types_all_py_ints(o1_dtype, o2_dtype, dev):
         o2_kind_num = _weak_type_num_kind(o2_dtype)
         if o2_kind_num > o1_kind_num:
             if isinstance(o2_dtype, WeakIntegralType):
-                return o1_dtype, dpt.dtype(ti.default_device_int_type(dev))
+                return o1_dtype, dpt.dtype(dev.capabilities.default_int_type)
             if isinstance(o2_dtype, WeakComplexType):
                 if o1_dtype is dpt.float16 or o1_dtype is dpt.float32:
                     return o1_dtype, dpt.complex64
@@ -477,7 +483,7 @@ def _resolve_one_strong_two_weak_types(st_dtype, dtype1, dtype2, dev):
 
             if kind_num1 > st_kind_num:
                 if isinstance(dtype1, WeakIntegralType):
-                    ret_dtype1 = dpt.dtype(ti.default_device_int_type(dev))
+                    ret_dtype1 = dpt.dtype(dev.capabilities.default_int_type)
                 elif isinstance(dtype1, WeakComplexType):
                     if st_dtype is dpt.float16 or st_dtype is dpt.float32:
                         ret_dtype1 = dpt.complex64
@@ -489,7 +495,7 @@ def _resolve_one_strong_two_weak_types(st_dtype, dtype1, dtype2, dev):
 
             if kind_num2 > st_kind_num:
                 if isinstance(dtype2, WeakIntegralType):
-                    ret_dtype2 = dpt.dtype(ti.default_device_int_type(dev))
+                    ret_dtype2 = dpt.dtype(dev.capabilities.default_int_type)
                 elif isinstance(dtype2, WeakComplexType):
                     if st_dtype is dpt.float16 or st_dtype is dpt.float32:
                         ret_dtype2 = dpt.complex64
@@ -510,7 +516,7 @@ def _resolve_one_strong_two_weak_types(st_dtype, dtype1, dtype2, dev):
         dt1_kind_num = _weak_type_num_kind(dtype1)
         if dt1_kind_num > max_dt_num_kind:
             if isinstance(dtype1, WeakIntegralType):
-                return dpt.dtype(ti.default_device_int_type(dev)), dtype2
+                return dpt.dtype(dev.capabilities.default_int_type), dtype2
             if isinstance(dtype1, WeakComplexType):
                 if max_dtype is dpt.float16 or max_dtype is dpt.float32:
                     return dpt.complex64, dtype2
@@ -531,7 +537,7 @@ def _resolve_one_strong_two_weak_types(st_dtype, dtype1, dtype2, dev):
         dt2_kind_num = _weak_type_num_kind(dtype2)
         if dt2_kind_num > max_dt_num_kind:
             if isinstance(dtype2, WeakIntegralType):
-                return dtype1, dpt.dtype(ti.default_device_int_type(dev))
+                return dtype1, dpt.dtype(dev.capabilities.default_int_type)
             if isinstance(dtype2, WeakComplexType):
                 if max_dtype is dpt.float16 or max_dtype is dpt.float32:
                     return dtype1, dpt.complex64
@@ -557,7 +563,7 @@ def _resolve_one_strong_one_weak_types(st_dtype, dtype, dev):
         kind_num = _weak_type_num_kind(dtype)
         if kind_num > st_kind_num:
             if isinstance(dtype, WeakIntegralType):
-                return dpt.dtype(ti.default_device_int_type(dev))
+                return dpt.dtype(dev.capabilities.default_int_type)
             if isinstance(dtype, WeakComplexType):
                 if st_dtype is dpt.float16 or st_dtype is dpt.float32:
                     return dpt.complex64
@@ -694,11 +700,12 @@ def can_cast(from_, to, /, *, casting="safe") -> bool:
 
     if isinstance(from_, dpt.usm_ndarray):
         dtype_from = from_.dtype
+        caps = _queue_capabilities(from_.sycl_queue)
         return _can_cast(
             dtype_from,
             dtype_to,
-            from_.sycl_device.has_aspect_fp16,
-            from_.sycl_device.has_aspect_fp64,
+            caps.has_fp16,
+            caps.has_fp64,
             casting=casting,
         )
     else:
@@ -725,11 +732,11 @@ def result_type(*arrays_and_dtypes):
             input arrays and dtypes.
     """
     dtypes = []
-    devices = []
+    queues = []
     weak_dtypes = []
     for arg_i in arrays_and_dtypes:
         if isinstance(arg_i, dpt.usm_ndarray):
-            devices.append(arg_i.sycl_device)
+            queues.append(arg_i.sycl_queue)
             dtypes.append(arg_i.dtype)
         elif isinstance(arg_i, int):
             weak_dtypes.append(WeakIntegralType(arg_i))
@@ -746,13 +753,14 @@ def result_type(*arrays_and_dtypes):
 
     has_fp16 = True
     has_fp64 = True
-    target_dev = None
-    if devices:
+    target_q = None
+    if queues:
         inspected = False
-        for d in devices:
+        for q in queues:
+            caps = _queue_capabilities(q)
             if inspected:
-                unsame_fp16_support = d.has_aspect_fp16 != has_fp16
-                unsame_fp64_support = d.has_aspect_fp64 != has_fp64
+                unsame_fp16_support = caps.has_fp16 != has_fp16
+                unsame_fp64_support = caps.has_fp64 != has_fp64
                 if unsame_fp16_support or unsame_fp64_support:
                     raise ValueError(
                         "Input arrays reside on devices "
@@ -762,9 +770,9 @@ def result_type(*arrays_and_dtypes):
                         "to use."
                     )
             else:
-                has_fp16 = d.has_aspect_fp16
-                has_fp64 = d.has_aspect_fp64
-                target_dev = d
+                has_fp16 = caps.has_fp16
+                has_fp64 = caps.has_fp64
+                target_q = q
                 inspected = True
 
     if not dtypes and weak_dtypes:
@@ -778,6 +786,7 @@ def result_type(*arrays_and_dtypes):
                 )
         res_dt = np.result_type(*dtypes)
         res_dt = _to_device_supported_dtype_impl(res_dt, has_fp16, has_fp64)
+        target_dev = None if target_q is None else target_q.sycl_device
         for wdt in weak_dtypes:
             pair = _resolve_weak_types(wdt, res_dt, target_dev)
             res_dt = np.result_type(*pair)
@@ -913,11 +922,11 @@ def _default_accumulation_dtype(inp_dt, q):
     """
     inp_kind = inp_dt.kind
     if inp_kind in "bi":
-        res_dt = dpt.dtype(ti.default_device_int_type(q))
+        res_dt = dpt.dtype(_queue_capabilities(q).default_int_type)
         if inp_dt.itemsize > res_dt.itemsize:
             res_dt = inp_dt
     elif inp_kind in "u":
-        res_dt = dpt.dtype(ti.default_device_uint_type(q))
+        res_dt = dpt.dtype(_queue_capabilities(q).default_uint_type)
         res_ii = dpt.iinfo(res_dt)
         inp_ii = dpt.iinfo(inp_dt)
         if inp_ii.min >= res_ii.min and inp_ii.max <= res_ii.max:
@@ -937,10 +946,10 @@ def _default_accumulation_dtype_fp_types(inp_dt, q):
     """
     inp_kind = inp_dt.kind
     if inp_kind in "biu":
-        res_dt = dpt.dtype(ti.default_device_fp_type(q))
+        res_dt = dpt.dtype(_queue_capabilities(q).default_fp_type)
         can_cast_v = dpt.can_cast(inp_dt, res_dt)
         if not can_cast_v:
-            _fp64 = q.sycl_device.has_aspect_fp64
+            _fp64 = _queue_capabilities(q).has_fp64
             res_dt = dpt.float64 if _fp64 else dpt.float32
     elif inp_kind in "f":
         res_dt = inp_dt
@@ -122,6 +122,23 @@ cdef object _as_zero_dim_ndarray(object usm_ary):
     return view
 
 
+# passed as shape to the constructor by `_make_view`, which populates
+# fields of the instance itself
+cdef object _internal_view_token = object()
+
+
+cdef object _copy_utils_module = None
+
+
+cdef object _get_copy_utils():
+    "Returns dpctl.tensor._copy_utils module, importing it once"
+    global _copy_utils_module
+    if _copy_utils_module is None:
+        from . import _copy_utils
+        _copy_utils_module = _copy_utils
+    return _copy_utils_module
+
+
 cdef int _copy_writable(int lhs_flags, int rhs_flags):
     "Copy the WRITABLE flag to lhs_flags from rhs_flags"
     return (lhs_flags & ~USM_ARRAY_WRITABLE) | (rhs_flags & USM_ARRAY_WRITABLE)
@@ -284,6 +301,8 @@ cdef class usm_ndarray:
         cdef bint is_fp16 = False
 
         self._reset()
+        if shape is _internal_view_token:
+            return
         if not isinstance(shape, (list, tuple)):
             if hasattr(shape, 'tolist'):
                 fn = getattr(shape, 'tolist')
@@ -308,7 +327,7 @@ cdef class usm_ndarray:
                 dtype = default_device_fp_type(q)
             else:
                 dev = _cached_default_device()
-                dtype = "f8" if dev.has_aspect_fp64 else "f4"
+                dtype = dev.capabilities.default_fp_type
         typenum = dtype_to_typenum(dtype)
         if (typenum < 0):
             if typenum == -2:
@@ -379,8 +398,9 @@ cdef class usm_ndarray:
         is_fp64 = (typenum == UAR_DOUBLE or typenum == UAR_CDOUBLE)
         is_fp16 = (typenum == UAR_HALF)
         if (is_fp64 or is_fp16):
-            if ((is_fp64 and not _buffer.sycl_device.has_aspect_fp64) or
-                (is_fp16 and not _buffer.sycl_device.has_aspect_fp16)
+            caps = _buffer.sycl_device.capabilities
+            if ((is_fp64 and not caps.has_fp64) or
+                (is_fp16 and not caps.has_fp16)
             ):
                 raise ValueError(
                     f"Device {_buffer.sycl_device.name} does"
@@ -933,9 +953,9 @@ cdef class usm_ndarray:
             return _imag_view(self)
 
     def __getitem__(self, ind):
+        # offset of the view is computed relative to this array
         cdef tuple _meta = _basic_slice_meta(
-            ind, (<object>self).shape, (<object> self).strides,
-            self.get_offset())
+            ind, (<object>self).shape, (<object> self).strides, 0)
         cdef usm_ndarray res
         cdef int i = 0
         cdef bint matching = 1
@@ -943,24 +963,18 @@ cdef class usm_ndarray:
         if len(_meta) < 5:
             raise RuntimeError
 
-        res = usm_ndarray.__new__(
-            usm_ndarray,
-            _meta[0],
-            dtype=_make_typestr(self.typenum_),
-            strides=_meta[1],
-            buffer=self.base_,
-            offset=_meta[2]
-        )
-        res.array_namespace_ = self.array_namespace_
+        res = _make_view(self, self.typenum_, _meta[0], _meta[1], _meta[2])
 
         adv_ind = _meta[3]
         adv_ind_start_p = _meta[4]
 
         if adv_ind_start_p < 0:
-            res.flags_ = _copy_writable(res.flags_, self.flags_)
             return res
 
-        from ._copy_utils import _extract_impl, _nonzero_impl, _take_multi_index
+        _cu = _get_copy_utils()
+        _extract_impl = _cu._extract_impl
+        _nonzero_impl = _cu._nonzero_impl
+        _take_multi_index = _cu._take_multi_index
 
         # if len(adv_ind == 1), the (only) element is always an array
         if len(adv_ind) == 1 and adv_ind[0].dtype == dpt_bool:
@@ -976,7 +990,7 @@ cdef class usm_ndarray:
                         matching = 0
             if not matching:
                 raise IndexError("boolean index did not match indexed array in dimensions")
-            res = _extract_impl(res, key_, axis=adv_ind_start_p)
+            res = _extract_impl(res, key_, axis=adv_ind_start_p, deferred=False)
             res.flags_ = _copy_writable(res.flags_, self.flags_)
             return res
 
@@ -984,7 +998,7 @@ cdef class usm_ndarray:
             adv_ind_int = list()
             for ind in adv_ind:
                 if isinstance(ind, usm_ndarray) and ind.dtype == dpt_bool:
-                    adv_ind_int.extend(_nonzero_impl(ind))
+                    adv_ind_int.extend(_nonzero_impl(ind, deferred=False))
                 else:
                     adv_ind_int.append(ind)
             res = _take_multi_index(res, tuple(adv_ind_int), adv_ind_start_p)
@@ -1368,32 +1382,24 @@ cdef class usm_ndarray:
         if (self.flags_ & USM_ARRAY_WRITABLE) == 0:
             raise ValueError("Can not modify read-only array.")
 
+        # offset of the view is computed relative to this array
         _meta = _basic_slice_meta(
-            key, (<object>self).shape, (<object> self).strides,
-            self.get_offset()
+            key, (<object>self).shape, (<object> self).strides, 0
         )
 
         if len(_meta) < 5:
             raise RuntimeError
 
-        Xv = usm_ndarray.__new__(
-            usm_ndarray,
-            _meta[0],
-            dtype=_make_typestr(self.typenum_),
-            strides=_meta[1],
-            buffer=self.base_,
-            offset=_meta[2],
-        )
-        # set namespace
-        Xv.array_namespace_ = self.array_namespace_
-
-        from ._copy_utils import (
-            _copy_from_numpy_into,
-            _copy_from_usm_ndarray_to_usm_ndarray,
-            _nonzero_impl,
-            _place_impl,
-            _put_multi_index,
+        Xv = _make_view(self, self.typenum_, _meta[0], _meta[1], _meta[2])
+
+        _cu = _get_copy_utils()
+        _copy_from_numpy_into = _cu._copy_from_numpy_into
+        _copy_from_usm_ndarray_to_usm_ndarray = (
+            _cu._copy_from_usm_ndarray_to_usm_ndarray
         )
+        _nonzero_impl = _cu._nonzero_impl
+        _place_impl = _cu._place_impl
+        _put_multi_index = _cu._put_multi_index
 
         adv_ind = _meta[3]
         adv_ind_start_p = _meta[4]
@@ -1438,7 +1444,7 @@ cdef class usm_ndarray:
             adv_ind_int = list()
             for ind in adv_ind:
                 if isinstance(ind, usm_ndarray) and ind.dtype == dpt_bool:
-                    adv_ind_int.extend(_nonzero_impl(ind))
+                    adv_ind_int.extend(_nonzero_impl(ind, deferred=False))
                 else:
                     adv_ind_int.append(ind)
             _put_multi_index(Xv, tuple(adv_ind_int), adv_ind_start_p, rhs)
@@ -1557,13 +1563,57 @@ cdef class usm_ndarray:
         )
 
 
+cdef usm_ndarray _make_view(
+    usm_ndarray ary, int typenum, object shape, object strides,
+    Py_ssize_t displacement
+):
+    """
+    Construct view into the allocation of `ary` with given element type,
+    shape and strides. Zero-index element of the view is displaced by
+    `displacement` elements of the view type from that of `ary`.
+
+    Unlike the constructor, arguments are not validated, and are expected
+    to describe a view within the allocation of `ary`.
+    """
+    cdef int nd = len(shape)
+    cdef int itemsize = type_bytesize(typenum)
+    cdef int err = 0
+    cdef int contig_flag = 0
+    cdef Py_ssize_t *shape_ptr = NULL
+    cdef Py_ssize_t *strides_ptr = NULL
+    cdef Py_ssize_t ary_nelems = 0
+    cdef Py_ssize_t ary_min_displacement = 0
+    cdef Py_ssize_t ary_max_displacement = 0
+    cdef usm_ndarray r = usm_ndarray.__new__(usm_ndarray, _internal_view_token)
+
+    err = _from_input_shape_strides(
+        nd, shape, strides, itemsize, <char> ord('C'),
+        &shape_ptr, &strides_ptr, &ary_nelems,
+        &ary_min_displacement, &ary_max_displacement, &contig_flag
+    )
+    if (err):
+        if err == ERROR_MALLOC:
+            raise MemoryError("Memory allocation for shape/strides "
+                              "array failed.")
+        raise InternalUSMArrayError(
+            " .. while processing shape and strides.")
+    r.base_ = ary.base_
+    r.data_ = ary.data_ + itemsize * displacement
+    r.shape_ = shape_ptr
+    r.strides_ = strides_ptr
+    r.typenum_ = typenum
+    r.flags_ = (contig_flag | (ary.flags_ & USM_ARRAY_WRITABLE))
+    r.nd_ = nd
+    r.array_namespace_ = ary.array_namespace_
+    return r
+
+
 cdef usm_ndarray _real_view(usm_ndarray ary):
     """
     View into real parts of a complex type array
     """
     cdef int r_typenum_ = -1
     cdef usm_ndarray r = None
-    cdef Py_ssize_t offset_elems = 0
 
     if (ary.typenum_ == UAR_CFLOAT):
         r_typenum_ = UAR_FLOAT
@@ -1573,18 +1623,13 @@ cdef usm_ndarray _real_view(usm_ndarray ary):
         raise InternalUSMArrayError(
             "_real_view call on array of non-complex type.")
 
-    offset_elems = ary.get_offset() * 2
-    r = usm_ndarray.__new__(
-        usm_ndarray,
+    r = _make_view(
+        ary,
+        r_typenum_,
         _make_int_tuple(ary.nd_, ary.shape_) if ary.nd_ > 0 else tuple(),
-        dtype=_make_typestr(r_typenum_),
-        strides=tuple(2 * si for si in ary.strides),
-        buffer=ary.base_,
-        offset=offset_elems,
-        order=('C' if (ary.flags_ & USM_ARRAY_C_CONTIGUOUS) else 'F')
+        tuple(2 * si for si in ary.strides),
+        0
     )
-    r.flags_ = _copy_writable(r.flags_, ary.flags_)
-    r.array_namespace_ = ary.array_namespace_
     return r
 
 
@@ -1594,7 +1639,6 @@ cdef usm_ndarray _imag_view(usm_ndarray ary):
     """
     cdef int r_typenum_ = -1
     cdef usm_ndarray r = None
-    cdef Py_ssize_t offset_elems = 0
 
     if (ary.typenum_ == UAR_CFLOAT):
         r_typenum_ = UAR_FLOAT
@@ -1605,18 +1649,13 @@ cdef usm_ndarray _imag_view(usm_ndarray ary):
             "_imag_view call on array of non-complex type.")
 
     # displace pointer to imaginary part
-    offset_elems = 2 * ary.get_offset() + 1
-    r = usm_ndarray.__new__(
-        usm_ndarray,
+    r = _make_view(
+        ary,
+        r_typenum_,
         _make_int_tuple(ary.nd_, ary.shape_) if ary.nd_ > 0 else tuple(),
-        dtype=_make_typestr(r_typenum_),
-        strides=tuple(2 * si for si in ary.strides),
-        buffer=ary.base_,
-        offset=offset_elems,
-        order=('C' if (ary.flags_ & USM_ARRAY_C_CONTIGUOUS) else 'F')
+        tuple(2 * si for si in ary.strides),
+        1
     )
-    r.flags_ = _copy_writable(r.flags_, ary.flags_)
-    r.array_namespace_ = ary.array_namespace_
     return r
 
 
@@ -65,7 +65,7 @@ def _boolean_reduction(x, axis, keepdims, func):
     res_usm_type = x.usm_type
 
     _manager = du.SequentialOrderManager[exec_q]
-    dep_evs = _manager.submitted_events
+    dep_evs = _manager.dependency_events
     # always allocate the temporary as
     # int32 and usm-device  to ensure that atomic updates
     # are supported
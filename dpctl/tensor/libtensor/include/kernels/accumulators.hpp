@@ -114,7 +114,7 @@ public:
         : src_(src), size_(sz), local_scans_(local_scans)
     {
     }
-    ~stack_t(){};
+    ~stack_t() {};
 
     T *get_src_ptr() const { return src_; }
 
@@ -140,7 +140,7 @@ public:
           local_stride_(local_stride)
     {
     }
-    ~stack_strided_t(){};
+    ~stack_strided_t() {};
 
     T *get_src_ptr() const { return src_; }
 
@@ -1178,7 +1178,7 @@ accumulate_strided_impl(sycl::queue &q,
     return comp_ev;
 }
 
-typedef std::size_t (*cumsum_val_contig_impl_fn_ptr_t)(
+typedef sycl::event (*cumsum_contig_impl_fn_ptr_t)(
     sycl::queue &,
     std::size_t,
     const char *,
@@ -1186,13 +1186,16 @@ typedef std::size_t (*cumsum_val_contig_impl_fn_ptr_t)(
     std::vector<sycl::event> &,
     const std::vector<sycl::event> &);
 
+/*! @brief Submits inclusive scan of a contiguous vector, without waiting
+ *  for its completion. Returns event of the scan, after which the last
+ *  element of `cumsum` holds the total. */
 template <typename maskT, typename cumsumT, typename transformerT>
-std::size_t cumsum_val_contig_impl(sycl::queue &q,
-                                   std::size_t n_elems,
-                                   const char *mask,
-                                   char *cumsum,
-                                   std::vector<sycl::event> &host_tasks,
-                                   const std::vector<sycl::event> &depends = {})
+sycl::event cumsum_contig_impl(sycl::queue &q,
+                               std::size_t n_elems,
+                               const char *mask,
+                               char *cumsum,
+                               std::vector<sycl::event> &host_tasks,
+                               const std::vector<sycl::event> &depends = {})
 {
     const maskT *mask_data_ptr = reinterpret_cast<const maskT *>(mask);
     cumsumT *cumsum_data_ptr = reinterpret_cast<cumsumT *>(cumsum);
@@ -1229,6 +1232,30 @@ std::size_t cumsum_val_contig_impl(sycl::queue &q,
             q, wg_size, n_elems, mask_data_ptr, cumsum_data_ptr, s0, s1,
             flat_indexer, transformer, host_tasks, depends);
     }
+
+    return comp_ev;
+}
+
+typedef std::size_t (*cumsum_val_contig_impl_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    const char *,
+    char *,
+    std::vector<sycl::event> &,
+    const std::vector<sycl::event> &);
+
+template <typename maskT, typename cumsumT, typename transformerT>
+std::size_t cumsum_val_contig_impl(sycl::queue &q,
+                                   std::size_t n_elems,
+                                   const char *mask,
+                                   char *cumsum,
+                                   std::vector<sycl::event> &host_tasks,
+                                   const std::vector<sycl::event> &depends = {})
+{
+    sycl::event comp_ev = cumsum_contig_impl<maskT, cumsumT, transformerT>(
+        q, n_elems, mask, cumsum, host_tasks, depends);
+
+    cumsumT *cumsum_data_ptr = reinterpret_cast<cumsumT *>(cumsum);
     cumsumT *last_elem = cumsum_data_ptr + (n_elems - 1);
 
     auto host_usm_owner =
@@ -1271,6 +1298,28 @@ template <typename fnT, typename T> struct MaskPositionsContigFactoryForInt64
     }
 };
 
+template <typename fnT, typename T>
+struct MaskPositionsAsyncContigFactoryForInt32
+{
+    fnT get()
+    {
+        using cumsumT = std::int32_t;
+        fnT fn = cumsum_contig_impl<T, cumsumT, NonZeroIndicator<T, cumsumT>>;
+        return fn;
+    }
+};
+
+template <typename fnT, typename T>
+struct MaskPositionsAsyncContigFactoryForInt64
+{
+    fnT get()
+    {
+        using cumsumT = std::int64_t;
+        fnT fn = cumsum_contig_impl<T, cumsumT, NonZeroIndicator<T, cumsumT>>;
+        return fn;
+    }
+};
+
 template <typename fnT, typename T> struct Cumsum1DContigFactory
 {
     fnT get()
@@ -1287,7 +1336,7 @@ template <typename fnT, typename T> struct Cumsum1DContigFactory
     }
 };
 
-typedef std::size_t (*cumsum_val_strided_impl_fn_ptr_t)(
+typedef sycl::event (*cumsum_strided_impl_fn_ptr_t)(
     sycl::queue &,
     std::size_t,
     const char *,
@@ -1297,16 +1346,18 @@ typedef std::size_t (*cumsum_val_strided_impl_fn_ptr_t)(
     std::vector<sycl::event> &,
     const std::vector<sycl::event> &);
 
+/*! @brief Submits inclusive scan of a strided array, without waiting
+ *  for its completion. Returns event of the scan, after which the last
+ *  element of `cumsum` holds the total. */
 template <typename maskT, typename cumsumT, typename transformerT>
-std::size_t
-cumsum_val_strided_impl(sycl::queue &q,
-                        std::size_t n_elems,
-                        const char *mask,
-                        int nd,
-                        const ssize_t *shape_strides,
-                        char *cumsum,
-                        std::vector<sycl::event> &host_tasks,
-                        const std::vector<sycl::event> &depends = {})
+sycl::event cumsum_strided_impl(sycl::queue &q,
+                                std::size_t n_elems,
+                                const char *mask,
+                                int nd,
+                                const ssize_t *shape_strides,
+                                char *cumsum,
+                                std::vector<sycl::event> &host_tasks,
+                                const std::vector<sycl::event> &depends = {})
 {
     const maskT *mask_data_ptr = reinterpret_cast<const maskT *>(mask);
     cumsumT *cumsum_data_ptr = reinterpret_cast<cumsumT *>(cumsum);
@@ -1344,6 +1395,34 @@ cumsum_val_strided_impl(sycl::queue &q,
             strided_indexer, transformer, host_tasks, depends);
     }
 
+    return comp_ev;
+}
+
+typedef std::size_t (*cumsum_val_strided_impl_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    const char *,
+    int,
+    const ssize_t *,
+    char *,
+    std::vector<sycl::event> &,
+    const std::vector<sycl::event> &);
+
+template <typename maskT, typename cumsumT, typename transformerT>
+std::size_t
+cumsum_val_strided_impl(sycl::queue &q,
+                        std::size_t n_elems,
+                        const char *mask,
+                        int nd,
+                        const ssize_t *shape_strides,
+                        char *cumsum,
+                        std::vector<sycl::event> &host_tasks,
+                        const std::vector<sycl::event> &depends = {})
+{
+    sycl::event comp_ev = cumsum_strided_impl<maskT, cumsumT, transformerT>(
+        q, n_elems, mask, nd, shape_strides, cumsum, host_tasks, depends);
+
+    cumsumT *cumsum_data_ptr = reinterpret_cast<cumsumT *>(cumsum);
     cumsumT *last_elem = cumsum_data_ptr + (n_elems - 1);
 
     auto host_usm_owner =
@@ -1386,6 +1465,28 @@ template <typename fnT, typename T> struct MaskPositionsStridedFactoryForInt64
     }
 };
 
+template <typename fnT, typename T>
+struct MaskPositionsAsyncStridedFactoryForInt32
+{
+    fnT get()
+    {
+        using cumsumT = std::int32_t;
+        fnT fn = cumsum_strided_impl<T, cumsumT, NonZeroIndicator<T, cumsumT>>;
+        return fn;
+    }
+};
+
+template <typename fnT, typename T>
+struct MaskPositionsAsyncStridedFactoryForInt64
+{
+    fnT get()
+    {
+        using cumsumT = std::int64_t;
+        fnT fn = cumsum_strided_impl<T, cumsumT, NonZeroIndicator<T, cumsumT>>;
+        return fn;
+    }
+};
+
 template <typename fnT, typename T> struct Cumsum1DStridedFactory
 {
     fnT get()
@@ -0,0 +1,358 @@
+//=== fused.hpp - Fused evaluation of elementwise functions -----*-C++-*--/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines a kernel evaluating an expression composed of unary and
+/// binary element-wise functions in a single pass over contiguous arrays.
+/// The expression is a program of instructions interpreted by every
+/// work-item, which keeps intermediate results in private memory.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <sycl/sycl.hpp>
+#include <type_traits>
+#include <vector>
+
+#include "kernels/dpctl_tensor_types.hpp"
+#include "kernels/elementwise_functions/abs.hpp"
+#include "kernels/elementwise_functions/add.hpp"
+#include "kernels/elementwise_functions/ceil.hpp"
+#include "kernels/elementwise_functions/cos.hpp"
+#include "kernels/elementwise_functions/cosh.hpp"
+#include "kernels/elementwise_functions/exp.hpp"
+#include "kernels/elementwise_functions/expm1.hpp"
+#include "kernels/elementwise_functions/floor.hpp"
+#include "kernels/elementwise_functions/log.hpp"
+#include "kernels/elementwise_functions/log1p.hpp"
+#include "kernels/elementwise_functions/maximum.hpp"
+#include "kernels/elementwise_functions/minimum.hpp"
+#include "kernels/elementwise_functions/multiply.hpp"
+#include "kernels/elementwise_functions/negative.hpp"
+#include "kernels/elementwise_functions/positive.hpp"
+#include "kernels/elementwise_functions/pow.hpp"
+#include "kernels/elementwise_functions/reciprocal.hpp"
+#include "kernels/elementwise_functions/rsqrt.hpp"
+#include "kernels/elementwise_functions/sin.hpp"
+#include "kernels/elementwise_functions/sinh.hpp"
+#include "kernels/elementwise_functions/sqrt.hpp"
+#include "kernels/elementwise_functions/square.hpp"
+#include "kernels/elementwise_functions/subtract.hpp"
+#include "kernels/elementwise_functions/tan.hpp"
+#include "kernels/elementwise_functions/tanh.hpp"
+#include "kernels/elementwise_functions/true_divide.hpp"
+#include "kernels/elementwise_functions/trunc.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+namespace fused
+{
+
+/*! @brief Number of registers holding intermediate results */
+static constexpr std::size_t max_registers = 16;
+/*! @brief Maximal number of input arrays */
+static constexpr std::size_t max_inputs = 8;
+/*! @brief Maximal number of scalar constants */
+static constexpr std::size_t max_constants = 16;
+/*! @brief Maximal number of instructions */
+static constexpr std::size_t max_instructions = 64;
+/*! @brief Number of bytes encoding an instruction: opcode, index of
+ * destination register, and operands */
+static constexpr std::size_t instruction_size = 4;
+
+/*! @brief Operands numbered below `input_operand_base` refer to registers,
+ * operands numbered below `constant_operand_base` refer to input arrays,
+ * and the remaining ones refer to constants */
+static constexpr std::uint8_t input_operand_base = max_registers;
+static constexpr std::uint8_t constant_operand_base =
+    input_operand_base + max_inputs;
+
+/*! @brief Operations, values match those used by the Python implementation.
+ * Opcodes of binary functions start at `first_binary` */
+enum class FusedOp : std::uint8_t
+{
+    abs = 1,
+    negative = 2,
+    positive = 3,
+    square = 4,
+    sqrt = 5,
+    exp = 6,
+    expm1 = 7,
+    log = 8,
+    log1p = 9,
+    sin = 10,
+    cos = 11,
+    tan = 12,
+    tanh = 13,
+    sinh = 14,
+    cosh = 15,
+    rsqrt = 16,
+    reciprocal = 17,
+    floor = 18,
+    ceil = 19,
+    trunc = 20,
+    first_binary = 32,
+    add = 32,
+    subtract = 33,
+    multiply = 34,
+    divide = 35,
+    pow = 36,
+    maximum = 37,
+    minimum = 38,
+    end_of_ops = 39
+};
+
+/*! @brief Whether `opcode` encodes a unary function */
+inline bool is_unary_op(std::uint8_t opcode)
+{
+    return opcode >= static_cast<std::uint8_t>(FusedOp::abs) &&
+           opcode <= static_cast<std::uint8_t>(FusedOp::trunc);
+}
+
+/*! @brief Whether `opcode` encodes a binary function */
+inline bool is_binary_op(std::uint8_t opcode)
+{
+    return opcode >= static_cast<std::uint8_t>(FusedOp::first_binary) &&
+           opcode < static_cast<std::uint8_t>(FusedOp::end_of_ops);
+}
+
+template <typename T> T apply_unary(FusedOp op, const T &v)
+{
+    switch (op) {
+    case FusedOp::abs:
+        return abs::AbsFunctor<T, T>{}(v);
+    case FusedOp::negative:
+        return negative::NegativeFunctor<T, T>{}(v);
+    case FusedOp::positive:
+        return positive::PositiveFunctor<T, T>{}(v);
+    case FusedOp::square:
+        return square::SquareFunctor<T, T>{}(v);
+    case FusedOp::sqrt:
+        return sqrt::SqrtFunctor<T, T>{}(v);
+    case FusedOp::exp:
+        return exp::ExpFunctor<T, T>{}(v);
+    case FusedOp::expm1:
+        return expm1::Expm1Functor<T, T>{}(v);
+    case FusedOp::log:
+        return log::LogFunctor<T, T>{}(v);
+    case FusedOp::log1p:
+        return log1p::Log1pFunctor<T, T>{}(v);
+    case FusedOp::sin:
+        return sin::SinFunctor<T, T>{}(v);
+    case FusedOp::cos:
+        return cos::CosFunctor<T, T>{}(v);
+    case FusedOp::tan:
+        return tan::TanFunctor<T, T>{}(v);
+    case FusedOp::tanh:
+        return tanh::TanhFunctor<T, T>{}(v);
+    case FusedOp::sinh:
+        return sinh::SinhFunctor<T, T>{}(v);
+    case FusedOp::cosh:
+        return cosh::CoshFunctor<T, T>{}(v);
+    case FusedOp::rsqrt:
+        return rsqrt::RsqrtFunctor<T, T>{}(v);
+    case FusedOp::reciprocal:
+        return reciprocal::ReciprocalFunctor<T, T>{}(v);
+    case FusedOp::floor:
+        return floor::FloorFunctor<T, T>{}(v);
+    case FusedOp::ceil:
+        return ceil::CeilFunctor<T, T>{}(v);
+    case FusedOp::trunc:
+        return trunc::TruncFunctor<T, T>{}(v);
+    default:
+        return v;
+    }
+}
+
+template <typename T> T apply_binary(FusedOp op, const T &v1, const T &v2)
+{
+    switch (op) {
+    case FusedOp::add:
+        return add::AddFunctor<T, T, T>{}(v1, v2);
+    case FusedOp::subtract:
+        return subtract::SubtractFunctor<T, T, T>{}(v1, v2);
+    case FusedOp::multiply:
+        return multiply::MultiplyFunctor<T, T, T>{}(v1, v2);
+    case FusedOp::divide:
+        return true_divide::TrueDivideFunctor<T, T, T>{}(v1, v2);
+    case FusedOp::pow:
+        return pow::PowFunctor<T, T, T>{}(v1, v2);
+    case FusedOp::maximum:
+        return maximum::MaximumFunctor<T, T, T>{}(v1, v2);
+    case FusedOp::minimum:
+        return minimum::MinimumFunctor<T, T, T>{}(v1, v2);
+    default:
+        return v1;
+    }
+}
+
+template <typename T> class FusedElementwiseFunctor
+{
+private:
+    std::array<const T *, max_inputs> in_ps;
+    T *dst_p = nullptr;
+    std::array<std::uint8_t, max_instructions * instruction_size> program;
+    std::array<T, max_constants> constants;
+    std::size_t n_instructions;
+
+public:
+    FusedElementwiseFunctor(
+        const std::array<const T *, max_inputs> &in_ps_,
+        T *dst_p_,
+        const std::array<std::uint8_t, max_instructions * instruction_size>
+            &program_,
+        const std::array<T, max_constants> &constants_,
+        std::size_t n_instructions_)
+        : in_ps(in_ps_), dst_p(dst_p_), program(program_),
+          constants(constants_), n_instructions(n_instructions_)
+    {
+    }
+
+    void operator()(sycl::id<1> id) const
+    {
+        const std::size_t gid = id[0];
+        T regs[max_registers];
+        std::uint8_t res_reg = 0;
+
+        for (std::size_t i = 0; i < n_instructions; ++i) {
+            const std::uint8_t *instr = program.data() + i * instruction_size;
+            const FusedOp op = static_cast<FusedOp>(instr[0]);
+            res_reg = instr[1];
+            const T v1 = operand(regs, instr[2], gid);
+            if (is_binary_op(instr[0])) {
+                const T v2 = operand(regs, instr[3], gid);
+                regs[res_reg] = apply_binary<T>(op, v1, v2);
+            }
+            else {
+                regs[res_reg] = apply_unary<T>(op, v1);
+            }
+        }
+        dst_p[gid] = regs[res_reg];
+    }
+
+private:
+    T operand(const T *regs, std::uint8_t arg, std::size_t gid) const
+    {
+        if (arg < input_operand_base) {
+            return regs[arg];
+        }
+        else if (arg < constant_operand_base) {
+            return in_ps[arg - input_operand_base][gid];
+        }
+        return constants[arg - constant_operand_base];
+    }
+};
+
+template <typename T> class fused_elementwise_contig_krn;
+
+typedef sycl::event (*fused_elementwise_contig_impl_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    const std::vector<const char *> &,
+    char *,
+    const std::vector<std::uint8_t> &,
+    const std::vector<double> &,
+    const std::vector<sycl::event> &);
+
+/*!
+ * @brief Evaluates `program` over contiguous arrays of `nelems` elements.
+ *
+ * @param exec_q  Execution queue
+ * @param nelems  Number of elements in each array
+ * @param in_cps  Pointers to input arrays, at most `max_inputs`
+ * @param dst_cp  Pointer to destination array, which may be one of inputs
+ * @param program Instructions, each encoded in `instruction_size` bytes.
+ *                The result is the register written by the last instruction
+ * @param constants Values of scalar operands, at most `max_constants`
+ * @param depends Events to wait for before starting computations
+ * @return Event signaling completion of the computation
+ */
+template <typename T>
+sycl::event
+fused_elementwise_contig_impl(sycl::queue &exec_q,
+                              std::size_t nelems,
+                              const std::vector<const char *> &in_cps,
+                              char *dst_cp,
+                              const std::vector<std::uint8_t> &program,
+                              const std::vector<double> &constants,
+                              const std::vector<sycl::event> &depends)
+{
+    std::array<const T *, max_inputs> in_tps{};
+    for (std::size_t i = 0; i < in_cps.size(); ++i) {
+        in_tps[i] = reinterpret_cast<const T *>(in_cps[i]);
+    }
+    T *dst_tp = reinterpret_cast<T *>(dst_cp);
+
+    std::array<std::uint8_t, max_instructions * instruction_size> program_v{};
+    for (std::size_t i = 0; i < program.size(); ++i) {
+        program_v[i] = program[i];
+    }
+    std::array<T, max_constants> constants_v{};
+    for (std::size_t i = 0; i < constants.size(); ++i) {
+        constants_v[i] = static_cast<T>(constants[i]);
+    }
+    const std::size_t n_instructions = program.size() / instruction_size;
+
+    sycl::event fused_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        using KernelName = fused_elementwise_contig_krn<T>;
+        using Impl = FusedElementwiseFunctor<T>;
+
+        cgh.parallel_for<KernelName>(
+            sycl::range<1>(nelems),
+            Impl(in_tps, dst_tp, program_v, constants_v, n_instructions));
+    });
+
+    return fused_ev;
+}
+
+template <typename T> struct FusedElementwiseTypeSupported
+{
+    static constexpr bool is_defined =
+        std::disjunction_v<std::is_same<T, float>, std::is_same<T, double>>;
+};
+
+template <typename fnT, typename T> struct FusedElementwiseContigFactory
+{
+    fnT get()
+    {
+        if constexpr (FusedElementwiseTypeSupported<T>::is_defined) {
+            fnT fn = fused_elementwise_contig_impl<T>;
+            return fn;
+        }
+        else {
+            fnT fn = nullptr;
+            return fn;
+        }
+    }
+};
+
+} // namespace fused
+} // end of namespace kernels
+} // end of namespace tensor
+} // end of namespace dpctl
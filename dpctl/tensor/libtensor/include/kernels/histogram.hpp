@@ -0,0 +1,488 @@
+//=== histogram.hpp - Histogram and bincount kernels        ------ *-C++-*/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines kernels counting elements, or summing their weights,
+/// per bin. Each work-group accumulates a private histogram in local memory
+/// which is merged into the result with atomics, unless the histogram does
+/// not fit into local memory, in which case the result is updated by global
+/// atomics directly.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <sycl/sycl.hpp>
+#include <type_traits>
+#include <vector>
+
+#include "dpctl_tensor_types.hpp"
+#include "utils/offset_utils.hpp"
+#include "utils/type_utils.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+namespace histogram
+{
+
+using dpctl::tensor::ssize_t;
+
+/*! @brief Bin of integral value is the value itself, values outside of
+ * `[0, nbins)` are not counted */
+template <typename xT> struct IntegerBinner
+{
+    std::size_t nbins;
+
+    std::size_t operator()(const xT &v) const
+    {
+        if constexpr (std::is_same_v<xT, bool>) {
+            return (static_cast<std::size_t>(v) < nbins) ? v : nbins;
+        }
+        else {
+            if constexpr (std::is_signed_v<xT>) {
+                if (v < xT(0)) {
+                    return nbins;
+                }
+            }
+            const std::uint64_t u = static_cast<std::uint64_t>(v);
+            return (u < nbins) ? static_cast<std::size_t>(u) : nbins;
+        }
+    }
+};
+
+/*! @brief Bins given by sorted edges, the last bin includes its right
+ * edge. Bin is found by binary search. Values outside of the edges and
+ * NaNs are not counted */
+template <typename xT, typename edgeT> struct EdgesBinner
+{
+    const edgeT *edges;
+    std::size_t nbins;
+
+    std::size_t operator()(const xT &v) const
+    {
+        using dpctl::tensor::type_utils::convert_impl;
+        const edgeT val = convert_impl<edgeT, xT>(v);
+
+        if (!(val >= edges[0] && val <= edges[nbins])) {
+            return nbins;
+        }
+        // find last edge not greater than the value
+        std::size_t lo = 0;
+        std::size_t hi = nbins;
+        while (hi - lo > 1) {
+            const std::size_t mid = lo + (hi - lo) / 2;
+            if (val < edges[mid]) {
+                hi = mid;
+            }
+            else {
+                lo = mid;
+            }
+        }
+        return lo;
+    }
+};
+
+/*! @brief Bins of equal width. Bin is computed from the value, and adjusted
+ * by comparison with the edges, so that results match EdgesBinner. Values
+ * outside of the edges and NaNs are not counted */
+template <typename xT, typename edgeT> struct UniformBinner
+{
+    const edgeT *edges;
+    std::size_t nbins;
+    edgeT first_edge;
+    edgeT norm;
+
+    std::size_t operator()(const xT &v) const
+    {
+        using dpctl::tensor::type_utils::convert_impl;
+        const edgeT val = convert_impl<edgeT, xT>(v);
+
+        if (!(val >= edges[0] && val <= edges[nbins])) {
+            return nbins;
+        }
+        const edgeT pos = (val - first_edge) * norm;
+        std::size_t bin = (pos > edgeT(0)) ? static_cast<std::size_t>(pos) : 0;
+        bin = std::min(bin, nbins - 1);
+        // correct for round-off in computation of the position
+        if (val < edges[bin]) {
+            --bin;
+        }
+        else if (bin + 1 < nbins && val >= edges[bin + 1]) {
+            ++bin;
+        }
+        return bin;
+    }
+};
+
+/*! @brief Each work-group accumulates a histogram of elements it visits
+ * in local memory, and adds it to the result with atomics */
+template <typename xT, typename resT, typename BinnerT, typename SlmT>
+struct PrivatizedHistogramFunctor
+{
+private:
+    const xT *x_ = nullptr;
+    const resT *w_ = nullptr;
+    resT *hist_ = nullptr;
+    dpctl::tensor::offset_utils::Strided1DIndexer x_indexer_;
+    dpctl::tensor::offset_utils::Strided1DIndexer w_indexer_;
+    BinnerT binner_;
+    SlmT local_hist_;
+    std::size_t nelems_ = 0;
+    std::size_t nbins_ = 0;
+
+public:
+    PrivatizedHistogramFunctor(
+        const xT *x,
+        const resT *w,
+        resT *hist,
+        const dpctl::tensor::offset_utils::Strided1DIndexer &x_indexer,
+        const dpctl::tensor::offset_utils::Strided1DIndexer &w_indexer,
+        const BinnerT &binner,
+        SlmT local_hist,
+        std::size_t nelems,
+        std::size_t nbins)
+        : x_(x), w_(w), hist_(hist), x_indexer_(x_indexer),
+          w_indexer_(w_indexer), binner_(binner), local_hist_(local_hist),
+          nelems_(nelems), nbins_(nbins)
+    {
+    }
+
+    void operator()(sycl::nd_item<1> it) const
+    {
+        const std::size_t lid = it.get_local_id(0);
+        const std::size_t wg = it.get_local_range(0);
+
+        for (std::size_t b = lid; b < nbins_; b += wg) {
+            local_hist_[b] = resT(0);
+        }
+        sycl::group_barrier(it.get_group(), sycl::memory_scope::work_group);
+
+        const std::size_t gws = it.get_global_range(0);
+        for (std::size_t i = it.get_global_id(0); i < nelems_; i += gws) {
+            const std::size_t bin = binner_(x_[x_indexer_(i)]);
+            if (bin < nbins_) {
+                sycl::atomic_ref<resT, sycl::memory_order::relaxed,
+                                 sycl::memory_scope::work_group,
+                                 sycl::access::address_space::local_space>
+                    bin_ref(local_hist_[bin]);
+                bin_ref += (w_) ? w_[w_indexer_(i)] : resT(1);
+            }
+        }
+        sycl::group_barrier(it.get_group(), sycl::memory_scope::work_group);
+
+        for (std::size_t b = lid; b < nbins_; b += wg) {
+            const resT v = local_hist_[b];
+            if (v != resT(0)) {
+                sycl::atomic_ref<resT, sycl::memory_order::relaxed,
+                                 sycl::memory_scope::device,
+                                 sycl::access::address_space::global_space>
+                    res_ref(hist_[b]);
+                res_ref += v;
+            }
+        }
+    }
+};
+
+/*! @brief Each work-item adds its element to the result with atomics */
+template <typename xT, typename resT, typename BinnerT>
+struct GlobalHistogramFunctor
+{
+private:
+    const xT *x_ = nullptr;
+    const resT *w_ = nullptr;
+    resT *hist_ = nullptr;
+    dpctl::tensor::offset_utils::Strided1DIndexer x_indexer_;
+    dpctl::tensor::offset_utils::Strided1DIndexer w_indexer_;
+    BinnerT binner_;
+    std::size_t nbins_ = 0;
+
+public:
+    GlobalHistogramFunctor(
+        const xT *x,
+        const resT *w,
+        resT *hist,
+        const dpctl::tensor::offset_utils::Strided1DIndexer &x_indexer,
+        const dpctl::tensor::offset_utils::Strided1DIndexer &w_indexer,
+        const BinnerT &binner,
+        std::size_t nbins)
+        : x_(x), w_(w), hist_(hist), x_indexer_(x_indexer),
+          w_indexer_(w_indexer), binner_(binner), nbins_(nbins)
+    {
+    }
+
+    void operator()(sycl::id<1> id) const
+    {
+        const std::size_t i = id[0];
+        const std::size_t bin = binner_(x_[x_indexer_(i)]);
+        if (bin < nbins_) {
+            sycl::atomic_ref<resT, sycl::memory_order::relaxed,
+                             sycl::memory_scope::device,
+                             sycl::access::address_space::global_space>
+                res_ref(hist_[bin]);
+            res_ref += (w_) ? w_[w_indexer_(i)] : resT(1);
+        }
+    }
+};
+
+template <typename T1, typename T2, typename T3> class histogram_privatized_krn;
+
+template <typename T1, typename T2, typename T3> class histogram_global_krn;
+
+template <typename xT, typename resT, typename BinnerT>
+sycl::event submit_histogram(sycl::queue &exec_q,
+                             std::size_t nelems,
+                             const xT *x_tp,
+                             ssize_t x_stride,
+                             const resT *w_tp,
+                             ssize_t w_stride,
+                             resT *hist_tp,
+                             std::size_t nbins,
+                             const BinnerT &binner,
+                             const std::vector<sycl::event> &depends)
+{
+    sycl::event fill_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+        cgh.fill<resT>(hist_tp, resT(0), nbins);
+    });
+
+    if (nelems == 0) {
+        return fill_ev;
+    }
+
+    using dpctl::tensor::offset_utils::Strided1DIndexer;
+    const Strided1DIndexer x_indexer{nelems, x_stride};
+    const Strided1DIndexer w_indexer{nelems, w_stride};
+
+    const sycl::device &d = exec_q.get_device();
+    const std::size_t local_mem_size =
+        d.get_info<sycl::info::device::local_mem_size>();
+    // leave room for local memory used by the implementation
+    const std::size_t slm_budget = local_mem_size / 2;
+
+    if (nbins * sizeof(resT) <= slm_budget) {
+        const std::size_t wg = std::min<std::size_t>(
+            256, d.get_info<sycl::info::device::max_work_group_size>());
+        constexpr std::size_t preferred_elems_per_wi = 16;
+        const std::size_t max_groups =
+            8 * d.get_info<sycl::info::device::max_compute_units>();
+        std::size_t n_groups = (nelems + wg * preferred_elems_per_wi - 1) /
+                               (wg * preferred_elems_per_wi);
+        // merging costs nbins atomics per work-group, so it should not
+        // exceed the cost of counting
+        n_groups = std::min({n_groups, max_groups, nelems / nbins});
+        n_groups = std::max<std::size_t>(1, n_groups);
+
+        sycl::event hist_ev = exec_q.submit([&](sycl::handler &cgh) {
+            cgh.depends_on(fill_ev);
+
+            using SlmT = sycl::local_accessor<resT, 1>;
+            SlmT local_hist(sycl::range<1>(nbins), cgh);
+
+            using KernelName = histogram_privatized_krn<xT, resT, BinnerT>;
+
+            const sycl::range<1> gRange{n_groups * wg};
+            const sycl::range<1> lRange{wg};
+
+            cgh.parallel_for<KernelName>(
+                sycl::nd_range<1>(gRange, lRange),
+                PrivatizedHistogramFunctor<xT, resT, BinnerT, SlmT>(
+                    x_tp, w_tp, hist_tp, x_indexer, w_indexer, binner,
+                    local_hist, nelems, nbins));
+        });
+
+        return hist_ev;
+    }
+
+    sycl::event hist_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(fill_ev);
+
+        using KernelName = histogram_global_krn<xT, resT, BinnerT>;
+
+        cgh.parallel_for<KernelName>(
+            sycl::range<1>(nelems),
+            GlobalHistogramFunctor<xT, resT, BinnerT>(
+                x_tp, w_tp, hist_tp, x_indexer, w_indexer, binner, nbins));
+    });
+
+    return hist_ev;
+}
+
+typedef sycl::event (*bincount_impl_fn_ptr_t)(sycl::queue &,
+                                              std::size_t,
+                                              const char *,
+                                              ssize_t,
+                                              const char *,
+                                              ssize_t,
+                                              char *,
+                                              std::size_t,
+                                              const std::vector<sycl::event> &);
+
+template <typename xT, typename resT>
+sycl::event bincount_impl(sycl::queue &exec_q,
+                          std::size_t nelems,
+                          const char *x_cp,
+                          ssize_t x_stride,
+                          const char *w_cp,
+                          ssize_t w_stride,
+                          char *hist_cp,
+                          std::size_t nbins,
+                          const std::vector<sycl::event> &depends)
+{
+    const xT *x_tp = reinterpret_cast<const xT *>(x_cp);
+    const resT *w_tp = reinterpret_cast<const resT *>(w_cp);
+    resT *hist_tp = reinterpret_cast<resT *>(hist_cp);
+
+    const IntegerBinner<xT> binner{nbins};
+
+    return submit_histogram<xT, resT, IntegerBinner<xT>>(
+        exec_q, nelems, x_tp, x_stride, w_tp, w_stride, hist_tp, nbins, binner,
+        depends);
+}
+
+typedef sycl::event (*histogram_impl_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    const char *,
+    ssize_t,
+    const char *,
+    ssize_t,
+    const char *,
+    char *,
+    std::size_t,
+    bool,
+    double,
+    double,
+    const std::vector<sycl::event> &);
+
+template <typename xT, typename edgeT, typename resT>
+sycl::event histogram_impl(sycl::queue &exec_q,
+                           std::size_t nelems,
+                           const char *x_cp,
+                           ssize_t x_stride,
+                           const char *w_cp,
+                           ssize_t w_stride,
+                           const char *edges_cp,
+                           char *hist_cp,
+                           std::size_t nbins,
+                           bool uniform,
+                           double first_edge,
+                           double last_edge,
+                           const std::vector<sycl::event> &depends)
+{
+    const xT *x_tp = reinterpret_cast<const xT *>(x_cp);
+    const resT *w_tp = reinterpret_cast<const resT *>(w_cp);
+    const edgeT *edges_tp = reinterpret_cast<const edgeT *>(edges_cp);
+    resT *hist_tp = reinterpret_cast<resT *>(hist_cp);
+
+    if (uniform) {
+        const double norm =
+            static_cast<double>(nbins) / (last_edge - first_edge);
+        const UniformBinner<xT, edgeT> binner{edges_tp, nbins,
+                                              static_cast<edgeT>(first_edge),
+                                              static_cast<edgeT>(norm)};
+
+        return submit_histogram<xT, resT, UniformBinner<xT, edgeT>>(
+            exec_q, nelems, x_tp, x_stride, w_tp, w_stride, hist_tp, nbins,
+            binner, depends);
+    }
+
+    const EdgesBinner<xT, edgeT> binner{edges_tp, nbins};
+
+    return submit_histogram<xT, resT, EdgesBinner<xT, edgeT>>(
+        exec_q, nelems, x_tp, x_stride, w_tp, w_stride, hist_tp, nbins, binner,
+        depends);
+}
+
+/*! @brief Types of histogram which can be accumulated with atomics */
+template <typename resT> struct HistogramResultTypeSupported
+{
+    static constexpr bool is_defined = std::is_same_v<resT, std::int64_t> ||
+                                       std::is_same_v<resT, std::uint64_t> ||
+                                       std::is_same_v<resT, float> ||
+                                       std::is_same_v<resT, double>;
+};
+
+template <typename xT, typename resT> struct BincountTypePairSupported
+{
+    static constexpr bool is_defined =
+        std::is_integral_v<xT> &&
+        HistogramResultTypeSupported<resT>::is_defined;
+};
+
+template <typename xT, typename resT> struct HistogramTypePairSupported
+{
+    static constexpr bool is_defined =
+        (std::is_integral_v<xT> || std::is_floating_point_v<xT> ||
+         std::is_same_v<xT, sycl::half>) &&
+        HistogramResultTypeSupported<resT>::is_defined;
+};
+
+template <typename fnT, typename xT, typename resT> struct BincountFactory
+{
+    fnT get()
+    {
+        if constexpr (BincountTypePairSupported<xT, resT>::is_defined) {
+            fnT fn = bincount_impl<xT, resT>;
+            return fn;
+        }
+        else {
+            fnT fn = nullptr;
+            return fn;
+        }
+    }
+};
+
+template <typename fnT, typename xT, typename edgeT, typename resT>
+struct HistogramFactory
+{
+    fnT get()
+    {
+        if constexpr (HistogramTypePairSupported<xT, resT>::is_defined) {
+            fnT fn = histogram_impl<xT, edgeT, resT>;
+            return fn;
+        }
+        else {
+            fnT fn = nullptr;
+            return fn;
+        }
+    }
+};
+
+template <typename fnT, typename xT, typename resT>
+struct HistogramFloatEdgesFactory
+    : public HistogramFactory<fnT, xT, float, resT>
+{
+};
+
+template <typename fnT, typename xT, typename resT>
+struct HistogramDoubleEdgesFactory
+    : public HistogramFactory<fnT, xT, double, resT>
+{
+};
+
+} // namespace histogram
+} // namespace kernels
+} // namespace tensor
+} // namespace dpctl
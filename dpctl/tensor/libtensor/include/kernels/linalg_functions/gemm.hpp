@@ -24,6 +24,7 @@
 
 #pragma once
 
+#include <algorithm>
 #include <complex>
 #include <cstddef>
 #include <cstdint>
@@ -34,6 +35,7 @@
 #include <vector>
 
 #include "kernels/dpctl_tensor_types.hpp"
+#include "kernels/linalg_functions/gemm_tuning.hpp"
 #include "kernels/reductions.hpp"
 #include "utils/offset_utils.hpp"
 #include "utils/sycl_alloc_utils.hpp"
@@ -753,6 +755,7 @@ sycl::event _gemm_k_impl(sycl::queue &exec_q,
     const std::size_t delta_k(4);
     std::size_t n_wi(64);
     std::size_t delta_n(32);
+    gemm_detail::apply_gemm_k_tuning(n_wi);
 
     static_assert(std::is_same_v<LhsIndexerT, RhsIndexerT>);
     static_assert(std::is_same_v<LhsIndexerT, ResIndexerT>);
@@ -827,6 +830,7 @@ sycl::event _gemm_small_m_impl(sycl::queue &exec_q,
     const std::size_t delta_k(4);
     std::size_t n_wi(64);
     std::size_t delta_n(32);
+    gemm_detail::apply_gemm_k_tuning(n_wi);
 
     static_assert(std::is_same_v<LhsIndexerT, RhsIndexerT>);
     static_assert(std::is_same_v<LhsIndexerT, ResIndexerT>);
@@ -1316,9 +1320,15 @@ sycl::event _gemm_batch_nm_impl(sycl::queue &exec_q,
     constexpr std::size_t wg_sz_limit(2048);
     const std::size_t max_wg_sz = std::min(wg_sz_limit, k_wg_sz);
 
-    const std::uint32_t max_subgroups_per_wg =
+    std::uint32_t max_subgroups_per_wg =
         static_cast<std::uint32_t>(max_wg_sz / max_sg_size);
 
+    const auto &tuning = gemm_detail::current_gemm_tuning();
+    if (tuning.nm_wg_delta_m > 0) {
+        max_subgroups_per_wg =
+            std::min(max_subgroups_per_wg, tuning.nm_wg_delta_m);
+    }
+
     const std::size_t reserved_slm_byte_size = 512;
     const std::size_t slm_byte_size =
         dev.get_info<sycl::info::device::local_mem_size>();
@@ -1331,6 +1341,9 @@ sycl::event _gemm_batch_nm_impl(sycl::queue &exec_q,
         get_wg_delta_m_and_wi_delta_k<resTy, wi_delta_n, wi_total_delta_m>(
             slm_byte_size - reserved_slm_byte_size, wg_delta_n,
             max_subgroups_per_wg);
+    if (tuning.nm_wi_delta_k > 0) {
+        wi_delta_k = std::min(wi_delta_k, tuning.nm_wi_delta_k);
+    }
 
     const std::uint32_t lws = wg_delta_n * wg_delta_m;
 
@@ -2276,6 +2289,7 @@ gemm_batch_tree_k_impl(sycl::queue &exec_q,
     std::size_t delta_k(4);
     std::size_t n_wi(64);
     std::size_t delta_n(32);
+    gemm_detail::apply_gemm_k_tuning(n_wi);
 
     const sycl::device &dev = exec_q.get_device();
     const std::size_t local_mem_size =
@@ -2570,6 +2584,8 @@ gemm_batch_tree_nm_impl(sycl::queue &exec_q,
     std::size_t wi_delta_k(64); // Elements in K dimension processed by WI
 
     const sycl::device &dev = exec_q.get_device();
+    gemm_detail::apply_gemm_nm_tuning(dev, wg_delta_n, wg_delta_m, wi_delta_k);
+
     const std::size_t local_mem_size =
         dev.get_info<sycl::info::device::local_mem_size>();
     const std::size_t reserved_slm_size = 512;
@@ -2939,6 +2955,7 @@ gemm_batch_contig_tree_k_impl(sycl::queue &exec_q,
     std::size_t delta_k(4);
     std::size_t n_wi(64);
     std::size_t delta_n(32);
+    gemm_detail::apply_gemm_k_tuning(n_wi);
 
     const sycl::device &dev = exec_q.get_device();
     const std::size_t local_mem_size =
@@ -3126,6 +3143,8 @@ gemm_batch_contig_tree_nm_impl(sycl::queue &exec_q,
     std::size_t wi_delta_k(64); // Elements in K dimension processed by WI
 
     const sycl::device &dev = exec_q.get_device();
+    gemm_detail::apply_gemm_nm_tuning(dev, wg_delta_n, wg_delta_m, wi_delta_k);
+
     const std::size_t local_mem_size =
         dev.get_info<sycl::info::device::local_mem_size>();
     const std::size_t reserved_slm_size = 512;
@@ -3504,6 +3523,7 @@ sycl::event gemm_tree_k_impl(sycl::queue &exec_q,
     std::size_t delta_k(4);
     std::size_t n_wi(64);
     std::size_t delta_n(32);
+    gemm_detail::apply_gemm_k_tuning(n_wi);
 
     const sycl::device &dev = exec_q.get_device();
     const std::size_t local_mem_size =
@@ -3658,6 +3678,8 @@ sycl::event gemm_tree_nm_impl(sycl::queue &exec_q,
     std::size_t wi_delta_k(64); // Elements in K dimension processed by WI
 
     const sycl::device &dev = exec_q.get_device();
+    gemm_detail::apply_gemm_nm_tuning(dev, wg_delta_n, wg_delta_m, wi_delta_k);
+
     const std::size_t local_mem_size =
         dev.get_info<sycl::info::device::local_mem_size>();
     const std::size_t reserved_slm_size = 512;
@@ -3897,6 +3919,7 @@ sycl::event gemm_contig_tree_k_impl(sycl::queue &exec_q,
     std::size_t delta_k(4);
     std::size_t n_wi(64);
     std::size_t delta_n(32);
+    gemm_detail::apply_gemm_k_tuning(n_wi);
 
     const sycl::device &dev = exec_q.get_device();
     const std::size_t local_mem_size =
@@ -4035,6 +4058,8 @@ sycl::event gemm_contig_tree_nm_impl(sycl::queue &exec_q,
     std::size_t wi_delta_k(64); // Elements in K dimension processed by WI
 
     const sycl::device &dev = exec_q.get_device();
+    gemm_detail::apply_gemm_nm_tuning(dev, wg_delta_n, wg_delta_m, wi_delta_k);
+
     const std::size_t local_mem_size =
         dev.get_info<sycl::info::device::local_mem_size>();
     const std::size_t reserved_slm_size = 512;
@@ -0,0 +1,372 @@
+//=== gemm_epilogue.hpp - Epilogue of matrix multiplication ---*-C++-*--/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines kernels applying scaling, accumulation, bias and
+/// activation to the result of matrix multiplication in a single pass,
+/// i.e. computing act(alpha * res + beta * dst + bias).
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include <complex>
+#include <cstddef>
+#include <cstdint>
+#include <sycl/sycl.hpp>
+#include <type_traits>
+#include <vector>
+
+#include "kernels/dpctl_tensor_types.hpp"
+#include "utils/offset_utils.hpp"
+#include "utils/type_utils.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+namespace gemm_epilogue
+{
+
+using dpctl::tensor::ssize_t;
+
+/*! @brief Activations applied by the epilogue, values match those used by
+ * the Python implementation */
+enum class GemmActivation : int
+{
+    none = 0,
+    relu = 1,
+    gelu = 2,
+    tanh = 3
+};
+
+/*! @brief Whether the activation is defined for elements of type T */
+template <typename T> bool is_activation_supported(GemmActivation act)
+{
+    using dpctl::tensor::type_utils::is_complex_v;
+
+    switch (act) {
+    case GemmActivation::none:
+        return true;
+    case GemmActivation::relu:
+        return !is_complex_v<T>;
+    case GemmActivation::gelu:
+    case GemmActivation::tanh:
+        return std::is_floating_point_v<T> || std::is_same_v<T, sycl::half>;
+    default:
+        return false;
+    }
+}
+
+template <typename T> T apply_activation(const T &v, GemmActivation act)
+{
+    using dpctl::tensor::type_utils::is_complex_v;
+
+    if constexpr (is_complex_v<T>) {
+        return v;
+    }
+    else if constexpr (std::is_floating_point_v<T> ||
+                       std::is_same_v<T, sycl::half>)
+    {
+        switch (act) {
+        case GemmActivation::relu:
+            // propagate NaN, like maximum(v, 0)
+            return (v < T(0)) ? T(0) : v;
+        case GemmActivation::gelu:
+        {
+            // exact GELU, 0.5 * v * (1 + erf(v / sqrt(2)))
+            const T inv_sqrt2 = T(0.7071067811865476);
+            return T(0.5) * v * (T(1) + sycl::erf(v * inv_sqrt2));
+        }
+        case GemmActivation::tanh:
+            return sycl::tanh(v);
+        default:
+            return v;
+        }
+    }
+    else {
+        if (act == GemmActivation::relu) {
+            return (v < T(0)) ? T(0) : v;
+        }
+        return v;
+    }
+}
+
+template <typename T, typename IndexerT, typename BiasIndexerT>
+class GemmEpilogueFunctor
+{
+private:
+    const T *res_p = nullptr;
+    const T *bias_p = nullptr;
+    T *dst_p = nullptr;
+    T alpha;
+    T beta;
+    GemmActivation act;
+    IndexerT indexer;
+    BiasIndexerT bias_indexer;
+
+public:
+    GemmEpilogueFunctor(const T *res_p_,
+                        const T *bias_p_,
+                        T *dst_p_,
+                        const T &alpha_,
+                        const T &beta_,
+                        GemmActivation act_,
+                        const IndexerT &indexer_,
+                        const BiasIndexerT &bias_indexer_)
+        : res_p(res_p_), bias_p(bias_p_), dst_p(dst_p_), alpha(alpha_),
+          beta(beta_), act(act_), indexer(indexer_), bias_indexer(bias_indexer_)
+    {
+    }
+
+    void operator()(sycl::id<1> id) const
+    {
+        const ssize_t gid = static_cast<ssize_t>(id[0]);
+        const auto &offsets = indexer(gid);
+        const ssize_t res_offset = offsets.get_first_offset();
+        const ssize_t dst_offset = offsets.get_second_offset();
+
+        T v = alpha * res_p[res_offset];
+        // like in BLAS, destination is not read when beta is zero
+        if (beta != T(0)) {
+            v += beta * dst_p[dst_offset];
+        }
+        if (bias_p) {
+            v += bias_p[bias_indexer(gid, offsets.get_third_offset())];
+        }
+        dst_p[dst_offset] = apply_activation<T>(v, act);
+    }
+};
+
+/*! @brief Indexer of bias of contiguous result: bias is indexed by position
+ * of the element along the last dimension of the result */
+struct ContigBiasIndexer
+{
+    ContigBiasIndexer(ssize_t n_cols_, ssize_t bias_stride_)
+        : n_cols(n_cols_), bias_stride(bias_stride_)
+    {
+    }
+
+    ssize_t operator()(ssize_t gid, ssize_t) const
+    {
+        return (gid % n_cols) * bias_stride;
+    }
+
+private:
+    ssize_t n_cols;
+    ssize_t bias_stride;
+};
+
+/*! @brief Indexer of bias of strided result: offset of bias is computed by
+ * the strided indexer of the result */
+struct StridedBiasIndexer
+{
+    ssize_t operator()(ssize_t, ssize_t bias_offset) const
+    {
+        return bias_offset;
+    }
+};
+
+template <typename T> T cast_scalar(const std::complex<double> &v)
+{
+    using dpctl::tensor::type_utils::is_complex_v;
+    if constexpr (is_complex_v<T>) {
+        using realT = typename T::value_type;
+        return T(static_cast<realT>(v.real()), static_cast<realT>(v.imag()));
+    }
+    else {
+        return static_cast<T>(v.real());
+    }
+}
+
+template <typename T1, typename T2, typename T3> class gemm_epilogue_contig_krn;
+
+typedef sycl::event (*gemm_epilogue_contig_impl_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    const char *,
+    const char *,
+    char *,
+    ssize_t,
+    ssize_t,
+    const std::complex<double> &,
+    const std::complex<double> &,
+    int,
+    const std::vector<sycl::event> &);
+
+template <typename T>
+sycl::event gemm_epilogue_contig_impl(sycl::queue &exec_q,
+                                      std::size_t nelems,
+                                      const char *res_cp,
+                                      const char *bias_cp,
+                                      char *dst_cp,
+                                      ssize_t n_cols,
+                                      ssize_t bias_stride,
+                                      const std::complex<double> &alpha,
+                                      const std::complex<double> &beta,
+                                      int activation,
+                                      const std::vector<sycl::event> &depends)
+{
+    const T *res_tp = reinterpret_cast<const T *>(res_cp);
+    const T *bias_tp = reinterpret_cast<const T *>(bias_cp);
+    T *dst_tp = reinterpret_cast<T *>(dst_cp);
+
+    const T alpha_v = cast_scalar<T>(alpha);
+    const T beta_v = cast_scalar<T>(beta);
+    const GemmActivation act = static_cast<GemmActivation>(activation);
+
+    sycl::event epilogue_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        using dpctl::tensor::offset_utils::NoOpIndexer;
+        using ContigIndexerT =
+            dpctl::tensor::offset_utils::ThreeOffsets_CombinedIndexer<
+                NoOpIndexer, NoOpIndexer, NoOpIndexer>;
+        const ContigIndexerT indexer{NoOpIndexer{}, NoOpIndexer{},
+                                     NoOpIndexer{}};
+        const ContigBiasIndexer bias_indexer{n_cols, bias_stride};
+
+        using KernelName =
+            gemm_epilogue_contig_krn<T, ContigIndexerT, ContigBiasIndexer>;
+        using Impl = GemmEpilogueFunctor<T, ContigIndexerT, ContigBiasIndexer>;
+
+        cgh.parallel_for<KernelName>(sycl::range<1>(nelems),
+                                     Impl(res_tp, bias_tp, dst_tp, alpha_v,
+                                          beta_v, act, indexer, bias_indexer));
+    });
+
+    return epilogue_ev;
+}
+
+template <typename T1, typename T2, typename T3>
+class gemm_epilogue_strided_krn;
+
+typedef sycl::event (*gemm_epilogue_strided_impl_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    int,
+    const char *,
+    const char *,
+    char *,
+    const ssize_t *,
+    ssize_t,
+    ssize_t,
+    ssize_t,
+    const std::complex<double> &,
+    const std::complex<double> &,
+    int,
+    const std::vector<sycl::event> &);
+
+template <typename T>
+sycl::event gemm_epilogue_strided_impl(sycl::queue &exec_q,
+                                       std::size_t nelems,
+                                       int nd,
+                                       const char *res_cp,
+                                       const char *bias_cp,
+                                       char *dst_cp,
+                                       const ssize_t *shape_strides,
+                                       ssize_t res_offset,
+                                       ssize_t dst_offset,
+                                       ssize_t bias_offset,
+                                       const std::complex<double> &alpha,
+                                       const std::complex<double> &beta,
+                                       int activation,
+                                       const std::vector<sycl::event> &depends)
+{
+    const T *res_tp = reinterpret_cast<const T *>(res_cp);
+    const T *bias_tp = reinterpret_cast<const T *>(bias_cp);
+    T *dst_tp = reinterpret_cast<T *>(dst_cp);
+
+    const T alpha_v = cast_scalar<T>(alpha);
+    const T beta_v = cast_scalar<T>(beta);
+    const GemmActivation act = static_cast<GemmActivation>(activation);
+
+    sycl::event epilogue_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        using IndexerT =
+            dpctl::tensor::offset_utils::ThreeOffsets_StridedIndexer;
+        const IndexerT indexer{nd, res_offset, dst_offset, bias_offset,
+                               shape_strides};
+        const StridedBiasIndexer bias_indexer{};
+
+        using KernelName =
+            gemm_epilogue_strided_krn<T, IndexerT, StridedBiasIndexer>;
+        using Impl = GemmEpilogueFunctor<T, IndexerT, StridedBiasIndexer>;
+
+        cgh.parallel_for<KernelName>(sycl::range<1>(nelems),
+                                     Impl(res_tp, bias_tp, dst_tp, alpha_v,
+                                          beta_v, act, indexer, bias_indexer));
+    });
+
+    return epilogue_ev;
+}
+
+template <typename T> struct GemmEpilogueTypeSupported
+{
+    static constexpr bool is_defined = !std::is_same_v<T, bool>;
+};
+
+template <typename fnT, typename T> struct GemmEpilogueContigFactory
+{
+    fnT get()
+    {
+        if constexpr (GemmEpilogueTypeSupported<T>::is_defined) {
+            fnT fn = gemm_epilogue_contig_impl<T>;
+            return fn;
+        }
+        else {
+            fnT fn = nullptr;
+            return fn;
+        }
+    }
+};
+
+template <typename fnT, typename T> struct GemmEpilogueStridedFactory
+{
+    fnT get()
+    {
+        if constexpr (GemmEpilogueTypeSupported<T>::is_defined) {
+            fnT fn = gemm_epilogue_strided_impl<T>;
+            return fn;
+        }
+        else {
+            fnT fn = nullptr;
+            return fn;
+        }
+    }
+};
+
+typedef bool (*gemm_epilogue_activation_supported_fn_ptr_t)(GemmActivation);
+
+template <typename fnT, typename T> struct GemmEpilogueActivationFactory
+{
+    fnT get()
+    {
+        fnT fn = is_activation_supported<T>;
+        return fn;
+    }
+};
+
+} // namespace gemm_epilogue
+} // end of namespace kernels
+} // end of namespace tensor
+} // end of namespace dpctl
@@ -0,0 +1,119 @@
+//=== gemm_tuning.hpp - Run-time tuning of GEMM kernels     ---*-C++-*--/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines run-time parameters of GEMM kernels which may be
+/// overridden by the caller, e.g. with values found by benchmarking.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <sycl/sycl.hpp>
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+namespace gemm_detail
+{
+
+/*! @brief Overrides of work-group tiling of GEMM kernels. Zero values keep
+ * defaults chosen by the kernels. Values are upper bounds, which kernels
+ * still reduce to fit device local memory.
+ */
+struct GemmTuningParameters
+{
+    // rows of the right-hand side matrix (work-item rows of the work-group)
+    // processed by a work-group of kernels tiling both N and M
+    std::uint32_t nm_wg_delta_m = 0;
+    // elements along K staged in local memory per step of such kernels
+    std::uint32_t nm_wi_delta_k = 0;
+    // work-items along K in work-group of kernels splitting K dimension
+    std::uint32_t k_n_wi = 0;
+};
+
+/*! @brief Tuning parameters in effect for GEMM kernels submitted by the
+ * calling thread */
+inline GemmTuningParameters &current_gemm_tuning()
+{
+    thread_local GemmTuningParameters params{};
+    return params;
+}
+
+/*! @brief Sets tuning parameters of GEMM kernels submitted by the calling
+ * thread for the lifetime of the object */
+class GemmTuningScope
+{
+public:
+    explicit GemmTuningScope(const GemmTuningParameters &params)
+        : saved_(current_gemm_tuning())
+    {
+        current_gemm_tuning() = params;
+    }
+
+    GemmTuningScope(const GemmTuningScope &) = delete;
+    GemmTuningScope &operator=(const GemmTuningScope &) = delete;
+
+    ~GemmTuningScope() { current_gemm_tuning() = saved_; }
+
+private:
+    GemmTuningParameters saved_;
+};
+
+/*! @brief Applies tuning to initial tiling of kernels splitting K */
+inline void apply_gemm_k_tuning(std::size_t &n_wi)
+{
+    const auto &params = current_gemm_tuning();
+    if (params.k_n_wi > 0) {
+        n_wi = params.k_n_wi;
+    }
+}
+
+/*! @brief Applies tuning to initial tiling of kernels tiling N and M.
+ * Work-groups of such kernels have `wg_delta_n * wg_delta_m` work-items,
+ * and `wg_delta_m` is reduced so that they fit the device */
+inline void apply_gemm_nm_tuning(const sycl::device &dev,
+                                 const std::size_t wg_delta_n,
+                                 std::size_t &wg_delta_m,
+                                 std::size_t &wi_delta_k)
+{
+    const auto &params = current_gemm_tuning();
+    if (params.nm_wg_delta_m > 0) {
+        const std::size_t max_wg_size =
+            dev.get_info<sycl::info::device::max_work_group_size>();
+        wg_delta_m = params.nm_wg_delta_m;
+        while (wg_delta_m > 1 && wg_delta_n * wg_delta_m > max_wg_size) {
+            wg_delta_m /= 2;
+        }
+    }
+    if (params.nm_wi_delta_k > 0) {
+        wi_delta_k = params.nm_wi_delta_k;
+    }
+}
+
+} // namespace gemm_detail
+} // end of namespace kernels
+} // end of namespace tensor
+} // end of namespace dpctl
@@ -0,0 +1,534 @@
+//=== mean_var.hpp - Single pass mean and variance kernels  ------ *-C++-*/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines kernels computing mean and variance of elements along
+/// reduced axes in a single pass over the input, using Welford's update
+/// within a work-item and the pairwise merge of partial moments of Chan et al.
+/// across work-items and work-groups.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <sycl/sycl.hpp>
+#include <type_traits>
+#include <vector>
+
+#include "dpctl_tensor_types.hpp"
+#include "kernels/reductions.hpp"
+#include "utils/offset_utils.hpp"
+#include "utils/sycl_alloc_utils.hpp"
+#include "utils/sycl_utils.hpp"
+#include "utils/type_utils.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+namespace mean_var
+{
+
+using dpctl::tensor::ssize_t;
+using dpctl::tensor::sycl_utils::choose_workgroup_size;
+
+/*! @brief Type used to accumulate moments for result type `resT` */
+template <typename resT> struct MomentsAccumulationType
+{
+    using type = resT;
+};
+
+template <> struct MomentsAccumulationType<sycl::half>
+{
+    using type = float;
+};
+
+/*! @brief Partial moments of a sample: count, mean and sum of squared
+ * deviations from the mean */
+template <typename accT> struct Moments
+{
+    std::size_t n = 0;
+    accT mean = accT(0);
+    accT m2 = accT(0);
+
+    void push(const accT &val)
+    {
+        ++n;
+        const accT delta = val - mean;
+        mean += delta / static_cast<accT>(n);
+        m2 += delta * (val - mean);
+    }
+
+    void
+    merge(std::size_t other_n, const accT &other_mean, const accT &other_m2)
+    {
+        if (other_n == 0) {
+            return;
+        }
+        const std::size_t new_n = n + other_n;
+        const accT delta = other_mean - mean;
+        const accT w = static_cast<accT>(other_n) / static_cast<accT>(new_n);
+        mean += delta * w;
+        m2 += other_m2 + delta * delta * static_cast<accT>(n) * w;
+        n = new_n;
+    }
+};
+
+/*! @brief Combines moments held by work-items of the group. Result is
+ * meaningful in every work-item */
+template <typename GroupT, typename accT>
+Moments<accT> group_merge(const GroupT &wg, const Moments<accT> &local)
+{
+    Moments<accT> res{};
+    res.n = sycl::reduce_over_group(wg, local.n, sycl::plus<std::size_t>());
+    if (res.n == 0) {
+        return res;
+    }
+    const accT local_sum = local.mean * static_cast<accT>(local.n);
+    const accT sum = sycl::reduce_over_group(wg, local_sum, sycl::plus<accT>());
+    res.mean = sum / static_cast<accT>(res.n);
+    const accT delta = local.mean - res.mean;
+    const accT local_m2 = local.m2 + static_cast<accT>(local.n) * delta * delta;
+    res.m2 = sycl::reduce_over_group(wg, local_m2, sycl::plus<accT>());
+    return res;
+}
+
+template <typename accT, typename resT>
+void write_mean_var(const Moments<accT> &m,
+                    const accT &correction,
+                    resT *mean_p,
+                    resT *var_p)
+{
+    constexpr accT q_nan = std::numeric_limits<accT>::quiet_NaN();
+    const accT dof = static_cast<accT>(m.n) - correction;
+
+    *mean_p = static_cast<resT>((m.n > 0) ? m.mean : q_nan);
+    *var_p = static_cast<resT>((dof > accT(0)) ? m.m2 / dof : q_nan);
+}
+
+template <typename argT,
+          typename resT,
+          typename InputOutputIterIndexerT,
+          typename InputRedIndexerT>
+struct SequentialMeanVar
+{
+private:
+    using accT = typename MomentsAccumulationType<resT>::type;
+
+    const argT *inp_ = nullptr;
+    resT *mean_ = nullptr;
+    resT *var_ = nullptr;
+    accT correction_;
+    InputOutputIterIndexerT inp_out_iter_indexer_;
+    InputRedIndexerT inp_reduced_dims_indexer_;
+    std::size_t reduction_max_gid_ = 0;
+
+public:
+    SequentialMeanVar(const argT *inp,
+                      resT *mean_res,
+                      resT *var_res,
+                      const accT &correction,
+                      const InputOutputIterIndexerT &arg_res_iter_indexer,
+                      const InputRedIndexerT &arg_reduced_dims_indexer,
+                      std::size_t reduction_size)
+        : inp_(inp), mean_(mean_res), var_(var_res), correction_(correction),
+          inp_out_iter_indexer_(arg_res_iter_indexer),
+          inp_reduced_dims_indexer_(arg_reduced_dims_indexer),
+          reduction_max_gid_(reduction_size)
+    {
+    }
+
+    void operator()(sycl::id<1> id) const
+    {
+        const auto &inp_out_iter_offsets_ = inp_out_iter_indexer_(id[0]);
+        const ssize_t &inp_iter_offset =
+            inp_out_iter_offsets_.get_first_offset();
+        const ssize_t &out_iter_offset =
+            inp_out_iter_offsets_.get_second_offset();
+
+        using dpctl::tensor::type_utils::convert_impl;
+
+        Moments<accT> m{};
+        for (std::size_t m_id = 0; m_id < reduction_max_gid_; ++m_id) {
+            const ssize_t inp_reduction_offset =
+                inp_reduced_dims_indexer_(m_id);
+            const ssize_t inp_offset = inp_iter_offset + inp_reduction_offset;
+
+            m.push(convert_impl<accT, argT>(inp_[inp_offset]));
+        }
+
+        write_mean_var(m, correction_, mean_ + out_iter_offset,
+                       var_ + out_iter_offset);
+    }
+};
+
+/*! @brief Each work-group computes moments of a chunk of
+ * `wg * reductions_per_wi` elements of a row. If the row is covered by a
+ * single work-group, the mean and the variance are written out, otherwise
+ * partial means and partial sums of squared deviations are written into
+ * temporaries at position `row_id * n_reduction_groups + group_id`. */
+template <typename argT,
+          typename resT,
+          typename InputOutputIterIndexerT,
+          typename InputRedIndexerT>
+struct MeanVarOverGroupFunctor
+{
+private:
+    using accT = typename MomentsAccumulationType<resT>::type;
+
+    const argT *inp_ = nullptr;
+    resT *mean_ = nullptr;
+    resT *var_ = nullptr;
+    accT *partial_mean_ = nullptr;
+    accT *partial_m2_ = nullptr;
+    accT correction_;
+    InputOutputIterIndexerT inp_out_iter_indexer_;
+    InputRedIndexerT inp_reduced_dims_indexer_;
+    std::size_t reduction_max_gid_ = 0;
+    std::size_t iter_gws_ = 1;
+    std::size_t reductions_per_wi = 16;
+
+public:
+    MeanVarOverGroupFunctor(const argT *data,
+                            resT *mean_res,
+                            resT *var_res,
+                            accT *partial_mean,
+                            accT *partial_m2,
+                            const accT &correction,
+                            const InputOutputIterIndexerT &arg_res_iter_indexer,
+                            const InputRedIndexerT &arg_reduced_dims_indexer,
+                            std::size_t reduction_size,
+                            std::size_t iteration_size,
+                            std::size_t reduction_size_per_wi)
+        : inp_(data), mean_(mean_res), var_(var_res),
+          partial_mean_(partial_mean), partial_m2_(partial_m2),
+          correction_(correction), inp_out_iter_indexer_(arg_res_iter_indexer),
+          inp_reduced_dims_indexer_(arg_reduced_dims_indexer),
+          reduction_max_gid_(reduction_size), iter_gws_(iteration_size),
+          reductions_per_wi(reduction_size_per_wi)
+    {
+    }
+
+    void operator()(sycl::nd_item<1> it) const
+    {
+        const std::size_t reduction_lid = it.get_local_id(0);
+        const std::size_t wg = it.get_local_range(0);
+
+        const std::size_t iter_gid = it.get_group(0) % iter_gws_;
+        const std::size_t reduction_batch_id = it.get_group(0) / iter_gws_;
+        const std::size_t n_reduction_groups =
+            it.get_group_range(0) / iter_gws_;
+
+        const auto &inp_out_iter_offsets_ = inp_out_iter_indexer_(iter_gid);
+        const auto &inp_iter_offset = inp_out_iter_offsets_.get_first_offset();
+        const auto &out_iter_offset = inp_out_iter_offsets_.get_second_offset();
+
+        using dpctl::tensor::type_utils::convert_impl;
+
+        Moments<accT> local_m{};
+        const std::size_t arg_reduce_gid0 =
+            reduction_lid + reduction_batch_id * wg * reductions_per_wi;
+        for (std::size_t m = 0; m < reductions_per_wi; ++m) {
+            const std::size_t arg_reduce_gid = arg_reduce_gid0 + m * wg;
+
+            if (arg_reduce_gid < reduction_max_gid_) {
+                const auto inp_reduction_offset =
+                    inp_reduced_dims_indexer_(arg_reduce_gid);
+                const auto inp_offset = inp_iter_offset + inp_reduction_offset;
+
+                local_m.push(convert_impl<accT, argT>(inp_[inp_offset]));
+            }
+        }
+
+        auto work_group = it.get_group();
+        const Moments<accT> &group_m = group_merge(work_group, local_m);
+
+        if (work_group.leader()) {
+            if (n_reduction_groups == 1) {
+                write_mean_var(group_m, correction_, mean_ + out_iter_offset,
+                               var_ + out_iter_offset);
+            }
+            else {
+                const std::size_t tmp_id =
+                    iter_gid * n_reduction_groups + reduction_batch_id;
+                partial_mean_[tmp_id] = group_m.mean;
+                partial_m2_[tmp_id] = group_m.m2;
+            }
+        }
+    }
+};
+
+/*! @brief Merges partial moments of a row computed by
+ * MeanVarOverGroupFunctor, using a single work-group per row */
+template <typename resT, typename OutIterIndexerT> struct MeanVarMergeFunctor
+{
+private:
+    using accT = typename MomentsAccumulationType<resT>::type;
+
+    const accT *partial_mean_ = nullptr;
+    const accT *partial_m2_ = nullptr;
+    resT *mean_ = nullptr;
+    resT *var_ = nullptr;
+    accT correction_;
+    OutIterIndexerT out_iter_indexer_;
+    std::size_t reduction_nelems_ = 0;
+    std::size_t partial_nelems_ = 0;
+    std::size_t n_partials_ = 1;
+
+public:
+    MeanVarMergeFunctor(const accT *partial_mean,
+                        const accT *partial_m2,
+                        resT *mean_res,
+                        resT *var_res,
+                        const accT &correction,
+                        const OutIterIndexerT &out_iter_indexer,
+                        std::size_t reduction_nelems,
+                        std::size_t partial_nelems,
+                        std::size_t n_partials)
+        : partial_mean_(partial_mean), partial_m2_(partial_m2), mean_(mean_res),
+          var_(var_res), correction_(correction),
+          out_iter_indexer_(out_iter_indexer),
+          reduction_nelems_(reduction_nelems), partial_nelems_(partial_nelems),
+          n_partials_(n_partials)
+    {
+    }
+
+    void operator()(sycl::nd_item<1> it) const
+    {
+        const std::size_t lid = it.get_local_id(0);
+        const std::size_t wg = it.get_local_range(0);
+        const std::size_t iter_gid = it.get_group(0);
+
+        const std::size_t row_offset = iter_gid * n_partials_;
+
+        // number of elements a partial was computed over is implied by
+        // its position
+        Moments<accT> local_m{};
+        for (std::size_t i = lid; i < n_partials_; i += wg) {
+            const std::size_t start = i * partial_nelems_;
+            const std::size_t n_i =
+                std::min(partial_nelems_, reduction_nelems_ - start);
+            local_m.merge(n_i, partial_mean_[row_offset + i],
+                          partial_m2_[row_offset + i]);
+        }
+
+        auto work_group = it.get_group();
+        const Moments<accT> &group_m = group_merge(work_group, local_m);
+
+        if (work_group.leader()) {
+            const ssize_t out_iter_offset = out_iter_indexer_(iter_gid);
+            write_mean_var(group_m, correction_, mean_ + out_iter_offset,
+                           var_ + out_iter_offset);
+        }
+    }
+};
+
+typedef sycl::event (*mean_var_strided_impl_fn_ptr)(
+    sycl::queue &,
+    std::size_t,
+    std::size_t,
+    const char *,
+    char *,
+    char *,
+    double,
+    int,
+    const ssize_t *,
+    ssize_t,
+    ssize_t,
+    int,
+    const ssize_t *,
+    ssize_t,
+    const std::vector<sycl::event> &);
+
+template <typename T1, typename T2, typename T3, typename T4>
+class mean_var_seq_krn;
+
+template <typename T1, typename T2, typename T3, typename T4>
+class mean_var_over_group_krn;
+
+template <typename T1, typename T2> class mean_var_merge_krn;
+
+template <typename argTy, typename resTy>
+sycl::event mean_var_over_axis_strided_impl(
+    sycl::queue &exec_q,
+    std::size_t iter_nelems,      // number of reductions    (num. of rows in a
+                                  // matrix when reducing over rows)
+    std::size_t reduction_nelems, // size of each reduction  (length of rows,
+                                  // i.e. number of columns)
+    const char *arg_cp,
+    char *mean_cp,
+    char *var_cp,
+    double correction,
+    int iter_nd,
+    const ssize_t *iter_shape_and_strides,
+    ssize_t iter_arg_offset,
+    ssize_t iter_res_offset,
+    int red_nd,
+    const ssize_t *reduction_shape_stride,
+    ssize_t reduction_arg_offset,
+    const std::vector<sycl::event> &depends)
+{
+    using accT = typename MomentsAccumulationType<resTy>::type;
+
+    const argTy *arg_tp = reinterpret_cast<const argTy *>(arg_cp);
+    resTy *mean_tp = reinterpret_cast<resTy *>(mean_cp);
+    resTy *var_tp = reinterpret_cast<resTy *>(var_cp);
+    const accT correction_v = static_cast<accT>(correction);
+
+    using InputOutputIterIndexerT =
+        dpctl::tensor::offset_utils::TwoOffsets_StridedIndexer;
+    using ReductionIndexerT = dpctl::tensor::offset_utils::StridedIndexer;
+
+    const InputOutputIterIndexerT in_out_iter_indexer{
+        iter_nd, iter_arg_offset, iter_res_offset, iter_shape_and_strides};
+    const ReductionIndexerT reduction_indexer{red_nd, reduction_arg_offset,
+                                              reduction_shape_stride};
+
+    const sycl::device &d = exec_q.get_device();
+    const auto &sg_sizes = d.get_info<sycl::info::device::sub_group_sizes>();
+    std::size_t wg = choose_workgroup_size<4>(reduction_nelems, sg_sizes);
+
+    if (reduction_nelems < wg) {
+        sycl::event comp_ev = exec_q.submit([&](sycl::handler &cgh) {
+            cgh.depends_on(depends);
+
+            using KernelName =
+                class mean_var_seq_krn<argTy, resTy, InputOutputIterIndexerT,
+                                       ReductionIndexerT>;
+
+            cgh.parallel_for<KernelName>(
+                sycl::range<1>(iter_nelems),
+                SequentialMeanVar<argTy, resTy, InputOutputIterIndexerT,
+                                  ReductionIndexerT>(
+                    arg_tp, mean_tp, var_tp, correction_v, in_out_iter_indexer,
+                    reduction_indexer, reduction_nelems));
+        });
+
+        return comp_ev;
+    }
+
+    constexpr std::size_t preferred_reductions_per_wi = 8;
+    // prevents running out of resources on CPU
+    const std::size_t max_wg = reduction_detail::get_work_group_size(d);
+
+    if (reduction_nelems <= preferred_reductions_per_wi * max_wg) {
+        // Use one work-group per row, results are written out directly
+        if (iter_nelems == 1) {
+            // increase GPU occupancy
+            wg = max_wg;
+        }
+        const std::size_t reductions_per_wi =
+            std::max<std::size_t>(1, (reduction_nelems + wg - 1) / wg);
+
+        sycl::event comp_ev = exec_q.submit([&](sycl::handler &cgh) {
+            cgh.depends_on(depends);
+
+            using KernelName = class mean_var_over_group_krn<
+                argTy, resTy, InputOutputIterIndexerT, ReductionIndexerT>;
+
+            const sycl::range<1> gRange{iter_nelems * wg};
+            const sycl::range<1> lRange{wg};
+
+            cgh.parallel_for<KernelName>(
+                sycl::nd_range<1>(gRange, lRange),
+                MeanVarOverGroupFunctor<argTy, resTy, InputOutputIterIndexerT,
+                                        ReductionIndexerT>(
+                    arg_tp, mean_tp, var_tp, nullptr, nullptr, correction_v,
+                    in_out_iter_indexer, reduction_indexer, reduction_nelems,
+                    iter_nelems, reductions_per_wi));
+        });
+
+        return comp_ev;
+    }
+
+    // more than one work-group per row is needed. Cap the number of
+    // work-groups per row, so that partial moments can be merged by
+    // a single work-group efficiently
+    const std::size_t max_reduction_groups = preferred_reductions_per_wi * wg;
+    const std::size_t reductions_per_wi = std::max<std::size_t>(
+        preferred_reductions_per_wi,
+        (reduction_nelems + max_reduction_groups * wg - 1) /
+            (max_reduction_groups * wg));
+    const std::size_t partial_nelems = reductions_per_wi * wg;
+    const std::size_t reduction_groups =
+        (reduction_nelems + partial_nelems - 1) / partial_nelems;
+
+    auto tmp_owner = dpctl::tensor::alloc_utils::smart_malloc_device<accT>(
+        2 * iter_nelems * reduction_groups, exec_q);
+    accT *partial_mean_tmp = tmp_owner.get();
+    accT *partial_m2_tmp = partial_mean_tmp + iter_nelems * reduction_groups;
+
+    sycl::event partial_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        using KernelName =
+            class mean_var_over_group_krn<argTy, resTy, InputOutputIterIndexerT,
+                                          ReductionIndexerT>;
+
+        const sycl::range<1> gRange{iter_nelems * reduction_groups * wg};
+        const sycl::range<1> lRange{wg};
+
+        cgh.parallel_for<KernelName>(
+            sycl::nd_range<1>(gRange, lRange),
+            MeanVarOverGroupFunctor<argTy, resTy, InputOutputIterIndexerT,
+                                    ReductionIndexerT>(
+                arg_tp, mean_tp, var_tp, partial_mean_tmp, partial_m2_tmp,
+                correction_v, in_out_iter_indexer, reduction_indexer,
+                reduction_nelems, iter_nelems, reductions_per_wi));
+    });
+
+    sycl::event merge_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(partial_ev);
+
+        using ResIndexerT = dpctl::tensor::offset_utils::UnpackedStridedIndexer;
+        const ResIndexerT res_iter_indexer{
+            iter_nd, iter_res_offset,
+            /* shape */ iter_shape_and_strides,
+            /* strides */ iter_shape_and_strides + 2 * iter_nd};
+
+        using KernelName = class mean_var_merge_krn<resTy, ResIndexerT>;
+
+        const std::size_t merge_wg = std::min(wg, reduction_groups);
+        const sycl::range<1> gRange{iter_nelems * merge_wg};
+        const sycl::range<1> lRange{merge_wg};
+
+        cgh.parallel_for<KernelName>(sycl::nd_range<1>(gRange, lRange),
+                                     MeanVarMergeFunctor<resTy, ResIndexerT>(
+                                         partial_mean_tmp, partial_m2_tmp,
+                                         mean_tp, var_tp, correction_v,
+                                         res_iter_indexer, reduction_nelems,
+                                         partial_nelems, reduction_groups));
+    });
+
+    sycl::event cleanup_host_task_event =
+        dpctl::tensor::alloc_utils::async_smart_free(exec_q, {merge_ev},
+                                                     tmp_owner);
+
+    return cleanup_host_task_event;
+}
+
+} // namespace mean_var
+} // namespace kernels
+} // namespace tensor
+} // namespace dpctl
@@ -0,0 +1,732 @@
+//=== reduce_many.hpp - Fused reductions over common axes   ------ *-C++-*/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines kernels computing minimum, maximum, sum, indices of
+/// the first minimum and maximum, and the number of non-zero elements along
+/// reduced axes in a single pass over the input.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <sycl/sycl.hpp>
+#include <type_traits>
+#include <vector>
+
+#include "dpctl_tensor_types.hpp"
+#include "kernels/reductions.hpp"
+#include "utils/offset_utils.hpp"
+#include "utils/sycl_alloc_utils.hpp"
+#include "utils/sycl_utils.hpp"
+#include "utils/type_utils.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+namespace reduce_many
+{
+
+using dpctl::tensor::ssize_t;
+using dpctl::tensor::sycl_utils::choose_workgroup_size;
+namespace su_ns = dpctl::tensor::sycl_utils;
+
+/*! @brief Type used to accumulate the sum for result type `sumT` */
+template <typename sumT> struct SumAccumulationType
+{
+    using type = sumT;
+};
+
+template <> struct SumAccumulationType<sycl::half>
+{
+    using type = float;
+};
+
+using idxT = std::int64_t;
+
+/*! @brief Bits of the mask of statistics to compute */
+constexpr std::uint32_t min_op = 1u << 0;
+constexpr std::uint32_t max_op = 1u << 1;
+constexpr std::uint32_t sum_op = 1u << 2;
+constexpr std::uint32_t argmin_op = 1u << 3;
+constexpr std::uint32_t argmax_op = 1u << 4;
+constexpr std::uint32_t count_nonzero_op = 1u << 5;
+
+/*! @brief Whether the minimum is tracked for statistics `ops` */
+constexpr bool needs_min(std::uint32_t ops)
+{
+    return (ops & (min_op | argmin_op)) != 0;
+}
+
+/*! @brief Whether the maximum is tracked for statistics `ops` */
+constexpr bool needs_max(std::uint32_t ops)
+{
+    return (ops & (max_op | argmax_op)) != 0;
+}
+
+template <typename T> bool is_nan(const T &v)
+{
+    if constexpr (std::is_floating_point_v<T> || std::is_same_v<T, sycl::half>)
+    {
+        return std::isnan(v);
+    }
+    else {
+        return false;
+    }
+}
+
+/*! @brief Whether `a` replaces `b` as the minimum, NaNs take precedence */
+template <typename T> bool precedes_min(const T &a, const T &b)
+{
+    if constexpr (std::is_floating_point_v<T> || std::is_same_v<T, sycl::half>)
+    {
+        return is_nan(a) ? !is_nan(b) : (a < b);
+    }
+    else {
+        return a < b;
+    }
+}
+
+/*! @brief Whether `a` replaces `b` as the maximum, NaNs take precedence */
+template <typename T> bool precedes_max(const T &a, const T &b)
+{
+    if constexpr (std::is_floating_point_v<T> || std::is_same_v<T, sycl::half>)
+    {
+        return is_nan(a) ? !is_nan(b) : (a > b);
+    }
+    else {
+        return a > b;
+    }
+}
+
+template <typename T> bool same_extremum(const T &a, const T &b)
+{
+    return (a == b) || (is_nan(a) && is_nan(b));
+}
+
+/*! @brief Statistics of a sample: sum, number of non-zero elements, and
+ * minimum and maximum with positions of their first occurrences. Only
+ * statistics selected by the mask `ops` passed to member functions are
+ * updated, others keep their initial values */
+template <typename argT, typename accT> struct ManyStats
+{
+    static constexpr argT min_identity =
+        su_ns::Identity<su_ns::Minimum<argT>, argT>::value;
+    static constexpr argT max_identity =
+        su_ns::Identity<su_ns::Maximum<argT>, argT>::value;
+    static constexpr idxT idx_identity = std::numeric_limits<idxT>::max();
+
+    accT sum = accT(0);
+    idxT nz = 0;
+    argT min_v = min_identity;
+    idxT min_idx = idx_identity;
+    argT max_v = max_identity;
+    idxT max_idx = idx_identity;
+
+    void merge_min(const argT &other_min, idxT other_min_idx)
+    {
+        if (precedes_min(other_min, min_v)) {
+            min_v = other_min;
+            min_idx = other_min_idx;
+        }
+        else if (same_extremum(other_min, min_v)) {
+            min_idx = std::min(min_idx, other_min_idx);
+        }
+    }
+
+    void merge_max(const argT &other_max, idxT other_max_idx)
+    {
+        if (precedes_max(other_max, max_v)) {
+            max_v = other_max;
+            max_idx = other_max_idx;
+        }
+        else if (same_extremum(other_max, max_v)) {
+            max_idx = std::min(max_idx, other_max_idx);
+        }
+    }
+
+    void push(std::uint32_t ops, const argT &val, idxT idx)
+    {
+        using dpctl::tensor::type_utils::convert_impl;
+        if (ops & sum_op) {
+            sum += convert_impl<accT, argT>(val);
+        }
+        if (ops & count_nonzero_op) {
+            nz += (val != argT(0)) ? 1 : 0;
+        }
+        if (needs_min(ops)) {
+            merge_min(val, idx);
+        }
+        if (needs_max(ops)) {
+            merge_max(val, idx);
+        }
+    }
+};
+
+/*! @brief Combines statistics `ops` held by work-items of the group.
+ * Result is meaningful in every work-item. The mask is the same in all
+ * work-items, so that they all reach the same group algorithms */
+template <typename GroupT, typename LocAccT, typename argT, typename accT>
+ManyStats<argT, accT> group_merge(const GroupT &wg,
+                                  LocAccT local_mem,
+                                  const ManyStats<argT, accT> &local,
+                                  std::uint32_t ops)
+{
+    using StatsT = ManyStats<argT, accT>;
+
+    StatsT res{};
+    if (ops & sum_op) {
+        res.sum = sycl::reduce_over_group(wg, local.sum, sycl::plus<accT>());
+    }
+    if (ops & count_nonzero_op) {
+        res.nz = sycl::reduce_over_group(wg, local.nz, sycl::plus<idxT>());
+    }
+
+    // Minimum and Maximum propagate NaNs, so they are reduced with
+    // custom_reduce_over_group, and the first position among work-items
+    // holding the extremum is found next
+    if (needs_min(ops)) {
+        res.min_v = su_ns::custom_reduce_over_group(wg, local_mem, local.min_v,
+                                                    su_ns::Minimum<argT>());
+        const idxT local_min_idx = same_extremum(local.min_v, res.min_v)
+                                       ? local.min_idx
+                                       : StatsT::idx_identity;
+        res.min_idx = sycl::reduce_over_group(
+            wg, local_min_idx, StatsT::idx_identity, sycl::minimum<idxT>());
+    }
+
+    if (needs_max(ops)) {
+        if (needs_min(ops)) {
+            // local memory is reused
+            sycl::group_barrier(wg, sycl::memory_scope::work_group);
+        }
+        res.max_v = su_ns::custom_reduce_over_group(wg, local_mem, local.max_v,
+                                                    su_ns::Maximum<argT>());
+        const idxT local_max_idx = same_extremum(local.max_v, res.max_v)
+                                       ? local.max_idx
+                                       : StatsT::idx_identity;
+        res.max_idx = sycl::reduce_over_group(
+            wg, local_max_idx, StatsT::idx_identity, sycl::minimum<idxT>());
+    }
+    return res;
+}
+
+/*! @brief Pointers to destinations of each of the statistics, null for
+ * statistics which are not computed */
+template <typename argT, typename sumT> struct ManyStatsResults
+{
+    argT *min_ = nullptr;
+    argT *max_ = nullptr;
+    sumT *sum_ = nullptr;
+    idxT *argmin_ = nullptr;
+    idxT *argmax_ = nullptr;
+    idxT *count_nonzero_ = nullptr;
+
+    /*! @brief Mask of statistics with non-null destinations */
+    std::uint32_t ops() const
+    {
+        return ((min_) ? min_op : 0u) | ((max_) ? max_op : 0u) |
+               ((sum_) ? sum_op : 0u) | ((argmin_) ? argmin_op : 0u) |
+               ((argmax_) ? argmax_op : 0u) |
+               ((count_nonzero_) ? count_nonzero_op : 0u);
+    }
+
+    template <typename accT>
+    void write(const ManyStats<argT, accT> &s, ssize_t offset) const
+    {
+        using dpctl::tensor::type_utils::convert_impl;
+
+        if (min_) {
+            min_[offset] = s.min_v;
+        }
+        if (max_) {
+            max_[offset] = s.max_v;
+        }
+        if (sum_) {
+            sum_[offset] = convert_impl<sumT, accT>(s.sum);
+        }
+        if (argmin_) {
+            argmin_[offset] = s.min_idx;
+        }
+        if (argmax_) {
+            argmax_[offset] = s.max_idx;
+        }
+        if (count_nonzero_) {
+            count_nonzero_[offset] = s.nz;
+        }
+    }
+};
+
+/*! @brief Statistics of chunks of rows computed by work-groups, stored as
+ * structure of arrays */
+template <typename argT, typename accT> struct ManyStatsPartials
+{
+    accT *sum_ = nullptr;
+    idxT *nz_ = nullptr;
+    argT *min_ = nullptr;
+    idxT *min_idx_ = nullptr;
+    argT *max_ = nullptr;
+    idxT *max_idx_ = nullptr;
+
+    void store(const ManyStats<argT, accT> &s,
+               std::size_t id,
+               std::uint32_t ops) const
+    {
+        if (ops & sum_op) {
+            sum_[id] = s.sum;
+        }
+        if (ops & count_nonzero_op) {
+            nz_[id] = s.nz;
+        }
+        if (needs_min(ops)) {
+            min_[id] = s.min_v;
+            min_idx_[id] = s.min_idx;
+        }
+        if (needs_max(ops)) {
+            max_[id] = s.max_v;
+            max_idx_[id] = s.max_idx;
+        }
+    }
+
+    void
+    load_into(ManyStats<argT, accT> &s, std::size_t id, std::uint32_t ops) const
+    {
+        if (ops & sum_op) {
+            s.sum += sum_[id];
+        }
+        if (ops & count_nonzero_op) {
+            s.nz += nz_[id];
+        }
+        if (needs_min(ops)) {
+            s.merge_min(min_[id], min_idx_[id]);
+        }
+        if (needs_max(ops)) {
+            s.merge_max(max_[id], max_idx_[id]);
+        }
+    }
+};
+
+template <typename argT,
+          typename sumT,
+          typename InputOutputIterIndexerT,
+          typename InputRedIndexerT>
+struct SequentialReduceMany
+{
+private:
+    using accT = typename SumAccumulationType<sumT>::type;
+
+    const argT *inp_ = nullptr;
+    ManyStatsResults<argT, sumT> res_;
+    InputOutputIterIndexerT inp_out_iter_indexer_;
+    InputRedIndexerT inp_reduced_dims_indexer_;
+    std::size_t reduction_max_gid_ = 0;
+
+public:
+    SequentialReduceMany(const argT *inp,
+                         const ManyStatsResults<argT, sumT> &res,
+                         const InputOutputIterIndexerT &arg_res_iter_indexer,
+                         const InputRedIndexerT &arg_reduced_dims_indexer,
+                         std::size_t reduction_size)
+        : inp_(inp), res_(res), inp_out_iter_indexer_(arg_res_iter_indexer),
+          inp_reduced_dims_indexer_(arg_reduced_dims_indexer),
+          reduction_max_gid_(reduction_size)
+    {
+    }
+
+    void operator()(sycl::id<1> id) const
+    {
+        const auto &inp_out_iter_offsets_ = inp_out_iter_indexer_(id[0]);
+        const ssize_t &inp_iter_offset =
+            inp_out_iter_offsets_.get_first_offset();
+        const ssize_t &out_iter_offset =
+            inp_out_iter_offsets_.get_second_offset();
+
+        const std::uint32_t ops = res_.ops();
+        ManyStats<argT, accT> s{};
+        for (std::size_t m = 0; m < reduction_max_gid_; ++m) {
+            const ssize_t inp_reduction_offset = inp_reduced_dims_indexer_(m);
+            const ssize_t inp_offset = inp_iter_offset + inp_reduction_offset;
+
+            s.push(ops, inp_[inp_offset], static_cast<idxT>(m));
+        }
+
+        res_.write(s, out_iter_offset);
+    }
+};
+
+/*! @brief Each work-group computes statistics of a chunk of
+ * `wg * reductions_per_wi` elements of a row. If the row is covered by a
+ * single work-group, the results are written out, otherwise partial
+ * statistics are written into temporaries at position
+ * `row_id * n_reduction_groups + group_id`. */
+template <typename argT,
+          typename sumT,
+          typename InputOutputIterIndexerT,
+          typename InputRedIndexerT,
+          typename SlmT>
+struct ReduceManyOverGroupFunctor
+{
+private:
+    using accT = typename SumAccumulationType<sumT>::type;
+
+    const argT *inp_ = nullptr;
+    ManyStatsResults<argT, sumT> res_;
+    ManyStatsPartials<argT, accT> partials_;
+    InputOutputIterIndexerT inp_out_iter_indexer_;
+    InputRedIndexerT inp_reduced_dims_indexer_;
+    SlmT local_mem_;
+    std::size_t reduction_max_gid_ = 0;
+    std::size_t iter_gws_ = 1;
+    std::size_t reductions_per_wi = 16;
+
+public:
+    ReduceManyOverGroupFunctor(
+        const argT *data,
+        const ManyStatsResults<argT, sumT> &res,
+        const ManyStatsPartials<argT, accT> &partials,
+        const InputOutputIterIndexerT &arg_res_iter_indexer,
+        const InputRedIndexerT &arg_reduced_dims_indexer,
+        SlmT local_mem,
+        std::size_t reduction_size,
+        std::size_t iteration_size,
+        std::size_t reduction_size_per_wi)
+        : inp_(data), res_(res), partials_(partials),
+          inp_out_iter_indexer_(arg_res_iter_indexer),
+          inp_reduced_dims_indexer_(arg_reduced_dims_indexer),
+          local_mem_(local_mem), reduction_max_gid_(reduction_size),
+          iter_gws_(iteration_size), reductions_per_wi(reduction_size_per_wi)
+    {
+    }
+
+    void operator()(sycl::nd_item<1> it) const
+    {
+        const std::size_t reduction_lid = it.get_local_id(0);
+        const std::size_t wg = it.get_local_range(0);
+
+        const std::size_t iter_gid = it.get_group(0) % iter_gws_;
+        const std::size_t reduction_batch_id = it.get_group(0) / iter_gws_;
+        const std::size_t n_reduction_groups =
+            it.get_group_range(0) / iter_gws_;
+
+        const auto &inp_out_iter_offsets_ = inp_out_iter_indexer_(iter_gid);
+        const auto &inp_iter_offset = inp_out_iter_offsets_.get_first_offset();
+        const auto &out_iter_offset = inp_out_iter_offsets_.get_second_offset();
+
+        // work-item visits positions in increasing order, so the first
+        // occurrence of an extremum is kept
+        const std::uint32_t ops = res_.ops();
+        ManyStats<argT, accT> local_s{};
+        const std::size_t arg_reduce_gid0 =
+            reduction_lid + reduction_batch_id * wg * reductions_per_wi;
+        for (std::size_t m = 0; m < reductions_per_wi; ++m) {
+            const std::size_t arg_reduce_gid = arg_reduce_gid0 + m * wg;
+
+            if (arg_reduce_gid < reduction_max_gid_) {
+                const auto inp_reduction_offset =
+                    inp_reduced_dims_indexer_(arg_reduce_gid);
+                const auto inp_offset = inp_iter_offset + inp_reduction_offset;
+
+                local_s.push(ops, inp_[inp_offset],
+                             static_cast<idxT>(arg_reduce_gid));
+            }
+        }
+
+        auto work_group = it.get_group();
+        const ManyStats<argT, accT> &group_s =
+            group_merge(work_group, local_mem_, local_s, ops);
+
+        if (work_group.leader()) {
+            if (n_reduction_groups == 1) {
+                res_.write(group_s, out_iter_offset);
+            }
+            else {
+                partials_.store(
+                    group_s, iter_gid * n_reduction_groups + reduction_batch_id,
+                    ops);
+            }
+        }
+    }
+};
+
+/*! @brief Merges partial statistics of a row computed by
+ * ReduceManyOverGroupFunctor, using a single work-group per row */
+template <typename argT, typename sumT, typename OutIterIndexerT, typename SlmT>
+struct ReduceManyMergeFunctor
+{
+private:
+    using accT = typename SumAccumulationType<sumT>::type;
+
+    ManyStatsPartials<argT, accT> partials_;
+    ManyStatsResults<argT, sumT> res_;
+    OutIterIndexerT out_iter_indexer_;
+    SlmT local_mem_;
+    std::size_t n_partials_ = 1;
+
+public:
+    ReduceManyMergeFunctor(const ManyStatsPartials<argT, accT> &partials,
+                           const ManyStatsResults<argT, sumT> &res,
+                           const OutIterIndexerT &out_iter_indexer,
+                           SlmT local_mem,
+                           std::size_t n_partials)
+        : partials_(partials), res_(res), out_iter_indexer_(out_iter_indexer),
+          local_mem_(local_mem), n_partials_(n_partials)
+    {
+    }
+
+    void operator()(sycl::nd_item<1> it) const
+    {
+        const std::size_t lid = it.get_local_id(0);
+        const std::size_t wg = it.get_local_range(0);
+        const std::size_t iter_gid = it.get_group(0);
+
+        const std::size_t row_offset = iter_gid * n_partials_;
+
+        const std::uint32_t ops = res_.ops();
+        ManyStats<argT, accT> local_s{};
+        for (std::size_t i = lid; i < n_partials_; i += wg) {
+            partials_.load_into(local_s, row_offset + i, ops);
+        }
+
+        auto work_group = it.get_group();
+        const ManyStats<argT, accT> &group_s =
+            group_merge(work_group, local_mem_, local_s, ops);
+
+        if (work_group.leader()) {
+            const ssize_t out_iter_offset = out_iter_indexer_(iter_gid);
+            res_.write(group_s, out_iter_offset);
+        }
+    }
+};
+
+typedef sycl::event (*reduce_many_strided_impl_fn_ptr)(
+    sycl::queue &,
+    std::size_t,
+    std::size_t,
+    const char *,
+    char *,
+    char *,
+    char *,
+    char *,
+    char *,
+    char *,
+    int,
+    const ssize_t *,
+    ssize_t,
+    ssize_t,
+    int,
+    const ssize_t *,
+    ssize_t,
+    const std::vector<sycl::event> &);
+
+template <typename T1, typename T2, typename T3, typename T4>
+class reduce_many_seq_krn;
+
+template <typename T1, typename T2, typename T3, typename T4>
+class reduce_many_over_group_krn;
+
+template <typename T1, typename T2, typename T3> class reduce_many_merge_krn;
+
+template <typename argTy, typename sumTy>
+sycl::event reduce_many_over_axis_strided_impl(
+    sycl::queue &exec_q,
+    std::size_t iter_nelems,      // number of reductions    (num. of rows in a
+                                  // matrix when reducing over rows)
+    std::size_t reduction_nelems, // size of each reduction  (length of rows,
+                                  // i.e. number of columns)
+    const char *arg_cp,
+    char *min_cp, // destinations of statistics which are not computed
+    char *max_cp, // are null pointers
+    char *sum_cp,
+    char *argmin_cp,
+    char *argmax_cp,
+    char *count_nonzero_cp,
+    int iter_nd,
+    const ssize_t *iter_shape_and_strides,
+    ssize_t iter_arg_offset,
+    ssize_t iter_res_offset,
+    int red_nd,
+    const ssize_t *reduction_shape_stride,
+    ssize_t reduction_arg_offset,
+    const std::vector<sycl::event> &depends)
+{
+    using accT = typename SumAccumulationType<sumTy>::type;
+
+    const argTy *arg_tp = reinterpret_cast<const argTy *>(arg_cp);
+    const ManyStatsResults<argTy, sumTy> res{
+        reinterpret_cast<argTy *>(min_cp),
+        reinterpret_cast<argTy *>(max_cp),
+        reinterpret_cast<sumTy *>(sum_cp),
+        reinterpret_cast<idxT *>(argmin_cp),
+        reinterpret_cast<idxT *>(argmax_cp),
+        reinterpret_cast<idxT *>(count_nonzero_cp)};
+
+    using InputOutputIterIndexerT =
+        dpctl::tensor::offset_utils::TwoOffsets_StridedIndexer;
+    using ReductionIndexerT = dpctl::tensor::offset_utils::StridedIndexer;
+
+    const InputOutputIterIndexerT in_out_iter_indexer{
+        iter_nd, iter_arg_offset, iter_res_offset, iter_shape_and_strides};
+    const ReductionIndexerT reduction_indexer{red_nd, reduction_arg_offset,
+                                              reduction_shape_stride};
+
+    const sycl::device &d = exec_q.get_device();
+    const auto &sg_sizes = d.get_info<sycl::info::device::sub_group_sizes>();
+    std::size_t wg = choose_workgroup_size<4>(reduction_nelems, sg_sizes);
+
+    if (reduction_nelems < wg) {
+        sycl::event comp_ev = exec_q.submit([&](sycl::handler &cgh) {
+            cgh.depends_on(depends);
+
+            using KernelName =
+                class reduce_many_seq_krn<argTy, sumTy, InputOutputIterIndexerT,
+                                          ReductionIndexerT>;
+
+            cgh.parallel_for<KernelName>(
+                sycl::range<1>(iter_nelems),
+                SequentialReduceMany<argTy, sumTy, InputOutputIterIndexerT,
+                                     ReductionIndexerT>(
+                    arg_tp, res, in_out_iter_indexer, reduction_indexer,
+                    reduction_nelems));
+        });
+
+        return comp_ev;
+    }
+
+    using SlmT = sycl::local_accessor<argTy, 1>;
+    const ManyStatsPartials<argTy, accT> no_partials{};
+
+    constexpr std::size_t preferred_reductions_per_wi = 8;
+    // prevents running out of resources on CPU
+    const std::size_t max_wg = reduction_detail::get_work_group_size(d);
+
+    if (reduction_nelems <= preferred_reductions_per_wi * max_wg) {
+        // Use one work-group per row, results are written out directly
+        if (iter_nelems == 1) {
+            // increase GPU occupancy
+            wg = max_wg;
+        }
+        const std::size_t reductions_per_wi =
+            std::max<std::size_t>(1, (reduction_nelems + wg - 1) / wg);
+
+        sycl::event comp_ev = exec_q.submit([&](sycl::handler &cgh) {
+            cgh.depends_on(depends);
+
+            using KernelName = class reduce_many_over_group_krn<
+                argTy, sumTy, InputOutputIterIndexerT, ReductionIndexerT>;
+
+            const sycl::range<1> gRange{iter_nelems * wg};
+            const sycl::range<1> lRange{wg};
+            SlmT local_mem(lRange, cgh);
+
+            cgh.parallel_for<KernelName>(
+                sycl::nd_range<1>(gRange, lRange),
+                ReduceManyOverGroupFunctor<argTy, sumTy,
+                                           InputOutputIterIndexerT,
+                                           ReductionIndexerT, SlmT>(
+                    arg_tp, res, no_partials, in_out_iter_indexer,
+                    reduction_indexer, local_mem, reduction_nelems, iter_nelems,
+                    reductions_per_wi));
+        });
+
+        return comp_ev;
+    }
+
+    // more than one work-group per row is needed. Cap the number of
+    // work-groups per row, so that partial statistics can be merged by
+    // a single work-group efficiently
+    const std::size_t max_reduction_groups = preferred_reductions_per_wi * wg;
+    const std::size_t reductions_per_wi = std::max<std::size_t>(
+        preferred_reductions_per_wi,
+        (reduction_nelems + max_reduction_groups * wg - 1) /
+            (max_reduction_groups * wg));
+    const std::size_t partial_nelems = reductions_per_wi * wg;
+    const std::size_t reduction_groups =
+        (reduction_nelems + partial_nelems - 1) / partial_nelems;
+    const std::size_t n_tmp = iter_nelems * reduction_groups;
+
+    using dpctl::tensor::alloc_utils::smart_malloc_device;
+    auto sum_tmp_owner = smart_malloc_device<accT>(n_tmp, exec_q);
+    auto idx_tmp_owner = smart_malloc_device<idxT>(3 * n_tmp, exec_q);
+    auto val_tmp_owner = smart_malloc_device<argTy>(2 * n_tmp, exec_q);
+
+    idxT *idx_tmp = idx_tmp_owner.get();
+    argTy *val_tmp = val_tmp_owner.get();
+    const ManyStatsPartials<argTy, accT> partials{
+        sum_tmp_owner.get(), idx_tmp,         val_tmp,
+        idx_tmp + n_tmp,     val_tmp + n_tmp, idx_tmp + 2 * n_tmp};
+
+    sycl::event partial_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        using KernelName = class reduce_many_over_group_krn<
+            argTy, sumTy, InputOutputIterIndexerT, ReductionIndexerT>;
+
+        const sycl::range<1> gRange{n_tmp * wg};
+        const sycl::range<1> lRange{wg};
+        SlmT local_mem(lRange, cgh);
+
+        cgh.parallel_for<KernelName>(
+            sycl::nd_range<1>(gRange, lRange),
+            ReduceManyOverGroupFunctor<argTy, sumTy, InputOutputIterIndexerT,
+                                       ReductionIndexerT, SlmT>(
+                arg_tp, res, partials, in_out_iter_indexer, reduction_indexer,
+                local_mem, reduction_nelems, iter_nelems, reductions_per_wi));
+    });
+
+    sycl::event merge_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(partial_ev);
+
+        using ResIndexerT = dpctl::tensor::offset_utils::UnpackedStridedIndexer;
+        const ResIndexerT res_iter_indexer{
+            iter_nd, iter_res_offset,
+            /* shape */ iter_shape_and_strides,
+            /* strides */ iter_shape_and_strides + 2 * iter_nd};
+
+        using KernelName =
+            class reduce_many_merge_krn<argTy, sumTy, ResIndexerT>;
+
+        const std::size_t merge_wg = std::min(wg, reduction_groups);
+        const sycl::range<1> gRange{iter_nelems * merge_wg};
+        const sycl::range<1> lRange{merge_wg};
+        SlmT local_mem(lRange, cgh);
+
+        cgh.parallel_for<KernelName>(
+            sycl::nd_range<1>(gRange, lRange),
+            ReduceManyMergeFunctor<argTy, sumTy, ResIndexerT, SlmT>(
+                partials, res, res_iter_indexer, local_mem, reduction_groups));
+    });
+
+    sycl::event cleanup_host_task_event =
+        dpctl::tensor::alloc_utils::async_smart_free(
+            exec_q, {merge_ev}, sum_tmp_owner, idx_tmp_owner, val_tmp_owner);
+
+    return cleanup_host_task_event;
+}
+
+} // namespace reduce_many
+} // namespace kernels
+} // namespace tensor
+} // namespace dpctl
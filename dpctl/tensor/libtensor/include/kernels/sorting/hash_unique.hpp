@@ -0,0 +1,255 @@
+//=== hash_unique.hpp - Hash-based unique kernels           ---*-C++-*--/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines kernels counting distinct values of an array with an
+/// open-addressing hash table.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <type_traits>
+#include <vector>
+
+#include <sycl/sycl.hpp>
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+
+namespace hash_unique_detail
+{
+
+/*! @brief Bit pattern marking an empty slot of the hash table */
+static constexpr std::uint64_t empty_key =
+    std::numeric_limits<std::uint64_t>::max();
+
+/*! @brief Finalizer of splitmix64 generator, used as hash function */
+inline std::uint64_t mix_bits(std::uint64_t x)
+{
+    x ^= (x >> 30);
+    x *= std::uint64_t(0xbf58476d1ce4e5b9);
+    x ^= (x >> 27);
+    x *= std::uint64_t(0x94d049bb133111eb);
+    x ^= (x >> 31);
+    return x;
+}
+
+/*! @brief Zero-extended bit pattern of the value. Only values of 64-bit
+ * types can have bit pattern equal to `empty_key`. */
+template <typename T> std::uint64_t key_bits(const T &v)
+{
+    if constexpr (std::is_same_v<T, bool>) {
+        return (v) ? std::uint64_t(1) : std::uint64_t(0);
+    }
+    else {
+        using UT = std::make_unsigned_t<T>;
+        return static_cast<std::uint64_t>(static_cast<UT>(v));
+    }
+}
+
+} // namespace hash_unique_detail
+
+/*! @brief Inserts elements of a contiguous vector into hash table of
+ * `capacity` slots, a power of two, counting occurrences of each distinct
+ * value, and recording the smallest index of its occurrence.
+ *
+ * Tables `keys`, `counts` and `first` have `capacity + 1` elements. Slot
+ * `capacity` is reserved for the value whose bit pattern coincides with
+ * that of an empty slot. Slot `i` is occupied if `counts[i] > 0`. Number of
+ * elements which could not be inserted since the table is full is added to
+ * `overflow`.
+ */
+template <typename T> class HashUniqueInsertFunctor
+{
+private:
+    const T *src_ = nullptr;
+    std::size_t n_ = 0;
+    std::uint64_t *keys_ = nullptr;
+    std::int64_t *counts_ = nullptr;
+    std::int64_t *first_ = nullptr;
+    std::int64_t *overflow_ = nullptr;
+    std::size_t capacity_ = 0;
+    std::uint32_t n_wi_ = 0;
+
+public:
+    HashUniqueInsertFunctor(const T *src,
+                            std::size_t n,
+                            std::uint64_t *keys,
+                            std::int64_t *counts,
+                            std::int64_t *first,
+                            std::int64_t *overflow,
+                            std::size_t capacity,
+                            std::uint32_t n_wi)
+        : src_(src), n_(n), keys_(keys), counts_(counts), first_(first),
+          overflow_(overflow), capacity_(capacity), n_wi_(n_wi)
+    {
+    }
+
+    void operator()(sycl::id<1> id) const
+    {
+        const std::size_t start = id[0] * n_wi_;
+        const std::size_t end = std::min<std::size_t>(start + n_wi_, n_);
+
+        // consecutive equal elements are inserted at once, which reduces
+        // contention on slots of frequent values
+        std::uint64_t run_key = 0;
+        std::int64_t run_count = 0;
+        std::int64_t run_first = 0;
+        for (std::size_t i = start; i < end; ++i) {
+            const std::uint64_t bits = hash_unique_detail::key_bits(src_[i]);
+            if (run_count > 0 && bits == run_key) {
+                ++run_count;
+                continue;
+            }
+            if (run_count > 0) {
+                insert(run_key, run_count, run_first);
+            }
+            run_key = bits;
+            run_count = 1;
+            run_first = static_cast<std::int64_t>(i);
+        }
+        if (run_count > 0) {
+            insert(run_key, run_count, run_first);
+        }
+    }
+
+private:
+    void insert(std::uint64_t bits, std::int64_t cnt, std::int64_t pos) const
+    {
+        using KeyRefT =
+            sycl::atomic_ref<std::uint64_t, sycl::memory_order::relaxed,
+                             sycl::memory_scope::device,
+                             sycl::access::address_space::global_space>;
+        using ValRefT =
+            sycl::atomic_ref<std::int64_t, sycl::memory_order::relaxed,
+                             sycl::memory_scope::device,
+                             sycl::access::address_space::global_space>;
+
+        constexpr std::uint64_t empty_key = hash_unique_detail::empty_key;
+
+        std::size_t slot = capacity_;
+        if (bits != empty_key) {
+            const std::size_t mask = capacity_ - 1;
+            std::size_t probe_pos =
+                static_cast<std::size_t>(hash_unique_detail::mix_bits(bits)) &
+                mask;
+            bool found = false;
+            for (std::size_t probe = 0; probe < capacity_; ++probe) {
+                KeyRefT key_ref(keys_[probe_pos]);
+                std::uint64_t cur = key_ref.load();
+                if (cur == empty_key) {
+                    // claim the empty slot, unless another work-item
+                    // has claimed it in the meantime
+                    key_ref.compare_exchange_strong(cur, bits);
+                    found = (cur == empty_key) || (cur == bits);
+                }
+                else {
+                    found = (cur == bits);
+                }
+                if (found) {
+                    break;
+                }
+                probe_pos = (probe_pos + 1) & mask;
+            }
+            if (!found) {
+                ValRefT overflow_ref(overflow_[0]);
+                overflow_ref.fetch_add(cnt);
+                return;
+            }
+            slot = probe_pos;
+        }
+
+        ValRefT count_ref(counts_[slot]);
+        count_ref.fetch_add(cnt);
+        ValRefT first_ref(first_[slot]);
+        first_ref.fetch_min(pos);
+    }
+};
+
+typedef sycl::event (*hash_unique_insert_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    std::size_t,
+    const char *,
+    char *,
+    char *,
+    char *,
+    char *,
+    const std::vector<sycl::event> &);
+
+template <typename T> class hash_unique_insert_krn;
+
+template <typename T>
+sycl::event hash_unique_insert_impl(sycl::queue &exec_q,
+                                    std::size_t n,
+                                    std::size_t capacity,
+                                    const char *src_cp,
+                                    char *keys_cp,
+                                    char *counts_cp,
+                                    char *first_cp,
+                                    char *overflow_cp,
+                                    const std::vector<sycl::event> &depends)
+{
+    const T *src_tp = reinterpret_cast<const T *>(src_cp);
+    std::uint64_t *keys_tp = reinterpret_cast<std::uint64_t *>(keys_cp);
+    std::int64_t *counts_tp = reinterpret_cast<std::int64_t *>(counts_cp);
+    std::int64_t *first_tp = reinterpret_cast<std::int64_t *>(first_cp);
+    std::int64_t *overflow_tp = reinterpret_cast<std::int64_t *>(overflow_cp);
+
+    constexpr std::uint32_t n_wi = 8;
+    const std::size_t n_work_items = (n + n_wi - 1) / n_wi;
+
+    sycl::event comp_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        using KernelName = hash_unique_insert_krn<T>;
+        cgh.parallel_for<KernelName>(
+            sycl::range<1>(n_work_items),
+            HashUniqueInsertFunctor<T>(src_tp, n, keys_tp, counts_tp, first_tp,
+                                       overflow_tp, capacity, n_wi));
+    });
+
+    return comp_ev;
+}
+
+template <typename fnT, typename T> struct HashUniqueInsertFactory
+{
+    fnT get()
+    {
+        if constexpr (std::is_integral_v<T>) {
+            return hash_unique_insert_impl<T>;
+        }
+        else {
+            return nullptr;
+        }
+    }
+};
+
+} // end of namespace kernels
+} // end of namespace tensor
+} // end of namespace dpctl
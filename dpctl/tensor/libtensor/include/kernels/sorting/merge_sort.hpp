@@ -26,6 +26,7 @@
 
 #include <cassert>
 #include <cstddef>
+#include <cstdint>
 #include <functional>
 #include <iterator>
 #include <sycl/sycl.hpp>
@@ -34,6 +35,7 @@
 
 #include "kernels/dpctl_tensor_types.hpp"
 #include "kernels/sorting/search_sorted_detail.hpp"
+#include "kernels/sorting/segmented_sort.hpp"
 #include "kernels/sorting/sort_utils.hpp"
 
 namespace dpctl
@@ -722,6 +724,21 @@ sycl::event stable_sort_axis1_contig_impl(
 
         return sequential_sorting_ev;
     }
+    else if (sort_nelems <= small_segments_sort_threshold) {
+        // many short rows are sorted by each work-group, rather than
+        // one row occupying the whole work-group
+        using SegmentsT = segmented_sort_detail::UniformSegments;
+        const std::size_t padded_len =
+            segmented_sort_detail::padded_segment_length(sort_nelems);
+
+        sycl::event small_rows_sorting_ev =
+            small_segments_sort_impl<argTy, std::int64_t, Comp, SegmentsT, true,
+                                     false>(
+                exec_q, iter_nelems, padded_len, arg_tp, res_tp, nullptr, false,
+                SegmentsT{sort_nelems}, comp, depends);
+
+        return small_rows_sorting_ev;
+    }
     else {
         std::size_t sorted_block_size{};
 
@@ -787,6 +804,22 @@ sycl::event stable_argsort_axis1_contig_impl(
     IndexTy *res_tp =
         reinterpret_cast<IndexTy *>(res_cp) + iter_res_offset + sort_res_offset;
 
+    if (sort_nelems <= small_segments_sort_threshold) {
+        // many short rows are sorted by each work-group, positions of
+        // sorted elements within rows are written out directly
+        using SegmentsT = segmented_sort_detail::UniformSegments;
+        const std::size_t padded_len =
+            segmented_sort_detail::padded_segment_length(sort_nelems);
+
+        sycl::event small_rows_sorting_ev =
+            small_segments_sort_impl<argTy, IndexTy, ValueComp, SegmentsT,
+                                     false, true>(
+                exec_q, iter_nelems, padded_len, arg_tp, nullptr, res_tp, false,
+                SegmentsT{sort_nelems}, ValueComp{}, depends);
+
+        return small_rows_sorting_ev;
+    }
+
     const IndexComp<IndexTy, argTy, ValueComp> index_comp{arg_tp, ValueComp{}};
 
     static constexpr std::size_t determine_automatically = 0;
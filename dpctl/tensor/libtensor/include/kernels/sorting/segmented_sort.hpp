@@ -0,0 +1,290 @@
+//=== segmented_sort.hpp - Sorting of short segments          ---*-C++-*--/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines kernels sorting many short segments of an array, with
+/// several segments sorted by a work-group at a time using bitonic sorting
+/// network in local memory.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <type_traits>
+#include <vector>
+
+#include <sycl/sycl.hpp>
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+
+/*! @brief Largest length of segments sorted by
+ * `small_segments_sort_impl`. Sorting networks of larger size require
+ * too many work-group barriers to be competitive with merge sort. */
+static constexpr std::size_t small_segments_sort_threshold = 256;
+
+namespace segmented_sort_detail
+{
+
+/*! @brief Segments of equal length, stored one after another */
+struct UniformSegments
+{
+    std::size_t seg_len;
+
+    std::size_t begin(std::size_t seg_id) const { return seg_id * seg_len; }
+    std::size_t end(std::size_t seg_id) const { return (seg_id + 1) * seg_len; }
+};
+
+/*! @brief Segments delimited by consecutive elements of offsets array */
+template <typename OffsetT> struct OffsetSegments
+{
+    const OffsetT *offsets;
+
+    std::size_t begin(std::size_t seg_id) const
+    {
+        return static_cast<std::size_t>(offsets[seg_id]);
+    }
+    std::size_t end(std::size_t seg_id) const
+    {
+        return static_cast<std::size_t>(offsets[seg_id + 1]);
+    }
+};
+
+/*! @brief Padded length of segments, a power of two not smaller than 2 */
+inline std::size_t padded_segment_length(std::size_t max_seg_len)
+{
+    std::size_t padded_len = 2;
+    while (padded_len < max_seg_len) {
+        padded_len <<= 1;
+    }
+    return padded_len;
+}
+
+} // namespace segmented_sort_detail
+
+template <typename argTy,
+          typename IndexT,
+          typename Comp,
+          typename SegmentsT,
+          bool write_values,
+          bool write_indices>
+class small_segments_sort_krn;
+
+/*! @brief Sorts segments of length at most `padded_len`, a power of two,
+ * writing sorted values into `vals_dst`, and/or positions of sorted values
+ * into `inds_dst`. Positions are relative to the beginning of the segment,
+ * unless `absolute_indices` is set.
+ *
+ * Segments are padded to `padded_len` elements in local memory, and sorted
+ * with bitonic sorting network, several segments per work-group. Elements
+ * are compared together with their positions, which makes the sort stable.
+ */
+template <typename argTy,
+          typename IndexT,
+          typename Comp,
+          typename SegmentsT,
+          bool write_values,
+          bool write_indices>
+sycl::event small_segments_sort_impl(sycl::queue &exec_q,
+                                     std::size_t n_segments,
+                                     std::size_t padded_len,
+                                     const argTy *src,
+                                     argTy *vals_dst,
+                                     IndexT *inds_dst,
+                                     bool absolute_indices,
+                                     const SegmentsT &segments,
+                                     const Comp &comp,
+                                     const std::vector<sycl::event> &depends)
+{
+    // each work-item performs one compare-exchange per step of the network
+    const std::size_t wi_per_seg = padded_len / 2;
+
+    const auto &dev = exec_q.get_device();
+    const std::size_t max_wg_size =
+        dev.template get_info<sycl::info::device::max_work_group_size>();
+
+    constexpr std::size_t preferred_wg_size = 256;
+    const std::size_t segs_per_wg =
+        std::max<std::size_t>(1, std::min(preferred_wg_size, max_wg_size) /
+                                     std::max<std::size_t>(1, wi_per_seg));
+    const std::size_t lws = segs_per_wg * wi_per_seg;
+    const std::size_t n_groups = (n_segments + segs_per_wg - 1) / segs_per_wg;
+
+    using KernelName = small_segments_sort_krn<argTy, IndexT, Comp, SegmentsT,
+                                               write_values, write_indices>;
+
+    sycl::event sort_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        const std::size_t slm_size = segs_per_wg * padded_len;
+        sycl::local_accessor<argTy, 1> vals_slm(sycl::range<1>(slm_size), cgh);
+        sycl::local_accessor<std::uint32_t, 1> pos_slm(sycl::range<1>(slm_size),
+                                                       cgh);
+
+        cgh.parallel_for<KernelName>(
+            sycl::nd_range<1>(n_groups * lws, lws), [=](sycl::nd_item<1> it) {
+                const std::size_t lid = it.get_local_linear_id();
+                const std::size_t seg_in_wg = lid / wi_per_seg;
+                const std::size_t t = lid - seg_in_wg * wi_per_seg;
+                const std::size_t seg_id =
+                    it.get_group_linear_id() * segs_per_wg + seg_in_wg;
+
+                // work-items of out-of-range segments take part in
+                // barriers, working on segments of padding only
+                const bool valid = (seg_id < n_segments);
+                const std::size_t seg_begin =
+                    (valid) ? segments.begin(seg_id) : 0;
+                const std::size_t seg_len =
+                    (valid) ? segments.end(seg_id) - seg_begin : 0;
+
+                const std::size_t base = seg_in_wg * padded_len;
+
+                for (std::size_t k = t; k < padded_len; k += wi_per_seg) {
+                    pos_slm[base + k] = static_cast<std::uint32_t>(k);
+                    if (k < seg_len) {
+                        vals_slm[base + k] = src[seg_begin + k];
+                    }
+                }
+
+                // element at slm position p1 precedes element at p2;
+                // padding elements, recognized by their positions,
+                // follow all elements of the segment
+                auto precedes = [&](std::size_t p1, std::size_t p2) {
+                    const std::uint32_t i1 = pos_slm[p1];
+                    const std::uint32_t i2 = pos_slm[p2];
+                    const bool pad1 = (i1 >= seg_len);
+                    const bool pad2 = (i2 >= seg_len);
+                    if (pad1 || pad2) {
+                        return (pad1 && pad2) ? (i1 < i2) : pad2;
+                    }
+                    const argTy &v1 = vals_slm[p1];
+                    const argTy &v2 = vals_slm[p2];
+                    return comp(v1, v2) || (!comp(v2, v1) && (i1 < i2));
+                };
+
+                sycl::group_barrier(it.get_group());
+
+                for (std::size_t size = 2; size <= padded_len; size <<= 1) {
+                    for (std::size_t stride = size / 2; stride > 0;
+                         stride >>= 1) {
+                        const std::size_t i =
+                            2 * stride * (t / stride) + (t % stride);
+                        const std::size_t p1 = base + i;
+                        const std::size_t p2 = p1 + stride;
+                        const bool ascending = ((i & size) == 0);
+
+                        if (precedes(p2, p1) == ascending) {
+                            const argTy v = vals_slm[p1];
+                            vals_slm[p1] = vals_slm[p2];
+                            vals_slm[p2] = v;
+                            const std::uint32_t pos = pos_slm[p1];
+                            pos_slm[p1] = pos_slm[p2];
+                            pos_slm[p2] = pos;
+                        }
+
+                        sycl::group_barrier(it.get_group());
+                    }
+                }
+
+                const std::size_t inds_base =
+                    (absolute_indices) ? seg_begin : 0;
+                for (std::size_t k = t; k < seg_len; k += wi_per_seg) {
+                    if constexpr (write_values) {
+                        vals_dst[seg_begin + k] = vals_slm[base + k];
+                    }
+                    if constexpr (write_indices) {
+                        inds_dst[seg_begin + k] =
+                            static_cast<IndexT>(inds_base + pos_slm[base + k]);
+                    }
+                }
+            });
+    });
+
+    return sort_ev;
+}
+
+typedef sycl::event (*segmented_sort_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    std::size_t,
+    const char *,
+    const char *,
+    char *,
+    const std::vector<sycl::event> &);
+
+/*! @brief Sorts values of segments of contiguous vector delimited by
+ * `n_segments + 1` offsets of type int64, of length at most `padded_len`,
+ * a power of two not exceeding `small_segments_sort_threshold` */
+template <typename argTy, typename Comp>
+sycl::event segmented_sort_impl(sycl::queue &exec_q,
+                                std::size_t n_segments,
+                                std::size_t padded_len,
+                                const char *src_cp,
+                                const char *offsets_cp,
+                                char *dst_cp,
+                                const std::vector<sycl::event> &depends)
+{
+    const argTy *src_tp = reinterpret_cast<const argTy *>(src_cp);
+    argTy *dst_tp = reinterpret_cast<argTy *>(dst_cp);
+
+    using OffsetT = std::int64_t;
+    using SegmentsT = segmented_sort_detail::OffsetSegments<OffsetT>;
+    const SegmentsT segments{reinterpret_cast<const OffsetT *>(offsets_cp)};
+
+    return small_segments_sort_impl<argTy, std::int64_t, Comp, SegmentsT, true,
+                                    false>(exec_q, n_segments, padded_len,
+                                           src_tp, dst_tp, nullptr, false,
+                                           segments, Comp{}, depends);
+}
+
+/*! @brief Computes positions sorting values of segments of contiguous
+ * vector delimited by `n_segments + 1` offsets of type int64. Positions
+ * are relative to the beginning of the vector. */
+template <typename argTy, typename IndexT, typename Comp>
+sycl::event segmented_argsort_impl(sycl::queue &exec_q,
+                                   std::size_t n_segments,
+                                   std::size_t padded_len,
+                                   const char *src_cp,
+                                   const char *offsets_cp,
+                                   char *dst_cp,
+                                   const std::vector<sycl::event> &depends)
+{
+    const argTy *src_tp = reinterpret_cast<const argTy *>(src_cp);
+    IndexT *dst_tp = reinterpret_cast<IndexT *>(dst_cp);
+
+    using OffsetT = std::int64_t;
+    using SegmentsT = segmented_sort_detail::OffsetSegments<OffsetT>;
+    const SegmentsT segments{reinterpret_cast<const OffsetT *>(offsets_cp)};
+
+    return small_segments_sort_impl<argTy, IndexT, Comp, SegmentsT, false,
+                                    true>(exec_q, n_segments, padded_len,
+                                          src_tp, nullptr, dst_tp, true,
+                                          segments, Comp{}, depends);
+}
+
+} // end of namespace kernels
+} // end of namespace tensor
+} // end of namespace dpctl
@@ -0,0 +1,188 @@
+//=== sort_by_key.hpp - Sorting of values by keys             ---*-C++-*--/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines kernels for stable sorting of keys, reordering values
+/// alongside the keys.
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+#include <sycl/sycl.hpp>
+
+#include "kernels/dpctl_tensor_types.hpp"
+#include "kernels/sorting/merge_sort.hpp"
+#include "utils/sycl_alloc_utils.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace kernels
+{
+
+namespace sort_by_key_detail
+{
+
+/*! @brief Sixteen bytes of payload, e.g. a complex double value */
+struct Bytes16
+{
+    std::uint64_t lo;
+    std::uint64_t hi;
+};
+
+/*! @brief Type values of given size are moved as, so that payloads of
+ * different types of the same size share kernels */
+template <std::size_t size> struct PayloadStorage;
+
+template <> struct PayloadStorage<1>
+{
+    using type = std::uint8_t;
+};
+
+template <> struct PayloadStorage<2>
+{
+    using type = std::uint16_t;
+};
+
+template <> struct PayloadStorage<4>
+{
+    using type = std::uint32_t;
+};
+
+template <> struct PayloadStorage<8>
+{
+    using type = std::uint64_t;
+};
+
+template <> struct PayloadStorage<16>
+{
+    using type = Bytes16;
+};
+
+template <typename T>
+using payload_storage_t = typename PayloadStorage<sizeof(T)>::type;
+
+template <typename KeyT, typename PayloadT> struct KeyValuePair
+{
+    KeyT key;
+    PayloadT val;
+};
+
+/*! @brief Compares pairs by keys only */
+template <typename PairT, typename KeyComp> struct KeyValueComp
+{
+    bool operator()(const PairT &p1, const PairT &p2) const
+    {
+        return KeyComp{}(p1.key, p2.key);
+    }
+};
+
+} // namespace sort_by_key_detail
+
+typedef sycl::event (*sort_by_key_contig_fn_ptr_t)(
+    sycl::queue &,
+    std::size_t,
+    std::size_t,
+    const char *,
+    const char *,
+    char *,
+    char *,
+    const std::vector<sycl::event> &);
+
+template <typename KeyT, typename PayloadT> class sort_by_key_pack_krn;
+
+template <typename KeyT, typename PayloadT> class sort_by_key_unpack_krn;
+
+/*! @brief Stably sorts rows of contiguous matrix of keys, reordering
+ * rows of contiguous matrix of values of the same shape alongside.
+ *
+ * Keys and values are interleaved into a temporary of pairs, which is
+ * sorted by merge sort comparing keys only, so that values move together
+ * with their keys, without materializing sorting permutation.
+ */
+template <typename KeyT, typename PayloadT, typename KeyComp>
+sycl::event stable_sort_by_key_axis1_contig_impl(
+    sycl::queue &exec_q,
+    std::size_t iter_nelems, // number of sub-arrays to sort
+    std::size_t sort_nelems, // size of each array to sort
+    const char *keys_cp,
+    const char *vals_cp,
+    char *keys_res_cp,
+    char *vals_res_cp,
+    const std::vector<sycl::event> &depends)
+{
+    using PairT = sort_by_key_detail::KeyValuePair<KeyT, PayloadT>;
+    using PairComp = sort_by_key_detail::KeyValueComp<PairT, KeyComp>;
+
+    const KeyT *keys_tp = reinterpret_cast<const KeyT *>(keys_cp);
+    const PayloadT *vals_tp = reinterpret_cast<const PayloadT *>(vals_cp);
+    KeyT *keys_res_tp = reinterpret_cast<KeyT *>(keys_res_cp);
+    PayloadT *vals_res_tp = reinterpret_cast<PayloadT *>(vals_res_cp);
+
+    const std::size_t total_nelems = iter_nelems * sort_nelems;
+
+    auto pairs_owner = dpctl::tensor::alloc_utils::smart_malloc_device<PairT>(
+        total_nelems, exec_q);
+    // extract USM pointer
+    PairT *pairs_tp = pairs_owner.get();
+
+    sycl::event pack_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(depends);
+
+        using KernelName = sort_by_key_pack_krn<KeyT, PayloadT>;
+        cgh.parallel_for<KernelName>(
+            sycl::range<1>(total_nelems), [=](sycl::id<1> id) {
+                pairs_tp[id] = PairT{keys_tp[id], vals_tp[id]};
+            });
+    });
+
+    constexpr ssize_t zero_offset = ssize_t(0);
+    sycl::event sort_ev = stable_sort_axis1_contig_impl<PairT, PairComp>(
+        exec_q, iter_nelems, sort_nelems,
+        reinterpret_cast<const char *>(pairs_tp),
+        reinterpret_cast<char *>(pairs_tp), zero_offset, zero_offset,
+        zero_offset, zero_offset, {pack_ev});
+
+    sycl::event unpack_ev = exec_q.submit([&](sycl::handler &cgh) {
+        cgh.depends_on(sort_ev);
+
+        using KernelName = sort_by_key_unpack_krn<KeyT, PayloadT>;
+        cgh.parallel_for<KernelName>(sycl::range<1>(total_nelems),
+                                     [=](sycl::id<1> id) {
+                                         const PairT p = pairs_tp[id];
+                                         keys_res_tp[id] = p.key;
+                                         vals_res_tp[id] = p.val;
+                                     });
+    });
+
+    sycl::event cleanup_ev = dpctl::tensor::alloc_utils::async_smart_free(
+        exec_q, {unpack_ev}, pairs_owner);
+
+    return cleanup_ev;
+}
+
+} // end of namespace kernels
+} // end of namespace tensor
+} // end of namespace dpctl
@@ -65,6 +65,18 @@ static cumsum_val_strided_impl_fn_ptr_t
 static cumsum_val_strided_impl_fn_ptr_t
     mask_positions_strided_i32_dispatch_vector[td_ns::num_types];
 
+using dpctl::tensor::kernels::accumulators::cumsum_contig_impl_fn_ptr_t;
+static cumsum_contig_impl_fn_ptr_t
+    mask_positions_async_contig_i64_dispatch_vector[td_ns::num_types];
+static cumsum_contig_impl_fn_ptr_t
+    mask_positions_async_contig_i32_dispatch_vector[td_ns::num_types];
+
+using dpctl::tensor::kernels::accumulators::cumsum_strided_impl_fn_ptr_t;
+static cumsum_strided_impl_fn_ptr_t
+    mask_positions_async_strided_i64_dispatch_vector[td_ns::num_types];
+static cumsum_strided_impl_fn_ptr_t
+    mask_positions_async_strided_i32_dispatch_vector[td_ns::num_types];
+
 void populate_mask_positions_dispatch_vectors(void)
 {
     using dpctl::tensor::kernels::accumulators::
@@ -99,6 +111,42 @@ void populate_mask_positions_dispatch_vectors(void)
         dvb4;
     dvb4.populate_dispatch_vector(mask_positions_strided_i32_dispatch_vector);
 
+    using dpctl::tensor::kernels::accumulators::
+        MaskPositionsAsyncContigFactoryForInt64;
+    td_ns::DispatchVectorBuilder<cumsum_contig_impl_fn_ptr_t,
+                                 MaskPositionsAsyncContigFactoryForInt64,
+                                 td_ns::num_types>
+        dvb5;
+    dvb5.populate_dispatch_vector(
+        mask_positions_async_contig_i64_dispatch_vector);
+
+    using dpctl::tensor::kernels::accumulators::
+        MaskPositionsAsyncContigFactoryForInt32;
+    td_ns::DispatchVectorBuilder<cumsum_contig_impl_fn_ptr_t,
+                                 MaskPositionsAsyncContigFactoryForInt32,
+                                 td_ns::num_types>
+        dvb6;
+    dvb6.populate_dispatch_vector(
+        mask_positions_async_contig_i32_dispatch_vector);
+
+    using dpctl::tensor::kernels::accumulators::
+        MaskPositionsAsyncStridedFactoryForInt64;
+    td_ns::DispatchVectorBuilder<cumsum_strided_impl_fn_ptr_t,
+                                 MaskPositionsAsyncStridedFactoryForInt64,
+                                 td_ns::num_types>
+        dvb7;
+    dvb7.populate_dispatch_vector(
+        mask_positions_async_strided_i64_dispatch_vector);
+
+    using dpctl::tensor::kernels::accumulators::
+        MaskPositionsAsyncStridedFactoryForInt32;
+    td_ns::DispatchVectorBuilder<cumsum_strided_impl_fn_ptr_t,
+                                 MaskPositionsAsyncStridedFactoryForInt32,
+                                 td_ns::num_types>
+        dvb8;
+    dvb8.populate_dispatch_vector(
+        mask_positions_async_strided_i32_dispatch_vector);
+
     return;
 }
 
@@ -237,6 +285,125 @@ std::size_t py_mask_positions(const dpctl::tensor::usm_ndarray &mask,
     return total_set;
 }
 
+std::pair<sycl::event, sycl::event>
+py_mask_positions_async(const dpctl::tensor::usm_ndarray &mask,
+                        const dpctl::tensor::usm_ndarray &cumsum,
+                        sycl::queue &exec_q,
+                        const std::vector<sycl::event> &depends)
+{
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(cumsum);
+
+    // cumsum is 1D
+    if (cumsum.get_ndim() != 1) {
+        throw py::value_error("Result array must be one-dimensional.");
+    }
+
+    if (!cumsum.is_c_contiguous()) {
+        throw py::value_error("Expecting `cumsum` array must be C-contiguous.");
+    }
+
+    // cumsum.shape == (mask.size,)
+    auto mask_size = mask.get_size();
+    auto cumsum_size = cumsum.get_shape(0);
+    if (cumsum_size != mask_size) {
+        throw py::value_error("Inconsistent dimensions");
+    }
+
+    if (!dpctl::utils::queues_are_compatible(exec_q, {mask, cumsum})) {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+
+    if (mask_size == 0) {
+        return std::make_pair(sycl::event(), sycl::event());
+    }
+
+    int mask_typenum = mask.get_typenum();
+    int cumsum_typenum = cumsum.get_typenum();
+
+    // mask can be any type
+    const char *mask_data = mask.get_data();
+    char *cumsum_data = cumsum.get_data();
+
+    auto const &array_types = td_ns::usm_ndarray_types();
+
+    int mask_typeid = array_types.typenum_to_lookup_id(mask_typenum);
+    int cumsum_typeid = array_types.typenum_to_lookup_id(cumsum_typenum);
+
+    // cumsum must be int32_t/int64_t only
+    constexpr int int32_typeid = static_cast<int>(td_ns::typenum_t::INT32);
+    constexpr int int64_typeid = static_cast<int>(td_ns::typenum_t::INT64);
+    if (cumsum_typeid != int32_typeid && cumsum_typeid != int64_typeid) {
+        throw py::value_error(
+            "Cumulative sum array must have int32 or int64 data-type.");
+    }
+
+    const bool use_i32 = (cumsum_typeid == int32_typeid);
+
+    std::vector<sycl::event> host_task_events;
+
+    if (mask.is_c_contiguous()) {
+        auto fn =
+            (use_i32)
+                ? mask_positions_async_contig_i32_dispatch_vector[mask_typeid]
+                : mask_positions_async_contig_i64_dispatch_vector[mask_typeid];
+
+        sycl::event comp_ev = fn(exec_q, mask_size, mask_data, cumsum_data,
+                                 host_task_events, depends);
+
+        sycl::event ht_ev = dpctl::utils::keep_args_alive(
+            exec_q, {mask, cumsum}, host_task_events);
+
+        return std::make_pair(ht_ev, comp_ev);
+    }
+
+    const py::ssize_t *shape = mask.get_shape_raw();
+    auto const &strides_vector = mask.get_strides_vector();
+
+    using shT = std::vector<py::ssize_t>;
+    shT compact_shape;
+    shT compact_strides;
+
+    int mask_nd = mask.get_ndim();
+    int nd = mask_nd;
+
+    dpctl::tensor::py_internal::compact_iteration_space(
+        nd, shape, strides_vector, compact_shape, compact_strides);
+
+    // Strided implementation
+    auto strided_fn =
+        (use_i32)
+            ? mask_positions_async_strided_i32_dispatch_vector[mask_typeid]
+            : mask_positions_async_strided_i64_dispatch_vector[mask_typeid];
+
+    using dpctl::tensor::offset_utils::device_allocate_and_pack;
+    auto ptr_size_event_tuple = device_allocate_and_pack<py::ssize_t>(
+        exec_q, host_task_events, compact_shape, compact_strides);
+    auto shape_strides_owner = std::move(std::get<0>(ptr_size_event_tuple));
+    sycl::event copy_shape_ev = std::get<2>(ptr_size_event_tuple);
+    const py::ssize_t *shape_strides = shape_strides_owner.get();
+
+    std::vector<sycl::event> dependent_events;
+    dependent_events.reserve(depends.size() + 1);
+    dependent_events.insert(dependent_events.end(), copy_shape_ev);
+    dependent_events.insert(dependent_events.end(), depends.begin(),
+                            depends.end());
+
+    sycl::event comp_ev =
+        strided_fn(exec_q, mask_size, mask_data, nd, shape_strides, cumsum_data,
+                   host_task_events, dependent_events);
+
+    sycl::event temporaries_cleanup_ev =
+        dpctl::tensor::alloc_utils::async_smart_free(exec_q, {comp_ev},
+                                                     shape_strides_owner);
+    host_task_events.push_back(temporaries_cleanup_ev);
+
+    sycl::event ht_ev =
+        dpctl::utils::keep_args_alive(exec_q, {mask, cumsum}, host_task_events);
+
+    return std::make_pair(ht_ev, comp_ev);
+}
+
 using dpctl::tensor::kernels::accumulators::cumsum_val_strided_impl_fn_ptr_t;
 static cumsum_val_strided_impl_fn_ptr_t
     cumsum_1d_strided_dispatch_vector[td_ns::num_types];
@@ -46,6 +46,12 @@ py_mask_positions(const dpctl::tensor::usm_ndarray &mask,
                   sycl::queue &exec_q,
                   const std::vector<sycl::event> &depends = {});
 
+extern std::pair<sycl::event, sycl::event>
+py_mask_positions_async(const dpctl::tensor::usm_ndarray &mask,
+                        const dpctl::tensor::usm_ndarray &cumsum,
+                        sycl::queue &exec_q,
+                        const std::vector<sycl::event> &depends = {});
+
 extern void populate_cumsum_1d_dispatch_vectors(void);
 
 extern std::size_t py_cumsum_1d(const dpctl::tensor::usm_ndarray &src,
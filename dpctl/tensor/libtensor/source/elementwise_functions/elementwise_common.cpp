@@ -53,6 +53,7 @@
 #include "expm1.hpp"
 #include "floor.hpp"
 #include "floor_divide.hpp"
+#include "fused_elementwise.hpp"
 #include "greater.hpp"
 #include "greater_equal.hpp"
 #include "hypot.hpp"
@@ -138,6 +139,7 @@ void init_elementwise_functions(py::module_ m)
     init_expm1(m);
     init_floor(m);
     init_floor_divide(m);
+    init_fused_elementwise(m);
     init_greater(m);
     init_greater_equal(m);
     init_hypot(m);
@@ -0,0 +1,246 @@
+//===----------- Implementation of _tensor_impl module  ---------*-C++-*-/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines functions of dpctl.tensor._tensor_impl extensions,
+/// specifically fused evaluation of elementwise operations.
+//===----------------------------------------------------------------------===//
+
+#include <bitset>
+#include <cstddef>
+#include <cstdint>
+#include <sycl/sycl.hpp>
+#include <utility>
+#include <vector>
+
+#include "dpctl4pybind11.hpp"
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "fused_elementwise.hpp"
+#include "kernels/elementwise_functions/fused.hpp"
+#include "utils/memory_overlap.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/type_dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace py_internal
+{
+
+namespace td_ns = dpctl::tensor::type_dispatch;
+namespace fused_ns = dpctl::tensor::kernels::fused;
+
+using fused_ns::fused_elementwise_contig_impl_fn_ptr_t;
+
+static fused_elementwise_contig_impl_fn_ptr_t
+    fused_elementwise_contig_dispatch_vector[td_ns::num_types];
+
+void populate_fused_elementwise_dispatch_vectors(void)
+{
+    using namespace td_ns;
+
+    using fused_ns::FusedElementwiseContigFactory;
+    DispatchVectorBuilder<fused_elementwise_contig_impl_fn_ptr_t,
+                          FusedElementwiseContigFactory, num_types>
+        dvb;
+    dvb.populate_dispatch_vector(fused_elementwise_contig_dispatch_vector);
+}
+
+/* Validates program so that the kernel only reads registers which have
+   been written, and only refers to provided inputs and constants */
+void validate_program(const std::vector<std::uint8_t> &program,
+                      std::size_t n_inputs,
+                      std::size_t n_constants)
+{
+    using fused_ns::constant_operand_base;
+    using fused_ns::input_operand_base;
+    using fused_ns::instruction_size;
+    using fused_ns::max_instructions;
+    using fused_ns::max_registers;
+
+    if (program.empty() || program.size() % instruction_size != 0) {
+        throw py::value_error("Program must be a non-empty sequence of "
+                              "instructions.");
+    }
+    if (program.size() > max_instructions * instruction_size) {
+        throw py::value_error("Program has too many instructions.");
+    }
+
+    std::bitset<max_registers> written{};
+    auto validate_operand = [&](std::uint8_t arg) {
+        if (arg < input_operand_base) {
+            if (!written[arg]) {
+                throw py::value_error("Program reads a register before "
+                                      "writing it.");
+            }
+        }
+        else if (arg < constant_operand_base) {
+            if (static_cast<std::size_t>(arg - input_operand_base) >= n_inputs)
+            {
+                throw py::value_error("Program refers to a missing input.");
+            }
+        }
+        else if (static_cast<std::size_t>(arg - constant_operand_base) >=
+                 n_constants)
+        {
+            throw py::value_error("Program refers to a missing constant.");
+        }
+    };
+
+    for (std::size_t i = 0; i < program.size(); i += instruction_size) {
+        const std::uint8_t opcode = program[i];
+        const std::uint8_t dst_reg = program[i + 1];
+        if (fused_ns::is_unary_op(opcode)) {
+            validate_operand(program[i + 2]);
+        }
+        else if (fused_ns::is_binary_op(opcode)) {
+            validate_operand(program[i + 2]);
+            validate_operand(program[i + 3]);
+        }
+        else {
+            throw py::value_error("Program has an unknown operation.");
+        }
+        if (dst_reg >= max_registers) {
+            throw py::value_error("Program writes an invalid register.");
+        }
+        written[dst_reg] = true;
+    }
+}
+
+std::pair<sycl::event, sycl::event>
+py_fused_elementwise(const py::object &py_inputs,
+                     const dpctl::tensor::usm_ndarray &dst,
+                     const std::vector<std::uint8_t> &program,
+                     const std::vector<double> &constants,
+                     sycl::queue &exec_q,
+                     const std::vector<sycl::event> &depends)
+{
+    const std::size_t n_inputs = py::len(py_inputs);
+    if (n_inputs > fused_ns::max_inputs) {
+        throw py::value_error("Too many input arrays.");
+    }
+    if (constants.size() > fused_ns::max_constants) {
+        throw py::value_error("Too many constants.");
+    }
+    validate_program(program, n_inputs, constants.size());
+
+    if (!dpctl::utils::queues_are_compatible(exec_q, {dst})) {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(dst);
+    if (!dst.is_c_contiguous()) {
+        throw py::value_error("Destination array must be C-contiguous.");
+    }
+
+    auto const &array_types = td_ns::usm_ndarray_types();
+    const int dst_typeid = array_types.typenum_to_lookup_id(dst.get_typenum());
+
+    const int nd = dst.get_ndim();
+    const py::ssize_t *dst_shape = dst.get_shape_raw();
+    std::size_t nelems(1);
+    for (int i = 0; i < nd; ++i) {
+        nelems *= static_cast<std::size_t>(dst_shape[i]);
+    }
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    auto const &same_logical_tensors =
+        dpctl::tensor::overlap::SameLogicalTensors();
+
+    std::vector<const char *> in_data;
+    in_data.reserve(n_inputs);
+    for (std::size_t i = 0; i < n_inputs; ++i) {
+        py::object el_i = py_inputs[py::cast(i)];
+        dpctl::tensor::usm_ndarray arr_i =
+            py::cast<dpctl::tensor::usm_ndarray>(el_i);
+        if (!dpctl::utils::queues_are_compatible(exec_q, {arr_i})) {
+            throw py::value_error(
+                "Execution queue is not compatible with allocation queues");
+        }
+        if (arr_i.get_ndim() != nd) {
+            throw py::value_error("Arrays are not of matching shapes.");
+        }
+        const py::ssize_t *shape_i = arr_i.get_shape_raw();
+        for (int d = 0; d < nd; ++d) {
+            if (shape_i[d] != dst_shape[d]) {
+                throw py::value_error("Arrays are not of matching shapes.");
+            }
+        }
+        if (array_types.typenum_to_lookup_id(arr_i.get_typenum()) != dst_typeid)
+        {
+            throw py::value_error("Input and destination arrays must have "
+                                  "the same data type.");
+        }
+        if (!arr_i.is_c_contiguous()) {
+            throw py::value_error("Input arrays must be C-contiguous.");
+        }
+        if (overlap(dst, arr_i) && !same_logical_tensors(dst, arr_i)) {
+            throw py::value_error("Destination array overlaps with input.");
+        }
+        in_data.push_back(arr_i.get_data());
+    }
+
+    auto contig_fn = fused_elementwise_contig_dispatch_vector[dst_typeid];
+    if (contig_fn == nullptr) {
+        throw py::value_error("Fused evaluation is not supported for this "
+                              "data type.");
+    }
+
+    if (nelems == 0) {
+        return std::make_pair(sycl::event{}, sycl::event{});
+    }
+
+    dpctl::tensor::validation::AmpleMemory::throw_if_not_ample(dst, nelems);
+
+    sycl::event fused_ev = contig_fn(exec_q, nelems, in_data, dst.get_data(),
+                                     program, constants, depends);
+    sycl::event ht_ev =
+        dpctl::utils::keep_args_alive(exec_q, {py_inputs, dst}, {fused_ev});
+
+    return std::make_pair(ht_ev, fused_ev);
+}
+
+void init_fused_elementwise(py::module_ m)
+{
+    populate_fused_elementwise_dispatch_vectors();
+
+    m.def("_fused_elementwise", &py_fused_elementwise,
+          "Evaluates an expression composed of unary and binary elementwise "
+          "functions of C-contiguous arrays `inputs` of the same shape and "
+          "data type in a single kernel, writing the result into `dst`, "
+          "which may be one of `inputs`. The expression is a `program` of "
+          "4-byte instructions (opcode, destination register, operands), "
+          "where operands refer to one of 16 registers, one of `inputs` "
+          "(offset by 16) or one of `constants` (offset by 24). The result "
+          "is the register written by the last instruction. Only float32 "
+          "and float64 data types are supported.",
+          py::arg("inputs"), py::arg("dst"), py::arg("program"),
+          py::arg("constants"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+}
+
+} // namespace py_internal
+} // namespace tensor
+} // namespace dpctl
@@ -27,6 +27,7 @@
 #include <exception>
 #include <stdexcept>
 #include <sycl/sycl.hpp>
+#include <tuple>
 #include <utility>
 #include <vector>
 
@@ -41,6 +42,7 @@
 #include "elementwise_functions/elementwise_functions_type_utils.hpp"
 #include "kernels/linalg_functions/dot_product.hpp"
 #include "kernels/linalg_functions/gemm.hpp"
+#include "kernels/linalg_functions/gemm_tuning.hpp"
 #include "reductions/reduction_atomic_support.hpp"
 #include "simplify_iteration_space.hpp"
 #include "utils/memory_overlap.hpp"
@@ -203,8 +205,16 @@ py_dot(const dpctl::tensor::usm_ndarray &x1,
        int inner_dims,
        const dpctl::tensor::usm_ndarray &dst,
        sycl::queue &exec_q,
-       const std::vector<sycl::event> &depends)
+       const std::vector<sycl::event> &depends,
+       const std::tuple<std::uint32_t, std::uint32_t, std::uint32_t> &tuning)
 {
+    // GEMM kernels submitted below read tiling overrides of this thread
+    using dpctl::tensor::kernels::gemm_detail::GemmTuningParameters;
+    using dpctl::tensor::kernels::gemm_detail::GemmTuningScope;
+    const GemmTuningParameters tuning_params{
+        std::get<0>(tuning), std::get<1>(tuning), std::get<2>(tuning)};
+    const GemmTuningScope tuning_scope(tuning_params);
+
     if (!dpctl::utils::queues_are_compatible(exec_q, {x1, x2, dst})) {
         throw py::value_error(
             "Execution queue is not compatible with allocation queues");
@@ -843,7 +853,8 @@ void init_dot(py::module_ m)
     m.def("_dot", &py_dot, "", py::arg("x1"), py::arg("x2"),
           py::arg("batch_dims"), py::arg("x1_outer_dims"),
           py::arg("x2_outer_dims"), py::arg("inner_dims"), py::arg("dst"),
-          py::arg("sycl_queue"), py::arg("depends") = py::list());
+          py::arg("sycl_queue"), py::arg("depends") = py::list(),
+          py::arg("tuning") = std::make_tuple(0u, 0u, 0u));
 
     using dpctl::tensor::py_internal::dot_output_id_table;
     auto dot_result_type_pyapi = [&](const py::dtype &dtype1,
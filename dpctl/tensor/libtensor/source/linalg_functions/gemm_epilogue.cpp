@@ -0,0 +1,282 @@
+//===-- gemm_epilogue.cpp - Implementation of _tensor_linalg_impl -*-C++-*-===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines functions of dpctl.tensor._tensor_linalg_impl extension
+/// applying epilogue of matrix multiplication.
+//===----------------------------------------------------------------------===//
+
+#include <complex>
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <sycl/sycl.hpp>
+#include <utility>
+#include <vector>
+
+#include "dpctl4pybind11.hpp"
+#include <pybind11/complex.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "gemm_epilogue.hpp"
+#include "kernels/linalg_functions/gemm_epilogue.hpp"
+#include "simplify_iteration_space.hpp"
+#include "utils/memory_overlap.hpp"
+#include "utils/offset_utils.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/sycl_alloc_utils.hpp"
+#include "utils/type_dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace py_internal
+{
+
+namespace td_ns = dpctl::tensor::type_dispatch;
+
+using dpctl::tensor::kernels::gemm_epilogue::
+    gemm_epilogue_activation_supported_fn_ptr_t;
+using dpctl::tensor::kernels::gemm_epilogue::gemm_epilogue_contig_impl_fn_ptr_t;
+using dpctl::tensor::kernels::gemm_epilogue::
+    gemm_epilogue_strided_impl_fn_ptr_t;
+
+static gemm_epilogue_contig_impl_fn_ptr_t
+    gemm_epilogue_contig_dispatch_vector[td_ns::num_types];
+static gemm_epilogue_strided_impl_fn_ptr_t
+    gemm_epilogue_strided_dispatch_vector[td_ns::num_types];
+static gemm_epilogue_activation_supported_fn_ptr_t
+    gemm_epilogue_activation_supported_vector[td_ns::num_types];
+
+void init_gemm_epilogue_dispatch_vectors(void)
+{
+    using namespace td_ns;
+
+    using dpctl::tensor::kernels::gemm_epilogue::GemmEpilogueContigFactory;
+    DispatchVectorBuilder<gemm_epilogue_contig_impl_fn_ptr_t,
+                          GemmEpilogueContigFactory, num_types>
+        dvb1;
+    dvb1.populate_dispatch_vector(gemm_epilogue_contig_dispatch_vector);
+
+    using dpctl::tensor::kernels::gemm_epilogue::GemmEpilogueStridedFactory;
+    DispatchVectorBuilder<gemm_epilogue_strided_impl_fn_ptr_t,
+                          GemmEpilogueStridedFactory, num_types>
+        dvb2;
+    dvb2.populate_dispatch_vector(gemm_epilogue_strided_dispatch_vector);
+
+    using dpctl::tensor::kernels::gemm_epilogue::GemmEpilogueActivationFactory;
+    DispatchVectorBuilder<gemm_epilogue_activation_supported_fn_ptr_t,
+                          GemmEpilogueActivationFactory, num_types>
+        dvb3;
+    dvb3.populate_dispatch_vector(gemm_epilogue_activation_supported_vector);
+}
+
+using dpctl::utils::keep_args_alive;
+
+std::pair<sycl::event, sycl::event>
+py_gemm_epilogue(const dpctl::tensor::usm_ndarray &res,
+                 const dpctl::tensor::usm_ndarray &dst,
+                 const py::object &bias_obj,
+                 const std::complex<double> &alpha,
+                 const std::complex<double> &beta,
+                 int activation,
+                 sycl::queue &exec_q,
+                 const std::vector<sycl::event> &depends)
+{
+    const bool has_bias = !bias_obj.is_none();
+    // bias is only accessed when provided, otherwise res stands in for it
+    const dpctl::tensor::usm_ndarray bias =
+        has_bias ? bias_obj.cast<dpctl::tensor::usm_ndarray>() : res;
+
+    if (!dpctl::utils::queues_are_compatible(exec_q, {res, bias, dst})) {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(dst);
+
+    const int nd = dst.get_ndim();
+    if (res.get_ndim() != nd) {
+        throw py::value_error("Result of matrix multiplication and "
+                              "destination arrays must have the same "
+                              "number of dimensions.");
+    }
+
+    const py::ssize_t *res_shape = res.get_shape_raw();
+    const py::ssize_t *dst_shape = dst.get_shape_raw();
+
+    bool shapes_equal(true);
+    std::size_t nelems(1);
+    for (int i = 0; i < nd; ++i) {
+        const auto &sh_i = dst_shape[i];
+        nelems *= static_cast<std::size_t>(sh_i);
+        shapes_equal = shapes_equal && (res_shape[i] == sh_i);
+    }
+
+    if (!shapes_equal) {
+        throw py::value_error("Arrays are not of matching shapes.");
+    }
+
+    const py::ssize_t n_cols = (nd > 0) ? dst_shape[nd - 1] : 1;
+    py::ssize_t bias_stride(0);
+    if (has_bias) {
+        if (bias.get_ndim() != 1 || bias.get_shape(0) != n_cols) {
+            throw py::value_error("Bias must be a one-dimensional array with "
+                                  "as many elements as the last dimension "
+                                  "of the destination.");
+        }
+        bias_stride = bias.get_strides_vector()[0];
+    }
+
+    if (nelems == 0) {
+        return std::make_pair(sycl::event{}, sycl::event{});
+    }
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    auto const &same_logical_tensors =
+        dpctl::tensor::overlap::SameLogicalTensors();
+    if ((overlap(dst, res) && !same_logical_tensors(dst, res)) ||
+        (has_bias && overlap(dst, bias)))
+    {
+        throw py::value_error("Destination array overlaps with input.");
+    }
+
+    auto const &array_types = td_ns::usm_ndarray_types();
+    const int res_typeid = array_types.typenum_to_lookup_id(res.get_typenum());
+    const int dst_typeid = array_types.typenum_to_lookup_id(dst.get_typenum());
+    const int bias_typeid =
+        array_types.typenum_to_lookup_id(bias.get_typenum());
+
+    if (res_typeid != dst_typeid || bias_typeid != dst_typeid) {
+        throw py::value_error("Result of matrix multiplication, bias and "
+                              "destination arrays must have the same "
+                              "data type.");
+    }
+
+    using dpctl::tensor::kernels::gemm_epilogue::GemmActivation;
+    auto contig_fn = gemm_epilogue_contig_dispatch_vector[dst_typeid];
+    auto strided_fn = gemm_epilogue_strided_dispatch_vector[dst_typeid];
+    if (contig_fn == nullptr || strided_fn == nullptr) {
+        throw py::value_error("Epilogue of matrix multiplication is not "
+                              "supported for this data type.");
+    }
+    auto activation_supported_fn =
+        gemm_epilogue_activation_supported_vector[dst_typeid];
+    if (!activation_supported_fn(static_cast<GemmActivation>(activation))) {
+        throw py::value_error("Activation is not supported for this data "
+                              "type.");
+    }
+
+    dpctl::tensor::validation::AmpleMemory::throw_if_not_ample(dst, nelems);
+
+    const char *res_data = res.get_data();
+    const char *bias_data = (has_bias) ? bias.get_data() : nullptr;
+    char *dst_data = dst.get_data();
+
+    if (res.is_c_contiguous() && dst.is_c_contiguous()) {
+        sycl::event epilogue_ev =
+            contig_fn(exec_q, nelems, res_data, bias_data, dst_data, n_cols,
+                      bias_stride, alpha, beta, activation, depends);
+        sycl::event ht_ev =
+            keep_args_alive(exec_q, {res, bias, dst}, {epilogue_ev});
+
+        return std::make_pair(ht_ev, epilogue_ev);
+    }
+
+    using shT = std::vector<py::ssize_t>;
+    auto const &res_strides = res.get_strides_vector();
+    auto const &dst_strides = dst.get_strides_vector();
+    // bias is broadcast along all but the last dimension
+    shT bias_strides(nd, 0);
+    if (nd > 0) {
+        bias_strides[nd - 1] = bias_stride;
+    }
+
+    int simplified_nd = nd;
+    shT simplified_shape;
+    shT simplified_res_strides;
+    shT simplified_dst_strides;
+    shT simplified_bias_strides;
+    py::ssize_t res_offset(0);
+    py::ssize_t dst_offset(0);
+    py::ssize_t bias_offset(0);
+
+    dpctl::tensor::py_internal::simplify_iteration_space_3(
+        simplified_nd, dst_shape, res_strides, dst_strides, bias_strides,
+        // outputs
+        simplified_shape, simplified_res_strides, simplified_dst_strides,
+        simplified_bias_strides, res_offset, dst_offset, bias_offset);
+
+    std::vector<sycl::event> host_task_events;
+    host_task_events.reserve(2);
+
+    using dpctl::tensor::offset_utils::device_allocate_and_pack;
+    auto ptr_size_event_tuple = device_allocate_and_pack<py::ssize_t>(
+        exec_q, host_task_events, simplified_shape, simplified_res_strides,
+        simplified_dst_strides, simplified_bias_strides);
+    auto packed_shape_strides_owner =
+        std::move(std::get<0>(ptr_size_event_tuple));
+    sycl::event copy_shape_strides_ev = std::get<2>(ptr_size_event_tuple);
+    const py::ssize_t *packed_shape_strides = packed_shape_strides_owner.get();
+
+    std::vector<sycl::event> all_deps;
+    all_deps.reserve(depends.size() + 1);
+    all_deps.insert(all_deps.end(), depends.begin(), depends.end());
+    all_deps.push_back(copy_shape_strides_ev);
+
+    sycl::event epilogue_ev =
+        strided_fn(exec_q, nelems, simplified_nd, res_data, bias_data, dst_data,
+                   packed_shape_strides, res_offset, dst_offset, bias_offset,
+                   alpha, beta, activation, all_deps);
+
+    // free packed temporaries
+    sycl::event temporaries_cleanup_ev =
+        dpctl::tensor::alloc_utils::async_smart_free(
+            exec_q, {epilogue_ev}, packed_shape_strides_owner);
+    host_task_events.push_back(temporaries_cleanup_ev);
+
+    sycl::event arg_cleanup_ev =
+        keep_args_alive(exec_q, {res, bias, dst}, host_task_events);
+
+    return std::make_pair(arg_cleanup_ev, epilogue_ev);
+}
+
+void init_gemm_epilogue(py::module_ m)
+{
+    init_gemm_epilogue_dispatch_vectors();
+
+    m.def("_gemm_epilogue", &py_gemm_epilogue,
+          "Computes `dst = act(alpha * res + beta * dst + bias)` for the "
+          "result `res` of matrix multiplication, where `bias` is broadcast "
+          "along all but the last dimension, and `act` is one of identity "
+          "(0), relu (1), gelu (2) or tanh (3) activations. Destination is "
+          "not read if `beta` is zero, and may be the same array as `res`.",
+          py::arg("res"), py::arg("dst"), py::arg("bias"), py::arg("alpha"),
+          py::arg("beta"), py::arg("activation"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+}
+
+} // namespace py_internal
+} // namespace tensor
+} // namespace dpctl
@@ -0,0 +1,383 @@
+//===-- ------------ Implementation of _tensor_impl module  ----*-C++-*-/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===--------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines functions of dpctl.tensor._tensor_impl extensions
+//===--------------------------------------------------------------------===//
+
+#include "dpctl4pybind11.hpp"
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <stdexcept>
+#include <string>
+#include <sycl/sycl.hpp>
+#include <utility>
+#include <vector>
+
+#include "kernels/histogram.hpp"
+#include "reduction_atomic_support.hpp"
+#include "utils/memory_overlap.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/type_dispatch.hpp"
+#include "utils/type_dispatch_building.hpp"
+
+namespace py = pybind11;
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace py_internal
+{
+
+namespace td_ns = dpctl::tensor::type_dispatch;
+
+namespace impl
+{
+
+using dpctl::tensor::kernels::histogram::bincount_impl_fn_ptr_t;
+static bincount_impl_fn_ptr_t bincount_dispatch_table[td_ns::num_types]
+                                                     [td_ns::num_types];
+
+using dpctl::tensor::kernels::histogram::histogram_impl_fn_ptr_t;
+static histogram_impl_fn_ptr_t
+    histogram_float_edges_dispatch_table[td_ns::num_types][td_ns::num_types];
+static histogram_impl_fn_ptr_t
+    histogram_double_edges_dispatch_table[td_ns::num_types][td_ns::num_types];
+
+using atomic_support::atomic_support_fn_ptr_t;
+static atomic_support_fn_ptr_t
+    histogram_atomic_support_vector[td_ns::num_types];
+
+void populate_histogram_dispatch_tables(void)
+{
+    using namespace td_ns;
+    using namespace dpctl::tensor::kernels::histogram;
+
+    DispatchTableBuilder<bincount_impl_fn_ptr_t, BincountFactory, num_types>
+        dtb1;
+    dtb1.populate_dispatch_table(bincount_dispatch_table);
+
+    DispatchTableBuilder<histogram_impl_fn_ptr_t, HistogramFloatEdgesFactory,
+                         num_types>
+        dtb2;
+    dtb2.populate_dispatch_table(histogram_float_edges_dispatch_table);
+
+    DispatchTableBuilder<histogram_impl_fn_ptr_t, HistogramDoubleEdgesFactory,
+                         num_types>
+        dtb3;
+    dtb3.populate_dispatch_table(histogram_double_edges_dispatch_table);
+
+    using atomic_support::HistogramAtomicSupportFactory;
+    DispatchVectorBuilder<atomic_support_fn_ptr_t,
+                          HistogramAtomicSupportFactory, num_types>
+        dvb;
+    dvb.populate_dispatch_vector(histogram_atomic_support_vector);
+}
+
+/*! @brief Validates arguments common to bincount and histogram, returns
+ * the array standing in for weights, which is `dst` if weights are not
+ * given */
+dpctl::tensor::usm_ndarray
+validate_histogram_args(const dpctl::tensor::usm_ndarray &x,
+                        const py::object &weights_obj,
+                        const dpctl::tensor::usm_ndarray &dst,
+                        sycl::queue &exec_q)
+{
+    const bool has_weights = !weights_obj.is_none();
+    // weights are only accessed when provided, otherwise dst stands in
+    const dpctl::tensor::usm_ndarray weights =
+        has_weights ? weights_obj.cast<dpctl::tensor::usm_ndarray>() : dst;
+
+    if (!dpctl::utils::queues_are_compatible(exec_q, {x, weights, dst})) {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(dst);
+
+    if (x.get_ndim() != 1 || dst.get_ndim() != 1) {
+        throw py::value_error("Input and destination arrays must be "
+                              "one-dimensional");
+    }
+    if (has_weights) {
+        if (weights.get_ndim() != 1 || weights.get_shape(0) != x.get_shape(0)) {
+            throw py::value_error("Weights must be a one-dimensional array "
+                                  "of the same size as the input array");
+        }
+        if (weights.get_typenum() != dst.get_typenum()) {
+            throw py::value_error("Weights and destination arrays must have "
+                                  "the same data type");
+        }
+    }
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    if (overlap(x, dst) || (has_weights && overlap(weights, dst))) {
+        throw py::value_error("Arrays index overlapping segments of memory");
+    }
+
+    const std::size_t nbins = dst.get_size();
+    dpctl::tensor::validation::AmpleMemory::throw_if_not_ample(dst, nbins);
+
+    const auto &array_types = td_ns::usm_ndarray_types();
+    const int dst_typeid = array_types.typenum_to_lookup_id(dst.get_typenum());
+    const auto &ctx = exec_q.get_context();
+    auto usm_type = sycl::get_pointer_type(dst.get_data(), ctx);
+    if (!histogram_atomic_support_vector[dst_typeid](exec_q, usm_type)) {
+        throw py::value_error("Atomic operations on the destination array are "
+                              "not supported by the device");
+    }
+
+    return weights;
+}
+
+sycl::usm::alloc usm_type_from_string(const std::string &usm_type)
+{
+    if (usm_type == "device") {
+        return sycl::usm::alloc::device;
+    }
+    else if (usm_type == "shared") {
+        return sycl::usm::alloc::shared;
+    }
+    else if (usm_type == "host") {
+        return sycl::usm::alloc::host;
+    }
+    throw py::value_error("Unrecognized `dst_usm_type` argument.");
+}
+
+} // namespace impl
+
+/*! @brief Counts occurrences of each non-negative integer in `x`, or sums
+ * `weights` of them, writing counts of values `[0, dst.size)` into `dst` */
+std::pair<sycl::event, sycl::event>
+py_bincount(const dpctl::tensor::usm_ndarray &x,
+            const py::object &weights_obj,
+            const dpctl::tensor::usm_ndarray &dst,
+            sycl::queue &exec_q,
+            const std::vector<sycl::event> &depends)
+{
+    const dpctl::tensor::usm_ndarray weights =
+        impl::validate_histogram_args(x, weights_obj, dst, exec_q);
+    const bool has_weights = !weights_obj.is_none();
+
+    const std::size_t nbins = dst.get_size();
+    if (nbins == 0) {
+        return std::make_pair(sycl::event(), sycl::event());
+    }
+
+    const auto &array_types = td_ns::usm_ndarray_types();
+    const int x_typeid = array_types.typenum_to_lookup_id(x.get_typenum());
+    const int dst_typeid = array_types.typenum_to_lookup_id(dst.get_typenum());
+
+    auto fn = impl::bincount_dispatch_table[x_typeid][dst_typeid];
+    if (fn == nullptr) {
+        throw std::runtime_error("Datatypes are not supported");
+    }
+
+    const std::size_t nelems = x.get_size();
+    const py::ssize_t x_stride = x.get_strides_vector()[0];
+    const py::ssize_t w_stride =
+        (has_weights) ? weights.get_strides_vector()[0] : 0;
+    const char *w_data = (has_weights) ? weights.get_data() : nullptr;
+
+    sycl::event bincount_ev = fn(exec_q, nelems, x.get_data(), x_stride, w_data,
+                                 w_stride, dst.get_data(), nbins, depends);
+
+    sycl::event keep_args_event =
+        dpctl::utils::keep_args_alive(exec_q, {x, weights, dst}, {bincount_ev});
+
+    return std::make_pair(keep_args_event, bincount_ev);
+}
+
+/*! @brief Counts elements of `x`, or sums their `weights`, per bin given
+ * by `bin_edges`. If `uniform_range` is given, bins are of equal width and
+ * bin of an element is computed from its value rather than searched */
+std::pair<sycl::event, sycl::event>
+py_histogram(const dpctl::tensor::usm_ndarray &x,
+             const py::object &weights_obj,
+             const dpctl::tensor::usm_ndarray &bin_edges,
+             const dpctl::tensor::usm_ndarray &dst,
+             std::optional<std::pair<double, double>> uniform_range,
+             sycl::queue &exec_q,
+             const std::vector<sycl::event> &depends)
+{
+    const dpctl::tensor::usm_ndarray weights =
+        impl::validate_histogram_args(x, weights_obj, dst, exec_q);
+    const bool has_weights = !weights_obj.is_none();
+
+    if (!dpctl::utils::queues_are_compatible(exec_q, {bin_edges})) {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+
+    const std::size_t nbins = dst.get_size();
+    if (bin_edges.get_ndim() != 1 ||
+        static_cast<std::size_t>(bin_edges.get_shape(0)) != nbins + 1 ||
+        !bin_edges.is_c_contiguous())
+    {
+        throw py::value_error("Bin edges must be a contiguous one-dimensional "
+                              "array with one more element than the "
+                              "destination array");
+    }
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    if (overlap(bin_edges, dst)) {
+        throw py::value_error("Arrays index overlapping segments of memory");
+    }
+
+    if (nbins == 0) {
+        return std::make_pair(sycl::event(), sycl::event());
+    }
+
+    const auto &array_types = td_ns::usm_ndarray_types();
+    const int x_typeid = array_types.typenum_to_lookup_id(x.get_typenum());
+    const int edges_typeid =
+        array_types.typenum_to_lookup_id(bin_edges.get_typenum());
+    const int dst_typeid = array_types.typenum_to_lookup_id(dst.get_typenum());
+
+    impl::histogram_impl_fn_ptr_t fn = nullptr;
+    if (edges_typeid == static_cast<int>(td_ns::typenum_t::FLOAT)) {
+        fn = impl::histogram_float_edges_dispatch_table[x_typeid][dst_typeid];
+    }
+    else if (edges_typeid == static_cast<int>(td_ns::typenum_t::DOUBLE)) {
+        fn = impl::histogram_double_edges_dispatch_table[x_typeid][dst_typeid];
+    }
+    if (fn == nullptr) {
+        throw std::runtime_error("Datatypes are not supported");
+    }
+
+    const bool uniform = uniform_range.has_value();
+    double first_edge(0);
+    double last_edge(1);
+    if (uniform) {
+        first_edge = uniform_range->first;
+        last_edge = uniform_range->second;
+        if (!(first_edge < last_edge)) {
+            throw py::value_error("Range of uniform bins must be non-empty");
+        }
+    }
+
+    const std::size_t nelems = x.get_size();
+    const py::ssize_t x_stride = x.get_strides_vector()[0];
+    const py::ssize_t w_stride =
+        (has_weights) ? weights.get_strides_vector()[0] : 0;
+    const char *w_data = (has_weights) ? weights.get_data() : nullptr;
+
+    sycl::event histogram_ev =
+        fn(exec_q, nelems, x.get_data(), x_stride, w_data, w_stride,
+           bin_edges.get_data(), dst.get_data(), nbins, uniform, first_edge,
+           last_edge, depends);
+
+    sycl::event keep_args_event = dpctl::utils::keep_args_alive(
+        exec_q, {x, weights, bin_edges, dst}, {histogram_ev});
+
+    return std::make_pair(keep_args_event, histogram_ev);
+}
+
+void init_histogram(py::module_ m)
+{
+    using arrayT = dpctl::tensor::usm_ndarray;
+    using event_vecT = std::vector<sycl::event>;
+    {
+        impl::populate_histogram_dispatch_tables();
+
+        auto bincount_pyapi = [&](const arrayT &x, const py::object &weights,
+                                  const arrayT &dst, sycl::queue &exec_q,
+                                  const event_vecT &depends = {}) {
+            return py_bincount(x, weights, dst, exec_q, depends);
+        };
+        m.def("_bincount", bincount_pyapi, "", py::arg("x"), py::arg("weights"),
+              py::arg("dst"), py::arg("sycl_queue"),
+              py::arg("depends") = py::list());
+
+        auto histogram_pyapi =
+            [&](const arrayT &x, const py::object &weights,
+                const arrayT &bin_edges, const arrayT &dst,
+                std::optional<std::pair<double, double>> uniform_range,
+                sycl::queue &exec_q, const event_vecT &depends = {}) {
+                return py_histogram(x, weights, bin_edges, dst, uniform_range,
+                                    exec_q, depends);
+            };
+        m.def("_histogram", histogram_pyapi, "", py::arg("x"),
+              py::arg("weights"), py::arg("bin_edges"), py::arg("dst"),
+              py::arg("uniform_range"), py::arg("sycl_queue"),
+              py::arg("depends") = py::list());
+
+        auto bincount_dtype_supported = [&](const py::dtype &x_dtype,
+                                            const py::dtype &dst_dtype,
+                                            const std::string &dst_usm_type,
+                                            sycl::queue &q) {
+            const auto &array_types = td_ns::usm_ndarray_types();
+            const int x_typeid =
+                array_types.typenum_to_lookup_id(x_dtype.num());
+            const int dst_typeid =
+                array_types.typenum_to_lookup_id(dst_dtype.num());
+            const sycl::usm::alloc kind =
+                impl::usm_type_from_string(dst_usm_type);
+
+            return (impl::bincount_dispatch_table[x_typeid][dst_typeid] !=
+                    nullptr) &&
+                   impl::histogram_atomic_support_vector[dst_typeid](q, kind);
+        };
+        m.def("_bincount_dtype_supported", bincount_dtype_supported, "",
+              py::arg("x_dtype"), py::arg("dst_dtype"), py::arg("dst_usm_type"),
+              py::arg("sycl_queue"));
+
+        auto histogram_dtype_supported = [&](const py::dtype &x_dtype,
+                                             const py::dtype &edges_dtype,
+                                             const py::dtype &dst_dtype,
+                                             const std::string &dst_usm_type,
+                                             sycl::queue &q) {
+            const auto &array_types = td_ns::usm_ndarray_types();
+            const int x_typeid =
+                array_types.typenum_to_lookup_id(x_dtype.num());
+            const int edges_typeid =
+                array_types.typenum_to_lookup_id(edges_dtype.num());
+            const int dst_typeid =
+                array_types.typenum_to_lookup_id(dst_dtype.num());
+            const sycl::usm::alloc kind =
+                impl::usm_type_from_string(dst_usm_type);
+
+            impl::histogram_impl_fn_ptr_t fn = nullptr;
+            if (edges_typeid == static_cast<int>(td_ns::typenum_t::FLOAT)) {
+                fn = impl::histogram_float_edges_dispatch_table[x_typeid]
+                                                               [dst_typeid];
+            }
+            else if (edges_typeid == static_cast<int>(td_ns::typenum_t::DOUBLE))
+            {
+                fn = impl::histogram_double_edges_dispatch_table[x_typeid]
+                                                                [dst_typeid];
+            }
+            return (fn != nullptr) &&
+                   impl::histogram_atomic_support_vector[dst_typeid](q, kind);
+        };
+        m.def("_histogram_dtype_supported", histogram_dtype_supported, "",
+              py::arg("x_dtype"), py::arg("edges_dtype"), py::arg("dst_dtype"),
+              py::arg("dst_usm_type"), py::arg("sycl_queue"));
+    }
+}
+
+} // namespace py_internal
+} // namespace tensor
+} // namespace dpctl
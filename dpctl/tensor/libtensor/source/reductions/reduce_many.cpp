@@ -0,0 +1,428 @@
+//===-- ------------ Implementation of _tensor_impl module  ----*-C++-*-/===//
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===--------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines functions of dpctl.tensor._tensor_impl extensions
+//===--------------------------------------------------------------------===//
+
+#include "dpctl4pybind11.hpp"
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <stdexcept>
+#include <sycl/sycl.hpp>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#include "kernels/reduce_many.hpp"
+#include "reduction_over_axis.hpp"
+#include "simplify_iteration_space.hpp"
+#include "utils/memory_overlap.hpp"
+#include "utils/offset_utils.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/sycl_alloc_utils.hpp"
+#include "utils/type_dispatch.hpp"
+#include "utils/type_dispatch_building.hpp"
+
+namespace py = pybind11;
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace py_internal
+{
+
+namespace td_ns = dpctl::tensor::type_dispatch;
+
+namespace impl
+{
+
+using dpctl::tensor::kernels::reduce_many::reduce_many_strided_impl_fn_ptr;
+static reduce_many_strided_impl_fn_ptr
+    reduce_many_over_axis_strided_dispatch_table[td_ns::num_types]
+                                                [td_ns::num_types];
+
+template <typename argTy, typename sumTy>
+struct TypePairSupportDataForReduceMany
+{
+
+    static constexpr bool is_defined = std::disjunction<
+        td_ns::TypePairDefinedEntry<argTy, bool, sumTy, std::int64_t>,
+
+        // signed integral inputs
+        td_ns::TypePairDefinedEntry<argTy, std::int8_t, sumTy, std::int64_t>,
+        td_ns::TypePairDefinedEntry<argTy, std::int16_t, sumTy, std::int64_t>,
+        td_ns::TypePairDefinedEntry<argTy, std::int32_t, sumTy, std::int64_t>,
+        td_ns::TypePairDefinedEntry<argTy, std::int64_t, sumTy, std::int64_t>,
+
+        // unsigned integral inputs
+        td_ns::TypePairDefinedEntry<argTy, std::uint8_t, sumTy, std::uint64_t>,
+        td_ns::TypePairDefinedEntry<argTy, std::uint16_t, sumTy, std::uint64_t>,
+        td_ns::TypePairDefinedEntry<argTy, std::uint32_t, sumTy, std::uint64_t>,
+        td_ns::TypePairDefinedEntry<argTy, std::uint64_t, sumTy, std::uint64_t>,
+
+        // real floating point inputs
+        td_ns::TypePairDefinedEntry<argTy, sycl::half, sumTy, sycl::half>,
+        td_ns::TypePairDefinedEntry<argTy, float, sumTy, float>,
+        td_ns::TypePairDefinedEntry<argTy, double, sumTy, double>,
+
+        // fall-through
+        td_ns::NotDefinedEntry>::is_defined;
+};
+
+template <typename fnT, typename srcTy, typename sumTy>
+struct ReduceManyOverAxisStridedFactory
+{
+    fnT get() const
+    {
+        if constexpr (TypePairSupportDataForReduceMany<srcTy,
+                                                       sumTy>::is_defined)
+        {
+            return dpctl::tensor::kernels::reduce_many::
+                reduce_many_over_axis_strided_impl<srcTy, sumTy>;
+        }
+        else {
+            return nullptr;
+        }
+    }
+};
+
+void populate_reduce_many_over_axis_dispatch_tables(void)
+{
+    using namespace td_ns;
+
+    DispatchTableBuilder<reduce_many_strided_impl_fn_ptr,
+                         ReduceManyOverAxisStridedFactory, num_types>
+        dtb1;
+    dtb1.populate_dispatch_table(reduce_many_over_axis_strided_dispatch_table);
+}
+
+} // namespace impl
+
+/*! @brief Computes minimum, maximum, sum, positions of the first minimum
+ * and maximum, and the number of non-zero elements over trailing
+ * dimensions of `src` in a single pass. Statistics whose destination is
+ * `None` are not computed */
+std::pair<sycl::event, sycl::event> py_reduce_many_over_axis(
+    const dpctl::tensor::usm_ndarray &src,
+    int trailing_dims_to_reduce, // comp over this many trailing indexes
+    const py::object &min_dst_obj,
+    const py::object &max_dst_obj,
+    const py::object &sum_dst_obj,
+    const py::object &argmin_dst_obj,
+    const py::object &argmax_dst_obj,
+    const py::object &count_nonzero_dst_obj,
+    sycl::queue &exec_q,
+    const std::vector<sycl::event> &depends)
+{
+    int src_nd = src.get_ndim();
+    int iteration_nd = src_nd - trailing_dims_to_reduce;
+    if (trailing_dims_to_reduce <= 0 || iteration_nd < 0) {
+        throw py::value_error("Trailing_dim_to_reduce must be positive, but no "
+                              "greater than rank of the array being reduced");
+    }
+
+    using arrayT = dpctl::tensor::usm_ndarray;
+    std::vector<arrayT> dsts;
+    dsts.reserve(6);
+    auto get_dst = [&dsts](const py::object &obj) -> char * {
+        if (obj.is_none()) {
+            return nullptr;
+        }
+        dsts.push_back(obj.cast<arrayT>());
+        return dsts.back().get_data();
+    };
+    char *min_data = get_dst(min_dst_obj);
+    char *max_data = get_dst(max_dst_obj);
+    char *sum_data = get_dst(sum_dst_obj);
+    char *argmin_data = get_dst(argmin_dst_obj);
+    char *argmax_data = get_dst(argmax_dst_obj);
+    char *count_nonzero_data = get_dst(count_nonzero_dst_obj);
+
+    if (dsts.empty()) {
+        throw py::value_error("At least one destination array is required");
+    }
+    // validation of shapes and strides is relative to the first destination
+    const arrayT &ref_dst = dsts.front();
+
+    int dst_nd = ref_dst.get_ndim();
+    if (dst_nd != iteration_nd) {
+        throw py::value_error("Destination array rank does not match input "
+                              "array rank and number of reduced dimensions");
+    }
+
+    const py::ssize_t *src_shape_ptr = src.get_shape_raw();
+    auto const &dst_strides_vecs = ref_dst.get_strides_vector();
+
+    for (const auto &dst : dsts) {
+        if (dst.get_ndim() != dst_nd) {
+            throw py::value_error("Destination arrays must have the same rank");
+        }
+        const py::ssize_t *dst_shape_ptr = dst.get_shape_raw();
+        bool same_shapes = true;
+        for (int i = 0; same_shapes && (i < dst_nd); ++i) {
+            same_shapes = same_shapes && (src_shape_ptr[i] == dst_shape_ptr[i]);
+        }
+        if (!same_shapes) {
+            throw py::value_error("Destination shape does not match unreduced "
+                                  "dimensions of the input shape");
+        }
+        if (dst.get_strides_vector() != dst_strides_vecs) {
+            throw py::value_error(
+                "Destination arrays must have the same strides");
+        }
+    }
+
+    if (!dpctl::utils::queues_are_compatible(exec_q, {src})) {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+    for (const auto &dst : dsts) {
+        if (!dpctl::utils::queues_are_compatible(exec_q, {dst})) {
+            throw py::value_error(
+                "Execution queue is not compatible with allocation queues");
+        }
+    }
+
+    for (const auto &dst : dsts) {
+        dpctl::tensor::validation::CheckWritable::throw_if_not_writable(dst);
+    }
+
+    std::size_t dst_nelems = ref_dst.get_size();
+
+    if (dst_nelems == 0) {
+        return std::make_pair(sycl::event(), sycl::event());
+    }
+
+    std::size_t reduction_nelems(1);
+    for (int i = dst_nd; i < src_nd; ++i) {
+        reduction_nelems *= static_cast<std::size_t>(src_shape_ptr[i]);
+    }
+
+    // check that destinations and src do not overlap
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    for (std::size_t i = 0; i < dsts.size(); ++i) {
+        if (overlap(src, dsts[i])) {
+            throw py::value_error(
+                "Arrays index overlapping segments of memory");
+        }
+        for (std::size_t j = i + 1; j < dsts.size(); ++j) {
+            if (overlap(dsts[i], dsts[j])) {
+                throw py::value_error(
+                    "Arrays index overlapping segments of memory");
+            }
+        }
+    }
+
+    for (const auto &dst : dsts) {
+        dpctl::tensor::validation::AmpleMemory::throw_if_not_ample(dst,
+                                                                   dst_nelems);
+    }
+
+    const auto &array_types = td_ns::usm_ndarray_types();
+    int src_typeid = array_types.typenum_to_lookup_id(src.get_typenum());
+    auto typeid_of = [&array_types](const py::object &obj) {
+        return array_types.typenum_to_lookup_id(
+            obj.cast<arrayT>().get_typenum());
+    };
+
+    if ((!min_dst_obj.is_none() && typeid_of(min_dst_obj) != src_typeid) ||
+        (!max_dst_obj.is_none() && typeid_of(max_dst_obj) != src_typeid))
+    {
+        throw py::value_error("Destination arrays for minimum and maximum "
+                              "must have the data type of the input");
+    }
+
+    constexpr int int64_typeid = static_cast<int>(td_ns::typenum_t::INT64);
+    for (const py::object *obj :
+         {&argmin_dst_obj, &argmax_dst_obj, &count_nonzero_dst_obj})
+    {
+        if (!obj->is_none() && typeid_of(*obj) != int64_typeid) {
+            throw py::value_error("Destination arrays for indices and counts "
+                                  "must have int64 data type");
+        }
+    }
+
+    const auto &fns =
+        impl::reduce_many_over_axis_strided_dispatch_table[src_typeid];
+    impl::reduce_many_strided_impl_fn_ptr fn = nullptr;
+    if (!sum_dst_obj.is_none()) {
+        fn = fns[typeid_of(sum_dst_obj)];
+    }
+    else {
+        // sum is not computed, any accumulation type supported for the
+        // input selects the kernel
+        for (int i = 0; fn == nullptr && i < td_ns::num_types; ++i) {
+            fn = fns[i];
+        }
+    }
+    if (fn == nullptr) {
+        throw std::runtime_error("Datatypes are not supported");
+    }
+
+    using dpctl::tensor::py_internal::compact_iteration_space;
+    using dpctl::tensor::py_internal::simplify_iteration_space;
+
+    auto const &src_strides_vecs = src.get_strides_vector();
+
+    int reduction_nd = trailing_dims_to_reduce;
+    const py::ssize_t *reduction_shape_ptr = src_shape_ptr + dst_nd;
+    using shT = std::vector<py::ssize_t>;
+    shT reduction_src_strides(std::begin(src_strides_vecs) + dst_nd,
+                              std::end(src_strides_vecs));
+
+    // positions of extrema refer to C-ordered reduced dimensions, so the
+    // reduction space is only compacted, never permuted
+    shT compact_reduction_shape;
+    shT compact_reduction_src_strides;
+    py::ssize_t reduction_src_offset(0);
+
+    compact_iteration_space(
+        reduction_nd, reduction_shape_ptr, reduction_src_strides,
+        // output
+        compact_reduction_shape, compact_reduction_src_strides);
+
+    const py::ssize_t *iteration_shape_ptr = src_shape_ptr;
+
+    shT iteration_src_strides(std::begin(src_strides_vecs),
+                              std::begin(src_strides_vecs) + iteration_nd);
+    shT const &iteration_dst_strides = dst_strides_vecs;
+
+    shT simplified_iteration_shape;
+    shT simplified_iteration_src_strides;
+    shT simplified_iteration_dst_strides;
+    py::ssize_t iteration_src_offset(0);
+    py::ssize_t iteration_dst_offset(0);
+
+    if (iteration_nd == 0) {
+        if (dst_nelems != 1) {
+            throw std::runtime_error("iteration_nd == 0, but dst_nelems != 1");
+        }
+        iteration_nd = 1;
+        simplified_iteration_shape.push_back(1);
+        simplified_iteration_src_strides.push_back(0);
+        simplified_iteration_dst_strides.push_back(0);
+    }
+    else {
+        simplify_iteration_space(iteration_nd, iteration_shape_ptr,
+                                 iteration_src_strides, iteration_dst_strides,
+                                 // output
+                                 simplified_iteration_shape,
+                                 simplified_iteration_src_strides,
+                                 simplified_iteration_dst_strides,
+                                 iteration_src_offset, iteration_dst_offset);
+    }
+
+    std::vector<sycl::event> host_task_events{};
+    using dpctl::tensor::offset_utils::device_allocate_and_pack;
+    auto arrays_metainfo_packing_triple_ =
+        device_allocate_and_pack<py::ssize_t>(
+            exec_q, host_task_events,
+            // iteration metadata
+            simplified_iteration_shape, simplified_iteration_src_strides,
+            simplified_iteration_dst_strides,
+            // reduction metadata
+            compact_reduction_shape, compact_reduction_src_strides);
+    auto tmp_owner = std::move(std::get<0>(arrays_metainfo_packing_triple_));
+    const auto &copy_metadata_ev = std::get<2>(arrays_metainfo_packing_triple_);
+    const py::ssize_t *temp_allocation_ptr = tmp_owner.get();
+
+    const py::ssize_t *iter_shape_and_strides = temp_allocation_ptr;
+    const py::ssize_t *reduction_shape_stride =
+        temp_allocation_ptr + 3 * simplified_iteration_shape.size();
+
+    std::vector<sycl::event> all_deps;
+    all_deps.reserve(depends.size() + 1);
+    all_deps.resize(depends.size());
+    std::copy(depends.begin(), depends.end(), all_deps.begin());
+    all_deps.push_back(copy_metadata_ev);
+
+    auto reduce_many_ev =
+        fn(exec_q, dst_nelems, reduction_nelems, src.get_data(), min_data,
+           max_data, sum_data, argmin_data, argmax_data, count_nonzero_data,
+           iteration_nd, iter_shape_and_strides, iteration_src_offset,
+           iteration_dst_offset,
+           reduction_nd, // number dimensions being reduced
+           reduction_shape_stride, reduction_src_offset, all_deps);
+
+    sycl::event temp_cleanup_ev = dpctl::tensor::alloc_utils::async_smart_free(
+        exec_q, {reduce_many_ev}, tmp_owner);
+    host_task_events.push_back(temp_cleanup_ev);
+
+    sycl::event keep_args_event = dpctl::utils::keep_args_alive(
+        exec_q,
+        {src, min_dst_obj, max_dst_obj, sum_dst_obj, argmin_dst_obj,
+         argmax_dst_obj, count_nonzero_dst_obj},
+        host_task_events);
+
+    return std::make_pair(keep_args_event, reduce_many_ev);
+}
+
+void init_reduce_many(py::module_ m)
+{
+    using arrayT = dpctl::tensor::usm_ndarray;
+    using event_vecT = std::vector<sycl::event>;
+    {
+        using impl::populate_reduce_many_over_axis_dispatch_tables;
+        populate_reduce_many_over_axis_dispatch_tables();
+        using impl::reduce_many_over_axis_strided_dispatch_table;
+
+        auto reduce_many_pyapi =
+            [&](const arrayT &src, int trailing_dims_to_reduce,
+                const py::object &min_dst, const py::object &max_dst,
+                const py::object &sum_dst, const py::object &argmin_dst,
+                const py::object &argmax_dst,
+                const py::object &count_nonzero_dst, sycl::queue &exec_q,
+                const event_vecT &depends = {}) {
+                return py_reduce_many_over_axis(
+                    src, trailing_dims_to_reduce, min_dst, max_dst, sum_dst,
+                    argmin_dst, argmax_dst, count_nonzero_dst, exec_q, depends);
+            };
+        m.def("_reduce_many_over_axis", reduce_many_pyapi,
+              "Computes statistics of `src` over its trailing dimensions in "
+              "a single pass. Statistics whose destination is `None` are not "
+              "computed.",
+              py::arg("src"), py::arg("trailing_dims_to_reduce"),
+              py::arg("min_dst"), py::arg("max_dst"), py::arg("sum_dst"),
+              py::arg("argmin_dst"), py::arg("argmax_dst"),
+              py::arg("count_nonzero_dst"), py::arg("sycl_queue"),
+              py::arg("depends") = py::list());
+
+        auto reduce_many_dtype_supported = [&](const py::dtype &input_dtype,
+                                               const py::dtype &sum_dtype) {
+            using dpctl::tensor::py_internal::py_tree_reduction_dtype_supported;
+            return py_tree_reduction_dtype_supported(
+                input_dtype, sum_dtype,
+                reduce_many_over_axis_strided_dispatch_table);
+        };
+        m.def("_reduce_many_over_axis_dtype_supported",
+              reduce_many_dtype_supported, "", py::arg("arg_dtype"),
+              py::arg("sum_dtype"));
+    }
+}
+
+} // namespace py_internal
+} // namespace tensor
+} // namespace dpctl
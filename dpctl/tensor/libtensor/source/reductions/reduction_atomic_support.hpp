@@ -134,6 +134,13 @@ struct ProductAtomicSupportFactory
 {
 };
 
+template <typename fnT, typename T> struct HistogramAtomicSupportFactory
+{
+    // bins are accumulated with atomics regardless of the data type, order
+    // of accumulation of floating point weights is unspecified
+    fnT get() { return check_atomic_support<T>; }
+};
+
 } // namespace atomic_support
 } // namespace py_internal
 } // namespace tensor
@@ -28,11 +28,14 @@
 #include "any.hpp"
 #include "argmax.hpp"
 #include "argmin.hpp"
+#include "histogram.hpp"
 #include "logsumexp.hpp"
 #include "max.hpp"
+#include "mean_var.hpp"
 #include "min.hpp"
 #include "prod.hpp"
 #include "reduce_hypot.hpp"
+#include "reduce_many.hpp"
 #include "sum.hpp"
 
 namespace py = pybind11;
@@ -51,11 +54,14 @@ void init_reduction_functions(py::module_ m)
     init_any(m);
     init_argmax(m);
     init_argmin(m);
+    init_histogram(m);
     init_logsumexp(m);
     init_max(m);
+    init_mean_var(m);
     init_min(m);
     init_prod(m);
     init_reduce_hypot(m);
+    init_reduce_many(m);
     init_sum(m);
 }
 
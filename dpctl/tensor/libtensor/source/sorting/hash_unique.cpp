@@ -0,0 +1,178 @@
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===--------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines functions of dpctl.tensor._tensor_sorting_impl
+/// extension.
+//===--------------------------------------------------------------------===//
+
+#include <cstddef>
+#include <cstdint>
+#include <utility>
+#include <vector>
+
+#include <sycl/sycl.hpp>
+
+#include "dpctl4pybind11.hpp"
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "kernels/sorting/hash_unique.hpp"
+#include "utils/memory_overlap.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/type_dispatch.hpp"
+
+#include "hash_unique.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace py_internal
+{
+
+namespace td_ns = dpctl::tensor::type_dispatch;
+
+using dpctl::tensor::kernels::hash_unique_insert_fn_ptr_t;
+static hash_unique_insert_fn_ptr_t
+    hash_unique_insert_dispatch_vector[td_ns::num_types];
+
+std::pair<sycl::event, sycl::event>
+py_hash_unique_insert(const dpctl::tensor::usm_ndarray &src,
+                      const dpctl::tensor::usm_ndarray &keys,
+                      const dpctl::tensor::usm_ndarray &counts,
+                      const dpctl::tensor::usm_ndarray &first_indices,
+                      const dpctl::tensor::usm_ndarray &overflow,
+                      sycl::queue &exec_q,
+                      const std::vector<sycl::event> &depends)
+{
+    if (src.get_ndim() != 1 || !src.is_c_contiguous()) {
+        throw py::value_error("Input array must be a C-contiguous vector");
+    }
+
+    for (const auto &tbl : {keys, counts, first_indices, overflow}) {
+        if (tbl.get_ndim() != 1 || !tbl.is_c_contiguous()) {
+            throw py::value_error(
+                "Hash table arrays must be C-contiguous vectors");
+        }
+    }
+
+    const py::ssize_t table_sz = keys.get_shape(0);
+    if (table_sz < 2 || counts.get_shape(0) != table_sz ||
+        first_indices.get_shape(0) != table_sz)
+    {
+        throw py::value_error("Hash table arrays must have the same size, "
+                              "exceeding the number of slots by one");
+    }
+
+    // number of slots must be a power of two
+    const std::size_t capacity = static_cast<std::size_t>(table_sz - 1);
+    if ((capacity & (capacity - 1)) != 0) {
+        throw py::value_error("Number of slots of hash table must be a power "
+                              "of two");
+    }
+
+    if (overflow.get_size() < 1) {
+        throw py::value_error("Overflow array must not be empty");
+    }
+
+    if (!dpctl::utils::queues_are_compatible(
+            exec_q, {src, keys, counts, first_indices, overflow}))
+    {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(keys);
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(counts);
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(
+        first_indices);
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(overflow);
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    if (overlap(src, keys) || overlap(src, counts) ||
+        overlap(src, first_indices) || overlap(src, overflow))
+    {
+        throw py::value_error("Arrays index overlapping segments of memory");
+    }
+
+    const auto &array_types = td_ns::usm_ndarray_types();
+    int src_typeid = array_types.typenum_to_lookup_id(src.get_typenum());
+    int keys_typeid = array_types.typenum_to_lookup_id(keys.get_typenum());
+    int counts_typeid = array_types.typenum_to_lookup_id(counts.get_typenum());
+    int first_typeid =
+        array_types.typenum_to_lookup_id(first_indices.get_typenum());
+    int overflow_typeid =
+        array_types.typenum_to_lookup_id(overflow.get_typenum());
+
+    constexpr int uint64_typeid = static_cast<int>(td_ns::typenum_t::UINT64);
+    constexpr int int64_typeid = static_cast<int>(td_ns::typenum_t::INT64);
+    if (keys_typeid != uint64_typeid) {
+        throw py::value_error("Keys array must have data type uint64");
+    }
+    if (counts_typeid != int64_typeid || first_typeid != int64_typeid ||
+        overflow_typeid != int64_typeid)
+    {
+        throw py::value_error("Counts, first indices and overflow arrays "
+                              "must have data type int64");
+    }
+
+    auto fn = hash_unique_insert_dispatch_vector[src_typeid];
+    if (fn == nullptr) {
+        throw py::value_error("Hash-based unique is only implemented for "
+                              "boolean and integral data types");
+    }
+
+    const std::size_t n = static_cast<std::size_t>(src.get_size());
+    if (n == 0) {
+        return std::make_pair(sycl::event(), sycl::event());
+    }
+
+    sycl::event comp_ev = fn(
+        exec_q, n, capacity, src.get_data(), keys.get_data(), counts.get_data(),
+        first_indices.get_data(), overflow.get_data(), depends);
+
+    sycl::event keep_args_alive_ev = dpctl::utils::keep_args_alive(
+        exec_q, {src, keys, counts, first_indices, overflow}, {comp_ev});
+
+    return std::make_pair(keep_args_alive_ev, comp_ev);
+}
+
+void init_hash_unique_dispatch_vectors(void)
+{
+    using dpctl::tensor::kernels::HashUniqueInsertFactory;
+    td_ns::DispatchVectorBuilder<hash_unique_insert_fn_ptr_t,
+                                 HashUniqueInsertFactory, td_ns::num_types>
+        dvb;
+    dvb.populate_dispatch_vector(hash_unique_insert_dispatch_vector);
+}
+
+void init_hash_unique_functions(py::module_ m)
+{
+    dpctl::tensor::py_internal::init_hash_unique_dispatch_vectors();
+
+    m.def("_hash_unique_insert", &py_hash_unique_insert, py::arg("src"),
+          py::arg("keys"), py::arg("counts"), py::arg("first_indices"),
+          py::arg("overflow"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+}
+
+} // end of namespace py_internal
+} // end of namespace tensor
+} // end of namespace dpctl
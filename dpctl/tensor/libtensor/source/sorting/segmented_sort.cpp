@@ -0,0 +1,279 @@
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===--------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines functions of dpctl.tensor._tensor_sorting_impl
+/// extension.
+//===--------------------------------------------------------------------===//
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#include <sycl/sycl.hpp>
+
+#include "dpctl4pybind11.hpp"
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "kernels/sorting/segmented_sort.hpp"
+#include "utils/memory_overlap.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/type_dispatch.hpp"
+
+#include "rich_comparisons.hpp"
+#include "segmented_sort.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace py_internal
+{
+
+namespace td_ns = dpctl::tensor::type_dispatch;
+
+using dpctl::tensor::kernels::segmented_sort_fn_ptr_t;
+static segmented_sort_fn_ptr_t
+    ascending_segmented_sort_dispatch_vector[td_ns::num_types];
+static segmented_sort_fn_ptr_t
+    descending_segmented_sort_dispatch_vector[td_ns::num_types];
+static segmented_sort_fn_ptr_t
+    ascending_segmented_argsort_dispatch_vector[td_ns::num_types];
+static segmented_sort_fn_ptr_t
+    descending_segmented_argsort_dispatch_vector[td_ns::num_types];
+
+template <typename fnT, typename argTy> struct AscendingSegmentedSortFactory
+{
+    fnT get()
+    {
+        using Comp = typename AscendingSorter<argTy>::type;
+
+        using dpctl::tensor::kernels::segmented_sort_impl;
+        return segmented_sort_impl<argTy, Comp>;
+    }
+};
+
+template <typename fnT, typename argTy> struct DescendingSegmentedSortFactory
+{
+    fnT get()
+    {
+        using Comp = typename DescendingSorter<argTy>::type;
+
+        using dpctl::tensor::kernels::segmented_sort_impl;
+        return segmented_sort_impl<argTy, Comp>;
+    }
+};
+
+template <typename fnT, typename argTy> struct AscendingSegmentedArgSortFactory
+{
+    fnT get()
+    {
+        using Comp = typename AscendingSorter<argTy>::type;
+
+        using dpctl::tensor::kernels::segmented_argsort_impl;
+        return segmented_argsort_impl<argTy, std::int64_t, Comp>;
+    }
+};
+
+template <typename fnT, typename argTy> struct DescendingSegmentedArgSortFactory
+{
+    fnT get()
+    {
+        using Comp = typename DescendingSorter<argTy>::type;
+
+        using dpctl::tensor::kernels::segmented_argsort_impl;
+        return segmented_argsort_impl<argTy, std::int64_t, Comp>;
+    }
+};
+
+std::pair<sycl::event, sycl::event>
+py_segmented_sort(const dpctl::tensor::usm_ndarray &src,
+                  const dpctl::tensor::usm_ndarray &offsets,
+                  const py::ssize_t max_segment_size,
+                  const dpctl::tensor::usm_ndarray &dst,
+                  const bool sort_indices,
+                  sycl::queue &exec_q,
+                  const std::vector<sycl::event> &depends,
+                  const segmented_sort_fn_ptr_t *sort_values_fns,
+                  const segmented_sort_fn_ptr_t *sort_indices_fns)
+{
+    if (src.get_ndim() != 1 || !src.is_c_contiguous()) {
+        throw py::value_error("Input array must be a C-contiguous vector");
+    }
+    if (dst.get_ndim() != 1 || !dst.is_c_contiguous()) {
+        throw py::value_error("Output array must be a C-contiguous vector");
+    }
+    if (offsets.get_ndim() != 1 || !offsets.is_c_contiguous()) {
+        throw py::value_error("Offsets array must be a C-contiguous vector");
+    }
+
+    const py::ssize_t n = src.get_shape(0);
+    if (dst.get_shape(0) != n) {
+        throw py::value_error(
+            "Input and output arrays must have the same size");
+    }
+
+    using dpctl::tensor::kernels::small_segments_sort_threshold;
+    if (max_segment_size < 0 || static_cast<std::size_t>(max_segment_size) >
+                                    small_segments_sort_threshold)
+    {
+        throw py::value_error("Size of segments must not exceed " +
+                              std::to_string(small_segments_sort_threshold));
+    }
+
+    if (!dpctl::utils::queues_are_compatible(exec_q, {src, offsets, dst})) {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(dst);
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    if (overlap(src, dst) || overlap(offsets, dst)) {
+        throw py::value_error("Arrays index overlapping segments of memory");
+    }
+
+    const auto &array_types = td_ns::usm_ndarray_types();
+    const int src_typeid = array_types.typenum_to_lookup_id(src.get_typenum());
+    const int dst_typeid = array_types.typenum_to_lookup_id(dst.get_typenum());
+    const int offsets_typeid =
+        array_types.typenum_to_lookup_id(offsets.get_typenum());
+
+    constexpr int int64_typeid = static_cast<int>(td_ns::typenum_t::INT64);
+    if (offsets_typeid != int64_typeid) {
+        throw py::value_error("Offsets array must have data type int64");
+    }
+
+    segmented_sort_fn_ptr_t fn = nullptr;
+    if (sort_indices) {
+        if (dst_typeid != int64_typeid) {
+            throw py::value_error("Output array must have data type int64");
+        }
+        fn = sort_indices_fns[src_typeid];
+    }
+    else {
+        if (dst_typeid != src_typeid) {
+            throw py::value_error(
+                "Input and output arrays must have the same data type");
+        }
+        fn = sort_values_fns[src_typeid];
+    }
+    if (fn == nullptr) {
+        throw py::value_error("Segmented sort is not implemented for "
+                              "the data type of the input array");
+    }
+
+    const py::ssize_t n_offsets = offsets.get_shape(0);
+    if (n == 0 || n_offsets < 2) {
+        return std::make_pair(sycl::event(), sycl::event());
+    }
+    const std::size_t n_segments = static_cast<std::size_t>(n_offsets - 1);
+
+    using dpctl::tensor::kernels::segmented_sort_detail::padded_segment_length;
+    const std::size_t padded_len =
+        padded_segment_length(static_cast<std::size_t>(max_segment_size));
+
+    sycl::event comp_ev = fn(exec_q, n_segments, padded_len, src.get_data(),
+                             offsets.get_data(), dst.get_data(), depends);
+
+    sycl::event keep_args_alive_ev =
+        dpctl::utils::keep_args_alive(exec_q, {src, offsets, dst}, {comp_ev});
+
+    return std::make_pair(keep_args_alive_ev, comp_ev);
+}
+
+void init_segmented_sort_dispatch_vectors(void)
+{
+    td_ns::DispatchVectorBuilder<segmented_sort_fn_ptr_t,
+                                 AscendingSegmentedSortFactory,
+                                 td_ns::num_types>
+        dvb1;
+    dvb1.populate_dispatch_vector(ascending_segmented_sort_dispatch_vector);
+
+    td_ns::DispatchVectorBuilder<segmented_sort_fn_ptr_t,
+                                 DescendingSegmentedSortFactory,
+                                 td_ns::num_types>
+        dvb2;
+    dvb2.populate_dispatch_vector(descending_segmented_sort_dispatch_vector);
+
+    td_ns::DispatchVectorBuilder<segmented_sort_fn_ptr_t,
+                                 AscendingSegmentedArgSortFactory,
+                                 td_ns::num_types>
+        dvb3;
+    dvb3.populate_dispatch_vector(ascending_segmented_argsort_dispatch_vector);
+
+    td_ns::DispatchVectorBuilder<segmented_sort_fn_ptr_t,
+                                 DescendingSegmentedArgSortFactory,
+                                 td_ns::num_types>
+        dvb4;
+    dvb4.populate_dispatch_vector(descending_segmented_argsort_dispatch_vector);
+}
+
+void init_segmented_sort_functions(py::module_ m)
+{
+    dpctl::tensor::py_internal::init_segmented_sort_dispatch_vectors();
+
+    auto py_segmented_sort_ascending =
+        [](const dpctl::tensor::usm_ndarray &src,
+           const dpctl::tensor::usm_ndarray &offsets,
+           const py::ssize_t max_segment_size,
+           const dpctl::tensor::usm_ndarray &dst, const bool sort_indices,
+           sycl::queue &exec_q, const std::vector<sycl::event> &depends)
+        -> std::pair<sycl::event, sycl::event> {
+        return py_segmented_sort(src, offsets, max_segment_size, dst,
+                                 sort_indices, exec_q, depends,
+                                 ascending_segmented_sort_dispatch_vector,
+                                 ascending_segmented_argsort_dispatch_vector);
+    };
+    m.def("_segmented_sort_ascending", py_segmented_sort_ascending,
+          py::arg("src"), py::arg("offsets"), py::arg("max_segment_size"),
+          py::arg("dst"), py::arg("sort_indices"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+
+    auto py_segmented_sort_descending =
+        [](const dpctl::tensor::usm_ndarray &src,
+           const dpctl::tensor::usm_ndarray &offsets,
+           const py::ssize_t max_segment_size,
+           const dpctl::tensor::usm_ndarray &dst, const bool sort_indices,
+           sycl::queue &exec_q, const std::vector<sycl::event> &depends)
+        -> std::pair<sycl::event, sycl::event> {
+        return py_segmented_sort(src, offsets, max_segment_size, dst,
+                                 sort_indices, exec_q, depends,
+                                 descending_segmented_sort_dispatch_vector,
+                                 descending_segmented_argsort_dispatch_vector);
+    };
+    m.def("_segmented_sort_descending", py_segmented_sort_descending,
+          py::arg("src"), py::arg("offsets"), py::arg("max_segment_size"),
+          py::arg("dst"), py::arg("sort_indices"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+
+    auto py_segmented_sort_max_segment_size = []() -> std::size_t {
+        return dpctl::tensor::kernels::small_segments_sort_threshold;
+    };
+    m.def("_segmented_sort_max_segment_size",
+          py_segmented_sort_max_segment_size);
+}
+
+} // end of namespace py_internal
+} // end of namespace tensor
+} // end of namespace dpctl
@@ -0,0 +1,252 @@
+//
+//                      Data Parallel Control (dpctl)
+//
+// Copyright 2020-2025 Intel Corporation
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//    http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+//===--------------------------------------------------------------------===//
+///
+/// \file
+/// This file defines functions of dpctl.tensor._tensor_sorting_impl
+/// extension.
+//===--------------------------------------------------------------------===//
+
+#include <cstddef>
+#include <utility>
+#include <vector>
+
+#include <sycl/sycl.hpp>
+
+#include "dpctl4pybind11.hpp"
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "kernels/sorting/sort_by_key.hpp"
+#include "utils/memory_overlap.hpp"
+#include "utils/output_validation.hpp"
+#include "utils/type_dispatch.hpp"
+
+#include "rich_comparisons.hpp"
+#include "sort_by_key.hpp"
+
+namespace dpctl
+{
+namespace tensor
+{
+namespace py_internal
+{
+
+namespace td_ns = dpctl::tensor::type_dispatch;
+
+using dpctl::tensor::kernels::sort_by_key_contig_fn_ptr_t;
+static sort_by_key_contig_fn_ptr_t
+    ascending_sort_by_key_contig_dispatch_table[td_ns::num_types]
+                                               [td_ns::num_types];
+static sort_by_key_contig_fn_ptr_t
+    descending_sort_by_key_contig_dispatch_table[td_ns::num_types]
+                                                [td_ns::num_types];
+
+template <typename fnT, typename KeyT, typename ValT>
+struct AscendingSortByKeyContigFactory
+{
+    fnT get()
+    {
+        using Comp = typename AscendingSorter<KeyT>::type;
+        using dpctl::tensor::kernels::sort_by_key_detail::payload_storage_t;
+        using PayloadT = payload_storage_t<ValT>;
+
+        using dpctl::tensor::kernels::stable_sort_by_key_axis1_contig_impl;
+        return stable_sort_by_key_axis1_contig_impl<KeyT, PayloadT, Comp>;
+    }
+};
+
+template <typename fnT, typename KeyT, typename ValT>
+struct DescendingSortByKeyContigFactory
+{
+    fnT get()
+    {
+        using Comp = typename DescendingSorter<KeyT>::type;
+        using dpctl::tensor::kernels::sort_by_key_detail::payload_storage_t;
+        using PayloadT = payload_storage_t<ValT>;
+
+        using dpctl::tensor::kernels::stable_sort_by_key_axis1_contig_impl;
+        return stable_sort_by_key_axis1_contig_impl<KeyT, PayloadT, Comp>;
+    }
+};
+
+std::pair<sycl::event, sycl::event>
+py_sort_by_key(const dpctl::tensor::usm_ndarray &keys,
+               const dpctl::tensor::usm_ndarray &values,
+               const int trailing_dims_to_sort,
+               const dpctl::tensor::usm_ndarray &keys_dst,
+               const dpctl::tensor::usm_ndarray &values_dst,
+               sycl::queue &exec_q,
+               const std::vector<sycl::event> &depends,
+               const sort_by_key_contig_fn_ptr_t fns[][td_ns::num_types])
+{
+    const int nd = keys.get_ndim();
+    if (values.get_ndim() != nd || keys_dst.get_ndim() != nd ||
+        values_dst.get_ndim() != nd)
+    {
+        throw py::value_error("Keys, values and output arrays must have "
+                              "the same array ranks");
+    }
+    const int iteration_nd = nd - trailing_dims_to_sort;
+    if (trailing_dims_to_sort <= 0 || iteration_nd < 0) {
+        throw py::value_error("Trailing_dim_to_sort must be positive, but no "
+                              "greater than rank of the array being sorted");
+    }
+
+    const py::ssize_t *keys_shape_ptr = keys.get_shape_raw();
+    const py::ssize_t *values_shape_ptr = values.get_shape_raw();
+    const py::ssize_t *keys_dst_shape_ptr = keys_dst.get_shape_raw();
+    const py::ssize_t *values_dst_shape_ptr = values_dst.get_shape_raw();
+
+    bool same_shapes = true;
+    std::size_t iter_nelems(1);
+    std::size_t sort_nelems(1);
+    for (int i = 0; same_shapes && (i < nd); ++i) {
+        const auto sh_i = keys_shape_ptr[i];
+        same_shapes = (sh_i == values_shape_ptr[i]) &&
+                      (sh_i == keys_dst_shape_ptr[i]) &&
+                      (sh_i == values_dst_shape_ptr[i]);
+        if (i < iteration_nd) {
+            iter_nelems *= static_cast<std::size_t>(sh_i);
+        }
+        else {
+            sort_nelems *= static_cast<std::size_t>(sh_i);
+        }
+    }
+
+    if (!same_shapes) {
+        throw py::value_error(
+            "Keys, values and output arrays must have the same shape");
+    }
+
+    if (!dpctl::utils::queues_are_compatible(
+            exec_q, {keys, values, keys_dst, values_dst}))
+    {
+        throw py::value_error(
+            "Execution queue is not compatible with allocation queues");
+    }
+
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(keys_dst);
+    dpctl::tensor::validation::CheckWritable::throw_if_not_writable(values_dst);
+
+    if ((iter_nelems == 0) || (sort_nelems == 0)) {
+        // Nothing to do
+        return std::make_pair(sycl::event(), sycl::event());
+    }
+
+    auto const &overlap = dpctl::tensor::overlap::MemoryOverlap();
+    if (overlap(keys, keys_dst) || overlap(keys, values_dst) ||
+        overlap(values, keys_dst) || overlap(values, values_dst) ||
+        overlap(keys_dst, values_dst))
+    {
+        throw py::value_error("Arrays index overlapping segments of memory");
+    }
+
+    if (!keys.is_c_contiguous() || !values.is_c_contiguous() ||
+        !keys_dst.is_c_contiguous() || !values_dst.is_c_contiguous())
+    {
+        throw py::value_error("All arrays must be C-contiguous");
+    }
+
+    const auto &array_types = td_ns::usm_ndarray_types();
+    const int keys_typeid =
+        array_types.typenum_to_lookup_id(keys.get_typenum());
+    const int values_typeid =
+        array_types.typenum_to_lookup_id(values.get_typenum());
+
+    if (keys_typeid !=
+            array_types.typenum_to_lookup_id(keys_dst.get_typenum()) ||
+        values_typeid !=
+            array_types.typenum_to_lookup_id(values_dst.get_typenum()))
+    {
+        throw py::value_error("Output arrays must have the same data types "
+                              "as keys and values arrays");
+    }
+
+    auto fn = fns[keys_typeid][values_typeid];
+    if (fn == nullptr) {
+        throw py::value_error("Not implemented for the dtypes of input arrays");
+    }
+
+    sycl::event comp_ev =
+        fn(exec_q, iter_nelems, sort_nelems, keys.get_data(), values.get_data(),
+           keys_dst.get_data(), values_dst.get_data(), depends);
+
+    sycl::event keep_args_alive_ev = dpctl::utils::keep_args_alive(
+        exec_q, {keys, values, keys_dst, values_dst}, {comp_ev});
+
+    return std::make_pair(keep_args_alive_ev, comp_ev);
+}
+
+void init_sort_by_key_dispatch_tables(void)
+{
+    td_ns::DispatchTableBuilder<sort_by_key_contig_fn_ptr_t,
+                                AscendingSortByKeyContigFactory,
+                                td_ns::num_types>
+        dtb1;
+    dtb1.populate_dispatch_table(ascending_sort_by_key_contig_dispatch_table);
+
+    td_ns::DispatchTableBuilder<sort_by_key_contig_fn_ptr_t,
+                                DescendingSortByKeyContigFactory,
+                                td_ns::num_types>
+        dtb2;
+    dtb2.populate_dispatch_table(descending_sort_by_key_contig_dispatch_table);
+}
+
+void init_sort_by_key_functions(py::module_ m)
+{
+    dpctl::tensor::py_internal::init_sort_by_key_dispatch_tables();
+
+    auto py_sort_by_key_ascending =
+        [](const dpctl::tensor::usm_ndarray &keys,
+           const dpctl::tensor::usm_ndarray &values,
+           const int trailing_dims_to_sort,
+           const dpctl::tensor::usm_ndarray &keys_dst,
+           const dpctl::tensor::usm_ndarray &values_dst, sycl::queue &exec_q,
+           const std::vector<sycl::event> &depends)
+        -> std::pair<sycl::event, sycl::event> {
+        return py_sort_by_key(keys, values, trailing_dims_to_sort, keys_dst,
+                              values_dst, exec_q, depends,
+                              ascending_sort_by_key_contig_dispatch_table);
+    };
+    m.def("_sort_by_key_ascending", py_sort_by_key_ascending, py::arg("keys"),
+          py::arg("values"), py::arg("trailing_dims_to_sort"),
+          py::arg("keys_dst"), py::arg("values_dst"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+
+    auto py_sort_by_key_descending =
+        [](const dpctl::tensor::usm_ndarray &keys,
+           const dpctl::tensor::usm_ndarray &values,
+           const int trailing_dims_to_sort,
+           const dpctl::tensor::usm_ndarray &keys_dst,
+           const dpctl::tensor::usm_ndarray &values_dst, sycl::queue &exec_q,
+           const std::vector<sycl::event> &depends)
+        -> std::pair<sycl::event, sycl::event> {
+        return py_sort_by_key(keys, values, trailing_dims_to_sort, keys_dst,
+                              values_dst, exec_q, depends,
+                              descending_sort_by_key_contig_dispatch_table);
+    };
+    m.def("_sort_by_key_descending", py_sort_by_key_descending, py::arg("keys"),
+          py::arg("values"), py::arg("trailing_dims_to_sort"),
+          py::arg("keys_dst"), py::arg("values_dst"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+}
+
+} // end of namespace py_internal
+} // end of namespace tensor
+} // end of namespace dpctl
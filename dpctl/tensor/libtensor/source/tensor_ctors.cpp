@@ -106,6 +106,7 @@ using dpctl::tensor::py_internal::usm_ndarray_take;
 
 using dpctl::tensor::py_internal::py_extract;
 using dpctl::tensor::py_internal::py_mask_positions;
+using dpctl::tensor::py_internal::py_mask_positions_async;
 using dpctl::tensor::py_internal::py_nonzero;
 using dpctl::tensor::py_internal::py_place;
 
@@ -406,6 +407,10 @@ PYBIND11_MODULE(_tensor_impl, m)
           py::arg("cumsum"), py::arg("sycl_queue"),
           py::arg("depends") = py::list());
 
+    m.def("_mask_positions_async", &py_mask_positions_async, "",
+          py::arg("mask"), py::arg("cumsum"), py::arg("sycl_queue"),
+          py::arg("depends") = py::list());
+
     m.def("_cumsum_1d", &py_cumsum_1d, "", py::arg("src"), py::arg("cumsum"),
           py::arg("sycl_queue"), py::arg("depends") = py::list());
 
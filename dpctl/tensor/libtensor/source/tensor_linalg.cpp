@@ -24,6 +24,7 @@
 //===----------------------------------------------------------------------===//
 
 #include "linalg_functions/dot.hpp"
+#include "linalg_functions/gemm_epilogue.hpp"
 #include <pybind11/pybind11.h>
 
 namespace py = pybind11;
@@ -31,4 +32,5 @@ namespace py = pybind11;
 PYBIND11_MODULE(_tensor_linalg_impl, m)
 {
     dpctl::tensor::py_internal::init_dot(m);
+    dpctl::tensor::py_internal::init_gemm_epilogue(m);
 }
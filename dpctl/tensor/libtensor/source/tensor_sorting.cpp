@@ -25,11 +25,14 @@
 
 #include <pybind11/pybind11.h>
 
+#include "sorting/hash_unique.hpp"
 #include "sorting/merge_argsort.hpp"
 #include "sorting/merge_sort.hpp"
 #include "sorting/radix_argsort.hpp"
 #include "sorting/radix_sort.hpp"
 #include "sorting/searchsorted.hpp"
+#include "sorting/segmented_sort.hpp"
+#include "sorting/sort_by_key.hpp"
 #include "sorting/topk.hpp"
 
 namespace py = pybind11;
@@ -42,4 +45,7 @@ PYBIND11_MODULE(_tensor_sorting_impl, m)
     dpctl::tensor::py_internal::init_radix_sort_functions(m);
     dpctl::tensor::py_internal::init_radix_argsort_functions(m);
     dpctl::tensor::py_internal::init_topk_functions(m);
+    dpctl::tensor::py_internal::init_hash_unique_functions(m);
+    dpctl::tensor::py_internal::init_segmented_sort_functions(m);
+    dpctl::tensor::py_internal::init_sort_by_key_functions(m);
 }
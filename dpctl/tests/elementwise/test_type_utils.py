@@ -29,6 +29,19 @@ class MockDevice:
     def __init__(self, fp16: bool, fp64: bool):
         self.has_aspect_fp16 = fp16
         self.has_aspect_fp64 = fp64
+        self.capabilities = dpctl.DeviceCapabilities(
+            has_fp16=fp16,
+            has_fp64=fp64,
+            has_atomic64=True,
+            max_work_group_size=256,
+            sub_group_sizes=(16,),
+            local_mem_size=65536,
+            default_fp_type="f8" if fp64 else "f4",
+            default_complex_type="c16" if fp64 else "c8",
+            default_int_type="i8",
+            default_uint_type="u8",
+            default_index_type="i8",
+        )
 
 
 @pytest.mark.parametrize("dtype", _all_dtypes)
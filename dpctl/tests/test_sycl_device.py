@@ -20,6 +20,8 @@
 import pytest
 
 import dpctl
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_impl as ti
 from dpctl import SyclDeviceCreationError
 
 from .helper import get_queue_or_skip
@@ -341,3 +343,36 @@ def test_get_component_devices_from_composite():
             assert d.has_aspect_is_component
             # component devices are root devices
             assert d in devices
+
+
+def test_device_capabilities():
+    try:
+        d = dpctl.SyclDevice()
+    except dpctl.SyclDeviceCreationError:
+        pytest.skip("Could not create default-selected device")
+    caps = d.capabilities
+    assert isinstance(caps, dpctl.DeviceCapabilities)
+    assert caps.has_fp16 == d.has_aspect_fp16
+    assert caps.has_fp64 == d.has_aspect_fp64
+    assert caps.has_atomic64 == d.has_aspect_atomic64
+    assert caps.max_work_group_size == d.max_work_group_size
+    assert caps.sub_group_sizes == tuple(d.sub_group_sizes)
+    assert caps.local_mem_size == d.local_mem_size
+    assert caps.default_fp_type == ("f8" if d.has_aspect_fp64 else "f4")
+    assert caps.default_complex_type == ("c16" if d.has_aspect_fp64 else "c8")
+    # the snapshot is computed once per device
+    assert dpctl.SyclDevice(d).capabilities is caps
+    with pytest.raises(AttributeError):
+        caps.has_fp64 = not caps.has_fp64
+
+
+def test_tensor_device_capabilities():
+    q = get_queue_or_skip()
+    dev = dpt.Device.create_device(q)
+    caps = dev.capabilities
+    assert caps == q.sycl_device.capabilities
+    assert caps.default_fp_type == ti.default_device_fp_type(q)
+    assert caps.default_complex_type == ti.default_device_complex_type(q)
+    assert caps.default_int_type == ti.default_device_int_type(q)
+    assert caps.default_uint_type == ti.default_device_uint_type(q)
+    assert caps.default_index_type == ti.default_device_index_type(q)
@@ -319,3 +319,111 @@ def test_submit_local_accessor_arg():
         2 * lws
     )
     assert dpt.all(x == expected)
+
+
+def _axpy_int_kernel(q):
+    oclSrc = (
+        "kernel void axpy(global int *a, global int *b, global int *c, int d)"
+        "{"
+        "   size_t index = get_global_id(0);"
+        "   c[index] = d * a[index] + b[index];"
+        "}"
+    )
+    prog = dpctl_prog.create_program_from_source(q, oclSrc)
+    return prog.get_sycl_kernel("axpy")
+
+
+def test_kernel_launch():
+    try:
+        q = dpctl.SyclQueue("opencl", property="in_order")
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("OpenCL queue could not be created")
+    krn = _axpy_int_kernel(q)
+    n = 256
+    a = dpt.arange(n, dtype="i4", sycl_queue=q)
+    b = dpt.ones(n, dtype="i4", sycl_queue=q)
+    c = dpt.zeros(n, dtype="i4", sycl_queue=q)
+    c2 = dpt.zeros(n, dtype="i4", sycl_queue=q)
+
+    launch = dpctl.KernelLaunch(
+        q, krn, [a.usm_data, b.usm_data, c.usm_data, ctypes.c_int(2)], [n]
+    )
+    assert launch.sycl_queue == q
+    assert launch.global_range == (n,)
+    assert launch.local_range is None
+    assert len(launch.args) == 4
+    launch.submit_async().wait()
+    a_np = dpt.asnumpy(a)
+    assert np.array_equal(dpt.asnumpy(c), 2 * a_np + 1)
+
+    # update scalar and pointer arguments, and range
+    launch.set_arg(3, 5)
+    launch.set_arg(-2, c2.usm_data)
+    launch.set_range([n], [64])
+    assert launch.local_range == (64,)
+    launch.submit()
+    assert np.array_equal(dpt.asnumpy(c2), 5 * a_np + 1)
+    assert np.array_equal(dpt.asnumpy(c), 2 * a_np + 1)
+
+    with pytest.raises(TypeError):
+        launch.set_arg(3, ctypes.c_double(1))
+    with pytest.raises(TypeError):
+        launch.set_arg(0, 1)
+    with pytest.raises(TypeError):
+        launch.set_arg(3, c.usm_data)
+    with pytest.raises(IndexError):
+        launch.set_arg(4, 1)
+    with pytest.raises(TypeError):
+        dpctl.KernelLaunch(q, krn, [a.usm_data, object()], [n])
+    with pytest.raises(dpctl.SyclKernelInvalidRangeError):
+        dpctl.KernelLaunch(q, krn, [], [1, 1, 1, 1])
+    with pytest.raises(ValueError):
+        dpctl.KernelLaunch(q, krn, [], [n], [1, 1])
+
+
+def test_submit_batch():
+    try:
+        q = dpctl.SyclQueue("opencl", property="in_order")
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("OpenCL queue could not be created")
+    krn = _axpy_int_kernel(q)
+    n = 128
+    a = dpt.arange(n, dtype="i4", sycl_queue=q)
+    b = dpt.ones(n, dtype="i4", sycl_queue=q)
+    outs = [dpt.zeros(n, dtype="i4", sycl_queue=q) for _ in range(3)]
+
+    launch = dpctl.KernelLaunch(
+        q, krn, [a.usm_data, b.usm_data, outs[0].usm_data, ctypes.c_int(1)], [n]
+    )
+    evs = q.submit_batch(
+        [
+            launch,
+            (
+                krn,
+                [a.usm_data, b.usm_data, outs[1].usm_data, ctypes.c_int(2)],
+                [n],
+            ),
+            (
+                krn,
+                [a.usm_data, b.usm_data, outs[2].usm_data, ctypes.c_int(3)],
+                [n],
+                [32],
+            ),
+        ],
+        dEvents=[dpctl.SyclEvent()],
+    )
+    assert len(evs) == 3
+    assert all(isinstance(e, dpctl.SyclEvent) for e in evs)
+    dpctl.SyclEvent.wait_for(evs)
+    a_np = dpt.asnumpy(a)
+    for i, out in enumerate(outs):
+        assert np.array_equal(dpt.asnumpy(out), (i + 1) * a_np + 1)
+
+    assert q.submit_batch([]) == []
+    with pytest.raises(TypeError):
+        q.submit_batch([krn])
+    with pytest.raises(TypeError):
+        q.submit_batch([launch], dEvents=[object()])
+    q2 = dpctl.SyclQueue(q.sycl_context, q.sycl_device)
+    with pytest.raises(ValueError):
+        q2.submit_batch([launch])
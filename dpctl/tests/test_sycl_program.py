@@ -263,3 +263,82 @@ def test_create_program_from_invalid_src_ocl():
     }"
     with pytest.raises(dpctl_prog.SyclProgramCompilationError):
         dpctl_prog.create_program_from_source(q, invalid_oclSrc)
+
+
+def test_program_cache_memo():
+    try:
+        q = dpctl.SyclQueue("opencl")
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("No OpenCL queue is available")
+    oclSrc = "                                                             \
+    kernel void add(global int* a, global int* b, global int* c) {         \
+        size_t index = get_global_id(0);                                   \
+        c[index] = a[index] + b[index];                                    \
+    }"
+    prog1 = dpctl_prog.create_program_from_source(q, oclSrc)
+    prog2 = dpctl_prog.create_program_from_source(q, oclSrc)
+    assert prog1 is prog2
+    prog3 = dpctl_prog.create_program_from_source(q, oclSrc, "-w")
+    assert prog3 is not prog1
+    prog4 = dpctl_prog.create_program_from_source(q, oclSrc, cache=False)
+    assert prog4 is not prog1
+    assert prog4.has_sycl_kernel("add")
+
+    dpctl_prog.clear_program_cache()
+    prog5 = dpctl_prog.create_program_from_source(q, oclSrc)
+    assert prog5 is not prog1
+    assert prog5.has_sycl_kernel("add")
+
+
+def test_program_cache_on_disk(tmp_path):
+    try:
+        q = dpctl.SyclQueue("opencl")
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("No OpenCL queue is available")
+    spirv_file = get_spirv_abspath("multi_kernel.spv")
+    with open(spirv_file, "rb") as fin:
+        spirv = fin.read()
+    saved_dir = dpctl_prog.get_program_cache_dir()
+    cache_dir = tmp_path / "programs"
+    try:
+        dpctl_prog.set_program_cache_dir(cache_dir)
+        assert dpctl_prog.get_program_cache_dir() == str(cache_dir)
+        dpctl_prog.clear_program_cache()
+        prog = dpctl_prog.create_program_from_spirv(q, spirv)
+        _check_multi_kernel_program(prog)
+        entries = list(cache_dir.glob("*.bin"))
+        if not entries:
+            pytest.skip("Program binary is not available")
+
+        # program is loaded from the on-disk cache
+        dpctl_prog.clear_program_cache()
+        prog2 = dpctl_prog.create_program_from_spirv(q, spirv)
+        assert prog2 is not prog
+        _check_multi_kernel_program(prog2)
+
+        # corrupted entries are replaced
+        dpctl_prog.clear_program_cache()
+        entries[0].write_bytes(b"not a binary")
+        prog3 = dpctl_prog.create_program_from_spirv(q, spirv)
+        _check_multi_kernel_program(prog3)
+
+        dpctl_prog.clear_program_cache(on_disk=True)
+        assert not list(cache_dir.glob("*.bin"))
+    finally:
+        dpctl_prog.set_program_cache_dir(saved_dir)
+        dpctl_prog.clear_program_cache()
+
+
+def test_clear_program_cache_on_disk_keeps_foreign_files(tmp_path):
+    saved_dir = dpctl_prog.get_program_cache_dir()
+    try:
+        dpctl_prog.set_program_cache_dir(tmp_path)
+        cached = ["0" * 64 + ".bin", "program-1x2y.tmp"]
+        foreign = ["model.bin", "notes.txt", "abc.tmp"]
+        for fn in cached + foreign:
+            (tmp_path / fn).write_bytes(b"data")
+        dpctl_prog.clear_program_cache(on_disk=True)
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(foreign)
+    finally:
+        dpctl_prog.set_program_cache_dir(saved_dir)
+        dpctl_prog.clear_program_cache()
@@ -17,11 +17,15 @@
 """Defines unit test cases for the Memory classes in _memory.pyx.
 """
 
+import threading
+import time
+
 import numpy as np
 import pytest
 
 import dpctl
 from dpctl.memory import (
+    MemoryPool,
     MemoryUSMDevice,
     MemoryUSMHost,
     MemoryUSMShared,
@@ -678,3 +682,144 @@ def test_memset():
     m_ho.memset(ord("7"))
     m_ho.copy_to_host(host_buf)
     assert host_buf == b"7" * n
+
+
+@pytest.mark.parametrize(
+    "usm_type,memory_ctor",
+    [
+        ("device", MemoryUSMDevice),
+        ("shared", MemoryUSMShared),
+        ("host", MemoryUSMHost),
+    ],
+)
+def test_memory_pool(usm_type, memory_ctor):
+    try:
+        q = dpctl.SyclQueue()
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("Default queue could not be created")
+
+    pool = MemoryPool(q.sycl_context, usm_type=usm_type)
+    assert pool.usm_type == usm_type
+    assert pool.sycl_context == q.sycl_context
+    assert type(repr(pool)) is str
+    with pool:
+        m = memory_ctor(1000, queue=q)
+        assert m.nbytes == 1000
+        st = pool.stats()
+        assert st["misses"] == 1
+        assert st["in_use_bytes"] >= 1000
+        del m
+        st = pool.stats()
+        assert st["in_use_bytes"] == 0
+        assert st["cached_blocks"] == 1
+        m = memory_ctor(990, queue=q)
+        assert pool.stats()["hits"] == 1
+        # allocations with alignment request are not served from the pool
+        m_al = memory_ctor(1000, alignment=64, queue=q)
+        assert pool.stats()["misses"] == 1
+        big = memory_ctor(pool.max_block_size + 1, queue=q)
+        assert pool.stats()["bypassed"] == 1
+        del m_al, big
+    # pool is not active outside of the with-block
+    m2 = memory_ctor(1000, queue=q)
+    assert pool.stats()["misses"] == 1
+    del m, m2
+    assert pool.stats()["cached_bytes"] > 0
+    assert pool.trim() > 0
+    assert pool.stats()["cached_bytes"] == 0
+
+
+def test_memory_pool_high_water_mark():
+    try:
+        q = dpctl.SyclQueue()
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("Default queue could not be created")
+
+    pool = MemoryPool(q, usm_type="device", max_cached_bytes=4096)
+    assert pool.max_cached_bytes == 4096
+    with pool:
+        ms = [MemoryUSMDevice(1024, queue=q) for _ in range(8)]
+    del ms
+    st = pool.stats()
+    assert st["cached_bytes"] <= 4096
+    pool.max_cached_bytes = 0
+    assert pool.stats()["cached_bytes"] == 0
+    with pytest.raises(ValueError):
+        MemoryPool(q, usm_type="unknown")
+    with pytest.raises(TypeError):
+        MemoryPool(None)
+
+
+def test_memory_pool_concurrent_enter():
+    try:
+        q = dpctl.SyclQueue()
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("Default queue could not be created")
+
+    pool = MemoryPool(q, usm_type="device")
+    n_threads = 4
+    entered = threading.Barrier(n_threads)
+    errors = []
+
+    def worker(i):
+        try:
+            with pool:
+                entered.wait()
+                m = MemoryUSMDevice(256 * (i + 1), queue=q)
+                with pool:
+                    del m
+                # exit in reverse order of entry
+                time.sleep(0.01 * (n_threads - i))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(n_threads)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert pool.stats()["in_use_bytes"] == 0
+    st = pool.stats()
+    # pool is not active in the main thread
+    MemoryUSMDevice(256, queue=q)
+    st_after = pool.stats()
+    assert st_after["hits"] + st_after["misses"] == st["hits"] + st["misses"]
+
+
+def test_deferred_free():
+    try:
+        q = dpctl.SyclQueue()
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("Default queue could not be created")
+
+    prev = dpctl.memory.set_deferred_free(True)
+    try:
+        st0 = dpctl.memory.deferred_free_stats()
+        m = MemoryUSMDevice(4096, queue=q)
+        m.memset(1)
+        del m
+        st1 = dpctl.memory.deferred_free_stats()
+        assert st1["deferred_blocks"] == st0["deferred_blocks"] + 1
+        dpctl.memory.wait_deferred_free()
+        st2 = dpctl.memory.deferred_free_stats()
+        assert st2["pending_bytes"] == 0
+        assert st2["pending_blocks"] == 0
+        assert st2["released_bytes"] == st0["released_bytes"] + 4096
+
+        # copies sharing an allocation release it once
+        m = MemoryUSMDevice(4096, queue=q)
+        m_copy = MemoryUSMDevice(m)
+        del m
+        st3 = dpctl.memory.deferred_free_stats()
+        assert st3["deferred_blocks"] == st2["deferred_blocks"]
+        assert st3["pending_bytes"] == 0
+        del m_copy
+        dpctl.memory.wait_deferred_free()
+        st4 = dpctl.memory.deferred_free_stats()
+        assert st4["deferred_blocks"] == st2["deferred_blocks"] + 1
+        assert st4["released_bytes"] == st2["released_bytes"] + 4096
+    finally:
+        dpctl.memory.set_deferred_free(prev)
@@ -433,3 +433,20 @@ def test_gh_2017(dt):
     x = dpt.asarray([-1, 1], dtype=dpt.dtype(dt), sycl_queue=q)
     r = dpt.cumulative_sum(x, dtype="?")
     assert dpt.all(r)
+
+
+class _UnhashableDtype:
+    "Unhashable object with `dtype` attribute, accepted by `dpt.dtype`"
+
+    __hash__ = None
+
+    def __init__(self, dt):
+        self.dtype = dpt.dtype(dt)
+
+
+def test_cumsum_unhashable_dtype():
+    q = get_queue_or_skip()
+    x = dpt.ones(10, dtype="i4", sycl_queue=q)
+    r = dpt.cumulative_sum(x, dtype=_UnhashableDtype("i8"))
+    assert r.dtype == dpt.int64
+    assert int(r[-1]) == 10
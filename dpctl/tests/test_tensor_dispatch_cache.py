@@ -0,0 +1,94 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+import dpctl.tensor as dpt
+import dpctl.tensor._dispatch_cache as dc
+from dpctl.tensor._dispatch_cache import (
+    DispatchCache,
+    clear_dispatch_caches,
+    set_dispatch_cache_size,
+)
+from dpctl.tests.helper import get_queue_or_skip
+
+
+def test_dispatch_cache_eviction():
+    c = DispatchCache(maxsize=2)
+    c.put("a", 1)
+    c.put("b", 2)
+    assert c.get("a") == 1
+    c.put("c", 3)
+    # "b" is the least recently used entry
+    assert c.get("b") is None
+    assert c.get("a") == 1
+    assert c.get("c") == 3
+    assert len(c) == 2
+    assert c.hits == 3
+    assert c.misses == 1
+    c.maxsize = 1
+    assert len(c) == 1
+    with pytest.raises(ValueError):
+        c.maxsize = -1
+    c.clear()
+    assert len(c) == 0
+
+
+def test_dispatch_cache_elementwise():
+    q = get_queue_or_skip()
+    x = dpt.ones(8, dtype="i4", sycl_queue=q)
+    cache = dpt.add._dispatch_cache
+    clear_dispatch_caches()
+    r1 = dpt.add(x, x)
+    assert cache.misses == 1
+    r2 = dpt.add(x, x)
+    assert cache.hits == 1
+    assert r1.dtype == r2.dtype
+    assert dpt.all(r1 == r2)
+    # Python scalars are resolved according to their kind
+    r3 = dpt.add(x, 2)
+    r4 = dpt.add(x, 3)
+    assert r3.dtype == r4.dtype == x.dtype
+    assert int(r4[0]) == 4
+    # resolution of comparisons depends on value of Python integers
+    assert dpt.all(dpt.less(x, 2**40))
+    assert not dpt.any(dpt.greater(x, 2**40))
+    assert dpt.all(dpt.less(x, 2))
+
+
+def test_dispatch_cache_disabled():
+    q = get_queue_or_skip()
+    x = dpt.ones(8, dtype="f4", sycl_queue=q)
+    default_maxsize = dc._default_maxsize
+    try:
+        set_dispatch_cache_size(0)
+        assert len(dpt.sin._dispatch_cache) == 0
+        r = dpt.sin(x)
+        assert len(dpt.sin._dispatch_cache) == 0
+        s = dpt.sum(x)
+    finally:
+        set_dispatch_cache_size(default_maxsize)
+    assert dpt.allclose(r, dpt.sin(x))
+    assert float(s) == 8
+
+
+def test_dispatch_cache_key_default_int_type():
+    q = get_queue_or_skip()
+    assert dpt.clear_dispatch_caches is clear_dispatch_caches
+    assert dpt.set_dispatch_cache_size is set_dispatch_cache_size
+    caps = dc._device_capabilities(q)
+    # Python integers are resolved to the default integer type
+    assert caps[-1] == q.sycl_device.capabilities.default_int_type
@@ -0,0 +1,271 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+
+import dpctl.tensor as dpt
+import dpctl.tensor._tensor_elementwise_impl as ti
+from dpctl.tests.helper import get_queue_or_skip, skip_if_dtype_not_supported
+
+
+def test_lazy_chain():
+    q = get_queue_or_skip()
+    x = dpt.linspace(0, 1, num=1025, dtype="f4", sycl_queue=q)
+    expected = dpt.exp(-0.5 * dpt.square(x)) * dpt.sin(2.3 * x + 0.11)
+    with dpt.lazy():
+        y = dpt.exp(-0.5 * dpt.square(x)) * dpt.sin(2.3 * x + 0.11)
+    assert isinstance(y, dpt.LazyArray)
+    assert not y.is_materialized
+    assert y.shape == x.shape
+    assert y.dtype == expected.dtype
+    assert y.sycl_queue == q
+    r = y.materialize()
+    assert isinstance(r, dpt.usm_ndarray)
+    assert y.is_materialized
+    assert r is y.materialize()
+    assert dpt.allclose(r, expected)
+
+
+def test_lazy_common_subexpressions():
+    q = get_queue_or_skip()
+    x = dpt.arange(100, dtype="i4", sycl_queue=q)
+    with dpt.lazy():
+        a = dpt.square(x)
+        b = dpt.square(x)
+        y = a + b
+    r = dpt.asnumpy(y.materialize())
+    xn = np.arange(100, dtype="i4")
+    assert np.array_equal(r, 2 * xn * xn)
+    # intermediate values may be materialized after the root
+    assert np.array_equal(dpt.asnumpy(a.materialize()), xn * xn)
+
+
+def test_lazy_broadcasting_and_scalars():
+    q = get_queue_or_skip()
+    x = dpt.ones((3, 4), dtype="f4", sycl_queue=q)
+    v = dpt.arange(4, dtype="f4", sycl_queue=q)
+    with dpt.lazy():
+        y = (x + v) * 2 - 1
+    assert y.shape == (3, 4)
+    r = dpt.asnumpy(y.materialize())
+    expected = (np.ones((3, 4), "f4") + np.arange(4, dtype="f4")) * 2 - 1
+    assert np.array_equal(r, expected)
+    # lazy arrays continue recording outside of the context
+    z = dpt.negative(y)
+    assert isinstance(z, dpt.LazyArray)
+    assert np.array_equal(dpt.asnumpy(z.materialize()), -expected)
+
+
+def test_lazy_library_functions_evaluate():
+    q = get_queue_or_skip()
+    x = dpt.arange(10, dtype="f4", sycl_queue=q)
+    m = x > 4
+    with dpt.lazy():
+        # functions implemented with element-wise functions receive
+        # arrays, and return arrays
+        assert dpt.allclose(x, x)
+        r = dpt.where(m, x, 0)
+        assert isinstance(r, dpt.usm_ndarray)
+        hist, _ = dpt.histogram(x, bins=2)
+        assert isinstance(hist, dpt.usm_ndarray)
+        assert isinstance(dpt.clip(x, 1, 5), dpt.usm_ndarray)
+        assert isinstance(x > 4, dpt.LazyArray)
+    assert np.array_equal(
+        dpt.asnumpy(r), np.where(np.arange(10) > 4, np.arange(10), 0)
+    )
+
+
+def test_lazy_signed_zero_scalars():
+    q = get_queue_or_skip()
+    x = dpt.ones(4, dtype="f4", sycl_queue=q)
+    with dpt.lazy():
+        y = dpt.copysign(x, 0.0) + dpt.copysign(x, -0.0)
+        z = dpt.divide(x, 0.0) + dpt.divide(x, -0.0)
+    assert np.array_equal(dpt.asnumpy(y.materialize()), np.zeros(4, "f4"))
+    assert np.all(np.isnan(dpt.asnumpy(z.materialize())))
+
+
+def test_lazy_out_keyword_evaluates():
+    q = get_queue_or_skip()
+    x = dpt.arange(10, dtype="f4", sycl_queue=q)
+    out = dpt.empty_like(x)
+    with dpt.lazy():
+        t = x + 1
+        r = dpt.multiply(t, 2, out=out)
+    assert r is out
+    assert np.array_equal(dpt.asnumpy(out), (np.arange(10, dtype="f4") + 1) * 2)
+
+
+@pytest.mark.parametrize("dt", ["f4", "f8"])
+def test_lazy_fused_chain(dt):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(dt, q)
+    x_np = np.linspace(0.1, 2, num=1031, dtype=dt)
+    x = dpt.asarray(x_np, sycl_queue=q)
+    w = dpt.copy(dpt.flip(x))
+    with dpt.lazy():
+        y = dpt.maximum(dpt.log1p(x) * dpt.sqrt(w), 0.5) - dpt.pow(x, 2.5)
+        y = dpt.minimum(dpt.abs(dpt.tanh(y)), 0.75) / (1 + dpt.exp(-w))
+    expected = np.maximum(np.log1p(x_np) * np.sqrt(x_np[::-1]), 0.5)
+    expected = expected - np.power(x_np, 2.5)
+    expected = np.minimum(np.abs(np.tanh(expected)), 0.75)
+    expected = expected / (1 + np.exp(-x_np[::-1]))
+    r = y.materialize()
+    assert r.dtype == x.dtype
+    assert r.flags.c_contiguous
+    tol = 8 * dpt.finfo(dt).resolution
+    assert np.allclose(dpt.asnumpy(r), expected, rtol=tol, atol=tol)
+
+
+def test_lazy_fused_chain_exceeding_kernel_limits():
+    q = get_queue_or_skip()
+    xs = [dpt.full(17, i + 1, dtype="f4", sycl_queue=q) for i in range(10)]
+    with dpt.lazy():
+        # more inputs, constants and instructions than a single
+        # fused kernel takes
+        y = xs[0]
+        for x in xs[1:]:
+            y = y + x
+        for i in range(40):
+            y = y * 1 + (i - i)
+    r = dpt.asnumpy(y.materialize())
+    assert np.array_equal(r, np.full(17, 55, dtype="f4"))
+
+
+def test_lazy_fused_chain_non_contiguous_inputs():
+    q = get_queue_or_skip()
+    x = dpt.reshape(dpt.arange(24, dtype="f4", sycl_queue=q), (4, 6))
+    xt = x.mT
+    with dpt.lazy():
+        y = dpt.square(xt + 1) - xt
+    x_np = np.arange(24, dtype="f4").reshape(4, 6).T
+    assert np.array_equal(dpt.asnumpy(y.materialize()), (x_np + 1) ** 2 - x_np)
+
+
+def test_lazy_sharded_and_top_k_evaluate():
+    q = get_queue_or_skip()
+    x = dpt.arange(12, dtype="f4", sycl_queue=q)
+    with dpt.lazy():
+        s = dpt.shard(x, [q, q])
+        r = s.max()
+        assert isinstance(r, dpt.usm_ndarray)
+        acc = dpt.TopKAccumulator(2)
+        acc.update(x)
+        acc.update(x, offset=12)
+        vals, inds = acc.result()
+        assert isinstance(inds, dpt.usm_ndarray)
+    assert float(r) == 11
+    assert np.array_equal(np.sort(dpt.asnumpy(inds)), [11, 23])
+
+
+def test_fused_elementwise_validation():
+    q = get_queue_or_skip()
+    x = dpt.ones(8, dtype="f4", sycl_queue=q)
+    out = dpt.empty_like(x)
+    # register 1 is read before being written
+    with pytest.raises(ValueError):
+        ti._fused_elementwise([x], out, [32, 0, 1, 16], [], sycl_queue=q)
+    # unknown operation
+    with pytest.raises(ValueError):
+        ti._fused_elementwise([x], out, [31, 0, 16, 16], [], sycl_queue=q)
+    # missing constant
+    with pytest.raises(ValueError):
+        ti._fused_elementwise([x], out, [32, 0, 16, 24], [], sycl_queue=q)
+    ht_ev, ev = ti._fused_elementwise(
+        [x], out, [32, 0, 16, 24, 2, 1, 0, 0], [1.0], sycl_queue=q
+    )
+    ht_ev.wait()
+    assert np.array_equal(dpt.asnumpy(out), np.full(8, -2, dtype="f4"))
+
+
+def test_lazy_deferred_size_results():
+    q = get_queue_or_skip()
+    x_np = np.array([[3, 1, 4, 1], [5, 9, 2, 6], [5, 3, 5, 8]], dtype="i4")
+    x = dpt.asarray(x_np, sycl_queue=q)
+    m = x > 3
+    n = np.count_nonzero(x_np > 3)
+    with dpt.lazy():
+        sel = x[m]
+        rows = x[m[:, 0]]
+        ext = dpt.extract(m, x)
+        nz = dpt.nonzero(m)
+        uv = dpt.unique_values(x)
+    # indexing returns usm_ndarray regardless of the context
+    assert isinstance(sel, dpt.usm_ndarray)
+    assert isinstance(rows, dpt.usm_ndarray)
+    assert np.array_equal(dpt.asnumpy(sel), x_np[x_np > 3])
+    assert np.array_equal(dpt.asnumpy(rows), x_np[x_np[:, 0] > 3])
+    for r in (ext, uv) + nz:
+        assert isinstance(r, dpt.DeferredSizeArray)
+        assert not r.is_materialized
+    assert ext.dtype == x.dtype
+    assert ext.ndim == 1 and ext.axis == 0
+    assert ext.capacity == x.size
+    assert int(ext.count) == n
+
+    # observing the shape does not materialize the array
+    assert len(ext.shape) == 1
+    assert ext.shape == (n,)
+    assert not ext.is_materialized
+    assert np.array_equal(dpt.asnumpy(ext.materialize()), x_np[x_np > 3])
+    assert ext.shape == (n,)
+    for i, ind in enumerate(np.nonzero(x_np > 3)):
+        assert np.array_equal(dpt.asnumpy(nz[i].materialize()), ind)
+    assert np.array_equal(dpt.asnumpy(uv.materialize()), np.unique(x_np))
+
+
+def test_lazy_elementwise_of_deferred_size_results():
+    q = get_queue_or_skip()
+    x_np = np.array([[3, 1, 4, 1], [5, 9, 2, 6], [5, 3, 5, 8]], dtype="i4")
+    x = dpt.asarray(x_np, sycl_queue=q)
+    m = x > 3
+    with dpt.lazy():
+        ext = dpt.extract(m, x)
+        nz = dpt.nonzero(m)
+    y = dpt.square(ext) + 1
+    i = nz[0] * x.shape[1] + nz[1]
+    for r in (y, i):
+        assert isinstance(r, dpt.DeferredSizeArray)
+        assert not r.is_materialized
+    assert not ext.is_materialized
+    assert np.array_equal(dpt.asnumpy(y.materialize()), x_np[x_np > 3] ** 2 + 1)
+    i_np = np.flatnonzero(x_np > 3)
+    assert np.array_equal(dpt.asnumpy(i.materialize()), i_np)
+
+    # operands not broadcasting along the deferred axis materialize it
+    with dpt.lazy():
+        ext = dpt.extract(m, x)
+    other = dpt.ones(int(ext.count), dtype="i4", sycl_queue=q)
+    z = ext + other
+    assert not isinstance(z, dpt.DeferredSizeArray)
+    assert ext.is_materialized
+    assert np.array_equal(dpt.asnumpy(z.materialize()), x_np[x_np > 3] + 1)
+
+
+def test_place_broadcast_values():
+    q = get_queue_or_skip()
+    x = dpt.zeros((4, 5), dtype="i4", sycl_queue=q)
+    m = dpt.asarray([True, False, True, True, False], sycl_queue=q)
+    x[:, m] = dpt.asarray([[1], [2], [3], [4]], dtype="i4", sycl_queue=q)
+    expected = np.zeros((4, 5), dtype="i4")
+    expected[:, [0, 2, 3]] = np.arange(1, 5)[:, np.newaxis]
+    assert np.array_equal(dpt.asnumpy(x), expected)
+
+    a = dpt.zeros(6, dtype="i4", sycl_queue=q)
+    mask = dpt.asarray([0, 1, 1, 0, 1, 1], dtype="?", sycl_queue=q)
+    dpt.place(a, mask, dpt.asarray([7, 8], dtype="i4", sycl_queue=q))
+    assert np.array_equal(dpt.asnumpy(a), [0, 7, 8, 0, 7, 8])
@@ -0,0 +1,142 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+
+import dpctl
+import dpctl.tensor as dpt
+from dpctl.tests.helper import get_queue_or_skip
+
+
+def _queues(q, n=3):
+    return [dpctl.SyclQueue(q.sycl_context, q.sycl_device) for _ in range(n)]
+
+
+def test_shard_gather():
+    q = get_queue_or_skip()
+    qs = _queues(q)
+    x = dpt.reshape(dpt.arange(7 * 4, dtype="i4", sycl_queue=q), (7, 4))
+    xs = dpt.shard(x, qs)
+    assert isinstance(xs, dpt.ShardedArray)
+    assert xs.shape == x.shape
+    assert xs.dtype == x.dtype
+    assert xs.axis == 0
+    assert [s.shape[0] for s in xs.shards] == [3, 2, 2]
+    assert all(s.sycl_queue == sq for s, sq in zip(xs.shards, qs))
+    assert dpt.all(xs.gather(sycl_queue=q) == x)
+
+    xs1 = dpt.shard(x, qs, axis=1)
+    assert [s.shape[1] for s in xs1.shards] == [2, 1, 1]
+    assert dpt.all(xs1.gather(sycl_queue=q) == x)
+
+
+def test_sharded_elementwise():
+    q = get_queue_or_skip()
+    qs = _queues(q)
+    x = dpt.reshape(dpt.linspace(0, 1, num=60, sycl_queue=q), (10, 6))
+    y = dpt.linspace(1, 2, num=6, sycl_queue=q)
+    xs = dpt.shard(x, qs)
+    r = (2 * xs + y).map(dpt.sin)
+    assert isinstance(r, dpt.ShardedArray)
+    expected = dpt.sin(2 * x + y)
+    assert dpt.allclose(r.gather(sycl_queue=q), expected)
+
+    r = xs.map(dpt.hypot, xs)
+    assert dpt.allclose(r.gather(sycl_queue=q), dpt.hypot(x, x))
+
+    with pytest.raises(ValueError):
+        xs + dpt.ones((2, 10, 6), sycl_queue=q)
+
+
+@pytest.mark.parametrize("axis", [None, 0, 1, (0, 1)])
+@pytest.mark.parametrize("keepdims", [False, True])
+def test_sharded_reductions(axis, keepdims):
+    q = get_queue_or_skip()
+    qs = _queues(q)
+    rng = np.random.default_rng(1234)
+    x_np = rng.integers(-100, 100, size=(9, 5)).astype("i4")
+    x = dpt.asarray(x_np, sycl_queue=q)
+    xs = dpt.shard(x, qs)
+    for fn in (dpt.sum, dpt.max, dpt.min):
+        r = xs.reduce(fn, axis=axis, keepdims=keepdims)
+        if isinstance(r, dpt.ShardedArray):
+            r = r.gather(sycl_queue=q)
+        expected = fn(x, axis=axis, keepdims=keepdims)
+        assert r.shape == expected.shape
+        assert dpt.all(dpt.asarray(r, sycl_queue=q) == expected)
+    r = xs.mean(axis=axis, keepdims=keepdims)
+    if isinstance(r, dpt.ShardedArray):
+        r = r.gather(sycl_queue=q)
+    expected = dpt.mean(x, axis=axis, keepdims=keepdims)
+    assert dpt.allclose(dpt.asarray(r, sycl_queue=q), expected)
+
+
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_sharded_argmax(axis):
+    q = get_queue_or_skip()
+    qs = _queues(q)
+    x_np = np.zeros((8, 5), dtype="i4")
+    # ties across shards resolve to the first occurrence
+    x_np[3, 2] = 7
+    x_np[6, 4] = 7
+    x_np[1, 0] = -3
+    x = dpt.asarray(x_np, sycl_queue=q)
+    for shard_axis in (0, 1):
+        xs = dpt.shard(x, qs, axis=shard_axis)
+        for fn in (dpt.argmax, dpt.argmin):
+            r = xs.reduce(fn, axis=axis)
+            if isinstance(r, dpt.ShardedArray):
+                r = r.gather(sycl_queue=q)
+            expected = fn(x, axis=axis)
+            assert dpt.all(dpt.asarray(r, sycl_queue=q) == expected)
+
+
+def test_sharded_argmax_empty():
+    q = get_queue_or_skip()
+    qs = _queues(q)
+    xs = dpt.shard(dpt.empty((0, 3), dtype="i4", sycl_queue=q), qs)
+    for axis in (None, 0):
+        with pytest.raises(ValueError):
+            xs.argmax(axis=axis)
+    # empty shards are skipped
+    shards = [
+        dpt.asarray([[1, 5]], dtype="i4", sycl_queue=qs[0]),
+        dpt.empty((0, 2), dtype="i4", sycl_queue=qs[1]),
+        dpt.asarray([[9, 2]], dtype="i4", sycl_queue=qs[2]),
+    ]
+    xs = dpt.ShardedArray(shards, 0)
+    assert int(xs.argmax()) == 2
+    r = dpt.asnumpy(xs.argmin(axis=0))
+    assert np.array_equal(r, [0, 1])
+
+
+def test_sharded_sub_devices():
+    q = get_queue_or_skip()
+    d = q.sycl_device
+    try:
+        sub_devs = d.create_sub_devices(partition=2)
+    except dpctl.SyclSubDeviceCreationError:
+        pytest.skip("Device can not be partitioned")
+    except Exception:
+        pytest.skip("Device partitioning is not supported")
+    ctx = dpctl.SyclContext(sub_devs)
+    qs = [dpctl.SyclQueue(ctx, sd) for sd in sub_devs]
+    x = dpt.arange(10**5, dtype="i8", sycl_queue=q)
+    xs = dpt.shard(x, qs)
+    assert len(xs.shards) == len(sub_devs)
+    assert int(xs.sum()) == int(dpt.sum(x))
+    assert int((xs * 2).max()) == 2 * (10**5 - 1)
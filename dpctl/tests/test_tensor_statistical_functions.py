@@ -17,7 +17,11 @@
 import pytest
 
 import dpctl.tensor as dpt
-from dpctl.tensor._tensor_impl import default_device_fp_type
+import dpctl.tensor._tensor_reductions_impl as tri
+from dpctl.tensor._tensor_impl import (
+    default_device_fp_type,
+    default_device_index_type,
+)
 from dpctl.tests.helper import get_queue_or_skip, skip_if_dtype_not_supported
 
 _no_complex_dtypes = [
@@ -210,6 +214,37 @@ def test_var_std():
     assert dpt.allclose(r1, expected1)
 
 
+def test_var_return_mean():
+    get_queue_or_skip()
+
+    x = dpt.reshape(dpt.arange(12, dtype="i4"), (3, 4))
+    m, v = dpt.var(x, axis=1, correction=1, return_mean=True)
+    assert dpt.allclose(m, dpt.mean(x, axis=1))
+    assert dpt.allclose(v, dpt.var(x, axis=1, correction=1))
+
+    m, s = dpt.std(x, axis=0, keepdims=True, return_mean=True)
+    assert m.shape == (1, 4)
+    assert s.shape == (1, 4)
+    assert dpt.allclose(m, dpt.mean(x, axis=0, keepdims=True))
+    assert dpt.allclose(s, dpt.std(x, axis=0, keepdims=True))
+
+
+@pytest.mark.parametrize("n", [8, 4098, 1048578])
+def test_var_large_offset(n):
+    q = get_queue_or_skip()
+
+    # single pass algorithm must not lose precision to cancellation
+    x = dpt.asarray([1e4, 1e4 + 2], dtype="f4", sycl_queue=q)
+    x = dpt.tile(x, (n,))
+    m, v = dpt.var(x, return_mean=True)
+    assert dpt.allclose(m, dpt.asarray(1e4 + 1, dtype="f4", sycl_queue=q))
+    assert dpt.allclose(v, dpt.asarray(1, dtype="f4", sycl_queue=q))
+
+    x2 = dpt.reshape(x, (2, n))
+    v = dpt.var(x2, axis=1)
+    assert dpt.allclose(v, dpt.ones(2, dtype="f4", sycl_queue=q))
+
+
 def test_var_axis_length_correction():
     get_queue_or_skip()
 
@@ -253,3 +288,247 @@ def test_stat_function_errors():
         dpt.var(x)
     with pytest.raises(ValueError):
         dpt.std(x)
+
+
+@pytest.mark.parametrize("dt", _no_complex_dtypes + ["c8", "c16"])
+def test_describe_dtypes(dt):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(dt, q)
+
+    x = dpt.asarray([3, 0, 5, 1, 5, 0, 1], dtype=dt, sycl_queue=q)
+    r = dpt.describe(x)
+    assert r._fields == (
+        "min",
+        "max",
+        "sum",
+        "argmin",
+        "argmax",
+        "count_nonzero",
+    )
+    assert r.min == dpt.min(x)
+    assert r.max == dpt.max(x)
+    assert r.sum == dpt.sum(x)
+    assert r.sum.dtype == dpt.sum(x).dtype
+    assert r.argmin == dpt.argmin(x)
+    assert r.argmax == dpt.argmax(x)
+    assert r.count_nonzero == dpt.count_nonzero(x)
+
+
+@pytest.mark.parametrize("n", [5, 4098, 1048578])
+def test_reduce_many_axis(n):
+    q = get_queue_or_skip()
+
+    x = dpt.reshape(
+        dpt.remainder(dpt.arange(3 * n, dtype="i4", sycl_queue=q), 97),
+        (3, n),
+    )
+    for axis in (0, 1, None, (0, 1)):
+        r = dpt.reduce_many(x, ("sum", "argmax", "min"), axis=axis)
+        assert r._fields == ("sum", "argmax", "min")
+        assert dpt.all(r.sum == dpt.sum(x, axis=axis))
+        assert dpt.all(r.min == dpt.min(x, axis=axis))
+        if not isinstance(axis, tuple):
+            assert dpt.all(r.argmax == dpt.argmax(x, axis=axis))
+
+    r = dpt.reduce_many(x, "max", axis=1, keepdims=True)
+    assert r.max.shape == (3, 1)
+    assert dpt.all(r.max == dpt.max(x, axis=1, keepdims=True))
+
+    x3 = dpt.reshape(x, (3, 1, n))
+    r = dpt.reduce_many(x3, ("argmin", "count_nonzero"), axis=(0, 2))
+    assert r.argmin.shape == (1,)
+    assert int(r.argmin[0]) == 0
+    assert dpt.all(r.count_nonzero == dpt.count_nonzero(x3, axis=(0, 2)))
+
+
+def test_reduce_many_nan():
+    q = get_queue_or_skip()
+
+    x = dpt.asarray([1, dpt.nan, -2, dpt.nan, 7], dtype="f4", sycl_queue=q)
+    r = dpt.describe(x)
+    assert dpt.isnan(r.min) and dpt.isnan(r.max)
+    assert int(r.argmin) == 1 and int(r.argmax) == 1
+    assert int(r.count_nonzero) == 5
+
+    x = dpt.asarray([1, 2, 2, 1], dtype="f4", sycl_queue=q)
+    r = dpt.reduce_many(x, ("argmin", "argmax"))
+    assert int(r.argmin) == 0 and int(r.argmax) == 1
+
+
+@pytest.mark.parametrize(
+    "op", ["min", "max", "sum", "argmin", "argmax", "count_nonzero"]
+)
+@pytest.mark.parametrize("n", [5, 4098, 1048578])
+def test_reduce_many_single_op(op, n):
+    q = get_queue_or_skip()
+
+    x = dpt.remainder(dpt.arange(n, dtype="i4", sycl_queue=q), 97)
+    r = dpt.reduce_many(x, op)
+    assert r._fields == (op,)
+    expected = getattr(dpt, op)(x)
+    assert getattr(r, op).dtype == expected.dtype
+    assert getattr(r, op) == expected
+
+
+def test_reduce_many_no_destinations():
+    q = get_queue_or_skip()
+
+    x = dpt.ones((2, 3), dtype="i4", sycl_queue=q)
+    with pytest.raises(ValueError):
+        tri._reduce_many_over_axis(
+            src=x,
+            trailing_dims_to_reduce=1,
+            min_dst=None,
+            max_dst=None,
+            sum_dst=None,
+            argmin_dst=None,
+            argmax_dst=None,
+            count_nonzero_dst=None,
+            sycl_queue=q,
+        )
+
+
+def test_reduce_many_errors():
+    q = get_queue_or_skip()
+
+    with pytest.raises(TypeError):
+        dpt.describe(dict())
+
+    x = dpt.ones(4, dtype="i4", sycl_queue=q)
+    with pytest.raises(ValueError):
+        dpt.reduce_many(x, ())
+    with pytest.raises(ValueError):
+        dpt.reduce_many(x, ("min", "mean"))
+    with pytest.raises(ValueError):
+        dpt.reduce_many(x, ("min", "min"))
+
+    x = dpt.ones((2, 0), dtype="i4", sycl_queue=q)
+    with pytest.raises(ValueError):
+        dpt.describe(x, axis=1)
+    r = dpt.reduce_many(x, ("sum", "count_nonzero"), axis=1)
+    assert dpt.all(r.sum == 0)
+    assert dpt.all(r.count_nonzero == 0)
+
+
+@pytest.mark.parametrize("dt", ["?", "i1", "u1", "i4", "u4", "i8", "u8"])
+def test_bincount_dtypes(dt):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(dt, q)
+
+    x = dpt.asarray([1, 0, 1, 1, 0, 1], dtype=dt, sycl_queue=q)
+    res = dpt.bincount(x)
+    assert res.dtype == dpt.dtype(default_device_index_type(q.sycl_device))
+    assert dpt.all(res == dpt.asarray([2, 4], sycl_queue=q))
+
+    res = dpt.bincount(x, minlength=4)
+    assert dpt.all(res == dpt.asarray([2, 4, 0, 0], sycl_queue=q))
+
+
+@pytest.mark.parametrize("n", [7, 4098, 1048578])
+def test_bincount_weights(n):
+    q = get_queue_or_skip()
+
+    x = dpt.remainder(dpt.arange(n, dtype="i4", sycl_queue=q), 5)
+    res = dpt.bincount(x)
+    expected = dpt.sum(
+        x[:, dpt.newaxis] == dpt.arange(5, dtype="i4", sycl_queue=q), axis=0
+    )
+    assert dpt.all(res == expected)
+
+    w = dpt.full(n, 0.5, dtype="f4", sycl_queue=q)
+    res = dpt.bincount(x, weights=w)
+    assert res.dtype == w.dtype
+    assert dpt.allclose(res, dpt.astype(expected, "f4") / 2)
+
+    w = dpt.ones(n, dtype="i4", sycl_queue=q)
+    res = dpt.bincount(x, weights=w)
+    assert res.dtype == dpt.dtype(default_device_fp_type(q))
+    assert dpt.all(res == expected)
+
+
+def test_bincount_validation():
+    q = get_queue_or_skip()
+
+    x = dpt.asarray([1, 0, 3], dtype="i4", sycl_queue=q)
+    with pytest.raises(TypeError):
+        dpt.bincount(dpt.astype(x, "f4"))
+    with pytest.raises(ValueError):
+        dpt.bincount(dpt.reshape(x, (1, 3)))
+    with pytest.raises(ValueError):
+        dpt.bincount(-x)
+    with pytest.raises(ValueError):
+        dpt.bincount(x, minlength=-1)
+    with pytest.raises(ValueError):
+        dpt.bincount(x, weights=dpt.ones(2, sycl_queue=q))
+
+    res = dpt.bincount(dpt.empty(0, dtype="i4", sycl_queue=q), minlength=3)
+    assert res.shape == (3,)
+    assert dpt.all(res == 0)
+
+
+@pytest.mark.parametrize("dt", ["i2", "u4", "f2", "f4", "f8"])
+def test_histogram_uniform_bins(dt):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(dt, q)
+
+    x = dpt.asarray([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], dtype=dt, sycl_queue=q)
+    hist, edges = dpt.histogram(x, bins=3)
+    assert edges.shape == (4,)
+    assert edges.dtype == dpt.dtype(default_device_fp_type(q))
+    assert float(edges[0]) == 0 and float(edges[-1]) == 9
+    # the last bin includes its right edge
+    assert dpt.all(hist == dpt.asarray([3, 3, 4], sycl_queue=q))
+
+    hist, edges = dpt.histogram(x, bins=2, range=(2, 6))
+    assert dpt.all(hist == dpt.asarray([2, 3], sycl_queue=q))
+
+
+@pytest.mark.parametrize("n", [9, 4098, 1048578])
+def test_histogram_explicit_edges(n):
+    q = get_queue_or_skip()
+
+    x = dpt.astype(
+        dpt.remainder(dpt.arange(n, dtype="i4", sycl_queue=q), 10), "f4"
+    )
+    x[0] = dpt.nan
+    bins = dpt.asarray([1, 2, 5, 6], dtype="f4", sycl_queue=q)
+    hist, edges = dpt.histogram(x, bins=bins)
+    assert dpt.all(edges == dpt.astype(bins, edges.dtype))
+    in_bin = [(x >= 1) & (x < 2), (x >= 2) & (x < 5), (x >= 5) & (x <= 6)]
+    expected = dpt.stack([dpt.count_nonzero(m) for m in in_bin])
+    assert dpt.all(hist == expected)
+
+    # uniform edges given explicitly count the same as a number of bins
+    hist_u, edges_u = dpt.histogram(x, bins=5, range=(0, 10))
+    hist_e, _ = dpt.histogram(x, bins=edges_u)
+    assert dpt.all(hist_u == hist_e)
+
+    w = dpt.full(n, 2, dtype="f4", sycl_queue=q)
+    hist_w, _ = dpt.histogram(x, bins=bins, weights=w)
+    assert dpt.allclose(hist_w, dpt.astype(2 * expected, "f4"))
+
+    dens, _ = dpt.histogram(x, bins=bins, density=True)
+    widths = bins[1:] - bins[:-1]
+    assert dpt.allclose(dpt.sum(dens * widths), 1)
+
+
+def test_histogram_validation():
+    q = get_queue_or_skip()
+
+    x = dpt.arange(5, dtype="f4", sycl_queue=q)
+    with pytest.raises(TypeError):
+        dpt.histogram(dpt.astype(x, "c8"))
+    with pytest.raises(ValueError):
+        dpt.histogram(x, bins=0)
+    with pytest.raises(ValueError):
+        dpt.histogram(x, range=(3, 1))
+    with pytest.raises(ValueError):
+        dpt.histogram(x, range=(0, dpt.inf))
+    with pytest.raises(ValueError):
+        dpt.histogram(x, bins=dpt.asarray([2, 1, 3], sycl_queue=q))
+    with pytest.raises(ValueError):
+        dpt.histogram(x, bins=dpt.asarray([1], sycl_queue=q))
+
+    hist, edges = dpt.histogram(dpt.full(3, 2, sycl_queue=q), bins=1)
+    assert float(edges[0]) == 1.5 and float(edges[1]) == 2.5
+    assert int(hist[0]) == 3
@@ -0,0 +1,100 @@
+#                       Data Parallel Control (dpctl)
+#
+#  Copyright 2020-2025 Intel Corporation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+import pytest
+
+import dpctl.tensor as dpt
+from dpctl.tests.helper import get_queue_or_skip
+
+
+def test_stream_to_device():
+    q = get_queue_or_skip()
+    chunks = [np.full((4, 5), i, dtype="i4") for i in range(7)]
+    ring = dpt.StagingRing(q, depth=2)
+    stream = dpt.stream_to_device(iter(chunks), sycl_queue=q, ring=ring)
+    assert isinstance(stream, dpt.TransferStream)
+    res = []
+    for x in stream:
+        assert isinstance(x, dpt.usm_ndarray)
+        assert x.sycl_queue == q
+        # consumer computations are ordered after the transfer
+        res.append(dpt.sum(x))
+    assert [int(r) for r in res] == [20 * i for i in range(7)]
+    assert stream.nbytes == 7 * 20 * 4
+    assert stream.bandwidth > 0
+    assert ring.nbytes == 2 * 20 * 4
+
+
+def test_stream_to_device_dtype():
+    q = get_queue_or_skip()
+    chunks = [np.arange(10, dtype="i8"), np.arange(3, dtype="i8")]
+    res = list(dpt.stream_to_device(chunks, dtype="f4", sycl_queue=q))
+    assert all(r.dtype == dpt.float32 for r in res)
+    assert dpt.all(res[1] == dpt.arange(3, dtype="f4", sycl_queue=q))
+    with pytest.raises(TypeError):
+        list(dpt.stream_to_device([np.array(["a"])], sycl_queue=q))
+
+
+def test_stream_to_host():
+    q = get_queue_or_skip()
+    xs = [dpt.full((3, 8), i, dtype="f4", sycl_queue=q) for i in range(5)]
+    # non-contiguous view
+    xs.append(dpt.ones((8, 6), dtype="f4", sycl_queue=q)[::2, ::3])
+    stream = dpt.stream_to_host(xs)
+    res = list(stream)
+    assert len(res) == len(xs)
+    for r, x in zip(res, xs):
+        assert isinstance(r, np.ndarray)
+        np.testing.assert_array_equal(r, dpt.asnumpy(x))
+    assert stream.nbytes == sum(x.nbytes for x in xs)
+    assert stream.bandwidth > 0
+
+
+def test_staging_ring_validation():
+    q = get_queue_or_skip()
+    with pytest.raises(ValueError):
+        dpt.StagingRing(q, depth=1)
+    with pytest.raises(TypeError):
+        dpt.StagingRing(None)
+    ring = dpt.StagingRing(q)
+    s1 = dpt.stream_to_device([np.ones(4)] * 2, sycl_queue=q, ring=ring)
+    next(s1)
+    with pytest.raises(ValueError):
+        dpt.stream_to_device([np.ones(4)], sycl_queue=q, ring=ring)
+    s1.close()
+    assert list(dpt.stream_to_host([], ring=ring)) == []
+
+
+def test_staging_ring_taken_on_creation():
+    q = get_queue_or_skip()
+    ring = dpt.StagingRing(q)
+    s1 = dpt.stream_to_device([np.ones(4)], sycl_queue=q, ring=ring)
+    # the ring is taken before the stream is iterated
+    with pytest.raises(ValueError):
+        dpt.stream_to_device([np.ones(4)], sycl_queue=q, ring=ring)
+    # closing a stream which has not been iterated releases the ring
+    s1.close()
+    s2 = dpt.stream_to_host([], ring=ring)
+    assert list(s2) == []
+
+    # streams created before either is iterated use different rings
+    chunks = [np.arange(4, dtype="i4")] * 3
+    s3 = dpt.stream_to_device(chunks, sycl_queue=q)
+    s4 = dpt.stream_to_device(chunks, sycl_queue=q)
+    assert s3._ring is not s4._ring
+    for x, y in zip(s3, s4):
+        assert dpt.all(x == y)
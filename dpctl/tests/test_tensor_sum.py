@@ -330,3 +330,20 @@ def test_gh_1944(dt):
     # reduction must be performed in the requested dtype
     # if performed in the input type, result is False
     assert r
+
+
+class _UnhashableDtype:
+    "Unhashable object with `dtype` attribute, accepted by `dpt.dtype`"
+
+    __hash__ = None
+
+    def __init__(self, dt):
+        self.dtype = dpt.dtype(dt)
+
+
+def test_sum_unhashable_dtype():
+    q = get_queue_or_skip()
+    x = dpt.ones(10, dtype="i4", sycl_queue=q)
+    r = dpt.sum(x, dtype=_UnhashableDtype("i8"))
+    assert r.dtype == dpt.int64
+    assert int(r) == 10
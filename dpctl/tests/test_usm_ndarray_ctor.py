@@ -1162,6 +1162,44 @@ def test_tofrom_numpy_permuted(dtype, usm_type):
     assert np.array_equal(dpt.to_numpy(Xusm), Ynp)
 
 
+@pytest.mark.parametrize("usm_type", ["device", "shared", "host"])
+def test_to_numpy_views(usm_type):
+    q = get_queue_or_skip()
+    Xnp = np.arange(4 * 7 * 5, dtype="i4").reshape((4, 7, 5))
+    Xusm = dpt.asarray(Xnp, usm_type=usm_type, sycl_queue=q)
+    views = [
+        (1, slice(2, 5), slice(None)),
+        (slice(None), slice(1, None, 3), slice(None, None, -2)),
+        (Ellipsis, 3),
+        (slice(None, None, -1), 0),
+        (2, 4, 1),
+    ]
+    for ind in views:
+        V = Xusm[ind]
+        Y = dpt.to_numpy(V)
+        assert np.array_equal(Y, Xnp[ind])
+        # only the byte span of the view, or its elements if the view
+        # is sparse in that span, are copied
+        beg_p, end_p = V._byte_bounds
+        assert Y.base.nbytes == min(end_p - beg_p, V.size * V.itemsize)
+    # contiguous views with an offset copy exactly their byte span
+    for ind in [slice(1, 3), (2, slice(1, 4)), (3, 6, slice(2, None))]:
+        V = Xusm[ind]
+        Y = dpt.to_numpy(V)
+        assert np.array_equal(Y, Xnp[ind])
+        beg_p, end_p = V._byte_bounds
+        assert beg_p > Xusm.usm_data._pointer
+        assert Y.base.nbytes == end_p - beg_p
+        assert Y.base.nbytes < Xusm.usm_data.nbytes
+    Ynp = np.broadcast_to(Xnp[1, 1], (3, 5))
+    Yusm = dpt.broadcast_to(Xusm[1, 1], (3, 5))
+    Y = dpt.to_numpy(Yusm)
+    assert np.array_equal(Y, Ynp)
+    assert Y.base.nbytes == Ynp.itemsize * 5
+    Zusm = Xusm[:, :0]
+    assert dpt.to_numpy(Zusm).shape == Zusm.shape
+
+
 @pytest.mark.parametrize(
     "dtype",
     _all_dtypes,
@@ -2729,6 +2767,52 @@ def test_setitem_from_numpy_contig():
     assert dpt.all(dpt.flip(Xdpt, axis=-1) == expected)
 
 
+def test_async_upload():
+    q = get_queue_or_skip()
+
+    prev = dpt.set_async_upload(True)
+    try:
+        Xnp = np.reshape(np.arange(60, dtype="i8"), (6, 10))
+        X = dpt.asarray(Xnp[:, ::-2], dtype="f4", sycl_queue=q)
+        Y = dpt.from_numpy(Xnp, sycl_queue=q)
+        Z = dpt.zeros((3, 6, 10), dtype="i4", sycl_queue=q)
+        Z[1:] = Xnp[1]
+        # source may be modified once the call returns
+        Xnp[...] = -1
+        with pytest.raises(ValueError):
+            Z[...] = np.ones(4)
+    finally:
+        assert dpt.set_async_upload(prev) is True
+    expected = np.reshape(np.arange(60), (6, 10))
+    np.testing.assert_array_equal(
+        dpt.asnumpy(X), expected[:, ::-2].astype("f4")
+    )
+    np.testing.assert_array_equal(dpt.asnumpy(Y), expected)
+    assert dpt.all(Z[0] == 0)
+    np.testing.assert_array_equal(
+        dpt.asnumpy(Z[1:]), np.broadcast_to(expected[1], (2, 6, 10))
+    )
+
+
+def test_async_upload_context():
+    q = get_queue_or_skip()
+
+    assert dpt.set_async_upload(False) is False
+    with dpt.async_upload():
+        # half precision data are staged as single precision on
+        # devices without fp16 support
+        Xnp = np.linspace(0, 1, num=16, dtype="e")
+        X = dpt.asarray(Xnp, sycl_queue=q)
+        with dpt.async_upload(False):
+            Y = dpt.asarray(Xnp, sycl_queue=q)
+        assert dpt.set_async_upload(True) is True
+    # previous setting is restored on exit
+    assert dpt.set_async_upload(False) is False
+    assert X.dtype == Y.dtype
+    np.testing.assert_array_equal(dpt.asnumpy(X), dpt.asnumpy(Y))
+    np.testing.assert_allclose(dpt.asnumpy(X), Xnp, rtol=1e-3)
+
+
 def test_full_functions_raise_type_error():
     get_queue_or_skip()
 
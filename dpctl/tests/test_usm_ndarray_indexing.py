@@ -165,6 +165,36 @@ def test_basic_slice10():
     assert y.strides == (0, n1 * n2, n2, 1)
 
 
+def test_basic_slice_of_view():
+    q = get_queue_or_skip()
+    x = dpt.reshape(dpt.arange(60, dtype="i4", sycl_queue=q), (6, 10))
+    y = x[1:, 2:]
+    # offset of nested views accumulates
+    z = y[2, 1::3]
+    assert z._element_offset == 3 * 10 + 3
+    assert dpt.asnumpy(z).tolist() == [33, 36, 39]
+    assert not y.flags.c_contiguous
+    assert x[2].flags.c_contiguous
+    assert x[2:4].flags.c_contiguous
+    x.flags["W"] = False
+    assert not x[1:3].flags.writable
+    assert not x[..., None].flags.writable
+    with pytest.raises(ValueError):
+        x[0] = 1
+
+
+def test_real_imag_views_of_slice():
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported("c8", q)
+    x_np = np.arange(12, dtype="f4") + 1j * np.arange(12, 24, dtype="f4")
+    x = dpt.asarray(x_np.astype("c8"), sycl_queue=q)
+    y = x[3:10:2]
+    assert_array_equal(dpt.asnumpy(y.real), x_np.real[3:10:2])
+    assert_array_equal(dpt.asnumpy(y.imag), x_np.imag[3:10:2])
+    assert y.real._element_offset == 6
+    assert y.imag._element_offset == 7
+
+
 def _all_equal(it1, it2):
     return all(bool(x == y) for x, y in zip(it1, it2))
 
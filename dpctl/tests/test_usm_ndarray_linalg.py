@@ -15,12 +15,14 @@
 #  limitations under the License.
 
 import itertools
+import json
 
 import numpy as np
 import pytest
 
 import dpctl
 import dpctl.tensor as dpt
+import dpctl.tensor._gemm_tuning as _gemm_tuning
 from dpctl.tests.helper import get_queue_or_skip, skip_if_dtype_not_supported
 from dpctl.utils import ExecutionPlacementError
 
@@ -1013,3 +1015,237 @@ def test_matmul_out_appended_axes():
     out = dpt.empty((), dtype="i4")
     dpt.matmul(x1, x2, out=out)
     assert out == n1
+
+
+def test_matmul_autotuning(tmp_path):
+    get_queue_or_skip()
+
+    fn = tmp_path / "gemm_tuning.json"
+    prev_file = dpt.get_gemm_tuning_file()
+    dpt.set_gemm_tuning_file(fn)
+    prev = dpt.set_gemm_autotuning(True)
+    try:
+        dpt.clear_gemm_tuning()
+        for n, k, m in [(64, 33, 48), (17, 50, 2), (3, 7, 5)]:
+            x1 = dpt.reshape(dpt.arange(n * k, dtype="i4") % 5, (n, k))
+            x2 = dpt.reshape(dpt.arange(k * m, dtype="i4") % 3, (k, m))
+            expected = np.matmul(dpt.asnumpy(x1), dpt.asnumpy(x2))
+            # first call is tuned, second uses the recorded tiling
+            for _ in range(2):
+                r = dpt.matmul(x1, x2)
+                assert np.array_equal(dpt.asnumpy(r), expected)
+        assert fn.is_file()
+        entries = json.loads(fn.read_text())["entries"]
+        assert len(entries) == 3
+
+        # tilings are loaded from the file and used without autotuning
+        dpt.clear_gemm_tuning()
+        dpt.set_gemm_autotuning(False)
+        dpt.set_gemm_tuning_file(fn)
+        r = dpt.matmul(x1, x2)
+        assert np.array_equal(dpt.asnumpy(r), expected)
+
+        dpt.clear_gemm_tuning(on_disk=True)
+        assert not fn.exists()
+    finally:
+        dpt.set_gemm_autotuning(prev)
+        dpt.set_gemm_tuning_file(prev_file)
+        dpt.clear_gemm_tuning()
+
+
+def test_matmul_tuning_exceeding_work_group_size(tmp_path):
+    q = get_queue_or_skip()
+
+    n, k, m = 64, 33, 48
+    max_wg = q.sycl_device.max_work_group_size
+    # work-group of 16 * nm_wg_delta_m work-items exceeds the device limit,
+    # and is reduced by the kernel
+    key = "{}|int32|{},{},{}".format(
+        _gemm_tuning._device_key(q),
+        n.bit_length(),
+        k.bit_length(),
+        m.bit_length(),
+    )
+    fn = tmp_path / "gemm_tuning.json"
+    fn.write_text(
+        json.dumps({"version": 1, "entries": {key: [2 * max_wg, 0, 0]}})
+    )
+    prev_file = dpt.get_gemm_tuning_file()
+    try:
+        dpt.clear_gemm_tuning()
+        dpt.set_gemm_tuning_file(fn)
+        x1 = dpt.reshape(dpt.arange(n * k, dtype="i4", sycl_queue=q), (n, k))
+        x2 = dpt.reshape(dpt.arange(k * m, dtype="i4", sycl_queue=q), (k, m))
+        r = dpt.matmul(x1 % 5, x2 % 3)
+        expected = np.matmul(dpt.asnumpy(x1) % 5, dpt.asnumpy(x2) % 3)
+        assert np.array_equal(dpt.asnumpy(r), expected)
+    finally:
+        dpt.set_gemm_tuning_file(prev_file)
+        dpt.clear_gemm_tuning()
+
+
+@pytest.mark.parametrize("dtype", ["f4", "f8", "c8", "i4"])
+def test_fused_matmul_bias_alpha_beta(dtype):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(dtype, q)
+
+    n, k, m = 7, 13, 5
+    x1_np = (np.arange(n * k) % 5).reshape(n, k).astype(dtype)
+    x2_np = (np.arange(k * m) % 3).reshape(k, m).astype(dtype)
+    b_np = np.arange(m).astype(dtype)
+    out_np = np.ones((n, m), dtype=dtype)
+    x1, x2, b = dpt.asarray(x1_np), dpt.asarray(x2_np), dpt.asarray(b_np)
+
+    r = dpt.fused_matmul(x1, x2, b, alpha=2)
+    assert np.allclose(dpt.asnumpy(r), 2 * (x1_np @ x2_np) + b_np)
+
+    out = dpt.asarray(out_np)
+    r = dpt.fused_matmul(x1, x2, b, alpha=2, beta=3, out=out)
+    assert r is out
+    assert np.allclose(dpt.asnumpy(out), 2 * (x1_np @ x2_np) + 3 + b_np)
+
+    # non-contiguous output and bias
+    out = dpt.ones((m, n), dtype=dtype).mT
+    b_s = dpt.asarray(np.repeat(b_np, 2))[::2]
+    dpt.fused_matmul(x1, x2, b_s, beta=-1, out=out)
+    assert np.allclose(dpt.asnumpy(out), (x1_np @ x2_np) - 1 + b_np)
+
+
+@pytest.mark.parametrize("activation", ["relu", "gelu", "tanh"])
+def test_fused_matmul_activation(activation):
+    get_queue_or_skip()
+
+    x1_np = np.linspace(-2, 2, num=12, dtype="f4").reshape(2, 3, 2)
+    x2_np = np.linspace(-1, 1, num=8, dtype="f4").reshape(2, 4)
+    x1, x2 = dpt.asarray(x1_np), dpt.asarray(x2_np)
+    b = dpt.asarray([0.5], dtype="f4")
+
+    r = dpt.fused_matmul(x1, x2, b, activation=activation)
+    expected = dpt.matmul(x1, x2) + 0.5
+    if activation == "relu":
+        expected = dpt.maximum(expected, 0)
+    elif activation == "gelu":
+        expected = 0.5 * expected * (1 + dpt.erf(expected / np.sqrt(2)))
+    else:
+        expected = dpt.tanh(expected)
+    assert r.shape == (2, 3, 4)
+    assert dpt.allclose(r, expected, atol=1e-6)
+
+
+def test_fused_matmul_validation():
+    get_queue_or_skip()
+
+    x1 = dpt.ones((3, 4), dtype="f4")
+    x2 = dpt.ones((4, 5), dtype="f4")
+    with pytest.raises(ValueError):
+        dpt.fused_matmul(x1, x2, activation="sigmoid")
+    with pytest.raises(ValueError):
+        dpt.fused_matmul(x1, x2, beta=1)
+    with pytest.raises(ValueError):
+        dpt.fused_matmul(x1, x2, dpt.ones(4, dtype="f4"))
+    with pytest.raises(TypeError):
+        dpt.fused_matmul(x1, x2, alpha=1j)
+    xi = dpt.ones((3, 4), dtype="i4")
+    with pytest.raises(TypeError):
+        dpt.fused_matmul(xi, xi.mT, alpha=0.5)
+    with pytest.raises(ValueError):
+        dpt.fused_matmul(xi, xi.mT, activation="gelu")
+
+
+def test_fused_matmul_validation_keeps_out():
+    get_queue_or_skip()
+
+    x1 = dpt.ones((3, 4), dtype="i4")
+    x2 = dpt.ones((4, 5), dtype="i4")
+    out = dpt.full((3, 5), 7, dtype="i4")
+    # invalid calls raise before the product is written to `out`
+    with pytest.raises(TypeError):
+        dpt.fused_matmul(x1, x2, out=out, alpha=0.5)
+    with pytest.raises(ValueError):
+        dpt.fused_matmul(x1, x2, out=out, activation="tanh")
+    with pytest.raises(ValueError):
+        dpt.fused_matmul(x1, x2, dpt.ones((2, 5), dtype="i4"), out=out)
+    with pytest.raises(ValueError):
+        dpt.fused_matmul(x1, x2, dpt.ones(4, dtype="i4"), out=out)
+    assert dpt.all(out == 7)
+
+
+@pytest.mark.parametrize("beta", [0, 1])
+def test_fused_matmul_bias_overlapping_out(beta):
+    get_queue_or_skip()
+
+    x1 = dpt.ones((3, 4), dtype="i4")
+    x2 = dpt.ones((4, 5), dtype="i4")
+    out = dpt.reshape(dpt.arange(15, dtype="i4"), (3, 5))
+    # bias is the first row of `out`, which the product overwrites
+    expected = 4 + beta * dpt.asnumpy(out) + dpt.asnumpy(out[0])
+    r = dpt.fused_matmul(x1, x2, out[0], beta=beta, out=out)
+    assert r is out
+    assert np.array_equal(dpt.asnumpy(out), expected)
+
+
+@pytest.mark.parametrize(
+    "subscripts,shapes",
+    [
+        ("ij,jk->ik", [(3, 4), (4, 5)]),
+        ("ij,jk", [(3, 4), (4, 5)]),
+        ("ij,jk,kl->il", [(2, 30), (30, 40), (40, 5)]),
+        ("bij,bjk->bik", [(3, 4, 5), (3, 5, 2)]),
+        ("...ij,...jk->...ik", [(2, 1, 3, 4), (5, 4, 2)]),
+        ("i,j->ij", [(3,), (4,)]),
+        ("ij,ij->i", [(3, 4), (3, 4)]),
+        ("ii->i", [(4, 4)]),
+        ("ii", [(4, 4)]),
+        ("ij->ji", [(3, 4)]),
+        ("ijk->", [(2, 3, 4)]),
+        ("iij,jk->ik", [(3, 3, 4), (4, 2)]),
+        ("ab,bc,cd,de->ae", [(3, 4), (4, 5), (5, 2), (2, 6)]),
+    ],
+)
+@pytest.mark.parametrize("optimize", ["greedy", "optimal", False])
+def test_einsum(subscripts, shapes, optimize):
+    get_queue_or_skip()
+
+    ops_np = [
+        (np.arange(np.prod(sh), dtype="i4") % 7 - 3).reshape(sh)
+        for sh in shapes
+    ]
+    ops = [dpt.asarray(op) for op in ops_np]
+    expected = np.einsum(subscripts, *ops_np)
+    r = dpt.einsum(subscripts, *ops, optimize=optimize)
+    assert r.shape == expected.shape
+    assert np.array_equal(dpt.asnumpy(r), expected)
+    for op in ops:
+        assert r.usm_data is not op.usm_data
+
+
+def test_einsum_path():
+    get_queue_or_skip()
+
+    x1 = dpt.ones((2, 30), dtype="f4")
+    x2 = dpt.ones((30, 40), dtype="f4")
+    x3 = dpt.ones((40, 5), dtype="f4")
+    path = dpt.einsum_path("ij,jk,kl->il", x1, x2, x3, optimize="optimal")
+    assert path == [(0, 1), (0, 1)]
+    r1 = dpt.einsum("ij,jk,kl->il", x1, x2, x3, optimize=[(1, 2), (0, 1)])
+    r2 = dpt.einsum("ij,jk,kl->il", x1, x2, x3, optimize=path)
+    assert dpt.all(r1 == 30 * 40)
+    assert dpt.all(r2 == 30 * 40)
+
+
+def test_einsum_validation():
+    get_queue_or_skip()
+
+    x = dpt.ones((3, 4), dtype="f4")
+    with pytest.raises(ValueError):
+        dpt.einsum("ij,jk->ik", x)
+    with pytest.raises(ValueError):
+        dpt.einsum("ij,jk->ik", x, x)
+    with pytest.raises(ValueError):
+        dpt.einsum("ij->ijk", x)
+    with pytest.raises(ValueError):
+        dpt.einsum("ij->ii", x)
+    with pytest.raises(ValueError):
+        dpt.einsum("ij,jk->ik", x, x.mT, optimize=[(0, 0)])
+    with pytest.raises(TypeError):
+        dpt.einsum("ij", np.ones((3, 4)))
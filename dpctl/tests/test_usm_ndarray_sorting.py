@@ -338,3 +338,133 @@ def test_sort_complex_fp_nan(dtype):
         assert np.array_equal(
             r1.view(np.int64), r2.view(np.int64)
         ), f"Failed for {i} and {j}"
+
+
+@pytest.mark.parametrize("dtype", ["i1", "u2", "i4", "f4", "f8"])
+@pytest.mark.parametrize("n_cols", [16, 32, 100, 256])
+def test_sort_short_rows(dtype, n_cols):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(dtype, q)
+
+    rng = np.random.default_rng(1234)
+    # many repeated values exercise stability
+    x_np = rng.integers(0, 7, size=(129, n_cols)).astype(dtype)
+    x = dpt.asarray(x_np, sycl_queue=q)
+
+    for descending in [False, True]:
+        s = dpt.sort(x, descending=descending)
+        i = dpt.argsort(x, descending=descending)
+        keys = -x_np.astype("f8") if descending else x_np
+        expected_i = np.argsort(keys, axis=-1, kind="stable")
+        assert np.array_equal(dpt.asnumpy(i), expected_i)
+        assert np.array_equal(
+            dpt.asnumpy(s), np.take_along_axis(x_np, expected_i, axis=-1)
+        )
+
+
+@pytest.mark.parametrize("dtype", ["i1", "i4", "f4", "f8"])
+@pytest.mark.parametrize("max_size", [5, 200, 1000])
+def test_segmented_sort(dtype, max_size):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(dtype, q)
+
+    rng = np.random.default_rng(4321)
+    sizes = rng.integers(0, max_size + 1, size=25)
+    offsets_np = np.concatenate(([0], np.cumsum(sizes)))
+    x_np = rng.integers(-5, 5, size=int(offsets_np[-1])).astype(dtype)
+
+    x = dpt.asarray(x_np, sycl_queue=q)
+    offsets = dpt.asarray(offsets_np, dtype="i4", sycl_queue=q)
+
+    for descending in [False, True]:
+        keys = -x_np.astype("f8") if descending else x_np
+        expected_i = np.concatenate(
+            [
+                b + np.argsort(keys[b:e], kind="stable")
+                for b, e in zip(offsets_np[:-1], offsets_np[1:])
+            ]
+        )
+        i = dpt.segmented_argsort(x, offsets, descending=descending)
+        assert i.dtype == dpt.int64
+        assert np.array_equal(dpt.asnumpy(i), expected_i)
+        s = dpt.segmented_sort(x, offsets, descending=descending)
+        assert np.array_equal(dpt.asnumpy(s), x_np[expected_i])
+
+
+def test_segmented_sort_validation():
+    q = get_queue_or_skip()
+
+    x = dpt.arange(10, dtype="i4", sycl_queue=q)
+    with pytest.raises(TypeError):
+        dpt.segmented_sort(x, [0, 10])
+    with pytest.raises(TypeError):
+        dpt.segmented_sort(x, dpt.asarray([0.0, 10.0], sycl_queue=q))
+    with pytest.raises(ValueError):
+        dpt.segmented_sort(dpt.reshape(x, (2, 5)), dpt.asarray([0, 10]))
+    for bad in ([0, 5], [1, 10], [0, 6, 4, 10]):
+        with pytest.raises(ValueError):
+            dpt.segmented_sort(x, dpt.asarray(bad, sycl_queue=q))
+
+    e = dpt.empty(0, dtype="f4", sycl_queue=q)
+    r = dpt.segmented_sort(e, dpt.zeros(1, dtype="i8", sycl_queue=q))
+    assert r.shape == (0,)
+
+
+@pytest.mark.parametrize("key_dt", ["i1", "i4", "f4", "f8"])
+@pytest.mark.parametrize("val_dt", ["?", "i2", "f4", "i8", "c16"])
+def test_sort_by_key(key_dt, val_dt):
+    q = get_queue_or_skip()
+    skip_if_dtype_not_supported(key_dt, q)
+    skip_if_dtype_not_supported(val_dt, q)
+
+    rng = np.random.default_rng(5678)
+    k_np = rng.integers(0, 9, size=(7, 1000)).astype(key_dt)
+    v_np = rng.integers(0, 100, size=(7, 1000)).astype(val_dt)
+    k = dpt.asarray(k_np, sycl_queue=q)
+    v = dpt.asarray(v_np, sycl_queue=q)
+
+    for axis in [-1, 0]:
+        for descending in [False, True]:
+            r = dpt.sort_by_key(k, v, axis=axis, descending=descending)
+            keys = -k_np.astype("f8") if descending else k_np
+            ind = np.argsort(keys, axis=axis, kind="stable")
+            assert np.array_equal(
+                dpt.asnumpy(r.keys), np.take_along_axis(k_np, ind, axis=axis)
+            )
+            assert np.array_equal(
+                dpt.asnumpy(r.values),
+                np.take_along_axis(v_np, ind, axis=axis),
+            )
+
+
+def test_sort_by_key_validation():
+    q = get_queue_or_skip()
+
+    k = dpt.zeros(10, dtype="i4", sycl_queue=q)
+    with pytest.raises(TypeError):
+        dpt.sort_by_key(k, np.zeros(10))
+    with pytest.raises(ValueError):
+        dpt.sort_by_key(k, dpt.zeros(9, sycl_queue=q))
+
+
+def test_lexsort():
+    q = get_queue_or_skip()
+
+    rng = np.random.default_rng(8765)
+    a_np = rng.integers(0, 3, size=(5, 300)).astype("i4")
+    b_np = rng.integers(0, 4, size=(5, 300)).astype("f4")
+    c_np = rng.integers(0, 2, size=(5, 300)).astype("?")
+    keys = [dpt.asarray(v, sycl_queue=q) for v in (a_np, b_np, c_np)]
+
+    for axis in [-1, 0]:
+        r = dpt.lexsort(keys, axis=axis)
+        expected = np.lexsort((a_np, b_np, c_np), axis=axis)
+        assert np.array_equal(dpt.asnumpy(r), expected)
+
+    r = dpt.lexsort(dpt.stack(keys[:2]))
+    assert np.array_equal(dpt.asnumpy(r), np.lexsort((a_np, b_np)))
+
+    with pytest.raises(ValueError):
+        dpt.lexsort([])
+    with pytest.raises(ValueError):
+        dpt.lexsort([keys[0], keys[1][:, :5]])
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
 
 import dpctl.tensor as dpt
@@ -313,3 +314,66 @@ def test_top_k_validation():
     with pytest.raises(ValueError):
         # mode must be "largest", or "smallest"
         dpt.top_k(x, 2, mode="invalid")
+
+
+@pytest.mark.parametrize("mode", ["largest", "smallest"])
+@pytest.mark.parametrize("host_first", [False, True])
+def test_top_k_accumulator(mode, host_first):
+    q = get_queue_or_skip()
+
+    rng = np.random.default_rng(2468)
+    # distinct values make indices of the result unambiguous
+    x_np = rng.permutation(10000).astype("i4")
+    k = 50
+    acc = dpt.TopKAccumulator(k, mode=mode)
+    bounds = [(0, 31), (31, 4000), (4000, 4000), (4000, 4001), (4001, 10000)]
+    for start, stop in bounds:
+        if bool(start % 2) != host_first:
+            chunk = x_np[start:stop]
+        else:
+            # a host chunk fed first determines the queue
+            chunk_q = q if acc.sycl_queue is None else acc.sycl_queue
+            chunk = dpt.asarray(x_np[start:stop], sycl_queue=chunk_q)
+        acc.update(chunk)
+        assert acc.sycl_queue is not None
+    assert acc.count == x_np.size
+    r = acc.result()
+    expected = dpt.top_k(dpt.asarray(x_np, sycl_queue=q), k, mode=mode)
+
+    vals = np.sort(dpt.asnumpy(r.values))
+    assert np.array_equal(vals, np.sort(dpt.asnumpy(expected.values)))
+    assert np.array_equal(x_np[dpt.asnumpy(r.indices)], dpt.asnumpy(r.values))
+
+
+def test_top_k_accumulator_offsets():
+    q = get_queue_or_skip()
+
+    acc = dpt.TopKAccumulator(2, sycl_queue=q)
+    with pytest.raises(ValueError):
+        acc.result()
+    acc.update(dpt.asarray([1, 7, 3], sycl_queue=q), offset=100)
+    acc.update(dpt.asarray([5], sycl_queue=q), offset=10)
+    r = acc.result()
+    res = sorted(zip(dpt.asnumpy(r.values), dpt.asnumpy(r.indices)))
+    assert res == [(5, 10), (7, 101)]
+
+    with pytest.raises(TypeError):
+        acc.update(dpt.asarray([1.0], sycl_queue=q))
+    with pytest.raises(ValueError):
+        dpt.TopKAccumulator(0)
+    with pytest.raises(ValueError):
+        dpt.TopKAccumulator(3, mode="median")
+
+
+def test_top_k_accumulator_reused_chunk():
+    q = get_queue_or_skip()
+
+    acc = dpt.TopKAccumulator(4, sycl_queue=q)
+    buf = dpt.asarray([5, 9], dtype="i4", sycl_queue=q)
+    acc.update(buf)
+    # chunk buffer is overwritten with the next chunk
+    buf[...] = dpt.asarray([1, 7], dtype="i4", sycl_queue=q)
+    acc.update(buf)
+    r = acc.result()
+    res = sorted(zip(dpt.asnumpy(r.values), dpt.asnumpy(r.indices)))
+    assert res == [(1, 2), (5, 0), (7, 3), (9, 1)]
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
 
 import dpctl
@@ -343,3 +344,80 @@ def test_gh_1738():
     assert dt == ind_dt
     dt = dpt.unique_all(iota).inverse_indices.dtype
     assert dt == ind_dt
+
+
+def _skip_if_no_atomic64(q):
+    if not q.sycl_device.has_aspect_atomic64:
+        pytest.skip("Device does not support 64-bit atomics")
+
+
+@pytest.mark.parametrize("dtype", ["?", "i1", "u1", "i4", "u4", "i8", "u8"])
+def test_unique_hash_method(dtype):
+    q = get_queue_or_skip()
+    _skip_if_no_atomic64(q)
+
+    n = 5000
+    x = dpt.astype(dpt.arange(n, sycl_queue=q) % 7, dtype)
+    if dtype in ("i1", "i4", "i8"):
+        x = x - 3
+    x_np = dpt.asnumpy(x)
+    expected, first, inv, counts = np.unique(
+        x_np, return_index=True, return_inverse=True, return_counts=True
+    )
+
+    uv = dpt.unique_values(x, method="hash")
+    assert uv.dtype == x.dtype
+    assert np.array_equal(dpt.asnumpy(uv), expected)
+
+    uc = dpt.unique_counts(x, method="hash")
+    assert np.array_equal(dpt.asnumpy(uc.values), expected)
+    assert np.array_equal(dpt.asnumpy(uc.counts), counts)
+
+    ui = dpt.unique_inverse(x, method="hash")
+    assert np.array_equal(dpt.asnumpy(ui.values), expected)
+    assert np.array_equal(dpt.asnumpy(ui.inverse_indices), inv.ravel())
+
+    ua = dpt.unique_all(x[::-1], method="hash")
+    exp_all = np.unique(
+        x_np[::-1], return_index=True, return_inverse=True, return_counts=True
+    )
+    for r, e in zip(ua, exp_all):
+        assert np.array_equal(dpt.asnumpy(r), e.ravel())
+
+
+def test_unique_hash_extreme_values():
+    q = get_queue_or_skip()
+    _skip_if_no_atomic64(q)
+
+    # value with all bits set is stored in a reserved slot
+    x = dpt.asarray([-1, 0, -1, 5, 0, -1], dtype="i8", sycl_queue=q)
+    uc = dpt.unique_counts(x, method="hash")
+    assert dpt.asnumpy(uc.values).tolist() == [-1, 0, 5]
+    assert dpt.asnumpy(uc.counts).tolist() == [3, 2, 1]
+
+    m = np.iinfo(np.uint64).max
+    x = dpt.asarray([m, 0, m], dtype="u8", sycl_queue=q)
+    assert dpt.asnumpy(dpt.unique_values(x, method="hash")).tolist() == [0, m]
+
+
+def test_unique_hash_many_distinct():
+    q = get_queue_or_skip()
+    _skip_if_no_atomic64(q)
+
+    # more distinct values than the sample suggests overflow the table
+    n = 2**17
+    x = dpt.arange(n, dtype="i4", sycl_queue=q)
+    x[: n // 2] = 0
+    res = dpt.unique_values(x, method="hash")
+    assert res.shape == (n // 2 + 1,)
+    assert dpt.all(res == dpt.unique_values(x, method="sort"))
+
+
+def test_unique_method_validation():
+    q = get_queue_or_skip()
+    x = dpt.ones(10, dtype="f4", sycl_queue=q)
+    with pytest.raises(ValueError):
+        dpt.unique_values(x, method="radix")
+    with pytest.raises(ValueError):
+        dpt.unique_counts(x, method="hash")
+    assert dpt.unique_values(x, method="auto").shape == (1,)
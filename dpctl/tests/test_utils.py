@@ -20,6 +20,7 @@
 import pytest
 
 import dpctl
+import dpctl.tensor as dpt
 import dpctl.utils
 
 
@@ -183,3 +184,59 @@ def test_order_manager():
         _passed = True
     finally:
         assert _passed
+
+
+def test_order_manager_coalescing():
+    try:
+        q = dpctl.SyclQueue()
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("Queue could not created for default-selected device")
+    _som = dpctl.utils.SequentialOrderManager
+    _mngr = _som[q]
+    _mngr.coalesce_threshold = 4
+    assert _mngr.coalesce_threshold == 4
+    # barriers waiting for a long-running sort stay outstanding, so
+    # that they are not pruned as complete before being coalesced
+    dpt.sort(dpt.arange(2**22, 0, -1, dtype="i8", sycl_queue=q))
+    sort_evs = _mngr.submitted_events
+    for _ in range(64):
+        ev = q.submit_barrier(sort_evs)
+        _mngr.add_event_pair(dpctl.SyclEvent(), ev)
+        assert _mngr.num_submitted_events <= 4
+    stats = _mngr.stats
+    assert isinstance(stats, dict)
+    for k in (
+        "pruned_events",
+        "coalesced_events",
+        "barriers",
+        "peak_submitted_events",
+        "peak_host_task_events",
+    ):
+        assert isinstance(stats[k], int)
+    assert stats["barriers"] >= 1
+    assert stats["coalesced_events"] >= 5 * stats["barriers"]
+    with pytest.raises(ValueError):
+        _mngr.coalesce_threshold = -1
+    _mngr.coalesce_threshold = 0
+    _mngr.wait()
+    assert _mngr.num_submitted_events == 0
+    _som.clear()
+
+
+def test_order_manager_in_order_queue():
+    try:
+        q = dpctl.SyclQueue(property="in_order")
+    except dpctl.SyclQueueCreationError:
+        pytest.skip("Queue could not created for default-selected device")
+    _som = dpctl.utils.SequentialOrderManager
+    _mngr = _som[q]
+    assert _mngr.is_in_order
+    for _ in range(16):
+        ev = q.submit_barrier()
+        _mngr.add_event_pair(dpctl.SyclEvent(), ev)
+        assert _mngr.dependency_events == []
+        assert _mngr.num_submitted_events <= 1
+        assert len(_mngr.submitted_events) <= 1
+    _mngr.wait()
+    assert _mngr.num_submitted_events == 0
+    _som.clear()
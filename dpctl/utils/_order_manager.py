@@ -1,3 +1,4 @@
+import operator
 import weakref
 from collections import defaultdict
 from contextvars import ContextVar
@@ -6,15 +7,37 @@ from .._sycl_event import SyclEvent
 from .._sycl_queue import SyclQueue
 from ._seq_order_keeper import _OrderManager
 
+# number of outstanding events above which they are replaced with a barrier
+_default_coalesce_threshold = 16
+
 
 class _SequentialOrderManager:
     """
     Class to orchestrate default sequential order
     of the tasks offloaded from Python.
+
+    Completed events are dropped whenever events are added or
+    queried. If the manager is associated with a queue, and the number
+    of outstanding events exceeds :attr:`coalesce_threshold`, they are
+    replaced with a single barrier event submitted to that queue, so
+    that lists of dependencies handed to offloaded tasks stay short.
+
+    Tasks submitted to an in-order queue are executed in order of their
+    submission, hence the manager associated with such a queue only keeps
+    the event of the most recently submitted task, and events of host
+    tasks which keep temporary allocations alive. Its
+    :attr:`dependency_events` list is empty.
     """
 
-    def __init__(self):
+    def __init__(self, sycl_queue=None):
         self._state = _OrderManager(16)
+        self._queue = sycl_queue
+        self._in_order = False
+        if sycl_queue is not None:
+            self._state.set_coalescing(sycl_queue, _default_coalesce_threshold)
+            if sycl_queue.is_in_order:
+                self._in_order = True
+                self._state.set_in_order(True)
 
     def __dealloc__(self):
         _local = self._state
@@ -54,6 +77,51 @@ class _SequentialOrderManager:
         _local = self._state
         return _local.get_submitted_events()
 
+    @property
+    def dependency_events(self):
+        """List of events tasks offloaded to the associated queue must
+        depend on to execute after tasks submitted earlier. The list is
+        empty for in-order queues, which order tasks themselves. Use
+        :attr:`submitted_events` to synchronize with the host, or to make
+        tasks submitted to other queues depend on submitted tasks."""
+        if self._in_order:
+            return []
+        _local = self._state
+        return _local.get_submitted_events()
+
+    @property
+    def is_in_order(self):
+        """``True`` if dependencies between tasks submitted to the
+        associated queue are not tracked, since the queue is in-order."""
+        return self._in_order
+
+    @property
+    def coalesce_threshold(self):
+        """Number of outstanding events above which they are coalesced
+        into a barrier event. Zero value disables coalescing."""
+        return self._state.get_coalesce_threshold()
+
+    @coalesce_threshold.setter
+    def coalesce_threshold(self, value):
+        value = operator.index(value)
+        if value < 0:
+            raise ValueError("Threshold must be non-negative")
+        if self._queue is None:
+            raise ValueError(
+                "Coalescing requires order manager associated with a queue"
+            )
+        self._state.set_coalescing(self._queue, value)
+
+    @property
+    def stats(self):
+        """Dictionary with counts of events dropped as complete
+        (``"pruned_events"``), of events replaced by barriers
+        (``"coalesced_events"``), of submitted barriers
+        (``"barriers"``), and the largest observed numbers of outstanding
+        events (``"peak_submitted_events"``, ``"peak_host_task_events"``).
+        """
+        return self._state.get_stats()
+
     def wait(self):
         _local = self._state
         return _local.wait()
@@ -61,6 +129,8 @@ class _SequentialOrderManager:
     def __copy__(self):
         res = _SequentialOrderManager.__new__(_SequentialOrderManager)
         res._state = _OrderManager(self._state)
+        res._queue = self._queue
+        res._in_order = self._in_order
         return res
 
 
@@ -82,7 +152,7 @@ class SyclQueueToOrderManagerMap:
         if q in _local:
             return _local[q]
         else:
-            v = _local[q]
+            v = _SequentialOrderManager(q)
             _local[q] = v
             return v
 
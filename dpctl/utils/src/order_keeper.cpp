@@ -25,6 +25,22 @@ PYBIND11_MODULE(_seq_order_keeper, m)
              &SequentialOrder::add_to_host_task_events)
         .def("add_to_submitted_events",
              &SequentialOrder::add_to_submitted_events)
+        .def("set_coalescing", &SequentialOrder::set_coalescing,
+             py::arg("sycl_queue"), py::arg("threshold"))
+        .def("get_coalesce_threshold", &SequentialOrder::get_coalesce_threshold)
+        .def("set_in_order", &SequentialOrder::set_in_order)
+        .def("is_in_order", &SequentialOrder::is_in_order)
+        .def("get_stats",
+             [](const SequentialOrder &self) {
+                 const SequentialOrderStats &stats = self.get_stats();
+                 py::dict res;
+                 res["pruned_events"] = stats.pruned_events;
+                 res["coalesced_events"] = stats.coalesced_events;
+                 res["barriers"] = stats.barriers;
+                 res["peak_submitted_events"] = stats.peak_submitted_events;
+                 res["peak_host_task_events"] = stats.peak_host_task_events;
+                 return res;
+             })
         .def("wait", &SequentialOrder::wait,
              py::call_guard<py::gil_scoped_release>());
 
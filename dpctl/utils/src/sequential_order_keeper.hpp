@@ -3,6 +3,8 @@
 
 #include <algorithm>
 #include <cstddef>
+#include <iterator>
+#include <optional>
 #include <vector>
 
 namespace
@@ -17,23 +19,85 @@ bool is_event_complete(const sycl::event &e)
 }
 } // namespace
 
+struct SequentialOrderStats
+{
+    // events found complete and dropped
+    std::size_t pruned_events = 0;
+    // outstanding events replaced by barriers
+    std::size_t coalesced_events = 0;
+    // barriers submitted to replace outstanding events
+    std::size_t barriers = 0;
+    // largest number of outstanding events
+    std::size_t peak_submitted_events = 0;
+    std::size_t peak_host_task_events = 0;
+};
+
 class SequentialOrder
 {
 private:
     std::vector<sycl::event> host_task_events;
     std::vector<sycl::event> submitted_events;
+    std::optional<sycl::queue> barrier_queue{};
+    std::size_t coalesce_threshold = 0;
+    // for in-order queues only the latest submitted event is kept
+    bool in_order = false;
+    SequentialOrderStats stats{};
+
+    static std::size_t prune_vector(std::vector<sycl::event> &events)
+    {
+        const auto &it =
+            std::remove_if(events.begin(), events.end(), is_event_complete);
+        const std::size_t n_pruned = std::distance(it, events.end());
+        events.erase(it, events.end());
+        return n_pruned;
+    }
 
     void prune_complete()
     {
-        const auto &ht_it =
-            std::remove_if(host_task_events.begin(), host_task_events.end(),
-                           is_event_complete);
-        host_task_events.erase(ht_it, host_task_events.end());
+        stats.pruned_events += prune_vector(host_task_events);
+        stats.pruned_events += prune_vector(submitted_events);
+    }
+
+    void push_submitted(const sycl::event &comp_ev)
+    {
+        if (is_event_complete(comp_ev)) {
+            return;
+        }
+        if (in_order) {
+            // completion of the latest task implies completion of
+            // all tasks submitted to in-order queue before it
+            submitted_events.clear();
+        }
+        submitted_events.push_back(comp_ev);
+    }
 
-        const auto &sub_it =
-            std::remove_if(submitted_events.begin(), submitted_events.end(),
-                           is_event_complete);
-        submitted_events.erase(sub_it, submitted_events.end());
+    void coalesce_vector(std::vector<sycl::event> &events)
+    {
+        if (events.size() <= coalesce_threshold) {
+            return;
+        }
+        sycl::event barrier_ev = barrier_queue->submit(
+            [&](sycl::handler &cgh) { cgh.ext_oneapi_barrier(events); });
+        stats.coalesced_events += events.size();
+        ++stats.barriers;
+        events.clear();
+        events.push_back(barrier_ev);
+    }
+
+    /*! @brief Replaces outstanding events with a single barrier event
+     * if their number exceeds the threshold, so that lists of
+     * dependencies handed to kernels stay short */
+    void coalesce()
+    {
+        stats.peak_host_task_events =
+            std::max(stats.peak_host_task_events, host_task_events.size());
+        stats.peak_submitted_events =
+            std::max(stats.peak_submitted_events, submitted_events.size());
+        if (!barrier_queue.has_value() || coalesce_threshold == 0) {
+            return;
+        }
+        coalesce_vector(host_task_events);
+        coalesce_vector(submitted_events);
     }
 
 public:
@@ -46,7 +110,9 @@ public:
 
     SequentialOrder(const SequentialOrder &other)
         : host_task_events(other.host_task_events),
-          submitted_events(other.submitted_events)
+          submitted_events(other.submitted_events),
+          barrier_queue(other.barrier_queue),
+          coalesce_threshold(other.coalesce_threshold), in_order(other.in_order)
     {
         prune_complete();
     }
@@ -55,6 +121,10 @@ public:
     {
         host_task_events = std::move(other.host_task_events);
         submitted_events = std::move(other.submitted_events);
+        barrier_queue = std::move(other.barrier_queue);
+        coalesce_threshold = other.coalesce_threshold;
+        in_order = other.in_order;
+        stats = other.stats;
         prune_complete();
     }
 
@@ -62,6 +132,9 @@ public:
     {
         host_task_events = other.host_task_events;
         submitted_events = other.submitted_events;
+        barrier_queue = other.barrier_queue;
+        coalesce_threshold = other.coalesce_threshold;
+        in_order = other.in_order;
 
         prune_complete();
         return *this;
@@ -72,11 +145,42 @@ public:
         if (this != &other) {
             host_task_events = std::move(other.host_task_events);
             submitted_events = std::move(other.submitted_events);
+            barrier_queue = std::move(other.barrier_queue);
+            coalesce_threshold = other.coalesce_threshold;
+            in_order = other.in_order;
+            stats = other.stats;
             prune_complete();
         }
         return *this;
     }
 
+    /*! @brief Enables coalescing of more than `threshold` outstanding
+     * events into a barrier submitted to `q`. Zero threshold disables
+     * coalescing. */
+    void set_coalescing(const sycl::queue &q, std::size_t threshold)
+    {
+        barrier_queue = q;
+        coalesce_threshold = threshold;
+        coalesce();
+    }
+
+    std::size_t get_coalesce_threshold() const { return coalesce_threshold; }
+
+    /*! @brief Declares that tasks are executed in order of their
+     * submission, so that only the latest submitted event is kept */
+    void set_in_order(bool value)
+    {
+        in_order = value;
+        if (in_order && submitted_events.size() > 1) {
+            submitted_events.erase(submitted_events.begin(),
+                                   submitted_events.end() - 1);
+        }
+    }
+
+    bool is_in_order() const { return in_order; }
+
+    const SequentialOrderStats &get_stats() const { return stats; }
+
     std::size_t get_num_submitted_events() const
     {
         return submitted_events.size();
@@ -117,8 +221,8 @@ public:
         prune_complete();
         if (!is_event_complete(ht_ev))
             host_task_events.push_back(ht_ev);
-        if (!is_event_complete(comp_ev))
-            submitted_events.push_back(comp_ev);
+        push_submitted(comp_ev);
+        coalesce();
     }
 
     void add_vector_to_both_events(const std::vector<sycl::event> &ht_evs,
@@ -130,9 +234,9 @@ public:
                 host_task_events.push_back(e);
         }
         for (const auto &e : comp_evs) {
-            if (!is_event_complete(e))
-                submitted_events.push_back(e);
+            push_submitted(e);
         }
+        coalesce();
     }
 
     void add_to_host_task_events(const sycl::event &ht_ev)
@@ -141,14 +245,14 @@ public:
         if (!is_event_complete(ht_ev)) {
             host_task_events.push_back(ht_ev);
         }
+        coalesce();
     }
 
     void add_to_submitted_events(const sycl::event &comp_ev)
     {
         prune_complete();
-        if (!is_event_complete(comp_ev)) {
-            submitted_events.push_back(comp_ev);
-        }
+        push_submitted(comp_ev);
+        coalesce();
     }
 
     template <std::size_t num>
@@ -160,6 +264,7 @@ public:
             if (!is_event_complete(e))
                 host_task_events.push_back(e);
         }
+        coalesce();
     }
 
     template <std::size_t num>
@@ -167,10 +272,9 @@ public:
     {
         prune_complete();
         for (std::size_t i = 0; i < num; ++i) {
-            const auto &e = comp_events[i];
-            if (!is_event_complete(e))
-                submitted_events.push_back(e);
+            push_submitted(comp_events[i]);
         }
+        coalesce();
     }
 
     void wait()
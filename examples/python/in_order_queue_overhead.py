@@ -0,0 +1,66 @@
+#                      Data Parallel Control (dpctl)
+#
+# Copyright 2020-2025 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares per-operation host overhead of dpctl.tensor functions
+applied to small arrays allocated on out-of-order and in-order queues.
+
+Functions offloading to an in-order queue do not need to pass
+dependencies on previously submitted tasks.
+"""
+
+import time
+
+import dpctl
+import dpctl.tensor as dpt
+
+n = 16
+repeats = 2000
+
+
+def time_per_op(q):
+    x = dpt.ones(n, dtype="f4", sycl_queue=q)
+    y = dpt.empty_like(x)
+    # warm-up, so that kernels are compiled
+    dpt.add(x, x, out=y)
+    q.wait()
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        dpt.add(x, y, out=y)
+        dpt.sin(y, out=y)
+    q.wait()
+    return (time.perf_counter() - t0) / (2 * repeats)
+
+
+try:
+    q_ooo = dpctl.SyclQueue()
+    q_io = dpctl.SyclQueue(
+        q_ooo.sycl_context, q_ooo.sycl_device, property="in_order"
+    )
+except dpctl.SyclQueueCreationError:
+    print(
+        "Skipping the example, as dpctl.SyclQueue targeting "
+        "default device could not be created"
+    )
+    exit(0)
+
+print(
+    f"Applying {2 * repeats} element-wise operations to arrays with {n} "
+    f"elements on {q_ooo.sycl_device.name}"
+)
+t_ooo = time_per_op(q_ooo)
+t_io = time_per_op(q_io)
+print(f"Out-of-order queue: {t_ooo * 1e6:.2f} us per operation")
+print(f"In-order queue:     {t_io * 1e6:.2f} us per operation")
@@ -0,0 +1,54 @@
+#                      Data Parallel Control (dpctl)
+#
+# Copyright 2020-2025 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures host time of basic indexing of usm_ndarray, which creates
+views into the array without offloading any tasks.
+"""
+
+import timeit
+
+import dpctl
+import dpctl.tensor as dpt
+
+try:
+    q = dpctl.SyclQueue()
+except dpctl.SyclQueueCreationError:
+    print(
+        "Skipping the example, as dpctl.SyclQueue targeting "
+        "default device could not be created"
+    )
+    exit(0)
+
+x = dpt.reshape(dpt.arange(64 * 64, dtype="i4", sycl_queue=q), (64, 64))
+y = dpt.empty_like(x)
+
+cases = {
+    "x[i]": lambda: x[3],
+    "x[a:b]": lambda: x[2:50],
+    "x[a:b, ::2]": lambda: x[2:50, ::2],
+    "x[..., None]": lambda: x[..., None],
+    "x.real": lambda: x.real,
+}
+number = 20000
+
+print(f"Time per operation on {q.sycl_device.name}, best of 5 repeats")
+for name, fn in cases.items():
+    t = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{name:>14}: {t * 1e6:.3f} us")
+
+t = min(timeit.repeat(lambda: y.__setitem__(3, x[4]), number=1000, repeat=5))
+print(f"{'y[i] = x[j]':>14}: {t * 1e3:.3f} us")
+q.wait()
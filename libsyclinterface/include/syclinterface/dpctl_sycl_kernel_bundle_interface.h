@@ -81,6 +81,61 @@ __dpctl_give DPCTLSyclKernelBundleRef DPCTLKernelBundle_CreateFromOCLSource(
     __dpctl_keep const char *Source,
     __dpctl_keep const char *CompileOpts);
 
+/*!
+ * @brief Create a Sycl kernel bundle from a device-specific binary previously
+ * obtained with ``DPCTLKernelBundle_GetBinary``.
+ *
+ * Uses SYCL2020 interoperability layer to create sycl::kernel_bundle object
+ * in executable state for OpenCL and Level-Zero backends, without compiling
+ * the program from source or SPIR-V.
+ *
+ * @param    Ctx            An opaque pointer to a sycl::context
+ * @param    Dev            An opaque pointer to a sycl::device
+ * @param    Binary         Device-specific binary
+ * @param    Length         The size of the binary in bytes.
+ * @param    CompileOpts    Optional build flags used when building the
+ *                          program from the binary.
+ * @return   A new SyclKernelBundleRef pointer if the kernel_bundle creation
+ * succeeded, else returns NULL.
+ * @ingroup KernelBundleInterface
+ */
+DPCTL_API
+__dpctl_give DPCTLSyclKernelBundleRef
+DPCTLKernelBundle_CreateFromBinary(__dpctl_keep const DPCTLSyclContextRef Ctx,
+                                   __dpctl_keep const DPCTLSyclDeviceRef Dev,
+                                   __dpctl_keep const void *Binary,
+                                   size_t Length,
+                                   const char *CompileOpts);
+
+/*!
+ * @brief Returns the size in bytes of the device-specific binary of the
+ * program, or zero if the binary can not be retrieved.
+ *
+ * @param    KBRef          Opaque pointer to a sycl::kernel_bundle
+ * @return   Size of the binary in bytes.
+ * @ingroup KernelBundleInterface
+ */
+DPCTL_API
+size_t
+DPCTLKernelBundle_GetBinarySize(__dpctl_keep DPCTLSyclKernelBundleRef KBRef);
+
+/*!
+ * @brief Copies the device-specific binary of the program into the buffer
+ * provided by the caller.
+ *
+ * @param    KBRef          Opaque pointer to a sycl::kernel_bundle
+ * @param    Binary         Buffer to copy the binary into
+ * @param    Length         Size of the buffer in bytes, which must be equal
+ *                          to the value returned by
+ *                          ``DPCTLKernelBundle_GetBinarySize``.
+ * @return   True if the binary has been copied, else False
+ * @ingroup KernelBundleInterface
+ */
+DPCTL_API
+bool DPCTLKernelBundle_GetBinary(__dpctl_keep DPCTLSyclKernelBundleRef KBRef,
+                                 __dpctl_keep void *Binary,
+                                 size_t Length);
+
 /*!
  * @brief Returns the SyclKernel with given name from the program, if not found
  * then return NULL.
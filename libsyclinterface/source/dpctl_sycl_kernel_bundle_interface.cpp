@@ -31,11 +31,13 @@
 #include "dpctl_error_handlers.h"
 #include "dpctl_sycl_type_casters.hpp"
 #include <CL/cl.h> /* OpenCL headers     */
+#include <algorithm>
 #include <sstream>
 #include <stddef.h>
 #include <sycl/backend/opencl.hpp>
 #include <sycl/sycl.hpp> /* Sycl headers       */
 #include <utility>
+#include <vector>
 
 #ifdef DPCTL_ENABLE_L0_PROGRAM_CREATION
 // Note: include ze_api.h before level_zero.hpp. Make sure clang-format does
@@ -154,6 +156,34 @@ clCreateKernelFT get_clCreateKernel()
     return st_clCreateKernelF;
 }
 
+typedef cl_program (*clCreateProgramWithBinaryFT)(cl_context,
+                                                  cl_uint,
+                                                  const cl_device_id *,
+                                                  const size_t *,
+                                                  const unsigned char **,
+                                                  cl_int *,
+                                                  cl_int *);
+const char *clCreateProgramWithBinary_Name = "clCreateProgramWithBinary";
+clCreateProgramWithBinaryFT get_clCreateProgramWithBinary()
+{
+    static auto st_clCreateProgramWithBinaryF =
+        cl_loader::get().getSymbol<clCreateProgramWithBinaryFT>(
+            clCreateProgramWithBinary_Name);
+
+    return st_clCreateProgramWithBinaryF;
+}
+
+typedef cl_int (
+    *clGetProgramInfoFT)(cl_program, cl_program_info, size_t, void *, size_t *);
+const char *clGetProgramInfo_Name = "clGetProgramInfo";
+clGetProgramInfoFT get_clGetProgramInfo()
+{
+    static auto st_clGetProgramInfoF =
+        cl_loader::get().getSymbol<clGetProgramInfoFT>(clGetProgramInfo_Name);
+
+    return st_clGetProgramInfoF;
+}
+
 std::string _GetErrorCode_ocl_impl(cl_int code)
 {
     switch (code) {
@@ -261,6 +291,103 @@ _CreateKernelBundleWithIL_ocl_impl(const context &ctx,
                                                CompileOpts);
 }
 
+DPCTLSyclKernelBundleRef
+_CreateKernelBundleWithBinary_ocl_impl(const context &ctx,
+                                       const device &dev,
+                                       const void *Binary,
+                                       size_t length,
+                                       const char *CompileOpts)
+{
+    auto clCreateProgramWithBinaryF = get_clCreateProgramWithBinary();
+    if (clCreateProgramWithBinaryF == nullptr) {
+        return nullptr;
+    }
+
+    backend_traits<cl_be>::return_type<context> clContext;
+    clContext = get_native<cl_be>(ctx);
+    backend_traits<cl_be>::return_type<device> clDevice;
+    clDevice = get_native<cl_be>(dev);
+
+    const unsigned char *binary = static_cast<const unsigned char *>(Binary);
+    cl_int binary_status = CL_SUCCESS;
+    cl_int create_err_code = CL_SUCCESS;
+    cl_program clProgram =
+        clCreateProgramWithBinaryF(clContext, 1, &clDevice, &length, &binary,
+                                   &binary_status, &create_err_code);
+
+    if (create_err_code != CL_SUCCESS || binary_status != CL_SUCCESS) {
+        error_handler("OpenCL program could not be created from the device "
+                      "binary. OpenCL Error " +
+                          _GetErrorCode_ocl_impl((create_err_code != CL_SUCCESS)
+                                                     ? create_err_code
+                                                     : binary_status),
+                      __FILE__, __func__, __LINE__);
+        return nullptr;
+    }
+
+    return _CreateKernelBundle_common_ocl_impl(clProgram, ctx, dev,
+                                               CompileOpts);
+}
+
+/*! @brief Returns binary of the first program of the kernel bundle built for
+ * any device, or an empty vector if the binary can not be retrieved */
+std::vector<unsigned char>
+_GetBinary_ocl_impl(const kernel_bundle<bundle_state::executable> &kb)
+{
+    auto clGetProgramInfoF = get_clGetProgramInfo();
+    if (clGetProgramInfoF == nullptr) {
+        return {};
+    }
+
+    std::vector<cl_program> oclKB = get_native<cl_be>(kb);
+    if (oclKB.empty()) {
+        return {};
+    }
+    cl_program clProgram = oclKB.front();
+
+    cl_uint n_devices = 0;
+    cl_int err_code = clGetProgramInfoF(clProgram, CL_PROGRAM_NUM_DEVICES,
+                                        sizeof(cl_uint), &n_devices, nullptr);
+    if (err_code != CL_SUCCESS || n_devices == 0) {
+        return {};
+    }
+
+    std::vector<size_t> sizes(n_devices, 0);
+    err_code =
+        clGetProgramInfoF(clProgram, CL_PROGRAM_BINARY_SIZES,
+                          n_devices * sizeof(size_t), sizes.data(), nullptr);
+    if (err_code != CL_SUCCESS) {
+        error_handler("clGetProgramInfo failed: " +
+                          _GetErrorCode_ocl_impl(err_code),
+                      __FILE__, __func__, __LINE__);
+        return {};
+    }
+
+    // binaries are only returned for devices the program was built for
+    std::vector<std::vector<unsigned char>> binaries(n_devices);
+    std::vector<unsigned char *> binary_ptrs(n_devices, nullptr);
+    for (cl_uint i = 0; i < n_devices; ++i) {
+        binaries[i].resize(sizes[i]);
+        binary_ptrs[i] = (sizes[i] > 0) ? binaries[i].data() : nullptr;
+    }
+    err_code = clGetProgramInfoF(clProgram, CL_PROGRAM_BINARIES,
+                                 n_devices * sizeof(unsigned char *),
+                                 binary_ptrs.data(), nullptr);
+    if (err_code != CL_SUCCESS) {
+        error_handler("clGetProgramInfo failed: " +
+                          _GetErrorCode_ocl_impl(err_code),
+                      __FILE__, __func__, __LINE__);
+        return {};
+    }
+
+    for (auto &binary : binaries) {
+        if (!binary.empty()) {
+            return std::move(binary);
+        }
+    }
+    return {};
+}
+
 bool _HasKernel_ocl_impl(const kernel_bundle<bundle_state::executable> &kb,
                          const char *kernel_name)
 {
@@ -392,6 +519,19 @@ zeModuleDestroyFT get_zeModuleDestroy()
     return st_zeModuleDestroyF;
 }
 
+typedef ze_result_t (*zeModuleGetNativeBinaryFT)(ze_module_handle_t,
+                                                 size_t *,
+                                                 uint8_t *);
+const char *zeModuleGetNativeBinary_Name = "zeModuleGetNativeBinary";
+zeModuleGetNativeBinaryFT get_zeModuleGetNativeBinary()
+{
+    static auto st_zeModuleGetNativeBinaryF =
+        ze_loader::get().getSymbol<zeModuleGetNativeBinaryFT>(
+            zeModuleGetNativeBinary_Name);
+
+    return st_zeModuleGetNativeBinaryF;
+}
+
 typedef ze_result_t (*zeKernelCreateFT)(ze_module_handle_t,
                                         const ze_kernel_desc_t *,
                                         ze_kernel_handle_t *);
@@ -424,11 +564,12 @@ std::string _GetErrorCode_ze_impl(ze_result_t code)
 }
 
 __dpctl_give DPCTLSyclKernelBundleRef
-_CreateKernelBundleWithIL_ze_impl(const context &SyclCtx,
-                                  const device &SyclDev,
-                                  const void *IL,
-                                  size_t il_length,
-                                  const char *CompileOpts)
+_CreateKernelBundle_common_ze_impl(const context &SyclCtx,
+                                   const device &SyclDev,
+                                   ze_module_format_t Format,
+                                   const void *Input,
+                                   size_t input_length,
+                                   const char *CompileOpts)
 {
     auto zeModuleCreateFn = get_zeModuleCreate();
     if (zeModuleCreateFn == nullptr) {
@@ -450,9 +591,9 @@ _CreateKernelBundleWithIL_ze_impl(const context &SyclCtx,
     // Populate the Level Zero module descriptions
     ze_module_desc_t ZeModuleDesc = {};
     ZeModuleDesc.stype = ZE_STRUCTURE_TYPE_MODULE_DESC;
-    ZeModuleDesc.format = ZE_MODULE_FORMAT_IL_SPIRV;
-    ZeModuleDesc.inputSize = il_length;
-    ZeModuleDesc.pInputModule = (uint8_t *)IL;
+    ZeModuleDesc.format = Format;
+    ZeModuleDesc.inputSize = input_length;
+    ZeModuleDesc.pInputModule = (uint8_t *)Input;
     ZeModuleDesc.pBuildFlags = CompileOpts;
     ZeModuleDesc.pConstants = &ZeSpecConstants;
 
@@ -483,6 +624,66 @@ _CreateKernelBundleWithIL_ze_impl(const context &SyclCtx,
     }
 }
 
+__dpctl_give DPCTLSyclKernelBundleRef
+_CreateKernelBundleWithIL_ze_impl(const context &SyclCtx,
+                                  const device &SyclDev,
+                                  const void *IL,
+                                  size_t il_length,
+                                  const char *CompileOpts)
+{
+    return _CreateKernelBundle_common_ze_impl(SyclCtx, SyclDev,
+                                              ZE_MODULE_FORMAT_IL_SPIRV, IL,
+                                              il_length, CompileOpts);
+}
+
+__dpctl_give DPCTLSyclKernelBundleRef
+_CreateKernelBundleWithBinary_ze_impl(const context &SyclCtx,
+                                      const device &SyclDev,
+                                      const void *Binary,
+                                      size_t length,
+                                      const char *CompileOpts)
+{
+    return _CreateKernelBundle_common_ze_impl(
+        SyclCtx, SyclDev, ZE_MODULE_FORMAT_NATIVE, Binary, length, CompileOpts);
+}
+
+/*! @brief Returns native binary of the first module of the kernel bundle,
+ * or an empty vector if the binary can not be retrieved */
+std::vector<unsigned char>
+_GetBinary_ze_impl(const kernel_bundle<bundle_state::executable> &kb)
+{
+    auto zeModuleGetNativeBinaryFn = get_zeModuleGetNativeBinary();
+    if (zeModuleGetNativeBinaryFn == nullptr) {
+        return {};
+    }
+
+    auto ZeKernelBundle = sycl::get_native<ze_be>(kb);
+    if (ZeKernelBundle.empty()) {
+        return {};
+    }
+    ze_module_handle_t ZeModule = ZeKernelBundle.front();
+
+    size_t binary_size = 0;
+    auto ret_code = zeModuleGetNativeBinaryFn(ZeModule, &binary_size, nullptr);
+    if (ret_code != ZE_RESULT_SUCCESS) {
+        error_handler("zeModuleGetNativeBinary failed: " +
+                          _GetErrorCode_ze_impl(ret_code),
+                      __FILE__, __func__, __LINE__);
+        return {};
+    }
+
+    std::vector<unsigned char> binary(binary_size);
+    ret_code = zeModuleGetNativeBinaryFn(
+        ZeModule, &binary_size, reinterpret_cast<uint8_t *>(binary.data()));
+    if (ret_code != ZE_RESULT_SUCCESS) {
+        error_handler("zeModuleGetNativeBinary failed: " +
+                          _GetErrorCode_ze_impl(ret_code),
+                      __FILE__, __func__, __LINE__);
+        return {};
+    }
+    return binary;
+}
+
 __dpctl_give DPCTLSyclKernelRef
 _GetKernel_ze_impl(const kernel_bundle<bundle_state::executable> &kb,
                    const char *kernel_name)
@@ -576,6 +777,25 @@ bool _HasKernel_ze_impl(const kernel_bundle<bundle_state::executable> &kb,
 
 #endif /* #ifdef DPCTL_ENABLE_L0_PROGRAM_CREATION */
 
+std::vector<unsigned char>
+_GetBinary_impl(const kernel_bundle<bundle_state::executable> &kb)
+{
+    sycl::backend be = kb.get_backend();
+    switch (be) {
+    case sycl::backend::opencl:
+        return _GetBinary_ocl_impl(kb);
+    case sycl::backend::ext_oneapi_level_zero:
+#ifdef DPCTL_ENABLE_L0_PROGRAM_CREATION
+        return _GetBinary_ze_impl(kb);
+#endif
+    default:
+        error_handler("Backend " + std::to_string(static_cast<int>(be)) +
+                          " is not supported.",
+                      __FILE__, __func__, __LINE__);
+        return {};
+    }
+}
+
 } /* end of anonymous namespace */
 
 __dpctl_give DPCTLSyclKernelBundleRef
@@ -677,6 +897,107 @@ __dpctl_give DPCTLSyclKernelBundleRef DPCTLKernelBundle_CreateFromOCLSource(
     }
 }
 
+__dpctl_give DPCTLSyclKernelBundleRef DPCTLKernelBundle_CreateFromBinary(
+    __dpctl_keep const DPCTLSyclContextRef CtxRef,
+    __dpctl_keep const DPCTLSyclDeviceRef DevRef,
+    __dpctl_keep const void *Binary,
+    size_t length,
+    const char *CompileOpts)
+{
+    DPCTLSyclKernelBundleRef KBRef = nullptr;
+    if (!CtxRef) {
+        error_handler("Cannot create program from binary as the supplied SYCL "
+                      "context is NULL.",
+                      __FILE__, __func__, __LINE__);
+        return KBRef;
+    }
+    if (!DevRef) {
+        error_handler("Cannot create program from binary as the supplied SYCL "
+                      "device is NULL.",
+                      __FILE__, __func__, __LINE__);
+        return KBRef;
+    }
+    if ((!Binary) || (length == 0)) {
+        error_handler("Cannot create program from null binary buffer.",
+                      __FILE__, __func__, __LINE__);
+        return KBRef;
+    }
+
+    context *SyclCtx = unwrap<context>(CtxRef);
+    device *SyclDev = unwrap<device>(DevRef);
+    // get the backend type
+    auto BE = SyclCtx->get_platform().get_backend();
+    try {
+        switch (BE) {
+        case backend::opencl:
+            KBRef = _CreateKernelBundleWithBinary_ocl_impl(
+                *SyclCtx, *SyclDev, Binary, length, CompileOpts);
+            break;
+        case backend::ext_oneapi_level_zero:
+#ifdef DPCTL_ENABLE_L0_PROGRAM_CREATION
+            KBRef = _CreateKernelBundleWithBinary_ze_impl(
+                *SyclCtx, *SyclDev, Binary, length, CompileOpts);
+            break;
+#endif
+        default:
+            error_handler("Backend " + std::to_string(static_cast<int>(BE)) +
+                              " is not supported",
+                          __FILE__, __func__, __LINE__);
+            break;
+        }
+    } catch (std::exception const &e) {
+        error_handler(e, __FILE__, __func__, __LINE__);
+        KBRef = nullptr;
+    }
+    return KBRef;
+}
+
+size_t
+DPCTLKernelBundle_GetBinarySize(__dpctl_keep DPCTLSyclKernelBundleRef KBRef)
+{
+    if (!KBRef) {
+        error_handler("Input KBRef is nullptr", __FILE__, __func__, __LINE__);
+        return 0;
+    }
+    auto SyclKB = unwrap<kernel_bundle<bundle_state::executable>>(KBRef);
+    try {
+        return _GetBinary_impl(*SyclKB).size();
+    } catch (std::exception const &e) {
+        error_handler(e, __FILE__, __func__, __LINE__);
+        return 0;
+    }
+}
+
+bool DPCTLKernelBundle_GetBinary(__dpctl_keep DPCTLSyclKernelBundleRef KBRef,
+                                 __dpctl_keep void *Binary,
+                                 size_t length)
+{
+    if (!KBRef) {
+        error_handler("Input KBRef is nullptr", __FILE__, __func__, __LINE__);
+        return false;
+    }
+    if (!Binary) {
+        error_handler("Input Binary is nullptr", __FILE__, __func__, __LINE__);
+        return false;
+    }
+    auto SyclKB = unwrap<kernel_bundle<bundle_state::executable>>(KBRef);
+    try {
+        const auto &binary = _GetBinary_impl(*SyclKB);
+        if (binary.empty() || binary.size() != length) {
+            error_handler("Size of the buffer does not match size of the "
+                          "program binary.",
+                          __FILE__, __func__, __LINE__);
+            return false;
+        }
+        std::copy(binary.begin(), binary.end(),
+                  static_cast<unsigned char *>(Binary));
+        return true;
+    } catch (std::exception const &e) {
+        error_handler(e, __FILE__, __func__, __LINE__);
+        return false;
+    }
+}
+
 __dpctl_give DPCTLSyclKernelRef
 DPCTLKernelBundle_GetKernel(__dpctl_keep DPCTLSyclKernelBundleRef KBRef,
                             __dpctl_keep const char *KernelName)
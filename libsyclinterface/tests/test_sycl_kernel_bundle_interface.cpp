@@ -177,6 +177,49 @@ TEST_P(TestDPCTLSyclKernelBundleInterface, ChkGetKernelNullProgram)
     EXPECT_TRUE(KRef == nullptr);
 }
 
+TEST_P(TestDPCTLSyclKernelBundleInterface, ChkBinaryRoundTrip)
+{
+    size_t binary_size = 0;
+    ASSERT_TRUE(KBRef != nullptr);
+
+    EXPECT_NO_FATAL_FAILURE(binary_size =
+                                DPCTLKernelBundle_GetBinarySize(KBRef));
+    if (binary_size == 0) {
+        GTEST_SKIP_("Program binary is not available.");
+    }
+    std::vector<unsigned char> binary(binary_size);
+    ASSERT_TRUE(
+        DPCTLKernelBundle_GetBinary(KBRef, binary.data(), binary.size()));
+    ASSERT_FALSE(
+        DPCTLKernelBundle_GetBinary(KBRef, binary.data(), binary.size() - 1));
+
+    DPCTLSyclKernelBundleRef BinKBRef = nullptr;
+    EXPECT_NO_FATAL_FAILURE(
+        BinKBRef = DPCTLKernelBundle_CreateFromBinary(CRef, DRef, binary.data(),
+                                                      binary.size(), nullptr));
+    ASSERT_TRUE(BinKBRef != nullptr);
+    ASSERT_TRUE(DPCTLKernelBundle_HasKernel(BinKBRef, "add"));
+    ASSERT_TRUE(DPCTLKernelBundle_HasKernel(BinKBRef, "axpy"));
+    EXPECT_NO_FATAL_FAILURE(DPCTLKernelBundle_Delete(BinKBRef));
+}
+
+TEST_P(TestDPCTLSyclKernelBundleInterface, ChkBinaryNull)
+{
+    DPCTLSyclKernelBundleRef NullRef = nullptr;
+    DPCTLSyclKernelBundleRef BinKBRef = nullptr;
+    unsigned char buf[1] = {0};
+
+    EXPECT_TRUE(DPCTLKernelBundle_GetBinarySize(NullRef) == 0);
+    EXPECT_FALSE(DPCTLKernelBundle_GetBinary(NullRef, buf, 1));
+    EXPECT_FALSE(DPCTLKernelBundle_GetBinary(KBRef, nullptr, 1));
+    EXPECT_NO_FATAL_FAILURE(BinKBRef = DPCTLKernelBundle_CreateFromBinary(
+                                CRef, DRef, nullptr, 0, nullptr));
+    ASSERT_TRUE(BinKBRef == nullptr);
+    EXPECT_NO_FATAL_FAILURE(BinKBRef = DPCTLKernelBundle_CreateFromBinary(
+                                nullptr, DRef, buf, 1, nullptr));
+    ASSERT_TRUE(BinKBRef == nullptr);
+}
+
 struct TestOCLKernelBundleFromSource
     : public ::testing::TestWithParam<const char *>
 {